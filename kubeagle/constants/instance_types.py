@@ -95,3 +95,76 @@ SPOT_PRICES: dict[str, float] = {
     "t3.xlarge": 0.053,
     "t3.2xlarge": 0.106,
 }
+
+# Default EKS max pods per node by instance size (VPC CNI, no prefix
+# delegation). Used as the pod-count cap when packing replicas onto nodes.
+_MAX_PODS_BY_SIZE: dict[str, int] = {
+    "large": 29,
+    "xlarge": 58,
+    "2xlarge": 58,
+    "4xlarge": 234,
+    "8xlarge": 234,
+    "9xlarge": 234,
+    "12xlarge": 234,
+    "16xlarge": 737,
+    "18xlarge": 737,
+    "24xlarge": 737,
+}
+MAX_PODS: dict[str, int] = {
+    name: _MAX_PODS_BY_SIZE[name.split(".", 1)[1]]
+    for name in SPOT_PRICES
+    if name.split(".", 1)[1] in _MAX_PODS_BY_SIZE and not name.startswith("t3.")
+}
+MAX_PODS.update({
+    "t3.medium": 17,
+    "t3.large": 35,
+    "t3.xlarge": 58,
+    "t3.2xlarge": 58,
+})
+
+# Max pods for instance types missing from MAX_PODS (kubelet default)
+DEFAULT_MAX_PODS: int = 110
+
+# Pod slots per node taken by DaemonSets (aws-node, kube-proxy, CSI node
+# plugins, log/metrics agents); their CPU/memory is in DEFAULT_OVERHEAD_PCT.
+DAEMONSET_PODS_PER_NODE: int = 4
+
+# vCPUs per instance size, used to derive shapes for SPOT_PRICES entries
+INSTANCE_SIZE_VCPUS: dict[str, int] = {
+    "medium": 2,
+    "large": 2,
+    "xlarge": 4,
+    "2xlarge": 8,
+    "4xlarge": 16,
+    "8xlarge": 32,
+    "9xlarge": 36,
+    "12xlarge": 48,
+    "16xlarge": 64,
+    "18xlarge": 72,
+    "24xlarge": 96,
+}
+
+# GiB of memory per vCPU by instance family
+INSTANCE_FAMILY_GIB_PER_VCPU: dict[str, float] = {
+    "m5": 4.0,
+    "m6i": 4.0,
+    "m7i": 4.0,
+    "c5": 2.0,
+    "c6i": 2.0,
+    "r5": 8.0,
+    "r6i": 8.0,
+}
+
+# Burstable types whose memory does not follow a per-vCPU ratio
+INSTANCE_SHAPE_OVERRIDES: dict[str, tuple[int, float]] = {
+    "t3.medium": (2, 4.0),
+    "t3.large": (2, 8.0),
+    "t3.xlarge": (4, 16.0),
+    "t3.2xlarge": (8, 32.0),
+}
+
+# Time budget for the cheapest node-mix search (seconds)
+NODE_MIX_TIME_BUDGET_SECONDS: float = 0.5
+
+# Number of ranked node-mix options reported
+NODE_MIX_MAX_OPTIONS: int = 5
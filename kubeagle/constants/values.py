@@ -35,6 +35,7 @@ PLACEHOLDER_ACTIVE_CHARTS: Final = "active-charts.txt (optional)"
 PLACEHOLDER_CODEOWNERS: Final = "CODEOWNERS (optional)"
 PLACEHOLDER_REFRESH_INTERVAL: Final = "30"
 PLACEHOLDER_EXPORT_PATH: Final = "./reports"
+PLACEHOLDER_INSTANCE_PRICE_TABLE: Final = "instance-prices.yaml (optional)"
 PLACEHOLDER_EVENT_AGE: Final = "1.0"
 PLACEHOLDER_THRESHOLD: Final = "80"
 PLACEHOLDER_LIMIT_REQUEST: Final = "3.0"
@@ -52,6 +53,7 @@ __all__ = [
     "PLACEHOLDER_CODEOWNERS",
     "PLACEHOLDER_EVENT_AGE",
     "PLACEHOLDER_EXPORT_PATH",
+    "PLACEHOLDER_INSTANCE_PRICE_TABLE",
     "PLACEHOLDER_LIMIT_REQUEST",
     "PLACEHOLDER_REFRESH_INTERVAL",
     "PLACEHOLDER_THRESHOLD",
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import subprocess
 import time
 from collections import OrderedDict
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from pathlib import Path
@@ -19,10 +20,14 @@ from kubeagle.controllers.charts.fetchers import (
     ReleaseFetcher,
 )
 from kubeagle.controllers.charts.parsers import ChartParser
+from kubeagle.controllers.charts.watcher import ChartsRepoWatcher
 from kubeagle.controllers.cluster.controller import ClusterController
+from kubeagle.controllers.cluster.release_index import HelmReleaseIndex
 from kubeagle.controllers.team.mappers import TeamMapper
+from kubeagle.models.cache.cluster_join_index import ClusterJoinIndex
 from kubeagle.models.cache.data_cache import DataCache
 from kubeagle.models.charts.chart_info import ChartInfo
+from kubeagle.utils.values_merge import merge_helm_values
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +54,9 @@ class ChartsController(BaseController):
         cache: DataCache | None = None,
         progressive_yield_interval: int = 2,
         progressive_parallelism: int = 2,
+        use_git_index: bool = False,
+        release_index: HelmReleaseIndex | None = None,
+        join_index: ClusterJoinIndex | None = None,
     ):
         """Initialize the charts controller.
 
@@ -61,6 +69,14 @@ class ChartsController(BaseController):
             cache: Optional external cache for coordinated invalidation
             progressive_yield_interval: Yield to event loop every N completions
             progressive_parallelism: Max concurrent namespace fetches
+            use_git_index: Discover charts from the git index instead of
+                walking the repository
+            release_index: Optional persistent Helm release index; in
+                cluster-values mode releases whose revision is unchanged
+                reuse their indexed charts
+            join_index: Optional release/workload join index of the context;
+                its live release names serve as active charts when no
+                active charts file is configured
         """
         super().__init__()
         self._repo_path = repo_path
@@ -71,9 +87,11 @@ class ChartsController(BaseController):
         self.max_workers = max_workers
         self.context = context
         self.is_cluster_mode = False
+        self._release_index = release_index
+        self._join_index = join_index
 
         # Initialize components
-        self._chart_fetcher = ChartFetcher(repo_path, max_workers)
+        self._chart_fetcher = ChartFetcher(repo_path, max_workers, use_git_index=use_git_index)
         self._release_fetcher: ReleaseFetcher | None = None
         resolved_codeowners = codeowners_path
         if resolved_codeowners is None:
@@ -103,13 +121,24 @@ class ChartsController(BaseController):
 
     @property
     def active_charts(self) -> frozenset[str] | None:
-        """Get active charts set, loading from file if needed."""
+        """Get active charts set, loading from file if needed.
+
+        Without an active charts file, the live release names of the join
+        index are used once a release listing has been recorded.
+        """
         if self._active_charts is None and self._active_charts_path is not None:
             from kubeagle.models.charts.active_charts import (
                 get_active_charts_set,
             )
 
             self._active_charts = get_active_charts_set(self._active_charts_path)
+        if (
+            self._active_charts is None
+            and self._active_charts_path is None
+            and self._join_index is not None
+            and self._join_index.releases_loaded
+        ):
+            return self._join_index.release_names()
         return self._active_charts
 
     async def check_connection(self) -> bool:
@@ -343,6 +372,11 @@ class ChartsController(BaseController):
         if not chart_dirs:
             return []
 
+        if self._team_mapper is not None:
+            # Match every chart against CODEOWNERS once up front so workers
+            # only hit the memoized matches.
+            await asyncio.to_thread(self._team_mapper.resolve_teams, chart_dirs)
+
         loop = asyncio.get_running_loop()
         total = len(chart_dirs)
         results_by_index: dict[int, list[ChartInfo]] = {}
@@ -406,13 +440,124 @@ class ChartsController(BaseController):
             charts.extend(results_by_index[index])
         return charts
 
+    def create_repo_watcher(
+        self,
+        on_change: Callable[[frozenset[Path]], None],
+        **options: Any,
+    ) -> ChartsRepoWatcher:
+        """Return a (not yet started) watcher over ``repo_path``.
+
+        Args:
+            on_change: Called from the watcher thread with each debounced
+                batch of changed chart directories.
+            **options: Forwarded to ``ChartsRepoWatcher``.
+        """
+        return ChartsRepoWatcher(self.repo_path, on_change, **options)
+
+    @staticmethod
+    def replace_chart_dir_results(
+        charts: list[ChartInfo],
+        results: Mapping[Path, list[ChartInfo]],
+    ) -> list[ChartInfo]:
+        """Return ``charts`` with the rows of each re-analyzed chart dir replaced.
+
+        New rows take the position of the chart's first old row; charts that
+        were not in ``charts`` yet are appended.
+        """
+        replacements = {str(chart_dir): rows for chart_dir, rows in results.items()}
+        if not replacements:
+            return list(charts)
+        spliced: list[ChartInfo] = []
+        placed: set[str] = set()
+        for chart in charts:
+            chart_dir = os.path.dirname(chart.values_file)
+            rows = replacements.get(chart_dir)
+            if rows is None:
+                spliced.append(chart)
+            elif chart_dir not in placed:
+                placed.add(chart_dir)
+                spliced.extend(rows)
+        for chart_dir, rows in replacements.items():
+            if chart_dir not in placed:
+                spliced.extend(rows)
+        return spliced
+
+    def _analyze_chart_dirs(self, chart_dirs: list[Path]) -> dict[Path, list[ChartInfo]]:
+        """Analyze ``chart_dirs`` in parallel; dirs without a chart map to []."""
+        existing = [d for d in chart_dirs if (d / "Chart.yaml").is_file()]
+        results: dict[Path, list[ChartInfo]] = dict.fromkeys(chart_dirs, [])
+        if existing:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(self.max_workers, len(existing))),
+            ) as executor:
+                for chart_dir, rows in zip(
+                    existing,
+                    executor.map(self._analyze_single_chart, existing),
+                    strict=True,
+                ):
+                    results[chart_dir] = rows
+        return results
+
+    async def reanalyze_chart_dirs(
+        self,
+        chart_dirs: Iterable[Path],
+    ) -> dict[Path, list[ChartInfo]]:
+        """Re-analyze changed chart directories and patch cached chart lists.
+
+        Only the given charts are parsed again; cached analyses of every other
+        chart are kept and get the new rows spliced in.
+
+        Args:
+            chart_dirs: Chart directories reported by ``ChartsRepoWatcher``.
+
+        Returns:
+            Rows per chart directory; empty for directories that no longer
+            hold a chart (or no values file).
+        """
+        dirs = sorted(set(chart_dirs))
+        if not dirs:
+            return {}
+        results = await asyncio.to_thread(self._analyze_chart_dirs, dirs)
+
+        async with self._charts_cache_lock:
+            if self._charts_cache is not None:
+                self._charts_cache = self.replace_chart_dir_results(
+                    self._charts_cache, results,
+                )
+            repo_key, codeowners_key, _ = self._global_cache_key(None)
+            for key, (cached_at, charts) in list(self._global_charts_cache.items()):
+                if key[0] != repo_key or key[1] != codeowners_key:
+                    continue
+                active_releases = key[2]
+                scoped = results
+                if active_releases is not None:
+                    scoped = {
+                        chart_dir: (
+                            rows
+                            if self._matches_active_release(chart_dir, set(active_releases))
+                            else []
+                        )
+                        for chart_dir, rows in results.items()
+                    }
+                self._global_charts_cache[key] = (
+                    cached_at,
+                    self.replace_chart_dir_results(charts, scoped),
+                )
+            if self._cache is not None:
+                cached = await self._cache.get("charts")
+                if cached is not None:
+                    await self._cache.set(
+                        "charts", self.replace_chart_dir_results(cached, results),
+                    )
+        return results
+
     def _analyze_single_chart(self, chart_path: Path) -> list[ChartInfo]:
         """Analyze a single chart for every values file variant.
 
         Overlay values files (values-automation.yaml, values-staging.yaml, etc.)
-        typically inherit resources from values.yaml via Helm merge semantics.
-        When an overlay has no resource definitions, its QoS and resource values
-        are inherited from the main values.yaml result to avoid false BestEffort.
+        are coalesced onto values.yaml with Helm merge semantics, so overlays
+        are evaluated on the values Helm would actually render with. The base
+        is parsed once and each merged view shares its unchanged subtrees.
 
         Umbrella charts are consolidated into a single tree: the parent row
         (from values.yaml) is followed by overlay variant children and
@@ -423,20 +568,35 @@ class ChartsController(BaseController):
         if not values_files:
             return []
 
-        # First pass: parse all values files and keep raw values for expansion.
+        main_values: dict[str, Any] | None = None
+        for values_file in values_files:
+            if values_file.name == "values.yaml":
+                base_values = self._chart_fetcher.parse_values_file(values_file)
+                if isinstance(base_values, dict):
+                    main_values = base_values
+                break
+
+        # First pass: parse all values files and keep merged values for expansion.
         parsed: list[tuple[Path, dict[str, Any], ChartInfo]] = []
         main_chart_info: ChartInfo | None = None
-        main_values: dict[str, Any] | None = None
 
         for values_file in values_files:
-            values = self._chart_fetcher.parse_values_file(values_file)
-            if values is None:
-                continue
+            if values_file.name == "values.yaml":
+                if main_values is None:
+                    continue
+                values = main_values
+            else:
+                overlay = self._chart_fetcher.parse_values_file(values_file)
+                if overlay is None:
+                    continue
+                if main_values is not None and isinstance(overlay, dict):
+                    values = merge_helm_values(main_values, overlay)
+                else:
+                    values = overlay
             chart_info = self._chart_parser.parse(chart_path, values, values_file)
             parsed.append((values_file, values, chart_info))
             if values_file.name == "values.yaml":
                 main_chart_info = chart_info
-                main_values = values
 
         # Check whether this chart directory produces an umbrella.
         is_umbrella_chart = any(ci.is_umbrella for _, _, ci in parsed)
@@ -446,26 +606,7 @@ class ChartsController(BaseController):
                 chart_path, parsed, main_chart_info, main_values,
             )
 
-        # Non-umbrella: overlay files with no resources inherit from main.
-        chart_results: list[ChartInfo] = []
-        for values_file, _values, chart_info in parsed:
-            if (
-                values_file.name != "values.yaml"
-                and main_chart_info is not None
-                and self._has_no_resources(chart_info)
-            ):
-                chart_info = chart_info.model_copy(
-                    update={
-                        "cpu_request": main_chart_info.cpu_request,
-                        "cpu_limit": main_chart_info.cpu_limit,
-                        "memory_request": main_chart_info.memory_request,
-                        "memory_limit": main_chart_info.memory_limit,
-                        "qos_class": main_chart_info.qos_class,
-                    }
-                )
-            chart_results.append(chart_info)
-
-        return chart_results
+        return [chart_info for _, _, chart_info in parsed]
 
     def _build_umbrella_tree(
         self,
@@ -520,8 +661,9 @@ class ChartsController(BaseController):
     ) -> ChartInfo:
         """Build a variant row for a sub-chart from an overlay values file.
 
-        If the overlay has resource overrides for this sub-chart alias,
-        those are used.  Otherwise the Main variant resources are inherited.
+        ``overlay_values`` is the overlay merged onto values.yaml.  If it
+        defines resources for this sub-chart alias, those are used.  Otherwise
+        the Main variant resources are inherited.
         """
         from kubeagle.utils.resource_parser import (
             parse_cpu_from_dict,
@@ -578,16 +720,6 @@ class ChartsController(BaseController):
             update={"values_file": str(overlay_file)},
         )
 
-    @staticmethod
-    def _has_no_resources(chart_info: ChartInfo) -> bool:
-        """Check if a ChartInfo has no resource definitions at all."""
-        return (
-            chart_info.cpu_request == 0
-            and chart_info.cpu_limit == 0
-            and chart_info.memory_request == 0
-            and chart_info.memory_limit == 0
-        )
-
     def _run_helm(self, args: tuple[str, ...], timeout: int = 60) -> str:
         """Run helm command and return output."""
         cmd = ["helm"]
@@ -610,7 +742,11 @@ class ChartsController(BaseController):
                 lambda args: asyncio.to_thread(self._run_helm, args),
                 self.context,
             )
-        return await self._release_fetcher.fetch_releases()
+        releases = await self._release_fetcher.fetch_releases()
+        if self._release_index is not None and releases:
+            await asyncio.to_thread(self._release_index.load)
+            self._release_index.record_listing(releases, complete=True)
+        return releases
 
     async def fetch_live_helm_releases_streaming(
         self,
@@ -625,11 +761,17 @@ class ChartsController(BaseController):
             context=self.context,
             progressive_yield_interval=self._progressive_yield_interval,
             progressive_parallelism=self._progressive_parallelism,
+            release_index=self._release_index,
+            join_index=self._join_index,
         )
         if on_namespace_update is None:
             releases = await cluster_controller.get_helm_releases()
             return [
-                {"name": release.name, "namespace": release.namespace}
+                {
+                    "name": release.name,
+                    "namespace": release.namespace,
+                    "revision": release.revision,
+                }
                 for release in releases
                 if release.name and release.namespace
             ]
@@ -640,7 +782,11 @@ class ChartsController(BaseController):
             total: int,
         ) -> None:
             mapped = [
-                {"name": str(release.name), "namespace": str(release.namespace)}
+                {
+                    "name": str(release.name),
+                    "namespace": str(release.namespace),
+                    "revision": str(getattr(release, "revision", "") or ""),
+                }
                 for release in partial_releases
                 if getattr(release, "name", None) and getattr(release, "namespace", None)
             ]
@@ -650,7 +796,11 @@ class ChartsController(BaseController):
             on_namespace_update=_on_namespace_update
         )
         return [
-            {"name": release.name, "namespace": release.namespace}
+            {
+                "name": release.name,
+                "namespace": release.namespace,
+                "revision": release.revision,
+            }
             for release in releases
             if release.name and release.namespace
         ]
@@ -688,6 +838,17 @@ class ChartsController(BaseController):
         """Get and clear cached raw values output for a release/namespace pair."""
         return self._live_values_output_cache.pop((release, namespace), None)
 
+    async def fetch_deployed_values_content(
+        self, release: str, namespace: str
+    ) -> str | None:
+        """Fetch the raw deployed values of a release, or None on failure.
+
+        Rows served from the release index carry no raw values (they are
+        never persisted), so the values preview fetches them on demand.
+        """
+        await self.get_live_chart_values(release, namespace)
+        return self._consume_live_values_output(release, namespace)
+
     async def get_live_chart_values(
         self, release: str, namespace: str
     ) -> dict[str, Any]:
@@ -903,11 +1064,25 @@ class ChartsController(BaseController):
                 if self._charts_cache is not None:
                     return self._charts_cache
 
+            release_index = self._release_index
+            _, codeowners_key, _ = self._global_cache_key(None)
+            if release_index is not None:
+                # Read the index file off the event loop before any lookup.
+                await asyncio.to_thread(release_index.load)
+
             async def fetch_and_analyze(
                 release: dict[str, str],
             ) -> list[ChartInfo]:
                 name = release["name"]
                 namespace = release["namespace"]
+                revision = str(release.get("revision") or "")
+                if release_index is not None:
+                    # Unchanged revisions keep their values, so their analysis too.
+                    indexed = release_index.cached_charts(
+                        namespace, name, revision, codeowners_key,
+                    )
+                    if indexed is not None:
+                        return indexed
                 values = await self.get_live_chart_values(name, namespace)
                 raw_values_output = self._consume_live_values_output(name, namespace)
                 chart = self.analyze_live_chart(name, namespace, values)
@@ -929,6 +1104,11 @@ class ChartsController(BaseController):
                                 chart, values, sub_aliases,
                             )
                         )
+                # Failed fetches analyze as empty values; never index those.
+                if release_index is not None and raw_values_output:
+                    release_index.store_charts(
+                        namespace, name, revision, result, codeowners_key,
+                    )
                 return result
 
             charts: list[ChartInfo] = []
@@ -974,7 +1154,13 @@ class ChartsController(BaseController):
                     seen_releases.add(key)
                     discovered_release_count = len(seen_releases)
                     task = asyncio.create_task(
-                        _analyze_and_publish({"name": name, "namespace": namespace})
+                        _analyze_and_publish(
+                            {
+                                "name": name,
+                                "namespace": namespace,
+                                "revision": str(release.get("revision") or ""),
+                            }
+                        )
                     )
                     analysis_tasks.add(task)
                     task.add_done_callback(analysis_tasks.discard)
@@ -1101,6 +1287,9 @@ class ChartsController(BaseController):
                     concurrency,
                 )
 
+            if release_index is not None:
+                await asyncio.to_thread(release_index.save)
+
             if should_cache:
                 self._charts_cache = charts
                 if self._cache is not None:
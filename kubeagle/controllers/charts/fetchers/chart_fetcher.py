@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+import os
+import shutil
+import subprocess
 from pathlib import Path
 from typing import Any
 
@@ -21,22 +24,42 @@ class ChartFetcher:
         "values-default-namespace.yaml",
     )
 
-    def __init__(self, repo_path: Path, max_workers: int = MAX_WORKERS) -> None:
+    # Directory names never descended into: Helm dependency sub-charts.
+    _EXCLUDED_DIR_NAMES = frozenset({"charts"})
+
+    _GIT_LS_FILES_TIMEOUT_SECONDS = 30
+
+    def __init__(
+        self,
+        repo_path: Path,
+        max_workers: int = MAX_WORKERS,
+        use_git_index: bool = False,
+    ) -> None:
         """Initialize chart fetcher.
 
         Args:
             repo_path: Path to Helm charts repository
             max_workers: Maximum number of parallel workers
+            use_git_index: Enumerate charts from the git index
+                (``git ls-files``) instead of walking the tree, falling back
+                to the walk when the repository is not a git checkout.
         """
         self.repo_path = repo_path
         self.max_workers = max_workers
+        self.use_git_index = use_git_index
+        # Values file names seen during discovery, keyed by chart dir path
+        # and validated against the directory mtime.
+        self._values_files_cache: dict[str, tuple[int, list[str]]] = {}
 
     def find_chart_directories(self) -> list[Path]:
         """Find all chart directories in the repository.
 
-        Uses a lightweight values-file existence check instead of the full
-        ``find_values_files`` scan to avoid redundant glob + sort work that
-        will be repeated by ``_analyze_single_chart`` anyway.
+        Hidden, underscore-prefixed and ``charts/`` (dependency) directories
+        are pruned during a single ``os.scandir`` walk, and each chart's
+        values files are collected in the same pass for ``find_values_files``.
+        Symlinked directories are not followed, as with the previous
+        ``rglob`` discovery. With ``use_git_index`` the git index replaces
+        the walk; charts that are not tracked by git are then not discovered.
 
         Returns:
             List of chart directory paths.
@@ -44,61 +67,139 @@ class ChartFetcher:
         if not self.repo_path.exists():
             return []
 
-        chart_dirs: list[Path] = []
+        discovered: dict[str, list[str]] | None = None
+        if self.use_git_index:
+            discovered = self._discover_from_git_index()
+        if discovered is None:
+            discovered = self._discover_by_walk()
 
-        for chart_file in self.repo_path.rglob("Chart.yaml"):
-            chart_dir = chart_file.parent
-            if not self._is_valid_chart_dir(chart_dir):
+        chart_dirs: list[str] = []
+        for chart_dir, values_names in discovered.items():
+            if not values_names:
                 continue
-            if not self._has_any_values_file(chart_dir):
+            try:
+                mtime_ns = os.stat(chart_dir).st_mtime_ns
+            except OSError:
                 continue
+            self._values_files_cache[chart_dir] = (
+                mtime_ns,
+                sorted(values_names, key=self._values_name_sort_key),
+            )
             chart_dirs.append(chart_dir)
 
-        return sorted(
-            chart_dirs,
-            key=lambda path: str(path.relative_to(self.repo_path)),
-        )
+        # Every path shares the repo prefix, so this orders by relative path.
+        return [Path(chart_dir) for chart_dir in sorted(chart_dirs)]
 
     @staticmethod
-    def _has_any_values_file(chart_dir: Path) -> bool:
-        """Fast check for at least one values file without full glob + sort."""
-        return any(
-            f.is_file()
-            and (f.name == "values.yaml" or f.name.startswith("values-"))
-            for f in chart_dir.glob("values*.yaml")
-        )
-
-    def _is_valid_chart_dir(self, chart_dir: Path) -> bool:
-        """Check whether chart directory should be included in analysis."""
-        if not chart_dir.is_dir():
-            return False
+    def _is_values_file_name(name: str) -> bool:
+        return name.endswith(".yaml") and (name == "values.yaml" or name.startswith("values-"))
 
+    def _is_excluded_dir_name(self, name: str) -> bool:
+        """Hidden/special directories and Helm dependency sub-chart dirs."""
+        return name[0] in (".", "_") or name in self._EXCLUDED_DIR_NAMES
+
+    def _scan_dir(
+        self, path: str, subdirs: list[str] | None = None,
+    ) -> tuple[os.DirEntry[str] | None, list[os.DirEntry[str]]]:
+        """Return the ``Chart.yaml`` entry and values file entries of ``path``.
+
+        Non-excluded subdirectories are appended to ``subdirs`` when given.
+        """
+        chart_entry: os.DirEntry[str] | None = None
+        values_entries: list[os.DirEntry[str]] = []
         try:
-            rel_parts = chart_dir.relative_to(self.repo_path).parts
-        except ValueError:
-            return False
+            with os.scandir(path) as iterator:
+                for entry in iterator:
+                    name = entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if subdirs is not None and not self._is_excluded_dir_name(name):
+                                subdirs.append(entry.path)
+                        elif name == "Chart.yaml":
+                            chart_entry = entry
+                        elif self._is_values_file_name(name) and entry.is_file():
+                            values_entries.append(entry)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return chart_entry, values_entries
+
+    def _discover_by_walk(self) -> dict[str, list[str]]:
+        """Return ``{chart dir: values file names}`` from one pruned scandir walk."""
+        discovered: dict[str, list[str]] = {}
+        root = str(self.repo_path)
+        pending = [root]
+        while pending:
+            current = pending.pop()
+            chart_entry, values_entries = self._scan_dir(current, pending)
+            if chart_entry is not None and current != root:
+                discovered[current] = [entry.name for entry in values_entries]
+        return discovered
+
+    def _run_git(self, *args: str) -> str | None:
+        git = shutil.which("git")
+        if git is None:
+            return None
+        try:
+            completed = subprocess.run(
+                [git, "-C", str(self.repo_path), *args],
+                capture_output=True,
+                check=True,
+                timeout=self._GIT_LS_FILES_TIMEOUT_SECONDS,
+            )
+        except (OSError, subprocess.SubprocessError):
+            logger.debug("git %s failed for %s", args[0], self.repo_path, exc_info=True)
+            return None
+        return os.fsdecode(completed.stdout)
 
-        if not rel_parts:
-            return False
+    def _discover_from_git_index(self) -> dict[str, list[str]] | None:
+        """Return ``{chart dir: values file names}`` using the git index.
 
-        # Skip hidden/special directories and Helm dependency sub-charts.
-        if any(part[0] in (".", "_") for part in rel_parts):
-            return False
-        return "charts" not in rel_parts
+        Chart directories come from the index (``git ls-files``), so the
+        tree is never walked; only chart directories are scanned, which keeps
+        values files exact (including untracked ones). Returns None when git
+        cannot list the repository.
+        """
+        listing = self._run_git("ls-files", "-z", "--", "*Chart.yaml")
+        if listing is None:
+            return None
+
+        discovered: dict[str, list[str]] = {}
+        for rel_path in listing.split("\0"):
+            parent, _, name = rel_path.rpartition("/")
+            if name != "Chart.yaml" or not parent or any(
+                self._is_excluded_dir_name(part) for part in parent.split("/")
+            ):
+                continue
+            chart_dir = os.path.join(self.repo_path, parent)
+            chart_entry, values_entries = self._scan_dir(chart_dir)
+            if chart_entry is None:
+                continue
+            discovered[chart_dir] = [entry.name for entry in values_entries]
+        return discovered
 
     def find_values_files(self, chart_path: Path) -> list[Path]:
-        """Find all values files for a chart in deterministic priority order."""
+        """Find all values files for a chart in deterministic priority order.
+
+        Reuses the files collected by ``find_chart_directories`` while the
+        chart directory's mtime is unchanged.
+        """
+        cached = self._values_files_cache.get(str(chart_path))
+        if cached is not None:
+            try:
+                if os.stat(chart_path).st_mtime_ns == cached[0]:
+                    return [chart_path / name for name in cached[1]]
+            except OSError:
+                pass
+
         if not chart_path.is_dir():
             return []
 
         values_files = [
             values_file
             for values_file in chart_path.glob("values*.yaml")
-            if values_file.is_file()
-            and (
-                values_file.name == "values.yaml"
-                or values_file.name.startswith("values-")
-            )
+            if values_file.is_file() and self._is_values_file_name(values_file.name)
         ]
 
         return sorted(values_files, key=self._values_file_sort_key)
@@ -106,7 +207,10 @@ class ChartFetcher:
     @classmethod
     def _values_file_sort_key(cls, values_file: Path) -> tuple[int, str]:
         """Sort key that preserves legacy priority and then name ordering."""
-        file_name = values_file.name
+        return cls._values_name_sort_key(values_file.name)
+
+    @classmethod
+    def _values_name_sort_key(cls, file_name: str) -> tuple[int, str]:
         try:
             priority_index = cls._VALUES_FILE_PRIORITY.index(file_name)
         except ValueError:
@@ -28,7 +28,8 @@ class ReleaseFetcher:
         """Fetch list of Helm releases from the cluster.
 
         Returns:
-            List of release dictionaries with name and namespace.
+            List of release dictionaries with name, namespace, revision,
+            chart and updated timestamp.
         """
         try:
             output = await self._run_helm(("list", "-A", "-o", "json"))
@@ -37,7 +38,13 @@ class ReleaseFetcher:
 
             releases_data = json.loads(output)
             return [
-                {"name": r["name"], "namespace": r["namespace"]}
+                {
+                    "name": r["name"],
+                    "namespace": r["namespace"],
+                    "revision": str(r.get("revision", "")),
+                    "chart": str(r.get("chart", "")),
+                    "updated": str(r.get("updated", "")),
+                }
                 for r in releases_data
                 if "name" in r and "namespace" in r
             ]
@@ -6,9 +6,11 @@ import logging
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from kubeagle.constants.enums import QoSClass
+from kubeagle.controllers.charts.parsers.sub_chart_defaults import (
+    SUB_CHART_DEFAULTS_CACHE,
+    find_vendored_archive,
+)
 from kubeagle.models.charts.chart_info import ChartInfo
 from kubeagle.utils.resource_parser import (
     parse_cpu_from_dict,
@@ -175,16 +177,7 @@ class ChartParser:
     @staticmethod
     def _read_chart_name_from_yaml(chart_path: Path) -> str | None:
         """Read chart name from Chart.yaml metadata."""
-        chart_yaml_path = chart_path / "Chart.yaml"
-        if not chart_yaml_path.is_file():
-            return None
-
-        try:
-            with open(chart_yaml_path, encoding="utf-8") as handle:
-                content = yaml.safe_load(handle)
-        except (OSError, yaml.YAMLError):
-            return None
-
+        content = SUB_CHART_DEFAULTS_CACHE.load_yaml(chart_path / "Chart.yaml")
         if not isinstance(content, dict):
             return None
 
@@ -354,17 +347,18 @@ class ChartParser:
         3. The dependency alias appears as a top-level key in values
         4. That key contains workload definitions (resources or replicaCount)
 
+        Dependencies vendored from a chart repository are not sub-charts;
+        their archives only supply defaults (see ``_load_sub_chart_defaults``).
+
         Returns list of alias names for identified sub-charts.
         """
-        local_deps = self._detect_local_file_dependencies(chart_path)
-        if not local_deps:
-            return []
-
         sub_chart_aliases: list[str] = []
-        for dep in local_deps:
+        for dep in self._detect_chart_dependencies(chart_path):
             alias = dep["alias"]
             repository = dep["repository"]
 
+            if not repository.startswith("file://"):
+                continue
             if self._resolve_dependency_path(chart_path, repository) is None:
                 continue
 
@@ -378,20 +372,11 @@ class ChartParser:
         return sub_chart_aliases
 
     @staticmethod
-    def _detect_local_file_dependencies(
+    def _detect_chart_dependencies(
         chart_path: Path,
     ) -> list[dict[str, str]]:
-        """Parse Chart.yaml and return dependencies with ``file://`` repositories."""
-        chart_yaml_path = chart_path / "Chart.yaml"
-        if not chart_yaml_path.is_file():
-            return []
-
-        try:
-            with open(chart_yaml_path, encoding="utf-8") as fh:
-                content = yaml.safe_load(fh)
-        except (OSError, yaml.YAMLError):
-            return []
-
+        """Parse Chart.yaml and return every declared dependency."""
+        content = SUB_CHART_DEFAULTS_CACHE.load_yaml(chart_path / "Chart.yaml")
         if not isinstance(content, dict):
             return []
 
@@ -399,24 +384,30 @@ class ChartParser:
         if not isinstance(dependencies, list):
             return []
 
-        local_deps: list[dict[str, str]] = []
+        chart_deps: list[dict[str, str]] = []
         for dep in dependencies:
             if not isinstance(dep, dict):
                 continue
             repo = dep.get("repository", "")
-            if not isinstance(repo, str) or not repo.startswith("file://"):
-                continue
             name = str(dep.get("name", "")).strip()
             alias = str(dep.get("alias", "") or name).strip()
             if not alias:
                 continue
-            local_deps.append({
+            chart_deps.append({
                 "name": name,
                 "alias": alias,
-                "repository": repo,
+                "repository": repo if isinstance(repo, str) else "",
             })
 
-        return local_deps
+        return chart_deps
+
+    @staticmethod
+    def _vendored_dependency_dir(chart_path: Path, name: str) -> Path | None:
+        """Return ``chart_path/charts/<name>`` if the dependency is unpacked there."""
+        if not name:
+            return None
+        unpacked = chart_path / "charts" / name
+        return unpacked if unpacked.is_dir() else None
 
     @staticmethod
     def _resolve_dependency_path(
@@ -590,31 +581,44 @@ class ChartParser:
     ) -> dict[str, dict[str, Any]]:
         """Load sub-chart own values.yaml files for the fallback chain.
 
+        Values come from the dependency directory's values.yaml (the
+        ``file://`` target, else the unpacked ``charts/<name>/`` folder).
+        Any dependency without one is looked up in the vendored
+        ``charts/<name>-<version>.tgz`` archive that ``helm dependency
+        build`` leaves behind. Parsed files are shared process-wide and
+        must not be mutated.
+
         Returns a mapping of alias → parsed values dict for sub-charts
-        whose dependency directory contains a values.yaml file.
+        whose dependency provides a values.yaml file.
         """
-        local_deps = self._detect_local_file_dependencies(chart_path)
-        dep_path_map: dict[str, Path] = {}
-        for dep in local_deps:
-            resolved = self._resolve_dependency_path(chart_path, dep["repository"])
-            if resolved is not None:
-                dep_path_map[dep["alias"]] = resolved
+        dep_map = {
+            dep["alias"]: dep for dep in self._detect_chart_dependencies(chart_path)
+        }
 
         defaults: dict[str, dict[str, Any]] = {}
         for alias in sub_chart_aliases:
-            dep_dir = dep_path_map.get(alias)
-            if dep_dir is None:
-                continue
-            vf = dep_dir / "values.yaml"
-            if not vf.is_file():
+            dep = dep_map.get(alias)
+            if dep is None:
                 continue
-            try:
-                with open(vf, encoding="utf-8") as fh:
-                    content = yaml.safe_load(fh)
-                if isinstance(content, dict):
-                    defaults[alias] = content
-            except (OSError, yaml.YAMLError):
-                pass
+            dep_name = dep["name"]
+            dep_dir: Path | None = None
+            if dep["repository"].startswith("file://"):
+                dep_dir = self._resolve_dependency_path(chart_path, dep["repository"])
+            if dep_dir is None:
+                dep_dir = self._vendored_dependency_dir(chart_path, dep_name)
+            content = (
+                SUB_CHART_DEFAULTS_CACHE.load_yaml(dep_dir / "values.yaml")
+                if dep_dir is not None
+                else None
+            )
+            if content is None:
+                archive = find_vendored_archive(chart_path, dep_name)
+                if archive is not None:
+                    content = SUB_CHART_DEFAULTS_CACHE.load_archive_values(
+                        archive, dep_name,
+                    )
+            if isinstance(content, dict):
+                defaults[alias] = content
 
         return defaults
 
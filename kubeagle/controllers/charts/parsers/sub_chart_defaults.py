@@ -0,0 +1,158 @@
+"""Process-wide cache of parsed sub-chart defaults and Chart.yaml files.
+
+Umbrella expansion reads every local dependency's Chart.yaml and
+``values.yaml``; shared library sub-charts are referenced by many umbrellas
+and each chart analysis used to re-parse them. Parsed documents are cached by
+resolved path and validated against the file's mtime and size, so an edited
+file is re-read on the next lookup.
+
+Vendored dependencies (``charts/<name>-<version>.tgz``) are read in place:
+the archive is streamed until the chart's ``values.yaml`` member and never
+extracted to disk.
+
+Cached documents are shared between callers and must be treated as
+read-only.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import stat as stat_module
+import tarfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# Maximum number of parsed documents kept.
+_SUB_CHART_DEFAULTS_CACHE_SIZE = 4_096
+
+_TGZ_NAME_PATTERN = re.compile(r"^(?P<name>.+?)-\d[^/]*\.tgz$")
+
+_Stamp = tuple[int, int]
+
+
+def _file_stamp(path: Path) -> tuple[str, _Stamp] | None:
+    try:
+        resolved = path.resolve()
+        stat = resolved.stat()
+    except OSError:
+        return None
+    if not stat_module.S_ISREG(stat.st_mode):
+        return None
+    return str(resolved), (stat.st_mtime_ns, stat.st_size)
+
+
+def _read_archive_values(archive: Path, chart_name: str) -> Any:
+    """Stream ``archive`` and parse ``<chart_name>/values.yaml`` from it."""
+    member_name = f"{chart_name}/values.yaml"
+    with tarfile.open(archive, mode="r|gz") as tar:
+        for member in tar:
+            if not member.isfile() or member.name.removeprefix("./") != member_name:
+                continue
+            handle = tar.extractfile(member)
+            if handle is None:
+                return None
+            with handle:
+                return yaml.safe_load(handle)
+    return None
+
+
+class SubChartDefaultsCache:
+    """Bounded LRU cache of YAML documents keyed by resolved path and stamp."""
+
+    def __init__(self, max_entries: int = _SUB_CHART_DEFAULTS_CACHE_SIZE) -> None:
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[tuple[str, str], tuple[_Stamp, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached document."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _lookup(self, key: tuple[str, str], stamp: _Stamp) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            self.misses += 1
+        return False, None
+
+    def _store(self, key: tuple[str, str], stamp: _Stamp, document: Any) -> None:
+        with self._lock:
+            self._entries[key] = (stamp, document)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def load_yaml(self, path: Path) -> Any:
+        """Return the parsed YAML document at ``path``, or None if unreadable."""
+        stamped = _file_stamp(path)
+        if stamped is None:
+            return None
+        resolved, stamp = stamped
+        key = (resolved, "")
+        found, document = self._lookup(key, stamp)
+        if found:
+            return document
+
+        try:
+            with open(resolved, encoding="utf-8") as handle:
+                document = yaml.safe_load(handle)
+        except (OSError, UnicodeDecodeError, yaml.YAMLError):
+            document = None
+        self._store(key, stamp, document)
+        return document
+
+    def load_archive_values(self, archive: Path, chart_name: str) -> Any:
+        """Return the parsed ``values.yaml`` of ``chart_name`` inside a chart archive."""
+        stamped = _file_stamp(archive)
+        if stamped is None:
+            return None
+        resolved, stamp = stamped
+        key = (resolved, chart_name)
+        found, document = self._lookup(key, stamp)
+        if found:
+            return document
+
+        try:
+            document = _read_archive_values(Path(resolved), chart_name)
+        except (OSError, EOFError, tarfile.TarError, UnicodeDecodeError, yaml.YAMLError):
+            document = None
+        self._store(key, stamp, document)
+        return document
+
+
+def find_vendored_archive(chart_path: Path, dependency_name: str) -> Path | None:
+    """Return ``chart_path/charts/<dependency_name>-<version>.tgz`` if present."""
+    if not dependency_name:
+        return None
+    try:
+        with os.scandir(chart_path / "charts") as entries:
+            for entry in entries:
+                match = _TGZ_NAME_PATTERN.match(entry.name)
+                if (
+                    match is not None
+                    and match.group("name") == dependency_name
+                    and entry.is_file()
+                ):
+                    return Path(entry.path)
+    except OSError:
+        return None
+    return None
+
+
+SUB_CHART_DEFAULTS_CACHE = SubChartDefaultsCache()
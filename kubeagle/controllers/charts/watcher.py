@@ -0,0 +1,461 @@
+"""Live watcher for on-disk changes in a Helm charts repository.
+
+On Linux the watcher uses inotify (through ``ctypes``, one watch per
+directory); elsewhere, or when inotify is unavailable or out of watches, it
+polls file stamps. Bursts of events such as a ``git checkout`` are debounced
+into one batch of changed chart directories, handed to a callback from the
+watcher thread.
+
+A changed path belongs to the deepest enclosing directory with a
+``Chart.yaml``, looking only above hidden and dependency (``charts/``)
+directories, so edits to a vendored sub-chart re-analyze its parent chart.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+ChartDirsCallback = Callable[[frozenset[Path]], None]
+
+# Seconds without new events before a batch is flushed.
+DEFAULT_DEBOUNCE_SECONDS = 0.5
+
+# A batch is flushed after this long even while events keep arriving.
+DEFAULT_MAX_BATCH_DELAY_SECONDS = 5.0
+
+# Seconds between two stamp scans of the polling backend.
+DEFAULT_POLL_INTERVAL_SECONDS = 2.0
+
+# Dependency sub-chart directories; changes there belong to the parent chart.
+_SUBCHART_DIR_NAME = "charts"
+
+# inotify(7) constants.
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_DONT_FOLLOW = 0x02000000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+    | _IN_DONT_FOLLOW
+)
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+def _is_hidden_dir_name(name: str) -> bool:
+    return name[0] in (".", "_")
+
+
+def _walk_dirs(root: str) -> Iterable[tuple[str, list[os.DirEntry[str]]]]:
+    """Yield ``(directory, file entries)`` below ``root``, skipping hidden dirs."""
+    pending = [root]
+    while pending:
+        current = pending.pop()
+        files: list[os.DirEntry[str]] = []
+        try:
+            with os.scandir(current) as iterator:
+                for entry in iterator:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if not _is_hidden_dir_name(entry.name):
+                            pending.append(entry.path)
+                    else:
+                        files.append(entry)
+        except OSError:
+            continue
+        yield current, files
+
+
+class _InotifyBackend:
+    """Recursive inotify watches on every non-hidden directory."""
+
+    name = "inotify"
+
+    def __init__(self, root: str) -> None:
+        self._root = root
+        self._fd = -1
+        self._wake_read = -1
+        self._wake_write = -1
+        self._paths: dict[int, str] = {}
+        self._libc: ctypes.CDLL | None = None
+
+    def open(self) -> None:
+        """Start watching; raises OSError when inotify cannot be used."""
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, "libc has no inotify support")
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self._libc = libc
+        self._fd = fd
+        self._wake_read, self._wake_write = os.pipe()
+        try:
+            for directory, _ in _walk_dirs(self._root):
+                self._add_watch(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, directory: str) -> None:
+        assert self._libc is not None
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                # Removed or unreadable before the watch was added.
+                return
+            raise OSError(error, f"inotify_add_watch({directory}): {os.strerror(error)}")
+        self._paths[wd] = directory
+
+    def _watch_new_tree(self, directory: str) -> list[str]:
+        """Watch a created directory; return files that appeared before the watch."""
+        created: list[str] = []
+        for subdir, files in _walk_dirs(directory):
+            self._add_watch(subdir)
+            created.append(subdir)
+            created.extend(entry.path for entry in files)
+        return created
+
+    def read(self, timeout: float) -> list[str] | None:
+        """Return changed paths, [] on timeout, or None when events were lost."""
+        if self._fd < 0:
+            return []
+        ready, _, _ = select.select([self._fd, self._wake_read], [], [], max(timeout, 0.0))
+        if self._wake_read in ready:
+            with contextlib.suppress(OSError):
+                os.read(self._wake_read, 64)
+        if self._fd not in ready:
+            return []
+        try:
+            data = os.read(self._fd, _READ_SIZE)
+        except BlockingIOError:
+            return []
+        changed: list[str] = []
+        offset = 0
+        header_size = _EVENT_HEADER.size
+        while offset + header_size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            raw_name = data[offset + header_size : offset + header_size + length]
+            offset += header_size + length
+            if mask & _IN_Q_OVERFLOW:
+                return None
+            directory = self._paths.get(wd)
+            if directory is None:
+                continue
+            if mask & _IN_IGNORED:
+                self._paths.pop(wd, None)
+                continue
+            name = os.fsdecode(raw_name.rstrip(b"\0"))
+            path = os.path.join(directory, name) if name else directory
+            changed.append(path)
+            if (
+                mask & _IN_ISDIR
+                and mask & (_IN_CREATE | _IN_MOVED_TO)
+                and name
+                and not _is_hidden_dir_name(name)
+            ):
+                changed.extend(self._watch_new_tree(path))
+        return changed
+
+    def wake(self) -> None:
+        if self._wake_write >= 0:
+            with contextlib.suppress(OSError):
+                os.write(self._wake_write, b"\0")
+
+    def close(self) -> None:
+        for fd in (self._fd, self._wake_read, self._wake_write):
+            if fd >= 0:
+                with contextlib.suppress(OSError):
+                    os.close(fd)
+        self._fd = self._wake_read = self._wake_write = -1
+        self._paths.clear()
+
+
+class _PollingBackend:
+    """Periodic ``(mtime_ns, size)`` scans of every file below the root."""
+
+    name = "polling"
+
+    def __init__(self, root: str, interval_seconds: float) -> None:
+        self._root = root
+        self._interval = max(interval_seconds, 0.01)
+        self._stamps: dict[str, tuple[int, int]] = {}
+        self._next_scan = 0.0
+        self._wake = threading.Event()
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        stamps: dict[str, tuple[int, int]] = {}
+        for directory, files in _walk_dirs(self._root):
+            for entry in files:
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                stamps[entry.path] = (stat.st_mtime_ns, stat.st_size)
+            stamps.setdefault(directory, (0, 0))
+        return stamps
+
+    def open(self) -> None:
+        self._stamps = self._scan()
+        self._next_scan = time.monotonic() + self._interval
+
+    def read(self, timeout: float) -> list[str] | None:
+        """Return paths whose stamp changed since the previous scan."""
+        wait = min(max(timeout, 0.0), max(self._next_scan - time.monotonic(), 0.0))
+        if self._wake.wait(wait):
+            self._wake.clear()
+        if time.monotonic() < self._next_scan:
+            return []
+        self._next_scan = time.monotonic() + self._interval
+        previous = self._stamps
+        current = self._scan()
+        self._stamps = current
+        changed = [path for path, stamp in current.items() if previous.get(path) != stamp]
+        changed.extend(path for path in previous if path not in current)
+        return changed
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def close(self) -> None:
+        self._stamps = {}
+
+
+class ChartsRepoWatcher:
+    """Report changed chart directories of a charts repository.
+
+    The callback runs on the watcher thread with the set of affected chart
+    directories; directories that no longer hold a chart are included so
+    callers can drop their rows.
+    """
+
+    def __init__(
+        self,
+        repo_path: Path,
+        on_change: ChartDirsCallback,
+        *,
+        backend: str = "auto",
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+        max_batch_delay_seconds: float = DEFAULT_MAX_BATCH_DELAY_SECONDS,
+        poll_interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize the watcher.
+
+        Args:
+            repo_path: Charts repository root.
+            on_change: Called with each debounced batch of chart directories.
+            backend: ``"auto"`` (inotify, falling back to polling),
+                ``"inotify"`` or ``"polling"``.
+            debounce_seconds: Quiet period that ends a batch.
+            max_batch_delay_seconds: Longest a batch waits under constant events.
+            poll_interval_seconds: Scan interval of the polling backend.
+        """
+        if backend not in ("auto", "inotify", "polling"):
+            raise ValueError(f"Unknown watcher backend: {backend!r}")
+        self._root = str(repo_path)
+        self._on_change = on_change
+        self._backend_choice = backend
+        self._debounce = max(debounce_seconds, 0.0)
+        self._max_delay = max(max_batch_delay_seconds, self._debounce)
+        self._poll_interval = poll_interval_seconds
+        self._backend: _InotifyBackend | _PollingBackend | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._known_chart_dirs: set[str] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def backend_name(self) -> str | None:
+        """Name of the running backend, None before ``start``."""
+        return self._backend.name if self._backend is not None else None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def set_chart_dirs(self, chart_dirs: Iterable[Path]) -> None:
+        """Seed known chart directories so deleted charts are still reported."""
+        with self._lock:
+            self._known_chart_dirs = {str(chart_dir) for chart_dir in chart_dirs}
+
+    def _open_backend(self) -> _InotifyBackend | _PollingBackend:
+        if self._backend_choice != "polling":
+            inotify = _InotifyBackend(self._root)
+            try:
+                inotify.open()
+                return inotify
+            except OSError as exc:
+                if self._backend_choice == "inotify":
+                    raise
+                logger.debug("inotify unavailable, polling %s: %s", self._root, exc)
+        polling = _PollingBackend(self._root, self._poll_interval)
+        polling.open()
+        return polling
+
+    def start(self) -> None:
+        """Start watching; the initial watch set is built before returning."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._backend = self._open_backend()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"charts-repo-watcher:{Path(self._root).name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the watcher thread; pending, unflushed changes are dropped."""
+        self._stop.set()
+        backend = self._backend
+        if backend is not None:
+            backend.wake()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+        if backend is not None:
+            backend.close()
+        self._backend = None
+
+    def _run(self) -> None:
+        backend = self._backend
+        if backend is None:
+            return
+        pending: set[str] = set()
+        rescan = False
+        first_event = last_event = 0.0
+        while not self._stop.is_set():
+            if pending or rescan:
+                now = time.monotonic()
+                timeout = min(last_event + self._debounce, first_event + self._max_delay) - now
+            else:
+                timeout = 1.0
+            try:
+                changed = backend.read(max(timeout, 0.0))
+            except OSError:
+                logger.debug("Charts watcher read failed", exc_info=True)
+                changed = []
+            if self._stop.is_set():
+                break
+            now = time.monotonic()
+            if changed is None or changed:
+                if not pending and not rescan:
+                    first_event = now
+                last_event = now
+                if changed is None:
+                    rescan = True
+                else:
+                    pending.update(changed)
+                continue
+            if not pending and not rescan:
+                continue
+            if now - last_event < self._debounce and now - first_event < self._max_delay:
+                continue
+            chart_dirs = self.chart_dirs_for_paths(pending, rescan=rescan)
+            pending = set()
+            rescan = False
+            if not chart_dirs:
+                continue
+            try:
+                self._on_change(chart_dirs)
+            except Exception:
+                logger.exception("Charts watcher callback failed")
+
+    def chart_dirs_for_paths(
+        self,
+        paths: Iterable[str],
+        *,
+        rescan: bool = False,
+    ) -> frozenset[Path]:
+        """Map changed paths to the chart directories they belong to.
+
+        Args:
+            paths: Absolute changed paths.
+            rescan: Events were lost; report every known and current chart.
+        """
+        root = self._root
+        prefix = root.rstrip(os.sep) + os.sep
+        with self._lock:
+            known = set(self._known_chart_dirs)
+        exists: dict[str, bool] = {}
+
+        def _is_chart_dir(directory: str) -> bool:
+            cached = exists.get(directory)
+            if cached is None:
+                cached = os.path.isfile(os.path.join(directory, "Chart.yaml"))
+                exists[directory] = cached
+            return cached
+
+        changed: set[str] = set()
+        for path in paths:
+            if not path.startswith(prefix):
+                continue
+            parts = path[len(prefix) :].split(os.sep)
+            candidate: str | None = None
+            current = root
+            # The last part is the changed entry itself; it may be a chart dir.
+            for part in parts:
+                if not part or _is_hidden_dir_name(part) or part == _SUBCHART_DIR_NAME:
+                    break
+                current = os.path.join(current, part)
+                if current in known or _is_chart_dir(current):
+                    candidate = current
+            if candidate is not None:
+                changed.add(candidate)
+
+        if rescan:
+            changed.update(known)
+            for directory, files in _walk_dirs(root):
+                relative = os.path.relpath(directory, root).split(os.sep)
+                if _SUBCHART_DIR_NAME in relative:
+                    continue
+                if any(entry.name == "Chart.yaml" for entry in files):
+                    changed.add(directory)
+
+        with self._lock:
+            for directory in changed:
+                if _is_chart_dir(directory):
+                    self._known_chart_dirs.add(directory)
+                else:
+                    self._known_chart_dirs.discard(directory)
+        return frozenset(Path(directory) for directory in changed)
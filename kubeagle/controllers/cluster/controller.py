@@ -40,6 +40,8 @@ from kubeagle.controllers.cluster.parsers import (
     NodeParser,
     PodParser,
 )
+from kubeagle.controllers.cluster.release_index import HelmReleaseIndex
+from kubeagle.models.cache.cluster_join_index import ClusterJoinIndex
 from kubeagle.models.charts.chart_info import HelmReleaseInfo
 from kubeagle.models.core.node_info import NodeInfo, NodeResourceInfo
 from kubeagle.models.core.workload_info import SingleReplicaWorkloadInfo
@@ -53,7 +55,8 @@ from kubeagle.models.events.event_info import EventDetail
 from kubeagle.models.events.event_summary import EventSummary
 from kubeagle.models.pdb.pdb_info import PDBInfo
 from kubeagle.models.teams.distribution import PodDistributionInfo
-from kubeagle.utils.resource_parser import memory_str_to_bytes, parse_cpu
+from kubeagle.utils.quantity import parse_quantities
+from kubeagle.utils.resource_parser import memory_str_to_bytes, parse_cpu_millicores
 
 logger = logging.getLogger(__name__)
 
@@ -250,6 +253,8 @@ class ClusterController(BaseController):
         context: str | None = None,
         progressive_yield_interval: int = 2,
         progressive_parallelism: int = 2,
+        release_index: HelmReleaseIndex | None = None,
+        join_index: ClusterJoinIndex | None = None,
     ):
         """Initialize the cluster controller.
 
@@ -257,9 +262,16 @@ class ClusterController(BaseController):
             context: Optional Kubernetes context name.
             progressive_yield_interval: Yield to event loop every N completions.
             progressive_parallelism: Max concurrent namespace fetches.
+            release_index: Optional persistent index updated with every
+                Helm release listing.
+            join_index: Release/workload join index fed with fetched
+                releases and workloads; pass the shared one of the context
+                to make them visible to other screens.
         """
         super().__init__()
         self.context = context
+        self._release_index = release_index
+        self._join_index = join_index if join_index is not None else ClusterJoinIndex()
         self._progressive_yield_interval = max(1, progressive_yield_interval)
         self._progressive_parallelism = max(1, progressive_parallelism)
 
@@ -704,8 +716,8 @@ class ClusterController(BaseController):
         requests = resources.get("requests", {})
         limits = resources.get("limits", {})
 
-        cpu_req = parse_cpu(requests.get("cpu", "0")) * 1000
-        cpu_lim = parse_cpu(limits.get("cpu", "0")) * 1000
+        cpu_req = parse_cpu_millicores(requests.get("cpu", "0"))
+        cpu_lim = parse_cpu_millicores(limits.get("cpu", "0"))
         mem_req = memory_str_to_bytes(requests.get("memory", "0Ki"))
         mem_lim = memory_str_to_bytes(limits.get("memory", "0Ki"))
 
@@ -760,7 +772,7 @@ class ClusterController(BaseController):
         effective_mem_lim = max(init_mem_lim, pod_mem_lim + sidecar_mem_lim)
 
         if overhead := pod_spec.get("overhead"):
-            overhead_cpu = parse_cpu(overhead.get("cpu", "0")) * 1000
+            overhead_cpu = parse_cpu_millicores(overhead.get("cpu", "0"))
             overhead_mem = memory_str_to_bytes(overhead.get("memory", "0Ki"))
             effective_cpu_req += overhead_cpu
             effective_mem_req += overhead_mem
@@ -1253,18 +1265,6 @@ class ClusterController(BaseController):
             )
         return result
 
-    @staticmethod
-    def _build_helm_release_lookup(
-        releases: list[HelmReleaseInfo],
-    ) -> dict[tuple[str, str], str]:
-        """Map (namespace, release) -> chart label."""
-        lookup: dict[tuple[str, str], str] = {}
-        for release in releases:
-            key = (release.namespace, release.name)
-            chart_name = release.chart.split("-")[0] if release.chart else None
-            lookup[key] = chart_name or release.name
-        return lookup
-
     @classmethod
     def _coerce_int(cls, value: Any, default: int = 0) -> int:
         """Convert arbitrary value to int safely."""
@@ -1365,10 +1365,11 @@ class ClusterController(BaseController):
         if not isinstance(raw_containers, list):
             return 0.0, 0.0, 0.0, 0.0
 
-        cpu_request = 0.0
-        cpu_limit = 0.0
-        memory_request = 0.0
-        memory_limit = 0.0
+        # Raw quantities per column, parsed in one batch per column.
+        cpu_requests: list[object] = []
+        cpu_limits: list[object] = []
+        memory_requests: list[object] = []
+        memory_limits: list[object] = []
 
         for container in raw_containers:
             if not isinstance(container, dict):
@@ -1383,12 +1384,15 @@ class ClusterController(BaseController):
             requests_map = requests if isinstance(requests, dict) else {}
             limits_map = limits if isinstance(limits, dict) else {}
 
-            cpu_request += parse_cpu(str(requests_map.get("cpu", "") or "")) * 1000
-            cpu_limit += parse_cpu(str(limits_map.get("cpu", "") or "")) * 1000
-            memory_request += memory_str_to_bytes(
-                str(requests_map.get("memory", "") or "")
-            )
-            memory_limit += memory_str_to_bytes(str(limits_map.get("memory", "") or ""))
+            cpu_requests.append(requests_map.get("cpu"))
+            cpu_limits.append(limits_map.get("cpu"))
+            memory_requests.append(requests_map.get("memory"))
+            memory_limits.append(limits_map.get("memory"))
+
+        cpu_request = sum(value or 0.0 for value in parse_quantities(cpu_requests, "m"))
+        cpu_limit = sum(value or 0.0 for value in parse_quantities(cpu_limits, "m"))
+        memory_request = sum(value or 0.0 for value in parse_quantities(memory_requests))
+        memory_limit = sum(value or 0.0 for value in parse_quantities(memory_limits))
 
         return cpu_request, cpu_limit, memory_request, memory_limit
 
@@ -1529,7 +1533,7 @@ class ClusterController(BaseController):
     def _single_replica_from_workload(
         cls,
         item: dict[str, Any],
-        helm_lookup: dict[tuple[str, str], str],
+        join_index: ClusterJoinIndex,
     ) -> SingleReplicaWorkloadInfo | None:
         """Convert one Deployment/StatefulSet into single-replica workload row."""
         spec = item.get("spec", {})
@@ -1548,7 +1552,7 @@ class ClusterController(BaseController):
         helm_release = cls._helm_release_from_labels(labels)
         chart_name = None
         if helm_release and namespace not in cls._SYSTEM_NAMESPACES:
-            chart_name = helm_lookup.get((namespace, helm_release))
+            chart_name = join_index.release_chart_label(helm_release, namespace)
 
         ready = cls._coerce_int(status.get("readyReplicas"), 0)
         status_str = (
@@ -1678,12 +1682,15 @@ class ClusterController(BaseController):
         if not namespaces:
             releases = await self._cluster_fetcher.fetch_helm_releases()
             self._helm_releases_cache = list(releases)
+            self._join_index.replace_releases(releases)
+            await self._record_release_listing(releases)
             return releases
 
         semaphore = asyncio.Semaphore(self._progressive_parallelism)
         total = len(namespaces)
         completed = 0
         all_releases: list[HelmReleaseInfo] = []
+        listing_complete = True
 
         async def _fetch_namespace(
             namespace: str,
@@ -1707,13 +1714,17 @@ class ClusterController(BaseController):
                 namespace, namespace_releases, error = await future
                 completed += 1
                 if error is not None:
+                    listing_complete = False
                     logger.warning(
                         "Namespace Helm release fetch failed for %s: %s",
                         namespace,
                         error,
                     )
-                elif namespace_releases:
+                else:
                     all_releases.extend(namespace_releases)
+                    self._join_index.replace_releases(
+                        namespace_releases, namespace=namespace
+                    )
 
                 if on_namespace_loaded is not None:
                     with suppress(Exception):
@@ -1736,8 +1747,27 @@ class ClusterController(BaseController):
                 await asyncio.gather(*tasks, return_exceptions=True)
 
         self._helm_releases_cache = list(all_releases)
+        await self._record_release_listing(all_releases, complete=listing_complete)
         return all_releases
 
+    async def _record_release_listing(
+        self,
+        releases: list[HelmReleaseInfo],
+        *,
+        complete: bool = True,
+    ) -> None:
+        """Update the persistent release index with a Helm release listing."""
+        if self._release_index is None or not releases:
+            return
+        await asyncio.to_thread(self._release_index.load)
+        changed = self._release_index.record_listing(releases, complete=complete)
+        logger.debug(
+            "Helm release index: %d of %d release(s) new or upgraded",
+            len(changed),
+            len(releases),
+        )
+        await asyncio.to_thread(self._release_index.save)
+
     def _parse_workload_inventory_items(
         self,
         items: list[dict[str, Any]],
@@ -2919,6 +2949,7 @@ class ClusterController(BaseController):
                 {},
                 template_labels_by_key=template_labels_by_key,
             )
+            self._join_index.replace_workloads(rows)
             pdb_selectors_by_namespace: dict[str, list[dict[str, str]]] = {}
             try:
                 pdbs = await pdb_task
@@ -2981,8 +3012,11 @@ class ClusterController(BaseController):
                         namespace,
                         error,
                     )
-                elif namespace_rows:
+                else:
                     all_rows.extend(namespace_rows)
+                    self._join_index.replace_workloads(
+                        namespace_rows, namespace=namespace
+                    )
 
                 if on_namespace_loaded is not None:
                     with suppress(Exception):
@@ -3031,12 +3065,10 @@ class ClusterController(BaseController):
     ) -> list[SingleReplicaWorkloadInfo]:
         """Fetch single-replica workloads namespace-by-namespace."""
         namespaces = await self._list_cluster_namespaces()
-        releases = (
-            list(self._helm_releases_cache)
-            if self._helm_releases_cache
-            else await self._fetch_helm_releases_incremental()
-        )
-        helm_lookup = self._build_helm_release_lookup(releases)
+        # Release listings feed the join index that resolves workload charts.
+        if not self._helm_releases_cache:
+            await self._fetch_helm_releases_incremental()
+        join_index = self._join_index
 
         if not namespaces:
             workloads_output = await self._run_kubectl_cached(
@@ -3054,7 +3086,7 @@ class ClusterController(BaseController):
             data = json.loads(workloads_output)
             result: list[SingleReplicaWorkloadInfo] = []
             for item in data.get("items", []):
-                row = self._single_replica_from_workload(item, helm_lookup)
+                row = self._single_replica_from_workload(item, join_index)
                 if row is not None:
                     result.append(row)
             return result
@@ -3085,7 +3117,7 @@ class ClusterController(BaseController):
                     data = json.loads(output)
                     namespace_rows: list[SingleReplicaWorkloadInfo] = []
                     for item in data.get("items", []):
-                        row = self._single_replica_from_workload(item, helm_lookup)
+                        row = self._single_replica_from_workload(item, join_index)
                         if row is not None:
                             namespace_rows.append(row)
                     return namespace, namespace_rows, None
@@ -75,6 +75,8 @@ class ClusterFetcher:
                     version=r.get("version", ""),
                     app_version=r.get("app_version", ""),
                     status=r.get("status", ""),
+                    revision=str(r.get("revision", "")),
+                    updated=r.get("updated", ""),
                 )
                 for r in releases_data
             ]
@@ -107,6 +109,8 @@ class ClusterFetcher:
                     version=r.get("version", ""),
                     app_version=r.get("app_version", ""),
                     status=r.get("status", ""),
+                    revision=str(r.get("revision", "")),
+                    updated=r.get("updated", ""),
                 )
                 for r in releases_data
             ]
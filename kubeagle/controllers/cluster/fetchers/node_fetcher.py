@@ -9,7 +9,7 @@ from typing import Any
 from kubeagle.constants.enums import NodeStatus
 from kubeagle.constants.timeouts import CLUSTER_REQUEST_TIMEOUT
 from kubeagle.models.core.node_info import NodeInfo
-from kubeagle.utils.resource_parser import memory_str_to_bytes, parse_cpu
+from kubeagle.utils.resource_parser import memory_str_to_bytes, parse_cpu_millicores
 
 logger = logging.getLogger(__name__)
 
@@ -170,7 +170,7 @@ class NodeFetcher:
 
             # Parse capacity and allocatable
             allocatable = status.get("allocatable", {})
-            cpu_allocatable = parse_cpu(allocatable.get("cpu", "0")) * 1000
+            cpu_allocatable = parse_cpu_millicores(allocatable.get("cpu", "0"))
             memory_allocatable = memory_str_to_bytes(
                 allocatable.get("memory", "0Ki")
             )
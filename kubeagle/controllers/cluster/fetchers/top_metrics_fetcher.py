@@ -12,7 +12,7 @@ import logging
 from typing import Any
 
 from kubeagle.constants.timeouts import CLUSTER_REQUEST_TIMEOUT
-from kubeagle.utils.resource_parser import memory_str_to_bytes, parse_cpu
+from kubeagle.utils.resource_parser import memory_str_to_bytes, parse_cpu_millicores
 
 logger = logging.getLogger(__name__)
 
@@ -41,11 +41,11 @@ class TopMetricsFetcher:
 
     @staticmethod
     def _parse_cpu_mcores(cpu_value: str) -> float:
-        return parse_cpu(str(cpu_value or "").strip()) * 1000.0
+        return parse_cpu_millicores(cpu_value)
 
     @staticmethod
     def _parse_memory_bytes(memory_value: str) -> float:
-        return memory_str_to_bytes(str(memory_value or "").strip())
+        return memory_str_to_bytes(memory_value)
 
     @staticmethod
     def _build_top_node_args(request_timeout: str) -> tuple[str, ...]:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from kubeagle.constants.enums import NodeStatus
 from kubeagle.models.core.node_info import NodeResourceInfo
-from kubeagle.utils.resource_parser import memory_str_to_bytes, parse_cpu
+from kubeagle.utils.resource_parser import memory_str_to_bytes, parse_cpu_millicores
 
 
 class NodeParser:
@@ -81,7 +81,7 @@ class NodeParser:
 
         # Allocatable resources
         allocatable = status.get("allocatable", {})
-        cpu_allocatable = parse_cpu(allocatable.get("cpu", "0")) * 1000  # millicores
+        cpu_allocatable = parse_cpu_millicores(allocatable.get("cpu", "0"))  # millicores
         memory_allocatable = memory_str_to_bytes(allocatable.get("memory", "0Ki"))
 
         # Max pods
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from kubeagle.models.teams.distribution import PodDistributionInfo
-from kubeagle.utils.resource_parser import memory_str_to_bytes, parse_cpu
+from kubeagle.utils.resource_parser import memory_str_to_bytes, parse_cpu_millicores
 
 
 class PodParser:
@@ -188,9 +188,9 @@ class PodParser:
                 cpu_limit_str = limits.get("cpu", "0")
                 mem_limit_str = limits.get("memory", "0Ki")
 
-                node_cpu_request_total += parse_cpu(cpu_str) * 1000
+                node_cpu_request_total += parse_cpu_millicores(cpu_str)
                 node_mem_request_total += memory_str_to_bytes(mem_str)
-                node_cpu_limit_total += parse_cpu(cpu_limit_str) * 1000
+                node_cpu_limit_total += parse_cpu_millicores(cpu_limit_str)
                 node_mem_limit_total += memory_str_to_bytes(mem_limit_str)
 
             if node_cpu_request_total > 0:
@@ -0,0 +1,380 @@
+"""Persistent per-context index of Helm releases and their analyzed charts.
+
+Cluster-values mode runs ``helm get values`` and re-analyzes every release
+on each refresh, although most releases have not changed since the previous
+one. The index stores, per kube context, each release's name, namespace,
+revision, chart (name and version) and last-updated timestamp, together with
+the ``ChartInfo`` rows produced for that revision. A release whose revision
+is unchanged reuses its rows; any other release is fetched and analyzed
+again.
+
+Revisions restart at 1 in every cluster, so the index is keyed by cluster
+identity (the resolved kube context and its API server URL), not by the
+``--context`` option, and each entry records the identity it was built in.
+Rows are also tied to the CODEOWNERS file that assigned their teams, and a
+release whose values could not be fetched is never stored. Releases whose
+revision or cluster is unknown are never served from the index.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import subprocess
+import tempfile
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypedDict
+
+from pydantic import ValidationError
+
+from kubeagle.models.charts.chart_info import ChartInfo, HelmReleaseInfo
+from kubeagle.models.state.app_settings import ConfigError
+from kubeagle.models.state.config_manager import ConfigManager
+
+logger = logging.getLogger(__name__)
+
+# Bump when ChartInfo analysis of live values changes, to drop stale rows.
+_INDEX_SCHEMA_VERSION = 3
+
+_INDEX_DIR_NAME = "release-index"
+
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+_ReleaseKey = tuple[str, str]
+
+
+@dataclass(slots=True)
+class ReleaseIndexEntry:
+    """One release as last seen by ``helm list``."""
+
+    name: str
+    namespace: str
+    revision: str = ""
+    chart: str = ""
+    updated: str = ""
+    charts: list[dict[str, Any]] | None = None
+    # CODEOWNERS file (resolved path, "" for none) the charts were analyzed with.
+    codeowners: str = ""
+    # Cluster identity (see ``resolve_cluster_identity``) of the release.
+    cluster: str = ""
+
+
+class _ReleaseFields(TypedDict):
+    name: str
+    namespace: str
+    revision: str
+    chart: str
+    updated: str
+
+
+def _release_fields(release: HelmReleaseInfo | Mapping[str, Any]) -> _ReleaseFields:
+    if isinstance(release, HelmReleaseInfo):
+        return {
+            "name": release.name,
+            "namespace": release.namespace,
+            "revision": release.revision,
+            "chart": release.chart,
+            "updated": release.updated,
+        }
+    return {
+        "name": str(release.get("name") or ""),
+        "namespace": str(release.get("namespace") or ""),
+        "revision": str(release.get("revision") or ""),
+        "chart": str(release.get("chart") or ""),
+        "updated": str(release.get("updated") or ""),
+    }
+
+
+def resolve_cluster_identity(context: str | None, timeout_seconds: int = 8) -> str:
+    """Return ``<context>@<API server URL>`` for ``context``, or "" if unknown.
+
+    ``None`` resolves kubectl's current context. This performs a blocking
+    subprocess call; call it from a worker thread.
+    """
+    cmd = ["kubectl", "config", "view", "--minify", "-o", "json"]
+    if context:
+        cmd.extend(["--context", context])
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=max(1, timeout_seconds),
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+    if result.returncode != 0:
+        return ""
+    try:
+        config = json.loads(result.stdout or "{}")
+    except ValueError:
+        return ""
+    if not isinstance(config, dict):
+        return ""
+    name = context or str(config.get("current-context") or "")
+    clusters = config.get("clusters")
+    server = ""
+    if isinstance(clusters, list) and clusters and isinstance(clusters[0], dict):
+        cluster = clusters[0].get("cluster")
+        if isinstance(cluster, dict):
+            server = str(cluster.get("server") or "")
+    return f"{name}@{server}" if name and server else ""
+
+
+def release_index_path(cluster: str) -> Path:
+    """File holding the index of the cluster identified by ``cluster``."""
+    context, _, server = cluster.rpartition("@")
+    server_hash = hashlib.sha256(server.encode("utf-8")).hexdigest()[:12]
+    filename = f"{_UNSAFE_FILENAME_CHARS.sub('_', context or 'default')}-{server_hash}.json"
+    try:
+        return ConfigManager.get_config_dir() / _INDEX_DIR_NAME / filename
+    except ConfigError:
+        return Path(tempfile.gettempdir()) / f"kubeagle-{_INDEX_DIR_NAME}" / filename
+
+
+class HelmReleaseIndex:
+    """Release metadata and analyzed charts of one cluster, saved as JSON.
+
+    The cluster is resolved by ``load()``, which async callers run in a
+    thread before using the index. Until it resolves, or if kubectl cannot
+    identify the cluster, nothing is read, served or saved.
+
+    Args:
+        path: Index file; derived from the cluster identity when None.
+        cluster: Fixed cluster identity; resolved from ``context`` on every
+            ``load()`` when None, so a kube context switch is noticed.
+        context: Kube context to resolve (None: kubectl's current one).
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        cluster: str | None = None,
+        *,
+        context: str | None = None,
+    ) -> None:
+        self._fixed_path = path
+        self.path = path
+        self._fixed_cluster = cluster
+        self._context = context
+        self.cluster = cluster or ""
+        self._entries: dict[_ReleaseKey, ReleaseIndexEntry] | None = None
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def _loaded(self) -> dict[_ReleaseKey, ReleaseIndexEntry]:
+        if self._entries is not None:
+            return self._entries
+        entries: dict[_ReleaseKey, ReleaseIndexEntry] = {}
+        if not self.cluster or self.path is None:
+            self._entries = entries
+            return entries
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                document = json.load(handle)
+        except FileNotFoundError:
+            document = None
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable Helm release index %s", self.path)
+            document = None
+        if (
+            isinstance(document, dict)
+            and document.get("schema_version") == _INDEX_SCHEMA_VERSION
+        ):
+            for item in document.get("releases", []):
+                try:
+                    entry = ReleaseIndexEntry(**item)
+                except TypeError:
+                    continue
+                if entry.cluster != self.cluster:
+                    continue
+                entries[(entry.namespace, entry.name)] = entry
+        self._entries = entries
+        return entries
+
+    def load(self) -> None:
+        """Resolve the cluster and read its index file.
+
+        Blocking (kubectl and file I/O), so async callers use a thread. A
+        changed cluster identity switches to that cluster's index.
+        """
+        cluster = (
+            self._fixed_cluster
+            if self._fixed_cluster is not None
+            else resolve_cluster_identity(self._context)
+        )
+        with self._lock:
+            if cluster != self.cluster or self._entries is None:
+                self.cluster = cluster
+                self.path = self._fixed_path or (
+                    release_index_path(cluster) if cluster else None
+                )
+                self._entries = None
+                self._dirty = False
+            self._loaded()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._loaded())
+
+    def get(self, namespace: str, name: str) -> ReleaseIndexEntry | None:
+        """Return the indexed entry of a release."""
+        with self._lock:
+            return self._loaded().get((namespace, name))
+
+    def record_listing(
+        self,
+        releases: Iterable[HelmReleaseInfo | Mapping[str, Any]],
+        *,
+        complete: bool = False,
+    ) -> list[_ReleaseKey]:
+        """Update release metadata from a ``helm list`` result.
+
+        Args:
+            releases: Listed releases.
+            complete: Whether the listing covers every namespace; releases
+                missing from a complete listing are dropped.
+
+        Returns:
+            (namespace, name) of releases that are new or changed revision.
+        """
+        changed: list[_ReleaseKey] = []
+        seen: set[_ReleaseKey] = set()
+        with self._lock:
+            entries = self._loaded()
+            for release in releases:
+                fields = _release_fields(release)
+                if not fields["name"] or not fields["namespace"]:
+                    continue
+                key = (fields["namespace"], fields["name"])
+                seen.add(key)
+                entry = entries.get(key)
+                if entry is None or entry.revision != fields["revision"] or not fields["revision"]:
+                    changed.append(key)
+                    entries[key] = ReleaseIndexEntry(**fields, cluster=self.cluster)
+                    self._dirty = True
+                    continue
+                if entry.chart != fields["chart"] or entry.updated != fields["updated"]:
+                    entry.chart = fields["chart"]
+                    entry.updated = fields["updated"]
+                    self._dirty = True
+            if complete:
+                for key in [key for key in entries if key not in seen]:
+                    del entries[key]
+                    self._dirty = True
+        return changed
+
+    def cached_charts(
+        self, namespace: str, name: str, revision: str, codeowners: str = ""
+    ) -> list[ChartInfo] | None:
+        """Charts analyzed for ``revision`` of a release, or None if stale/unknown."""
+        if not revision:
+            return None
+        with self._lock:
+            entry = self._loaded().get((namespace, name))
+            payloads = (
+                entry.charts
+                if (
+                    entry is not None
+                    and self.cluster
+                    and entry.cluster == self.cluster
+                    and entry.revision == revision
+                    and entry.codeowners == codeowners
+                )
+                else None
+            )
+            if payloads is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        try:
+            return [ChartInfo.model_validate(payload) for payload in payloads]
+        except ValidationError:
+            return None
+
+    def store_charts(
+        self,
+        namespace: str,
+        name: str,
+        revision: str,
+        charts: Iterable[ChartInfo],
+        codeowners: str = "",
+    ) -> None:
+        """Remember the charts analyzed for ``revision`` of a release.
+
+        Raw deployed values (which may hold secrets) are not stored; they
+        are fetched again when a chart's values are viewed.
+        """
+        if not revision:
+            return
+        payloads = [
+            chart.model_dump(mode="json", exclude={"deployed_values_content"})
+            for chart in charts
+        ]
+        with self._lock:
+            if not self.cluster:
+                return
+            entries = self._loaded()
+            entry = entries.get((namespace, name))
+            if entry is None or entry.revision != revision:
+                entry = ReleaseIndexEntry(name=name, namespace=namespace, revision=revision)
+                entries[(namespace, name)] = entry
+            entry.charts = payloads
+            entry.codeowners = codeowners
+            entry.cluster = self.cluster
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the index if it changed since it was loaded or last saved."""
+        with self._lock:
+            if not self._dirty or self._entries is None or self.path is None:
+                return
+            path = self.path
+            document = {
+                "schema_version": _INDEX_SCHEMA_VERSION,
+                "releases": [
+                    {
+                        "name": entry.name,
+                        "namespace": entry.namespace,
+                        "revision": entry.revision,
+                        "chart": entry.chart,
+                        "updated": entry.updated,
+                        "charts": entry.charts,
+                        "codeowners": entry.codeowners,
+                        "cluster": entry.cluster,
+                    }
+                    for _, entry in sorted(self._entries.items())
+                ],
+            }
+            self._dirty = False
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(document, handle)
+            os.replace(tmp_name, path)
+        except OSError:
+            logger.warning("Failed to save Helm release index %s", path, exc_info=True)
+
+
+_indexes: dict[str, HelmReleaseIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_release_index(context: str | None) -> HelmReleaseIndex:
+    """Return the process-wide release index of ``context`` (None: current)."""
+    key = context or ""
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = HelmReleaseIndex(context=context)
+            _indexes[key] = index
+        return index
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+import os
 import threading
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from kubeagle.constants.patterns import (
-    EMAIL_TEAM_PATTERN,
-    GITHUB_TEAM_PATTERN,
-    TEAM_PATTERN,
+from kubeagle.controllers.team.parsers.codeowners_parser import (
+    CodeownersFile,
+    build_ownership,
+    load_codeowners_file,
 )
 from kubeagle.models.teams.team_info import TeamInfo
 
@@ -19,7 +21,17 @@ from kubeagle.models.teams.team_info import TeamInfo
 class TeamMapper:
     """Map chart directories to teams using CODEOWNERS file."""
 
-    __slots__ = ("_codeowners_path", "_load_lock", "_loaded", "team_mapping", "teams")
+    __slots__ = (
+        "_codeowners",
+        "_codeowners_path",
+        "_load_lock",
+        "_loaded",
+        "_rule_teams",
+        "_siblings_cache",
+        "_values_team_cache",
+        "team_mapping",
+        "teams",
+    )
     _VALUES_FILE_CANDIDATES = (
         "values-automation.yaml",
         "values.yaml",
@@ -42,6 +54,12 @@ class TeamMapper:
         self._codeowners_path = codeowners_path
         self._loaded = False
         self._load_lock = threading.Lock()
+        self._codeowners: CodeownersFile | None = None
+        self._rule_teams: list[str] = []
+        # Filesystem lookups memoized by mtime: sibling charts per parent
+        # directory and the team found in each values file.
+        self._siblings_cache: dict[str, tuple[int, tuple[Path, ...]]] = {}
+        self._values_team_cache: dict[str, tuple[tuple[int, int], str | None]] = {}
 
     def _ensure_loaded(self) -> None:
         """Ensure data is loaded (sync fallback for non-async contexts).
@@ -71,105 +89,26 @@ class TeamMapper:
         """Load and parse a CODEOWNERS file."""
         self.teams = []
         self.team_mapping = {}
+        self._codeowners = None
+        self._rule_teams = []
         self._parse_codeowners(codeowners_path)
 
     def _parse_codeowners(self, path: Path) -> None:
         """Parse CODEOWNERS file to extract team mappings."""
-        if not path.exists():
+        codeowners = load_codeowners_file(path)
+        if codeowners is None:
             return
 
-        try:
-            with open(path, encoding="utf-8") as f:
-                current_team = "Unknown"
-                current_team_ref: str | None = None
-                current_owners: list[str] = []
-
-                for raw_line in f:
-                    line = raw_line.strip()
-
-                    if not line:
-                        continue
-
-                    if line.startswith("#"):
-                        if "=======" in line:
-                            continue
-
-                        match = TEAM_PATTERN.search(line)
-                        if match:
-                            team_name = match.group(1)
-                            current_team = self._normalize_team_name(team_name)
-                            current_team_ref = team_name
-                            current_owners = self._extract_owners_from_line(line)
-                        else:
-                            github_match = GITHUB_TEAM_PATTERN.search(line)
-                            if github_match:
-                                team_name = github_match.group(1)
-                                if "/" in team_name:
-                                    current_team = self._normalize_team_name(
-                                        team_name.split("/")[-1]
-                                    )
-                                    current_team_ref = team_name
-                                else:
-                                    current_team = self._normalize_team_name(team_name)
-                                    current_team_ref = team_name
-                        continue
-
-                    parts = line.split()
-
-                    if not parts:
-                        continue
-
-                    path_pattern = parts[0]
-
-                    if path_pattern.startswith("^"):
-                        continue
-
-                    line_owners = self._extract_owners_from_line(" ".join(parts[1:]))
-
-                    if current_team == "Unknown" and line_owners:
-                        current_team = self._extract_team_from_owner(line_owners[0])
-
-                    normalized_pattern = path_pattern.lstrip("/")
-
-                    if "**" in normalized_pattern:
-                        normalized_pattern = normalized_pattern.split("**/")[-1]
-
-                    team_info = TeamInfo(
-                        name=current_team,
-                        pattern=normalized_pattern,
-                        owners=line_owners or current_owners,
-                        team_ref=current_team_ref,
-                    )
-                    self.teams.append(team_info)
-
-                    if normalized_pattern.endswith("/"):
-                        dir_name = normalized_pattern.rstrip("/")
-                        self.team_mapping[dir_name] = current_team
-                    elif "*" in normalized_pattern:
-                        prefix = normalized_pattern.rstrip("*")
-                        if prefix:
-                            self.team_mapping[prefix] = current_team
-                    else:
-                        self.team_mapping[normalized_pattern] = current_team
-
-        except OSError:
-            return
-
-    def _extract_owners_from_line(self, line: str) -> list[str]:
-        """Extract owner references from a line."""
-        owners: list[str] = []
-
-        for match in GITHUB_TEAM_PATTERN.finditer(line):
-            owner = match.group(0)
-            if owner not in owners:
-                owners.append(owner)
-
-        for match in EMAIL_TEAM_PATTERN.finditer(line):
-            owner = match.group(1)
-            if owner not in owners:
-                owners.append(owner)
-
-        return owners
+        ownership = build_ownership(
+            codeowners,
+            header_team=self._normalize_team_name,
+            github_team=lambda team: self._normalize_team_name(team.split("/")[-1]),
+            owner_team=self._extract_team_from_owner,
+        )
+        self.teams.extend(ownership.teams)
+        self.team_mapping.update(ownership.team_mapping)
+        self._codeowners = codeowners
+        self._rule_teams = ownership.rule_teams
 
     def _normalize_name(self, name: str) -> str:
         """Normalize a name for consistent display.
@@ -208,41 +147,51 @@ class TeamMapper:
     def get_team_for_path(self, chart_path: Path) -> str | None:
         """Get team name for a chart path.
 
-        Checks chart name first, then parent directory names to support
-        CODEOWNERS directory-level patterns like ``/mobile/`` covering all
-        nested charts under that directory.
+        An explicit mapping for the chart name wins, then the last CODEOWNERS
+        rule owning the chart directory (gitignore-style globs). Charts outside
+        the CODEOWNERS root fall back to the longest mapped prefix of the chart
+        name and to parent directory names, so directory-level patterns like
+        ``/mobile/`` still cover nested charts.
         """
         self._ensure_loaded()
         chart_name = chart_path.name
+        team_mapping = self.team_mapping
+
+        team = team_mapping.get(chart_name)
+        if team is not None:
+            return team
+
+        codeowners = self._codeowners
+        if codeowners is not None:
+            rule_index = codeowners.match_rule(chart_path)
+            if rule_index is not None:
+                return self._rule_teams[rule_index]
+
+        # Longest mapped prefix of the chart name, probed by length instead of
+        # scanning every pattern.
+        for length in range(len(chart_name) - 1, 0, -1):
+            team = team_mapping.get(chart_name[:length])
+            if team is not None:
+                return team
 
-        if chart_name in self.team_mapping:
-            return self.team_mapping[chart_name]
-
-        best_match: str | None = None
-        best_match_length = 0
-
-        for pattern, team in self.team_mapping.items():
-            if chart_name.startswith(pattern):
-                match_length = len(pattern)
-                if match_length > best_match_length:
-                    best_match = team
-                    best_match_length = match_length
-
-        if best_match is not None:
-            return best_match
-
-        # Check parent directory names against directory-level CODEOWNERS
-        # patterns.  This handles nested charts like ``mobile/aconsumer``
-        # where ``/mobile/`` is mapped to "Mobile" in CODEOWNERS.
         for parent in chart_path.parents:
             parent_name = parent.name
             if not parent_name:
                 break
-            if parent_name in self.team_mapping:
-                return self.team_mapping[parent_name]
+            if parent_name in team_mapping:
+                return team_mapping[parent_name]
 
         return None
 
+    def resolve_teams(self, chart_paths: Iterable[Path]) -> dict[Path, str | None]:
+        """Resolve CODEOWNERS teams for many chart directories in one pass.
+
+        Matches are memoized per repository-relative path, so later per-chart
+        lookups from worker threads are dictionary hits.
+        """
+        self._ensure_loaded()
+        return {chart_path: self.get_team_for_path(chart_path) for chart_path in chart_paths}
+
     def get_team(self, chart_name: str) -> str:
         """Get team name for a chart by name."""
         self._ensure_loaded()
@@ -336,7 +285,9 @@ class TeamMapper:
 
         for filename in self._VALUES_FILE_CANDIDATES:
             candidate = chart_path / filename
-            if not candidate.exists():
+            try:
+                stat = candidate.stat()
+            except OSError:
                 continue
 
             try:
@@ -347,30 +298,39 @@ class TeamMapper:
             if skip_target is not None and candidate_resolved == skip_target:
                 continue
 
-            try:
-                with open(candidate, encoding="utf-8") as handle:
-                    parsed = yaml.safe_load(handle)
-            except (OSError, yaml.YAMLError):
-                continue
-
-            team = self._extract_team_from_values_dict(parsed)
+            team = self._read_values_file_team(candidate, (stat.st_mtime_ns, stat.st_size))
             if team is not None:
                 return team
 
         return None
 
+    def _read_values_file_team(
+        self,
+        values_file: Path,
+        signature: tuple[int, int],
+    ) -> str | None:
+        """Return the team set in a values file, memoized by mtime and size."""
+        key = str(values_file)
+        cached = self._values_team_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        try:
+            with open(values_file, encoding="utf-8") as handle:
+                parsed = yaml.safe_load(handle)
+        except (OSError, yaml.YAMLError):
+            parsed = None
+
+        team = self._extract_team_from_values_dict(parsed)
+        self._values_team_cache[key] = (signature, team)
+        return team
+
     def _infer_team_from_siblings(self, chart_path: Path) -> str | None:
         """Infer team from same-level chart siblings when they are unanimous."""
-        parent_dir = chart_path.parent
-        if not parent_dir.exists() or not parent_dir.is_dir():
-            return None
-
         inferred_teams: set[str] = set()
 
-        for sibling in sorted(parent_dir.iterdir()):
-            if sibling == chart_path or not sibling.is_dir():
-                continue
-            if not (sibling / "Chart.yaml").exists():
+        for sibling in self._chart_siblings(chart_path.parent):
+            if sibling == chart_path:
                 continue
 
             sibling_team = self._resolve_sibling_team(sibling)
@@ -385,6 +345,30 @@ class TeamMapper:
             return next(iter(inferred_teams))
         return None
 
+    def _chart_siblings(self, parent_dir: Path) -> tuple[Path, ...]:
+        """Return chart directories directly under ``parent_dir``, memoized by mtime."""
+        key = str(parent_dir)
+        try:
+            mtime_ns = parent_dir.stat().st_mtime_ns
+        except OSError:
+            return ()
+        cached = self._siblings_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        siblings: list[Path] = []
+        try:
+            with os.scandir(parent_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir() and os.path.exists(os.path.join(entry.path, "Chart.yaml")):
+                        siblings.append(parent_dir / entry.name)
+        except OSError:
+            return ()
+
+        result = tuple(sorted(siblings))
+        self._siblings_cache[key] = (mtime_ns, result)
+        return result
+
     def _resolve_sibling_team(self, sibling_path: Path) -> str | None:
         """Resolve a sibling chart team from CODEOWNERS first, then values files."""
         sibling_mapped = self.get_team_for_path(sibling_path)
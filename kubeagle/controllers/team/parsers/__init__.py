@@ -1,5 +1,10 @@
 """Init file for team parsers."""
 
+from kubeagle.controllers.team.parsers.codeowners_parser import (
+    CodeownersFile,
+    CodeownersMatcher,
+    load_codeowners_file,
+)
 from kubeagle.controllers.team.parsers.team_parser import TeamParser
 
-__all__ = ["TeamParser"]
+__all__ = ["CodeownersFile", "CodeownersMatcher", "TeamParser", "load_codeowners_file"]
@@ -0,0 +1,392 @@
+"""Parsed and compiled CODEOWNERS files shared by the team fetcher and mapper.
+
+A CODEOWNERS file is read once per ``(path, mtime)`` into header and rule
+entries. Rules are compiled into a matcher with gitignore-style globs
+(``*``, ``?``, ``[...]``, ``**``, anchored ``/pattern`` and directory
+``pattern/``) where the last matching rule wins, as on GitHub. Anchored
+rules sit in a path trie keyed by their literal leading segments and
+unanchored literal rules in a name index, so a chart path is only tested
+against the rules that can possibly match it.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+
+from kubeagle.constants.patterns import (
+    EMAIL_TEAM_PATTERN,
+    GITHUB_TEAM_PATTERN,
+    TEAM_PATTERN,
+)
+from kubeagle.models.teams.team_info import TeamInfo
+
+# Directories GitHub/GitLab look in for CODEOWNERS besides the repo root.
+_CODEOWNERS_SUBDIRS = frozenset({".github", ".gitlab", "docs"})
+_GLOB_CHARS = frozenset("*?[")
+_MATCH_CACHE_LIMIT = 65536
+
+
+@dataclass(frozen=True, slots=True)
+class CodeownersHeader:
+    """A team header comment.
+
+    Attributes:
+        team: Raw team name (``TEAM:`` name or ``@org/team`` mention).
+        owners: Owners listed in the comment (``TEAM:`` headers only).
+        github: Whether the team came from an ``@org/team`` mention.
+    """
+
+    team: str
+    owners: tuple[str, ...] = ()
+    github: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class CodeownersRule:
+    """A path pattern line with its owners."""
+
+    pattern: str
+    owners: tuple[str, ...]
+
+
+def extract_owners(line: str) -> list[str]:
+    """Extract ``@team`` mentions and e-mail owners from a line, in order."""
+    owners: list[str] = []
+
+    for match in GITHUB_TEAM_PATTERN.finditer(line):
+        owner = match.group(0)
+        if owner not in owners:
+            owners.append(owner)
+
+    for match in EMAIL_TEAM_PATTERN.finditer(line):
+        owner = match.group(1)
+        if owner not in owners:
+            owners.append(owner)
+
+    return owners
+
+
+def _translate_glob(body: str) -> str:
+    """Translate a gitignore-style glob (without anchoring slashes) to a regex."""
+    parts: list[str] = []
+    index = 0
+    length = len(body)
+    while index < length:
+        char = body[index]
+        if char == "*":
+            if body.startswith("**", index):
+                index += 2
+                if index < length and body[index] == "/":
+                    parts.append("(?:.*/)?")
+                    index += 1
+                else:
+                    parts.append(".*")
+                continue
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            end = body.find("]", index + 2 if body.startswith("[!", index) else index + 1)
+            if end < 0:
+                parts.append(re.escape(char))
+            else:
+                inner = body[index + 1 : end].replace("\\", "\\\\")
+                if inner.startswith("!"):
+                    inner = "^" + inner[1:]
+                parts.append(f"[{inner}]")
+                index = end
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return "".join(parts)
+
+
+@dataclass(slots=True)
+class _TrieNode:
+    children: dict[str, _TrieNode] = field(default_factory=dict)
+    rules: list[int] = field(default_factory=list)
+
+
+class CodeownersMatcher:
+    """Resolve the owning rule of repository paths with last-match-wins.
+
+    A rule owns a path when it matches the path itself or one of its parent
+    directories, mirroring how gitignore patterns apply to directory trees.
+    """
+
+    __slots__ = ("_cache", "_floating", "_names", "_regexes", "_root")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._root = _TrieNode()
+        self._names: dict[str, list[int]] = {}
+        self._floating: list[int] = []
+        self._regexes: list[re.Pattern[str] | None] = []
+        self._cache: dict[str, int | None] = {}
+        for index, pattern in enumerate(patterns):
+            self._regexes.append(self._compile(index, pattern))
+
+    def _compile(self, index: int, pattern: str) -> re.Pattern[str] | None:
+        body = pattern.strip()
+        if not body or body.startswith(("^", "!", "#")):
+            return None
+        anchored = body.startswith("/")
+        body = body.strip("/")
+        if not body:
+            # A bare "/" owns the whole repository.
+            self._root.rules.append(index)
+            return re.compile(".*", re.DOTALL)
+        if body.startswith("**/"):
+            body = body[3:]
+            anchored = False
+        elif "/" in body:
+            anchored = True
+
+        segments = body.split("/")
+        if anchored:
+            node = self._root
+            for segment in segments:
+                if _GLOB_CHARS.intersection(segment):
+                    break
+                node = node.children.setdefault(segment, _TrieNode())
+            node.rules.append(index)
+            prefix = ""
+        else:
+            if len(segments) == 1 and not _GLOB_CHARS.intersection(body):
+                self._names.setdefault(body, []).append(index)
+            else:
+                self._floating.append(index)
+            prefix = "(?:.*/)?"
+        return re.compile(f"{prefix}{_translate_glob(body)}(?:/.*)?", re.DOTALL)
+
+    def match(self, relative_path: str) -> int | None:
+        """Return the index of the last rule owning ``relative_path``.
+
+        Args:
+            relative_path: ``/``-separated path relative to the repository root.
+        """
+        key = relative_path.strip("/")
+        if key in self._cache:
+            return self._cache[key]
+
+        segments = key.split("/") if key else []
+        candidates: list[int] = list(self._floating)
+        node: _TrieNode | None = self._root
+        for segment in segments:
+            if node is not None:
+                candidates.extend(node.rules)
+                node = node.children.get(segment)
+            named = self._names.get(segment)
+            if named:
+                candidates.extend(named)
+        if node is not None:
+            candidates.extend(node.rules)
+
+        result: int | None = None
+        for index in sorted(set(candidates), reverse=True):
+            regex = self._regexes[index]
+            if regex is not None and regex.fullmatch(key):
+                result = index
+                break
+
+        if len(self._cache) >= _MATCH_CACHE_LIMIT:
+            self._cache.clear()
+        self._cache[key] = result
+        return result
+
+
+@dataclass(frozen=True, slots=True)
+class CodeownersFile:
+    """A parsed CODEOWNERS file.
+
+    Attributes:
+        root: Repository root the patterns are relative to.
+        entries: Header comments and rules in file order.
+        rules: Rules only, in file order (indices used by ``matcher``).
+        matcher: Compiled matcher over ``rules``.
+    """
+
+    root: Path
+    entries: tuple[CodeownersHeader | CodeownersRule, ...]
+    rules: tuple[CodeownersRule, ...]
+    matcher: CodeownersMatcher
+
+    def relative_path(self, path: Path) -> str | None:
+        """Return ``path`` relative to ``root`` in ``/`` form, or None if outside."""
+        try:
+            relative = path.relative_to(self.root)
+        except ValueError:
+            try:
+                relative = path.resolve().relative_to(self.root)
+            except (OSError, ValueError):
+                return None
+        return PurePosixPath(*relative.parts).as_posix() if relative.parts else ""
+
+    def match_rule(self, path: Path) -> int | None:
+        """Return the index in ``rules`` of the rule owning ``path``."""
+        relative = self.relative_path(path)
+        if relative is None:
+            return None
+        return self.matcher.match(relative)
+
+
+@dataclass(slots=True)
+class CodeownersOwnership:
+    """Team view of a CODEOWNERS file for one team-name normalization.
+
+    Attributes:
+        teams: One entry per rule, in file order.
+        team_mapping: Legacy name/prefix pattern to team mapping.
+        rule_teams: Team of each rule, aligned with ``CodeownersFile.rules``.
+    """
+
+    teams: list[TeamInfo]
+    team_mapping: dict[str, str]
+    rule_teams: list[str]
+
+
+def _codeowners_root(path: Path) -> Path:
+    parent = path.parent
+    if parent.name in _CODEOWNERS_SUBDIRS:
+        return parent.parent
+    return parent
+
+
+def _parse_entries(path: Path) -> list[CodeownersHeader | CodeownersRule]:
+    entries: list[CodeownersHeader | CodeownersRule] = []
+    with open(path, encoding="utf-8") as handle:
+        for raw_line in handle:
+            line = raw_line.strip()
+            if not line:
+                continue
+
+            if line.startswith("#"):
+                if "=======" in line:
+                    continue
+                match = TEAM_PATTERN.search(line)
+                if match:
+                    entries.append(
+                        CodeownersHeader(match.group(1), tuple(extract_owners(line)))
+                    )
+                    continue
+                github_match = GITHUB_TEAM_PATTERN.search(line)
+                if github_match:
+                    entries.append(CodeownersHeader(github_match.group(1), github=True))
+                continue
+
+            parts = line.split()
+            if parts[0].startswith("^"):
+                # Section headers (GitLab) and regex-style lines are not paths.
+                continue
+            entries.append(
+                CodeownersRule(parts[0], tuple(extract_owners(" ".join(parts[1:]))))
+            )
+    return entries
+
+
+_FILE_CACHE: dict[str, tuple[tuple[int, int], CodeownersFile]] = {}
+_FILE_CACHE_LOCK = threading.Lock()
+
+
+def load_codeowners_file(path: Path) -> CodeownersFile | None:
+    """Parse and compile a CODEOWNERS file, cached by its mtime and size.
+
+    Returns:
+        The parsed file, or None if it does not exist or cannot be read.
+    """
+    try:
+        stat = path.stat()
+        resolved = path.resolve()
+    except OSError:
+        return None
+    key = str(resolved)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _FILE_CACHE_LOCK:
+        cached = _FILE_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
+        entries = _parse_entries(resolved)
+    except (OSError, UnicodeDecodeError):
+        return None
+    rules = tuple(entry for entry in entries if isinstance(entry, CodeownersRule))
+    parsed = CodeownersFile(
+        root=_codeowners_root(resolved),
+        entries=tuple(entries),
+        rules=rules,
+        matcher=CodeownersMatcher(rule.pattern for rule in rules),
+    )
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE[key] = (signature, parsed)
+    return parsed
+
+
+def build_ownership(
+    codeowners: CodeownersFile,
+    *,
+    header_team: Callable[[str], str],
+    github_team: Callable[[str], str],
+    owner_team: Callable[[str], str],
+) -> CodeownersOwnership:
+    """Assign a team to every rule of ``codeowners``.
+
+    A ``TEAM:`` header or ``@org/team`` header comment names the team of the
+    rules that follow it; before any header the first owner of a rule names
+    it. Legacy ``team_mapping`` keys strip leading ``/``, everything up to the
+    last ``**/``, trailing ``/`` and trailing ``*``.
+
+    Args:
+        codeowners: Parsed CODEOWNERS file.
+        header_team: Display name for a ``TEAM:`` header name.
+        github_team: Display name for an ``@org/team`` header mention.
+        owner_team: Display name derived from a rule's first owner.
+    """
+    teams: list[TeamInfo] = []
+    team_mapping: dict[str, str] = {}
+    rule_teams: list[str] = []
+    current_team = "Unknown"
+    current_team_ref: str | None = None
+    current_owners: list[str] = []
+
+    for entry in codeowners.entries:
+        if isinstance(entry, CodeownersHeader):
+            current_team_ref = entry.team
+            if entry.github:
+                current_team = github_team(entry.team)
+            else:
+                current_team = header_team(entry.team)
+                current_owners = list(entry.owners)
+            continue
+
+        line_owners = list(entry.owners)
+        if current_team == "Unknown" and line_owners:
+            current_team = owner_team(line_owners[0])
+
+        normalized_pattern = entry.pattern.lstrip("/")
+        if "**" in normalized_pattern:
+            normalized_pattern = normalized_pattern.split("**/")[-1]
+
+        teams.append(
+            TeamInfo(
+                name=current_team,
+                pattern=normalized_pattern,
+                owners=line_owners or current_owners,
+                team_ref=current_team_ref,
+            )
+        )
+        rule_teams.append(current_team)
+
+        if normalized_pattern.endswith("/"):
+            team_mapping[normalized_pattern.rstrip("/")] = current_team
+        elif "*" in normalized_pattern:
+            prefix = normalized_pattern.rstrip("*")
+            if prefix:
+                team_mapping[prefix] = current_team
+        else:
+            team_mapping[normalized_pattern] = current_team
+
+    return CodeownersOwnership(teams=teams, team_mapping=team_mapping, rule_teams=rule_teams)
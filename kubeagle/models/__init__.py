@@ -24,11 +24,6 @@ from kubeagle.models.optimization.optimization_rule import (
 from kubeagle.models.optimization.optimization_violation import (
     OptimizationViolation,
 )
-from kubeagle.models.optimization.optimizer_controller import (
-    ContainerDict,
-    OptimizerController,
-    UnifiedOptimizerController,
-)
 from kubeagle.models.pdb.blocking_pdb import BlockingPDBInfo
 from kubeagle.models.pdb.pdb_info import PDBInfo
 from kubeagle.models.reports.report_data import ReportData
@@ -73,3 +68,14 @@ __all__ = [
     "get_active_charts_set",
     "load_active_charts_from_file",
 ]
+
+
+def __getattr__(name: str):
+    # The optimizer controller imports kubeagle.optimizer, whose rule modules
+    # import these models; loading it lazily keeps the optimizer importable
+    # on its own.
+    if name in {"ContainerDict", "OptimizerController", "UnifiedOptimizerController"}:
+        from kubeagle.models.optimization import optimizer_controller
+
+        return getattr(optimizer_controller, name)
+    raise AttributeError(name)
@@ -1,5 +1,15 @@
 """Caching utilities."""
 
+from kubeagle.models.cache.cluster_join_index import (
+    ClusterJoinIndex,
+    WorkloadReplicaMap,
+    get_cluster_join_index,
+)
 from kubeagle.models.cache.data_cache import DataCache
 
-__all__ = ["DataCache"]
+__all__ = [
+    "ClusterJoinIndex",
+    "DataCache",
+    "WorkloadReplicaMap",
+    "get_cluster_join_index",
+]
@@ -0,0 +1,281 @@
+"""Join index between Helm releases and live workloads of one cluster context.
+
+Several views link charts to the cluster: the charts explorer filters charts
+by live release name, the single-replica workloads table shows the chart of
+each workload's release, and impact analysis reads desired replicas per
+workload. Each used to build its own lookup, and impact analysis ran its own
+``kubectl get deployments,statefulsets -A``. The index is fed by the cluster
+controller with data it has already fetched, namespace by namespace, and
+answers every join by hash lookup:
+
+- (release, namespace) -> Helm release
+- (workload, namespace) -> workload rows and desired replicas
+- (release, namespace) -> workloads labelled with that release
+- workload name -> desired replicas per namespace
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+
+from kubeagle.models.charts.chart_info import HelmReleaseInfo
+from kubeagle.models.core.workload_inventory_info import WorkloadInventoryInfo
+
+# Workload kinds whose desired replicas count towards the replica map.
+REPLICATED_WORKLOAD_KINDS = frozenset({"Deployment", "StatefulSet"})
+
+_Key = tuple[str, str]
+
+
+class WorkloadReplicaMap(Mapping[_Key, int]):
+    """Read-only ``(workload_name, namespace) -> desired_replicas``, indexed by name too."""
+
+    __slots__ = ("_by_name", "_replicas")
+
+    def __init__(self, replicas: Mapping[_Key, int] | None = None) -> None:
+        self._replicas: dict[_Key, int] = dict(replicas or {})
+        self._by_name: dict[str, list[int]] = {}
+        for (name, _namespace), count in self._replicas.items():
+            self._by_name.setdefault(name, []).append(count)
+
+    def __getitem__(self, key: _Key) -> int:
+        return self._replicas[key]
+
+    def __iter__(self) -> Iterator[_Key]:
+        return iter(self._replicas)
+
+    def __len__(self) -> int:
+        return len(self._replicas)
+
+    def replicas_named(self, name: str) -> list[int]:
+        """Desired replicas of every workload called ``name``, one per namespace."""
+        return list(self._by_name.get(name, ()))
+
+
+def _release_chart_label(release: HelmReleaseInfo) -> str:
+    chart_name = release.chart.split("-")[0] if release.chart else None
+    return chart_name or release.name
+
+
+class ClusterJoinIndex:
+    """Hash-join index of Helm releases and workloads, updated incrementally.
+
+    Updates replace everything known about one namespace (or the whole
+    cluster), so namespace-streamed fetches keep the index current as each
+    namespace arrives. Safe to read from worker threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._releases: dict[_Key, HelmReleaseInfo] = {}
+        self._release_name_counts: dict[str, int] = {}
+        self._release_names: frozenset[str] | None = frozenset()
+        self._workloads: dict[_Key, dict[str, WorkloadInventoryInfo]] = {}
+        self._replicas: dict[_Key, int] = {}
+        self._replicas_by_name: dict[str, dict[str, int]] = {}
+        self._release_workloads: dict[_Key, set[_Key]] = {}
+        self._replica_map: WorkloadReplicaMap | None = None
+        self._releases_loaded = False
+        self._workloads_loaded = False
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def replace_releases(
+        self,
+        releases: Iterable[HelmReleaseInfo],
+        *,
+        namespace: str | None = None,
+    ) -> None:
+        """Replace the releases of ``namespace``, or of the whole cluster if None."""
+        with self._lock:
+            stale = [
+                key
+                for key in self._releases
+                if namespace is None or key[1] == namespace
+            ]
+            for key in stale:
+                self._drop_release(key)
+            for release in releases:
+                if not release.name or not release.namespace:
+                    continue
+                if namespace is not None and release.namespace != namespace:
+                    continue
+                key = (release.name, release.namespace)
+                if key in self._releases:
+                    self._drop_release(key)
+                self._releases[key] = release
+                self._release_name_counts[release.name] = (
+                    self._release_name_counts.get(release.name, 0) + 1
+                )
+            self._release_names = None
+            self._releases_loaded = True
+
+    def replace_workloads(
+        self,
+        workloads: Iterable[WorkloadInventoryInfo],
+        *,
+        namespace: str | None = None,
+    ) -> None:
+        """Replace the workloads of ``namespace``, or of the whole cluster if None."""
+        with self._lock:
+            stale = [
+                key
+                for key in self._workloads
+                if namespace is None or key[1] == namespace
+            ]
+            for key in stale:
+                self._drop_workload(key)
+            for row in workloads:
+                if not row.name or not row.namespace:
+                    continue
+                if namespace is not None and row.namespace != namespace:
+                    continue
+                self._add_workload(row)
+            self._replica_map = None
+            self._workloads_loaded = True
+
+    def _drop_release(self, key: _Key) -> None:
+        if self._releases.pop(key, None) is None:
+            return
+        remaining = self._release_name_counts.get(key[0], 0) - 1
+        if remaining > 0:
+            self._release_name_counts[key[0]] = remaining
+        else:
+            self._release_name_counts.pop(key[0], None)
+
+    def _add_workload(self, row: WorkloadInventoryInfo) -> None:
+        key = (row.name, row.namespace)
+        by_kind = self._workloads.setdefault(key, {})
+        by_kind[row.kind] = row
+        if row.helm_release:
+            self._release_workloads.setdefault(
+                (row.helm_release, row.namespace), set()
+            ).add(key)
+        self._refresh_replicas(key)
+
+    def _drop_workload(self, key: _Key) -> None:
+        by_kind = self._workloads.pop(key, None)
+        if by_kind is None:
+            return
+        for row in by_kind.values():
+            if not row.helm_release:
+                continue
+            release_key = (row.helm_release, row.namespace)
+            members = self._release_workloads.get(release_key)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._release_workloads[release_key]
+        self._refresh_replicas(key)
+
+    def _refresh_replicas(self, key: _Key) -> None:
+        name, namespace = key
+        # Sum in case a Deployment and a StatefulSet share a name.
+        rows = [
+            row
+            for row in self._workloads.get(key, {}).values()
+            if row.kind in REPLICATED_WORKLOAD_KINDS
+        ]
+        if rows:
+            total = sum(
+                row.desired_replicas if row.desired_replicas is not None else 1
+                for row in rows
+            )
+            self._replicas[key] = total
+            self._replicas_by_name.setdefault(name, {})[namespace] = total
+            return
+        self._replicas.pop(key, None)
+        per_namespace = self._replicas_by_name.get(name)
+        if per_namespace is not None:
+            per_namespace.pop(namespace, None)
+            if not per_namespace:
+                del self._replicas_by_name[name]
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    @property
+    def releases_loaded(self) -> bool:
+        """Whether any Helm release listing has been recorded."""
+        return self._releases_loaded
+
+    @property
+    def workloads_loaded(self) -> bool:
+        """Whether any workload inventory has been recorded."""
+        return self._workloads_loaded
+
+    def release(self, name: str, namespace: str) -> HelmReleaseInfo | None:
+        """Return the Helm release ``name`` in ``namespace``."""
+        return self._releases.get((name, namespace))
+
+    def release_chart_label(self, name: str, namespace: str) -> str | None:
+        """Chart label of a release (chart name without version), if known."""
+        release = self._releases.get((name, namespace))
+        return _release_chart_label(release) if release is not None else None
+
+    def has_release_name(self, name: str) -> bool:
+        """Whether a release called ``name`` exists in any namespace."""
+        return name in self._release_name_counts
+
+    def release_names(self) -> frozenset[str]:
+        """Names of all known releases."""
+        with self._lock:
+            if self._release_names is None:
+                self._release_names = frozenset(self._release_name_counts)
+            return self._release_names
+
+    def workloads_for_release(self, name: str, namespace: str) -> list[WorkloadInventoryInfo]:
+        """Workloads labelled with release ``name`` in ``namespace``."""
+        with self._lock:
+            keys = sorted(self._release_workloads.get((name, namespace), ()))
+            return [
+                row
+                for key in keys
+                for row in self._workloads.get(key, {}).values()
+                if row.helm_release == name
+            ]
+
+    def helm_release_of(self, workload: str, namespace: str) -> str | None:
+        """Helm release labelled on workload ``workload`` in ``namespace``."""
+        with self._lock:
+            for row in self._workloads.get((workload, namespace), {}).values():
+                if row.helm_release:
+                    return row.helm_release
+        return None
+
+    def desired_replicas(self, workload: str, namespace: str) -> int | None:
+        """Desired replicas of the Deployments/StatefulSets named ``workload``."""
+        return self._replicas.get((workload, namespace))
+
+    def replicas_by_namespace(self, workload: str) -> dict[str, int]:
+        """Desired replicas of workloads named ``workload``, keyed by namespace."""
+        with self._lock:
+            return dict(self._replicas_by_name.get(workload, {}))
+
+    def replica_map(self) -> WorkloadReplicaMap | None:
+        """Desired replicas of every replicated workload, or None before any load."""
+        with self._lock:
+            if not self._workloads_loaded:
+                return None
+            if self._replica_map is None:
+                self._replica_map = WorkloadReplicaMap(self._replicas)
+            return self._replica_map
+
+
+_indexes: dict[str, ClusterJoinIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_cluster_join_index(context: str | None) -> ClusterJoinIndex:
+    """Return the process-wide join index of ``context`` (None: current context)."""
+    key = context or ""
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = ClusterJoinIndex()
+            _indexes[key] = index
+        return index
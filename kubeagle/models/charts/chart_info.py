@@ -45,3 +45,5 @@ class HelmReleaseInfo(BaseModel):
     version: str
     app_version: str
     status: str
+    revision: str = ""
+    updated: str = ""
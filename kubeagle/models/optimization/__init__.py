@@ -4,17 +4,13 @@ from kubeagle.models.optimization.optimization_rule import OptimizationRule
 from kubeagle.models.optimization.optimization_violation import (
     OptimizationViolation,
 )
-from kubeagle.models.optimization.optimizer_controller import (
-    ContainerDict,
-    OptimizerController,
-    UnifiedOptimizerController,
-)
 from kubeagle.models.optimization.resource_impact import (
     ChartResourceSnapshot,
     ClusterNodeGroup,
     FleetResourceSummary,
     InstanceTypeSpec,
     NodeEstimation,
+    NodeMixOption,
     ResourceDelta,
     ResourceImpactResult,
 )
@@ -26,6 +22,7 @@ __all__ = [
     "FleetResourceSummary",
     "InstanceTypeSpec",
     "NodeEstimation",
+    "NodeMixOption",
     "OptimizationRule",
     "OptimizationViolation",
     "OptimizerController",
@@ -33,3 +30,14 @@ __all__ = [
     "ResourceImpactResult",
     "UnifiedOptimizerController",
 ]
+
+
+def __getattr__(name: str):
+    # The optimizer controller imports kubeagle.optimizer, whose rule modules
+    # import these models; loading it lazily keeps the optimizer importable
+    # on its own.
+    if name in {"ContainerDict", "OptimizerController", "UnifiedOptimizerController"}:
+        from kubeagle.models.optimization import optimizer_controller
+
+        return getattr(optimizer_controller, name)
+    raise AttributeError(name)
@@ -11,10 +11,20 @@ if TYPE_CHECKING:
     from kubeagle.models.optimization.optimization_violation import (
         OptimizationViolation,
     )
+    from kubeagle.optimizer.rule_features import ChartFeatures
 
 
 class OptimizationRule(BaseModel):
-    """Definition of an optimization rule."""
+    """Definition of an optimization rule.
+
+    ``check`` evaluates a rule-input dict. ``evaluate``, when set, evaluates
+    pre-extracted ``ChartFeatures`` and lets the optimizer run all rules over
+    one feature record without rebuilding or re-parsing the dict.
+
+    ``thresholds`` names the runtime settings the rule reads (see
+    ``current_rule_thresholds``). Rules that declare it, even as an empty
+    tuple, have their outcomes cached until one of those settings changes.
+    """
 
     id: str
     name: str
@@ -22,6 +32,8 @@ class OptimizationRule(BaseModel):
     severity: str
     category: str
     check: Callable[[dict], list[OptimizationViolation]]
+    evaluate: Callable[[ChartFeatures], list[OptimizationViolation]] | None = None
+    thresholds: tuple[str, ...] | None = None
     fix: Callable[[dict, OptimizationViolation], dict[str, Any] | None] = (
         lambda *_: None
     )
@@ -25,14 +25,37 @@ from kubeagle.models.charts.chart_info import ChartInfo
 from kubeagle.optimizer.fixer import FixGenerator
 from kubeagle.optimizer.helm_renderer import render_chart
 from kubeagle.optimizer.rendered_rule_input import (
-    build_rule_inputs_from_rendered,
+    RenderedWorkload,
+    build_rendered_workloads,
+)
+from kubeagle.optimizer.rule_batch import (
+    ChartFeatureTable,
+    evaluate_feature_table,
+)
+from kubeagle.optimizer.rule_features import (
+    ChartFeatures,
+    format_cpu_millicores,
+    format_memory_mi,
 )
 from kubeagle.optimizer.rules import (
     RULES,
     OptimizationViolation as RuleViolation,
+    current_rule_thresholds,
     get_rule_by_id,
 )
-from kubeagle.utils.resource_parser import memory_str_to_bytes, parse_cpu
+from kubeagle.optimizer.template_values_index import (
+    get_template_values_index,
+    load_values_document,
+    reuse_render_for_values_change,
+)
+from kubeagle.optimizer.violation_cache import (
+    RENDERED_INPUT_CACHE,
+    VIOLATION_CACHE,
+    RenderedChart,
+    chart_tree_stamp,
+    file_stamp,
+)
+from kubeagle.utils.resource_parser import memory_str_to_bytes, parse_cpu_millicores
 
 logger = logging.getLogger(__name__)
 
@@ -69,15 +92,13 @@ class UnifiedOptimizerController(BaseModel):
     max_workers: int = 0
     _helm_available: bool | None = PrivateAttr(default=None)
     _helm_unavailable_logged: bool = PrivateAttr(default=False)
+    _feature_table_charts: list[ChartInfo] = PrivateAttr(default_factory=list)
+    _feature_table: ChartFeatureTable | None = PrivateAttr(default=None)
 
     @staticmethod
     def _format_cpu_millicores(cpu_millicores: float) -> str:
         """Format CPU millicores for rule input and UI text."""
-        value = float(cpu_millicores)
-        if value.is_integer():
-            return f"{int(value)}m"
-        formatted = f"{value:.3f}".rstrip("0").rstrip(".")
-        return f"{formatted}m"
+        return format_cpu_millicores(cpu_millicores)
 
     @staticmethod
     def _memory_bytes_to_mib(memory_bytes: float) -> float:
@@ -87,12 +108,7 @@ class UnifiedOptimizerController(BaseModel):
     @classmethod
     def _format_memory_mib_from_bytes(cls, memory_bytes: float) -> str:
         """Format memory bytes as Mi for rule input and UI text."""
-        memory_mib = cls._memory_bytes_to_mib(memory_bytes)
-        rounded = round(memory_mib)
-        if abs(memory_mib - rounded) < 1e-6:
-            return f"{int(rounded)}Mi"
-        formatted = f"{memory_mib:.2f}".rstrip("0").rstrip(".")
-        return f"{formatted}Mi"
+        return format_memory_mi(cls._memory_bytes_to_mib(memory_bytes))
 
     def _chart_info_to_dict(self, chart: ChartInfo) -> dict[str, Any]:
         """Convert ChartInfo Pydantic model to dict format expected by optimizer rules.
@@ -398,15 +414,27 @@ class UnifiedOptimizerController(BaseModel):
             if rendered_violations is not None:
                 return rendered_violations
 
-        violations: list[ViolationResult] = []
+        # Extract typed features once and evaluate every rule over them;
+        # the rule-input dict is only built for rules without an evaluator.
+        features = ChartFeatures.from_chart_info(chart)
+        fingerprint = features.fingerprint()
+        thresholds = current_rule_thresholds()
+        chart_dict: dict[str, Any] | None = None
 
-        # Convert ChartInfo to dict format expected by optimizer rules
-        chart_dict = self._chart_info_to_dict(chart)
-
-        # Run all rule checks
+        violations: list[ViolationResult] = []
         for rule in self.rules:
             try:
-                rule_violations = rule.check(chart_dict)
+                if rule.evaluate is not None:
+                    rule_violations = VIOLATION_CACHE.evaluate(
+                        rule,
+                        features,
+                        fingerprint=fingerprint,
+                        thresholds=thresholds,
+                    )
+                else:
+                    if chart_dict is None:
+                        chart_dict = self._chart_info_to_dict(chart)
+                    rule_violations = rule.check(chart_dict)
             except Exception:
                 logger.warning(
                     "Rule check failed for rule '%s'",
@@ -462,6 +490,112 @@ class UnifiedOptimizerController(BaseModel):
         if not (chart_dir / "Chart.yaml").exists():
             return None
 
+        workloads = self._rendered_workloads(chart, chart_dir, values_path)
+        if workloads is None:
+            return None
+        if not workloads:
+            return []
+
+        # Single traversal: each workload is visited once and checked against
+        # every rule that has not matched yet. A rule reports its first
+        # matching workload, in workload order.
+        thresholds = current_rule_thresholds()
+        matches: dict[int, tuple[RuleViolation, dict[str, Any]]] = {}
+        pending = list(enumerate(self.rules))
+        for workload in workloads:
+            if not pending:
+                break
+            still_pending: list[tuple[int, Any]] = []
+            for rule_index, rule in pending:
+                try:
+                    if rule.evaluate is not None:
+                        candidate = VIOLATION_CACHE.evaluate(
+                            rule,
+                            workload.features,
+                            fingerprint=workload.fingerprint,
+                            thresholds=thresholds,
+                        )
+                    else:
+                        candidate = rule.check(workload.rule_input)
+                except Exception:
+                    logger.warning(
+                        "Rendered rule check failed for rule '%s'",
+                        rule.id,
+                        exc_info=True,
+                    )
+                    continue
+                if candidate:
+                    matches[rule_index] = (candidate[0], workload.rule_input)
+                else:
+                    still_pending.append((rule_index, rule))
+            pending = still_pending
+
+        return [
+            self._to_violation(
+                matched_violation,
+                chart,
+                analysis_source="rendered",
+                analysis_note="Analyzed from `helm template` rendered manifests.",
+                rendered_rule_input=matched_rule_input,
+            )
+            for _rule_index, (matched_violation, matched_rule_input) in sorted(
+                matches.items()
+            )
+        ]
+
+    def _rendered_workloads(
+        self,
+        chart: ChartInfo,
+        chart_dir: Path,
+        values_path: Path,
+    ) -> list[RenderedWorkload] | None:
+        """Render ``chart`` once and extract its per-workload records.
+
+        The last render is reused while the chart is unchanged, so re-checking
+        after a threshold change does not re-run ``helm template``. When only
+        the values file changed, the template values index decides whether
+        the previous render still applies (unreferenced paths) or can be
+        patched (resource quantities). Returns None when rendering fails.
+        """
+        cache_key = (str(chart_dir), str(values_path), chart.name)
+        tree_stamp = chart_tree_stamp(chart_dir, exclude=values_path)
+        values_stamp = file_stamp(values_path)
+        cached = RENDERED_INPUT_CACHE.get(cache_key)
+        values: dict[str, Any] | None = None
+        if (
+            cached is not None
+            and tree_stamp is not None
+            and values_stamp is not None
+            and cached.tree_stamp == tree_stamp
+        ):
+            if cached.values_stamp == values_stamp:
+                return cached.workloads
+            values = load_values_document(values_path)
+            if values is not None and cached.values is not None:
+                docs = reuse_render_for_values_change(
+                    get_template_values_index(chart_dir, tree_stamp),
+                    cached.docs,
+                    cached.values,
+                    values,
+                )
+                if docs is not None:
+                    workloads = (
+                        cached.workloads
+                        if docs is cached.docs
+                        else build_rendered_workloads(docs, chart_name=chart.name)
+                    )
+                    RENDERED_INPUT_CACHE.put(
+                        cache_key,
+                        RenderedChart(
+                            tree_stamp=tree_stamp,
+                            values_stamp=values_stamp,
+                            values=values,
+                            docs=docs,
+                            workloads=workloads,
+                        ),
+                    )
+                    return workloads
+
         render_result = render_chart(
             chart_dir=chart_dir,
             values_file=values_path,
@@ -471,45 +605,21 @@ class UnifiedOptimizerController(BaseModel):
         if not render_result.ok:
             return None
 
-        rule_inputs = build_rule_inputs_from_rendered(
-            render_result.docs,
-            chart_name=chart.name,
-        )
-        if not rule_inputs:
-            return []
-
-        violations: list[ViolationResult] = []
-        for rule in self.rules:
-            matched_violation: RuleViolation | None = None
-            matched_rule_input: dict[str, Any] | None = None
-            try:
-                for rule_input in rule_inputs:
-                    candidate = rule.check(rule_input)
-                    if candidate:
-                        matched_violation = candidate[0]
-                        matched_rule_input = rule_input
-                        break
-            except Exception:
-                logger.warning(
-                    "Rendered rule check failed for rule '%s'",
-                    rule.id,
-                    exc_info=True,
-                )
-                continue
-
-            if matched_violation is None:
-                continue
-            violations.append(
-                self._to_violation(
-                    matched_violation,
-                    chart,
-                    analysis_source="rendered",
-                    analysis_note="Analyzed from `helm template` rendered manifests.",
-                    rendered_rule_input=matched_rule_input,
-                )
+        workloads = build_rendered_workloads(render_result.docs, chart_name=chart.name)
+        if tree_stamp is not None and values_stamp is not None:
+            if values is None:
+                values = load_values_document(values_path)
+            RENDERED_INPUT_CACHE.put(
+                cache_key,
+                RenderedChart(
+                    tree_stamp=tree_stamp,
+                    values_stamp=values_stamp,
+                    values=values,
+                    docs=render_result.docs,
+                    workloads=workloads,
+                ),
             )
-
-        return violations
+        return workloads
 
     @staticmethod
     def _rendered_resource_value(
@@ -559,10 +669,10 @@ class UnifiedOptimizerController(BaseModel):
         )
         if cpu_value is None:
             return None
-        cores = parse_cpu(cpu_value)
-        if cores <= 0:
+        millicores = parse_cpu_millicores(cpu_value)
+        if millicores <= 0:
             return None
-        return cores * 1000
+        return millicores
 
     @classmethod
     def _rendered_memory_bytes(
@@ -615,6 +725,9 @@ class UnifiedOptimizerController(BaseModel):
         if chart_count == 0:
             return []
 
+        if self._can_batch_evaluate():
+            return self._check_all_charts_batched(charts, on_chart_done=on_chart_done)
+
         worker_count = self._resolve_worker_count(chart_count)
         all_violations: list[ViolationResult] = []
 
@@ -646,6 +759,65 @@ class UnifiedOptimizerController(BaseModel):
 
         return all_violations
 
+    def _can_batch_evaluate(self) -> bool:
+        """Return whether all charts can be checked as one feature table.
+
+        Batch mode covers values-based analysis with rules that all provide a
+        feature evaluator; rendered analysis needs per-chart helm renders.
+        """
+        mode = str(self.analysis_source or "auto").strip().lower()
+        if self._should_try_rendered_analysis(mode):
+            return False
+        return all(rule.evaluate is not None for rule in self.rules)
+
+    def _feature_table_for(self, charts: list[ChartInfo]) -> ChartFeatureTable:
+        """Return the feature table for ``charts``, reusing the last one.
+
+        Re-checking the same chart objects (e.g. after a threshold change in
+        Settings) skips feature extraction entirely.
+        """
+        cached_charts = self._feature_table_charts
+        table = self._feature_table
+        if (
+            table is not None
+            and len(cached_charts) == len(charts)
+            and all(a is b for a, b in zip(cached_charts, charts, strict=True))
+        ):
+            return table
+        table = ChartFeatureTable.from_features(
+            [ChartFeatures.from_chart_info(chart) for chart in charts]
+        )
+        self._feature_table_charts = list(charts)
+        self._feature_table = table
+        return table
+
+    def _check_all_charts_batched(
+        self,
+        charts: list[ChartInfo],
+        *,
+        on_chart_done: Callable[[ChartInfo, list[ViolationResult], int, int], None]
+        | None = None,
+    ) -> list[ViolationResult]:
+        """Check all charts by evaluating each rule over the fleet at once."""
+        table = self._feature_table_for(charts)
+        per_chart = evaluate_feature_table(table, self.rules, cache=VIOLATION_CACHE)
+        chart_count = len(charts)
+        all_violations: list[ViolationResult] = []
+        for completed, (chart, matches) in enumerate(zip(charts, per_chart, strict=True), 1):
+            violations = [
+                self._to_violation(
+                    violation,
+                    chart,
+                    analysis_source="values",
+                    analysis_note="Analyzed from values file content.",
+                )
+                for _rule, violation in matches
+            ]
+            all_violations.extend(violations)
+            if on_chart_done is not None:
+                on_chart_done(chart, violations, completed, chart_count)
+        return all_violations
+
     def _resolve_worker_count(self, chart_count: int) -> int:
         """Resolve bounded worker count for parallel violation checks."""
         configured_workers = int(self.max_workers)
@@ -78,6 +78,8 @@ class NodeEstimation(BaseModel):
     cost_before_monthly: float  # nodes_before * spot_price * hours_per_month
     cost_after_monthly: float  # nodes_after * spot_price * hours_per_month
     cost_savings_monthly: float  # cost_before - cost_after
+    unschedulable_before: int = 0  # replicas larger than one node (counted by volume)
+    unschedulable_after: int = 0
 
 
 class ClusterNodeGroup(BaseModel):
@@ -96,6 +98,17 @@ class ClusterNodeGroup(BaseModel):
     cost_current_monthly: float  # node_count * spot_price * hours_per_month
     cost_after_monthly: float  # nodes_needed_after * spot_price * hours_per_month
     cost_savings_monthly: float  # cost_current - cost_after
+    unschedulable_after: int = 0  # replicas larger than one node (counted by volume)
+
+
+class NodeMixOption(BaseModel):
+    """A priced combination of instance types that fits the fleet."""
+
+    nodes: dict[str, int]  # instance type -> node count
+    pricing: str  # "spot" or "on_demand"
+    hourly_cost_usd: float
+    monthly_cost_usd: float  # hourly_cost_usd * hours_per_month
+    unschedulable: int = 0  # replicas larger than every candidate type
 
 
 class ResourceImpactResult(BaseModel):
@@ -109,3 +122,4 @@ class ResourceImpactResult(BaseModel):
     node_estimations: list[NodeEstimation]
     cluster_node_groups: list[ClusterNodeGroup] = []
     total_spot_savings_monthly: float = 0.0  # sum of all group/estimation savings
+    node_mix_options: list[NodeMixOption] = []  # cheapest first
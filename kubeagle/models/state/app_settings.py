@@ -23,6 +23,9 @@ class AppSettings(BaseModel):
     active_charts_path: str = ""
     codeowners_path: str = ""
     export_path: str = "./reports"
+    instance_price_table_path: str = ""  # YAML/JSON instance prices for node-mix search
+    use_git_index_discovery: bool = False  # enumerate charts via `git ls-files`
+    watch_charts_repo: bool = False  # re-analyze charts edited on disk (inotify/polling)
 
     # UI preferences
     theme: str = ThemePreference.DARK
@@ -0,0 +1,810 @@
+"""Persistent scheduler for bulk AI full-fix jobs.
+
+Bulk AI fixes used to run as workers bound to the violations screen: closing
+the modal lost the run, and re-opening it sent identical chart states to the
+LLM again. Jobs now go through a process-wide scheduler:
+
+- Every job is written to a queue directory on disk (one JSON file per job)
+  before it runs. Queued and interrupted jobs found after a restart are
+  offered to the user, and only run again once they choose to resume them.
+- Each provider has a bounded pool of worker threads.
+- Jobs are deduplicated by (chart directory, chart digest, values file,
+  violation set, seed payload, prompt template, provider, model): a submit
+  matching a queued or running job waits for it, and one matching a finished
+  job returns the stored result while its staged workspace still exists.
+- Finished workspaces belong to the scheduler. Every caller receives its own
+  clone, so the screen can promote or clean up its copy without invalidating
+  the cached result. The cache is bounded by the disk space its records and
+  workspaces use, oldest first.
+- Each job records when it was queued, started and finished.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any
+
+from kubeagle.models.analysis.violation import ViolationResult
+from kubeagle.models.state.app_settings import ConfigError
+from kubeagle.models.state.config_manager import ConfigManager
+from kubeagle.optimizer.full_ai_fixer import (
+    AIFullFixResult,
+    AIFullFixStagedArtifact,
+    generate_ai_full_fix_for_chart,
+)
+from kubeagle.optimizer.llm_cli_runner import LLMProvider
+from kubeagle.optimizer.llm_patch_protocol import FullFixResponse
+from kubeagle.optimizer.staged_workspace import clone_tree
+from kubeagle.optimizer.stripped_chart_cache import chart_digest
+
+logger = logging.getLogger(__name__)
+
+# Disk space (records plus staged workspaces) kept by finished jobs.
+_FINISHED_JOBS_MAX_BYTES = 512 * 1024 * 1024
+
+# Worker threads per provider when no parallelism is configured.
+_DEFAULT_WORKERS_PER_PROVIDER = 2
+
+_STATUS_QUEUED = "queued"
+_STATUS_RUNNING = "running"
+_STATUS_DONE = "done"
+_STATUS_FAILED = "failed"
+
+_JOBS_DIR_NAME = "ai-fix-jobs"
+
+StatusCallback = Callable[[str], None]
+JobRunner = Callable[["AIFixJobSpec", StatusCallback], AIFullFixResult]
+
+
+@dataclass(slots=True)
+class AIFixJobSpec:
+    """Inputs of one chart-level AI full-fix generation."""
+
+    chart_dir: Path
+    values_path: Path
+    violations: list[ViolationResult]
+    seed_fix_payload: dict[str, Any] | None = None
+    timeout_seconds: int = 120
+    preferred_provider: LLMProvider | None = None
+    provider_models: dict[LLMProvider, str | None] | None = None
+    full_fix_system_prompt: str | None = None
+
+    @property
+    def provider_pool(self) -> str:
+        """Name of the worker pool this job runs in."""
+        return self.preferred_provider.value if self.preferred_provider else "auto"
+
+    def dedup_key(self) -> str:
+        """Key identifying jobs that would send the LLM the same request."""
+        chart_dir = self.chart_dir.expanduser().resolve()
+        violation_keys = sorted(
+            "|".join(
+                (
+                    violation.rule_id,
+                    violation.id,
+                    violation.chart_name,
+                    violation.description,
+                    violation.current_value,
+                    violation.recommended_value,
+                )
+            )
+            for violation in self.violations
+        )
+        models = {
+            provider.value: model
+            for provider, model in (self.provider_models or {}).items()
+        }
+        material = json.dumps(
+            {
+                "chart_dir": str(chart_dir),
+                "chart_digest": chart_digest(chart_dir),
+                "values_path": str(self.values_path.expanduser().resolve()),
+                "violations": violation_keys,
+                "seed": self.seed_fix_payload,
+                "prompt": self.full_fix_system_prompt or "",
+                "provider": self.provider_pool,
+                "models": models,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "chart_dir": str(self.chart_dir),
+            "values_path": str(self.values_path),
+            "violations": [v.model_dump(mode="json") for v in self.violations],
+            "seed_fix_payload": self.seed_fix_payload,
+            "timeout_seconds": self.timeout_seconds,
+            "preferred_provider": (
+                self.preferred_provider.value if self.preferred_provider else None
+            ),
+            "provider_models": (
+                None
+                if self.provider_models is None
+                else {p.value: m for p, m in self.provider_models.items()}
+            ),
+            "full_fix_system_prompt": self.full_fix_system_prompt,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> AIFixJobSpec:
+        provider = payload.get("preferred_provider")
+        models = payload.get("provider_models")
+        return cls(
+            chart_dir=Path(payload["chart_dir"]),
+            values_path=Path(payload["values_path"]),
+            violations=[
+                ViolationResult.model_validate(item)
+                for item in payload.get("violations", [])
+            ],
+            seed_fix_payload=payload.get("seed_fix_payload"),
+            timeout_seconds=int(payload.get("timeout_seconds", 120)),
+            preferred_provider=LLMProvider(provider) if provider else None,
+            provider_models=(
+                None
+                if models is None
+                else {LLMProvider(p): m for p, m in models.items()}
+            ),
+            full_fix_system_prompt=payload.get("full_fix_system_prompt"),
+        )
+
+
+@dataclass(slots=True)
+class AIFixJobMetrics:
+    """Timing of one scheduled job (wall-clock epoch seconds)."""
+
+    job_id: str
+    provider_pool: str
+    status: str
+    queued_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def wait_seconds(self) -> float | None:
+        """Seconds spent queued before a worker picked the job up."""
+        if self.started_at is None:
+            return None
+        return max(0.0, self.started_at - self.queued_at)
+
+    @property
+    def run_seconds(self) -> float | None:
+        """Seconds spent generating the fix."""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return max(0.0, self.finished_at - self.started_at)
+
+
+@dataclass(slots=True)
+class _Job:
+    job_id: str
+    key: str
+    spec: AIFixJobSpec
+    metrics: AIFixJobMetrics
+    futures: list[Future[AIFullFixResult]] = field(default_factory=list)
+    callbacks: list[StatusCallback] = field(default_factory=list)
+    result: AIFullFixResult | None = None
+    # Disk space of the job record and staged workspace, set once finished.
+    disk_bytes: int = 0
+
+
+def _result_to_payload(result: AIFullFixResult) -> dict[str, Any]:
+    artifact = result.staged_artifact
+    return {
+        "ok": result.ok,
+        "status": result.status,
+        "provider": result.provider,
+        "prompt": result.prompt,
+        "response": (
+            result.response.model_dump(mode="json") if result.response else None
+        ),
+        "note": result.note,
+        "tried_providers": list(result.tried_providers),
+        "errors": list(result.errors),
+        "raw_output_text": result.raw_output_text,
+        "staged_artifact": (
+            None
+            if artifact is None
+            else {
+                "stage_root": str(artifact.stage_root),
+                "staged_chart_dir": str(artifact.staged_chart_dir),
+                "rel_values_path": artifact.rel_values_path,
+                "changed_rel_paths": list(artifact.changed_rel_paths),
+                "source_hashes": dict(artifact.source_hashes),
+                "provider": artifact.provider,
+                "execution_log": artifact.execution_log,
+            }
+        ),
+    }
+
+
+def _result_from_payload(payload: dict[str, Any]) -> AIFullFixResult:
+    response = payload.get("response")
+    artifact = payload.get("staged_artifact")
+    return AIFullFixResult(
+        ok=bool(payload.get("ok")),
+        status=str(payload.get("status", "error")),
+        provider=str(payload.get("provider", "")),
+        prompt=str(payload.get("prompt", "")),
+        response=None if response is None else FullFixResponse.model_validate(response),
+        note=str(payload.get("note", "")),
+        tried_providers=list(payload.get("tried_providers", [])),
+        errors=list(payload.get("errors", [])),
+        raw_output_text=str(payload.get("raw_output_text", "")),
+        staged_artifact=(
+            None
+            if artifact is None
+            else AIFullFixStagedArtifact(
+                stage_root=Path(artifact["stage_root"]),
+                staged_chart_dir=Path(artifact["staged_chart_dir"]),
+                rel_values_path=artifact["rel_values_path"],
+                changed_rel_paths=list(artifact.get("changed_rel_paths", [])),
+                source_hashes=dict(artifact.get("source_hashes", {})),
+                provider=str(artifact.get("provider", "")),
+                execution_log=str(artifact.get("execution_log", "")),
+            )
+        ),
+    )
+
+
+def _result_is_reusable(result: AIFullFixResult) -> bool:
+    """Whether a finished result can be served again (its workspace still exists)."""
+    if not result.ok:
+        return False
+    artifact = result.staged_artifact
+    return artifact is None or artifact.staged_chart_dir.is_dir()
+
+
+def _detach_result(result: AIFullFixResult) -> AIFullFixResult:
+    """Copy of ``result`` whose staged workspace is a fresh clone.
+
+    Raises:
+        OSError: If the workspace cannot be cloned.
+    """
+    artifact = result.staged_artifact
+    if artifact is None:
+        return result
+    stage_root = Path(tempfile.mkdtemp(prefix="kubeagle-direct-edit-"))
+    staged_chart_dir = stage_root / artifact.staged_chart_dir.name
+    try:
+        clone_tree(artifact.staged_chart_dir, staged_chart_dir)
+    except OSError:
+        shutil.rmtree(stage_root, ignore_errors=True)
+        raise
+    old_root, new_root = str(artifact.stage_root), str(stage_root)
+    return replace(
+        result,
+        raw_output_text=result.raw_output_text.replace(old_root, new_root),
+        staged_artifact=replace(
+            artifact,
+            stage_root=stage_root,
+            staged_chart_dir=staged_chart_dir,
+            execution_log=artifact.execution_log.replace(old_root, new_root),
+        ),
+    )
+
+
+def _workspace_bytes(result: AIFullFixResult | None) -> int:
+    """Apparent size of the files in ``result``'s staged workspace."""
+    if result is None or result.staged_artifact is None:
+        return 0
+    total = 0
+    for root, _dirs, files in os.walk(result.staged_artifact.stage_root):
+        for name in files:
+            with contextlib.suppress(OSError):
+                total += os.lstat(os.path.join(root, name)).st_size
+    return total
+
+
+def _discard_workspace(result: AIFullFixResult | None) -> None:
+    if result is not None and result.staged_artifact is not None:
+        shutil.rmtree(result.staged_artifact.stage_root, ignore_errors=True)
+
+
+def _run_full_fix(spec: AIFixJobSpec, status_callback: StatusCallback) -> AIFullFixResult:
+    return generate_ai_full_fix_for_chart(
+        chart_dir=spec.chart_dir,
+        values_path=spec.values_path,
+        violations=spec.violations,
+        seed_fix_payload=spec.seed_fix_payload,
+        timeout_seconds=spec.timeout_seconds,
+        preferred_provider=spec.preferred_provider,
+        provider_models=spec.provider_models,
+        full_fix_system_prompt=spec.full_fix_system_prompt,
+        status_callback=status_callback,
+    )
+
+
+class AIFixJobStore:
+    """On-disk job records, one JSON file per job under ``root``."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def _path(self, job_id: str) -> Path:
+        return self.root / f"{job_id}.json"
+
+    def save(self, job: _Job) -> None:
+        record = {
+            "job_id": job.job_id,
+            "key": job.key,
+            "status": job.metrics.status,
+            "spec": job.spec.to_payload(),
+            "queued_at": job.metrics.queued_at,
+            "started_at": job.metrics.started_at,
+            "finished_at": job.metrics.finished_at,
+            "result": None if job.result is None else _result_to_payload(job.result),
+        }
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(record, handle, default=str)
+            os.replace(tmp_name, self._path(job.job_id))
+        except OSError:
+            logger.warning("Failed to persist AI fix job %s", job.job_id, exc_info=True)
+
+    def delete(self, job_id: str) -> None:
+        with contextlib.suppress(OSError):
+            self._path(job_id).unlink()
+
+    def record_bytes(self, job_id: str) -> int:
+        """Size of the job's record file, 0 if it is missing."""
+        try:
+            return self._path(job_id).stat().st_size
+        except OSError:
+            return 0
+
+    def load_all(self) -> list[dict[str, Any]]:
+        """Every readable job record, oldest first."""
+        records: list[dict[str, Any]] = []
+        try:
+            paths = list(self.root.glob("*.json"))
+        except OSError:
+            return records
+        for path in paths:
+            try:
+                with open(path, encoding="utf-8") as handle:
+                    record = json.load(handle)
+            except (OSError, ValueError):
+                continue
+            if isinstance(record, dict) and record.get("job_id"):
+                records.append(record)
+        records.sort(key=lambda record: float(record.get("queued_at") or 0.0))
+        return records
+
+
+class AIFixJobScheduler:
+    """Deduplicating, resumable AI full-fix job queue with per-provider pools.
+
+    Args:
+        store: Where job records are persisted.
+        runner: Generates one fix; ``generate_ai_full_fix_for_chart`` by default.
+        max_workers_per_provider: Concurrent jobs per provider pool.
+        finished_jobs_max_bytes: Disk space kept by finished jobs (records and
+            staged workspaces) as the result cache.
+    """
+
+    def __init__(
+        self,
+        store: AIFixJobStore,
+        runner: JobRunner | None = None,
+        max_workers_per_provider: int = _DEFAULT_WORKERS_PER_PROVIDER,
+        finished_jobs_max_bytes: int = _FINISHED_JOBS_MAX_BYTES,
+    ) -> None:
+        self._store = store
+        self._runner = runner or _run_full_fix
+        self._max_workers = max(1, max_workers_per_provider)
+        self._finished_max_bytes = max(0, int(finished_jobs_max_bytes))
+        self._lock = threading.Lock()
+        self._active: dict[str, _Job] = {}
+        self._finished: dict[str, _Job] = {}
+        # Jobs left queued or running by a previous process, by job id.
+        self._interrupted: dict[str, _Job] = {}
+        self._jobs: dict[str, _Job] = {}
+        self._queues: dict[str, deque[_Job]] = {}
+        self._running: dict[str, int] = {}
+        # Finished jobs whose final record is not written yet.
+        self._unsaved_finished = 0
+        self.cache_hits = 0
+        self.dedup_hits = 0
+        self.misses = 0
+
+    def set_max_workers(self, max_workers_per_provider: int) -> None:
+        """Change the per-provider pool size (queued jobs start if it grows)."""
+        with self._lock:
+            self._max_workers = max(1, int(max_workers_per_provider))
+            pools = list(self._queues)
+        for pool in pools:
+            self._dispatch(pool)
+
+    def submit(
+        self,
+        spec: AIFixJobSpec,
+        *,
+        status_callback: StatusCallback | None = None,
+        use_cache: bool = True,
+    ) -> Future[AIFullFixResult]:
+        """Queue a job, or join an identical queued/running/finished one.
+
+        Args:
+            spec: Job inputs.
+            status_callback: Receives progress messages from a worker thread.
+            use_cache: Whether a finished identical job may be reused.
+        """
+        key = spec.dedup_key()
+        future: Future[AIFullFixResult] = Future()
+        if use_cache:
+            detached = self._clone_finished(key)
+            if detached is not None:
+                future.set_result(detached)
+                return future
+        forgotten: list[_Job] = []
+        with self._lock:
+            active = self._active.get(key)
+            if active is not None:
+                self.dedup_hits += 1
+                active.futures.append(future)
+                if status_callback is not None:
+                    active.callbacks.append(status_callback)
+                return future
+            finished = self._finished.get(key)
+            if finished is not None:
+                forgotten.append(self._forget(finished))
+            # A new submit supersedes an interrupted run of the same request.
+            forgotten.extend(
+                self._interrupted.pop(job.job_id)
+                for job in list(self._interrupted.values())
+                if job.key == key
+            )
+            self.misses += 1
+            job = _Job(
+                job_id=uuid.uuid4().hex,
+                key=key,
+                spec=spec,
+                metrics=AIFixJobMetrics(
+                    job_id="",
+                    provider_pool=spec.provider_pool,
+                    status=_STATUS_QUEUED,
+                    queued_at=time.time(),
+                ),
+            )
+            job.metrics.job_id = job.job_id
+            job.futures.append(future)
+            if status_callback is not None:
+                job.callbacks.append(status_callback)
+            self._enqueue(job)
+        self._remove_forgotten(forgotten)
+        self._store.save(job)
+        self._dispatch(job.spec.provider_pool)
+        return future
+
+    def _clone_finished(self, key: str) -> AIFullFixResult | None:
+        """Clone the reusable result of the finished job ``key``, if any.
+
+        The clone is taken outside the lock. It is kept only if the job is
+        still cached afterwards, since a forgotten job's workspace may have
+        been removed while it was being copied.
+        """
+        with self._lock:
+            finished = self._finished.get(key)
+            cached = None if finished is None else finished.result
+        if cached is None or not _result_is_reusable(cached):
+            return None
+        try:
+            detached = _detach_result(cached)
+        except OSError:
+            logger.debug("Cached AI fix workspace could not be cloned", exc_info=True)
+            return None
+        with self._lock:
+            if (
+                finished is not None
+                and self._finished.get(key) is finished
+                and finished.result is cached
+            ):
+                self.cache_hits += 1
+                return detached
+        _discard_workspace(detached)
+        return None
+
+    def load(self) -> int:
+        """Load persisted jobs without running any of them.
+
+        Finished jobs seed the result cache. Jobs a previous process left
+        queued or running are kept aside until ``resume`` or
+        ``discard_interrupted`` is called, since running them again calls
+        the LLM.
+
+        Returns:
+            Number of interrupted jobs awaiting a decision.
+        """
+        for record in self._store.load_all():
+            try:
+                spec = AIFixJobSpec.from_payload(record["spec"])
+                result_payload = record.get("result")
+                result = (
+                    None if result_payload is None else _result_from_payload(result_payload)
+                )
+            except (KeyError, TypeError, ValueError):
+                self._store.delete(str(record.get("job_id")))
+                continue
+            status = str(record.get("status", _STATUS_QUEUED))
+            job = _Job(
+                job_id=str(record["job_id"]),
+                key=str(record.get("key", "")),
+                spec=spec,
+                metrics=AIFixJobMetrics(
+                    job_id=str(record["job_id"]),
+                    provider_pool=spec.provider_pool,
+                    status=status,
+                    queued_at=float(record.get("queued_at") or time.time()),
+                    started_at=record.get("started_at"),
+                    finished_at=record.get("finished_at"),
+                ),
+                result=result,
+            )
+            finished = status in (_STATUS_DONE, _STATUS_FAILED)
+            if finished:
+                job.disk_bytes = _workspace_bytes(result) + self._store.record_bytes(
+                    job.job_id
+                )
+            with self._lock:
+                if job.job_id in self._jobs or job.job_id in self._interrupted:
+                    continue
+                if finished:
+                    self._jobs[job.job_id] = job
+                    self._finished[job.key] = job
+                    continue
+                if job.key in self._active:
+                    continue
+                # Interrupted jobs start over from the queue if resumed.
+                job.metrics.status = _STATUS_QUEUED
+                job.metrics.started_at = None
+                self._interrupted[job.job_id] = job
+        with self._lock:
+            forgotten = self._prune_finished()
+            interrupted = len(self._interrupted)
+        self._remove_forgotten(forgotten)
+        return interrupted
+
+    def interrupted_jobs(self) -> dict[str, AIFixJobSpec]:
+        """Specs of the interrupted jobs awaiting a decision, by job id, oldest first."""
+        with self._lock:
+            jobs = sorted(self._interrupted.values(), key=lambda job: job.metrics.queued_at)
+        return {job.job_id: job.spec for job in jobs}
+
+    def resume(self, job_ids: Iterable[str] | None = None) -> int:
+        """Queue interrupted jobs again.
+
+        Args:
+            job_ids: Interrupted jobs to resume; all of them when None.
+
+        Returns:
+            Number of jobs queued again.
+        """
+        resumed: list[_Job] = []
+        with self._lock:
+            selected = list(self._interrupted) if job_ids is None else list(job_ids)
+            for job_id in selected:
+                job = self._interrupted.pop(job_id, None)
+                if job is None:
+                    continue
+                if job.key in self._active:
+                    # An identical job was submitted meanwhile; drop this one.
+                    self._store.delete(job.job_id)
+                    continue
+                job.metrics.queued_at = time.time()
+                self._enqueue(job)
+                resumed.append(job)
+        for job in resumed:
+            self._store.save(job)
+        for pool in {job.spec.provider_pool for job in resumed}:
+            self._dispatch(pool)
+        return len(resumed)
+
+    def discard_interrupted(self, job_ids: Iterable[str] | None = None) -> int:
+        """Delete interrupted jobs without running them.
+
+        Args:
+            job_ids: Interrupted jobs to discard; all of them when None.
+
+        Returns:
+            Number of jobs discarded.
+        """
+        with self._lock:
+            selected = list(self._interrupted) if job_ids is None else list(job_ids)
+            discarded = [
+                job
+                for job in (self._interrupted.pop(job_id, None) for job_id in selected)
+                if job is not None
+            ]
+        for job in discarded:
+            self._store.delete(job.job_id)
+        return len(discarded)
+
+    def metrics(self) -> list[AIFixJobMetrics]:
+        """Timing records of every known job, oldest first."""
+        with self._lock:
+            records = [job.metrics for job in self._jobs.values()]
+        return sorted(records, key=lambda record: record.queued_at)
+
+    def pending_count(self) -> int:
+        """Jobs queued, running, or finished but not yet persisted."""
+        with self._lock:
+            return len(self._active) + self._unsaved_finished
+
+    def _enqueue(self, job: _Job) -> None:
+        self._jobs[job.job_id] = job
+        self._active[job.key] = job
+        self._queues.setdefault(job.spec.provider_pool, deque()).append(job)
+
+    def _forget(self, job: _Job) -> _Job:
+        """Drop ``job`` from the cache; pass it to ``_remove_forgotten`` unlocked."""
+        self._jobs.pop(job.job_id, None)
+        if self._finished.get(job.key) is job:
+            del self._finished[job.key]
+        return job
+
+    def _remove_forgotten(self, jobs: list[_Job]) -> None:
+        """Delete the records and workspaces of forgotten jobs (lock not held)."""
+        for job in jobs:
+            self._store.delete(job.job_id)
+            _discard_workspace(job.result)
+
+    def _prune_finished(self, keep: _Job | None = None) -> list[_Job]:
+        """Forget the oldest finished jobs until they fit the disk budget.
+
+        ``keep`` (the job that just finished) is never pruned, so its waiters
+        can still clone its workspace.
+        """
+        total = sum(job.disk_bytes for job in self._finished.values())
+        if total <= self._finished_max_bytes:
+            return []
+        oldest = sorted(
+            self._finished.values(),
+            key=lambda job: job.metrics.finished_at or job.metrics.queued_at,
+        )
+        forgotten: list[_Job] = []
+        for job in oldest:
+            if total <= self._finished_max_bytes:
+                break
+            if job is keep:
+                continue
+            total -= job.disk_bytes
+            forgotten.append(self._forget(job))
+        return forgotten
+
+    def _dispatch(self, pool: str) -> None:
+        started: list[_Job] = []
+        with self._lock:
+            queue = self._queues.get(pool)
+            while queue and self._running.get(pool, 0) < self._max_workers:
+                job = queue.popleft()
+                self._running[pool] = self._running.get(pool, 0) + 1
+                job.metrics.status = _STATUS_RUNNING
+                job.metrics.started_at = time.time()
+                started.append(job)
+        for job in started:
+            self._store.save(job)
+            threading.Thread(
+                target=self._run,
+                args=(job,),
+                name=f"ai-fix-job-{job.job_id[:8]}",
+                daemon=True,
+            ).start()
+
+    def _notify(self, job: _Job, text: str) -> None:
+        with self._lock:
+            callbacks = list(job.callbacks)
+        for callback in callbacks:
+            try:
+                callback(text)
+            except Exception:
+                logger.debug("AI fix job status callback failed", exc_info=True)
+
+    def _run(self, job: _Job) -> None:
+        pool = job.spec.provider_pool
+        error: BaseException | None = None
+        result: AIFullFixResult | None = None
+        try:
+            result = self._runner(job.spec, lambda text: self._notify(job, text))
+        except Exception as exc:
+            logger.exception("AI fix job %s failed", job.job_id)
+            error = exc
+        disk_bytes = _workspace_bytes(result) + self._store.record_bytes(job.job_id)
+        with self._lock:
+            job.result = result
+            job.disk_bytes = disk_bytes
+            job.metrics.finished_at = time.time()
+            job.metrics.status = (
+                _STATUS_DONE if result is not None and result.ok else _STATUS_FAILED
+            )
+            job.callbacks.clear()
+            futures, job.futures = job.futures, []
+            if self._active.get(job.key) is job:
+                del self._active[job.key]
+            forgotten: list[_Job] = []
+            previous = self._finished.get(job.key)
+            if previous is not None and previous is not job:
+                forgotten.append(self._forget(previous))
+            self._finished[job.key] = job
+            forgotten.extend(self._prune_finished(keep=job))
+            self._running[pool] = max(0, self._running.get(pool, 0) - 1)
+            self._unsaved_finished += 1
+        try:
+            self._remove_forgotten(forgotten)
+            self._resolve_futures(job, futures, result, error)
+            self._store.save(job)
+        finally:
+            with self._lock:
+                self._unsaved_finished -= 1
+            self._dispatch(pool)
+
+    def _resolve_futures(
+        self,
+        job: _Job,
+        futures: list[Future[AIFullFixResult]],
+        result: AIFullFixResult | None,
+        error: BaseException | None,
+    ) -> None:
+        """Hand every waiter its own result; cancelled waiters get nothing."""
+        handed_over = False
+        for future in futures:
+            # Claims the future; False if its caller cancelled it already.
+            if not future.set_running_or_notify_cancel():
+                continue
+            if error is not None or result is None:
+                future.set_exception(error or RuntimeError("AI fix job produced no result"))
+                continue
+            try:
+                future.set_result(_detach_result(result))
+            except OSError:
+                # Give the caller the scheduler's own workspace; it stops being cached.
+                handed_over = True
+                future.set_result(result)
+        if handed_over:
+            record_bytes = self._store.record_bytes(job.job_id)
+            with self._lock:
+                job.result = None
+                job.disk_bytes = record_bytes
+
+
+_scheduler: AIFixJobScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def default_jobs_dir() -> Path:
+    """Queue directory under the application's configuration directory."""
+    try:
+        return ConfigManager.get_config_dir() / _JOBS_DIR_NAME
+    except ConfigError:
+        return Path(tempfile.gettempdir()) / f"kubeagle-{_JOBS_DIR_NAME}"
+
+
+def get_ai_fix_scheduler() -> AIFixJobScheduler:
+    """Return the process-wide scheduler, loading persisted jobs on first use.
+
+    Interrupted jobs are not run again until the user resumes them.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = AIFixJobScheduler(AIFixJobStore(default_jobs_dir()))
+            _scheduler.load()
+        return _scheduler
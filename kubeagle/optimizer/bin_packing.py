@@ -0,0 +1,298 @@
+"""First-fit-decreasing packing of replica requests onto node shapes.
+
+Replicas are packed on CPU and memory requests with a per-node pod cap.
+Identical replicas are handled as ``(cpu, memory, count)`` demands and
+identically filled nodes as one run with a node count, so packing 100k
+replicas touches a few thousand runs rather than every replica and node. A
+max segment tree over the runs finds the first run with room in logarithmic
+time on typical fleets.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+# Tolerance for float capacity comparisons (millicores / bytes).
+_EPSILON = 1e-6
+
+ReplicaDemand = tuple[float, float, int]
+
+
+@dataclass(frozen=True, slots=True)
+class PackingResult:
+    """Outcome of packing replicas onto one node shape.
+
+    Attributes:
+        nodes: Nodes opened for replicas that fit the node shape.
+        unschedulable: Replicas whose requests exceed an empty node.
+        unschedulable_cpu: Total CPU request of unschedulable replicas (millicores).
+        unschedulable_memory: Total memory request of unschedulable replicas (bytes).
+    """
+
+    nodes: int
+    unschedulable: int = 0
+    unschedulable_cpu: float = 0.0
+    unschedulable_memory: float = 0.0
+
+
+def group_replica_demands(
+    replicas: Iterable[tuple[float, float, int]],
+) -> list[ReplicaDemand]:
+    """Merge ``(cpu, memory, count)`` entries with identical requests."""
+    counts: dict[tuple[float, float], int] = {}
+    for cpu, memory, count in replicas:
+        if count <= 0:
+            continue
+        key = (max(float(cpu), 0.0), max(float(memory), 0.0))
+        counts[key] = counts.get(key, 0) + int(count)
+    return [(cpu, memory, count) for (cpu, memory), count in counts.items()]
+
+
+def _fit_count(free_cpu: float, free_mem: float, free_pods: float, cpu: float, mem: float) -> int:
+    count = int(free_pods)
+    if cpu > 0:
+        count = min(count, int((free_cpu + _EPSILON) // cpu))
+    if mem > 0:
+        count = min(count, int((free_mem + _EPSILON) // mem))
+    return max(count, 0)
+
+
+class _NodeRuns:
+    """Append-only node runs indexed by a max segment tree.
+
+    Each tree node holds the largest free CPU, memory and pod count below it,
+    so the first run that can take a replica is found without scanning every
+    open node.
+    """
+
+    __slots__ = ("cpu", "mem", "pods", "nodes", "_size", "_tree_cpu", "_tree_mem", "_tree_pods")
+
+    def __init__(self) -> None:
+        self.cpu: list[float] = []
+        self.mem: list[float] = []
+        self.pods: list[int] = []
+        self.nodes: list[int] = []
+        self._size = 0
+        self._tree_cpu: list[float] = []
+        self._tree_mem: list[float] = []
+        self._tree_pods: list[int] = []
+        self._rebuild(64)
+
+    def _rebuild(self, size: int) -> None:
+        self._size = size
+        self._tree_cpu = [-1.0] * (2 * size)
+        self._tree_mem = [-1.0] * (2 * size)
+        self._tree_pods = [0] * (2 * size)
+        for index in range(len(self.cpu)):
+            self._set_leaf(index)
+        for node in range(size - 1, 0, -1):
+            self._pull(node)
+
+    def _pull(self, node: int) -> None:
+        left, right = 2 * node, 2 * node + 1
+        self._tree_cpu[node] = max(self._tree_cpu[left], self._tree_cpu[right])
+        self._tree_mem[node] = max(self._tree_mem[left], self._tree_mem[right])
+        self._tree_pods[node] = max(self._tree_pods[left], self._tree_pods[right])
+
+    def append(self, cpu: float, mem: float, pods: int, nodes: int) -> None:
+        if len(self.cpu) == self._size:
+            self.cpu.append(cpu)
+            self.mem.append(mem)
+            self.pods.append(pods)
+            self.nodes.append(nodes)
+            self._rebuild(self._size * 2)
+            return
+        self.cpu.append(cpu)
+        self.mem.append(mem)
+        self.pods.append(pods)
+        self.nodes.append(nodes)
+        self.update(len(self.cpu) - 1)
+
+    def _set_leaf(self, index: int) -> None:
+        leaf = self._size + index
+        if self.pods[index] < 1:
+            # Full nodes must not lift their parents' CPU/memory maxima.
+            self._tree_cpu[leaf] = -1.0
+            self._tree_mem[leaf] = -1.0
+            self._tree_pods[leaf] = 0
+            return
+        self._tree_cpu[leaf] = self.cpu[index]
+        self._tree_mem[leaf] = self.mem[index]
+        self._tree_pods[leaf] = self.pods[index]
+
+    def take(self, index: int, cpu: float, mem: float, pods: int) -> None:
+        """Reserve resources on every node of run ``index``."""
+        self.cpu[index] -= cpu
+        self.mem[index] -= mem
+        self.pods[index] -= pods
+        self.update(index)
+
+    def update(self, index: int) -> None:
+        self._set_leaf(index)
+        tree_cpu, tree_mem, tree_pods = self._tree_cpu, self._tree_mem, self._tree_pods
+        node = (self._size + index) // 2
+        while node:
+            left = 2 * node
+            right = left + 1
+            cpu = tree_cpu[left] if tree_cpu[left] > tree_cpu[right] else tree_cpu[right]
+            mem = tree_mem[left] if tree_mem[left] > tree_mem[right] else tree_mem[right]
+            pods = tree_pods[left] if tree_pods[left] > tree_pods[right] else tree_pods[right]
+            if cpu == tree_cpu[node] and mem == tree_mem[node] and pods == tree_pods[node]:
+                # Ancestors already reflect this subtree.
+                return
+            tree_cpu[node] = cpu
+            tree_mem[node] = mem
+            tree_pods[node] = pods
+            node //= 2
+
+    def first_fit(self, cpu: float, mem: float) -> int:
+        """Return the index of the first run with room for one replica, or -1."""
+        cpu -= _EPSILON
+        mem -= _EPSILON
+        tree_cpu, tree_mem, tree_pods = self._tree_cpu, self._tree_mem, self._tree_pods
+        if tree_pods[1] < 1 or tree_cpu[1] < cpu or tree_mem[1] < mem:
+            return -1
+        size = self._size
+        pending: list[int] = []
+        node = 1
+        while node < size:
+            left = 2 * node
+            right = left + 1
+            right_fits = tree_pods[right] >= 1 and tree_cpu[right] >= cpu and tree_mem[right] >= mem
+            if tree_pods[left] >= 1 and tree_cpu[left] >= cpu and tree_mem[left] >= mem:
+                if right_fits:
+                    pending.append(right)
+                node = left
+            elif right_fits:
+                node = right
+            elif pending:
+                node = pending.pop()
+            else:
+                return -1
+        return node - size
+
+
+def sort_by_dominant_share(
+    demands: list[ReplicaDemand],
+    *,
+    cpu_capacity: float,
+    memory_capacity: float,
+) -> list[ReplicaDemand]:
+    """Order demands by dominant share of a node, largest first.
+
+    The order only depends on the node's CPU/memory ratio, so one sorted
+    list serves every node shape with that ratio.
+    """
+    return sorted(
+        demands,
+        key=lambda demand: max(demand[0] * memory_capacity, demand[1] * cpu_capacity),
+        reverse=True,
+    )
+
+
+def pack_first_fit_decreasing(
+    demands: list[ReplicaDemand],
+    *,
+    cpu_capacity: float,
+    memory_capacity: float,
+    max_pods: int,
+    presorted: bool = False,
+) -> PackingResult:
+    """Pack replicas onto identical nodes with first-fit-decreasing.
+
+    Demands are ordered by their dominant share of the node (the larger of
+    the CPU and memory fractions), largest first. When a replica run only
+    partly fills a node run, the untouched nodes move to the end of the
+    node order; this keeps runs append-only and barely changes the count.
+
+    Args:
+        demands: ``(cpu_millicores, memory_bytes, replica_count)`` per shape,
+            normally from ``group_replica_demands``.
+        cpu_capacity: Schedulable CPU per node (millicores).
+        memory_capacity: Schedulable memory per node (bytes).
+        max_pods: Pods that can be scheduled per node.
+        presorted: Whether ``demands`` already come from
+            ``sort_by_dominant_share`` for this node's CPU/memory ratio.
+
+    Returns:
+        Node count and the replicas that cannot fit this node shape.
+    """
+    unschedulable = 0
+    unschedulable_cpu = 0.0
+    unschedulable_memory = 0.0
+    fitting: list[ReplicaDemand] = []
+    for cpu, mem, count in demands:
+        if count <= 0:
+            continue
+        if (
+            max_pods < 1
+            or cpu > cpu_capacity + _EPSILON
+            or mem > memory_capacity + _EPSILON
+        ):
+            unschedulable += count
+            unschedulable_cpu += cpu * count
+            unschedulable_memory += mem * count
+        else:
+            fitting.append((cpu, mem, count))
+
+    if not presorted:
+        fitting = sort_by_dominant_share(
+            fitting, cpu_capacity=cpu_capacity, memory_capacity=memory_capacity,
+        )
+
+    runs = _NodeRuns()
+    nodes = 0
+    for cpu, mem, count in fitting:
+        remaining = count
+        while remaining:
+            index = runs.first_fit(cpu, mem)
+            if index < 0:
+                break
+            free_cpu, free_mem, free_pods = runs.cpu[index], runs.mem[index], runs.pods[index]
+            per_node = _fit_count(free_cpu, free_mem, free_pods, cpu, mem)
+            run_nodes = runs.nodes[index]
+            if per_node * run_nodes <= remaining:
+                remaining -= per_node * run_nodes
+                runs.take(index, per_node * cpu, per_node * mem, per_node)
+                continue
+            # Only part of the run is needed: split off the partly filled node
+            # and the untouched nodes, then finish this demand.
+            full_nodes, rest = divmod(remaining, per_node)
+            remaining = 0
+            untouched = run_nodes - full_nodes - (1 if rest else 0)
+            if rest:
+                runs.append(free_cpu - rest * cpu, free_mem - rest * mem, free_pods - rest, 1)
+            if untouched:
+                runs.append(free_cpu, free_mem, free_pods, untouched)
+            if full_nodes:
+                runs.nodes[index] = full_nodes
+                runs.take(index, per_node * cpu, per_node * mem, per_node)
+            else:
+                runs.take(index, 0.0, 0.0, free_pods)
+
+        if remaining:
+            per_node = _fit_count(cpu_capacity, memory_capacity, max_pods, cpu, mem)
+            full_nodes, rest = divmod(remaining, per_node)
+            if full_nodes:
+                runs.append(
+                    cpu_capacity - per_node * cpu,
+                    memory_capacity - per_node * mem,
+                    max_pods - per_node,
+                    full_nodes,
+                )
+            if rest:
+                runs.append(
+                    cpu_capacity - rest * cpu,
+                    memory_capacity - rest * mem,
+                    max_pods - rest,
+                    1,
+                )
+            nodes += full_nodes + (1 if rest else 0)
+
+    return PackingResult(
+        nodes=nodes,
+        unschedulable=unschedulable,
+        unschedulable_cpu=unschedulable_cpu,
+        unschedulable_memory=unschedulable_memory,
+    )
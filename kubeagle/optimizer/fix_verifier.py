@@ -1,8 +1,19 @@
-"""Fix verification dataclasses used by optimizer UI."""
+"""Fix verification dataclasses and render-based bulk verification."""
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from kubeagle.optimizer.helm_renderer import HelmRenderResult, render_chart
+from kubeagle.optimizer.rendered_rule_input import (
+    RenderedWorkload,
+    build_rendered_workloads,
+)
+from kubeagle.optimizer.rules import RULES_BY_ID
+from kubeagle.optimizer.yaml_patcher import apply_values_yaml_patch
 
 
 @dataclass(slots=True)
@@ -23,3 +34,165 @@ class FullFixBundleVerificationResult:
     status: str  # verified|unresolved|unverified|not_run
     note: str = ""
     per_violation: dict[str, FixVerificationResult] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class ValuesFixCandidate:
+    """One accepted values fix awaiting render verification."""
+
+    key: str
+    rule_id: str
+    values_patch: dict[str, Any]
+
+
+@dataclass(slots=True)
+class BulkFixVerificationResult:
+    """Per-fix verification results for one chart plus render accounting."""
+
+    per_fix: dict[str, FixVerificationResult] = field(default_factory=dict)
+    render_count: int = 0
+    # Keys of fixes that break rendering on their own.
+    render_failed: set[str] = field(default_factory=set)
+
+
+Renderer = Callable[..., HelmRenderResult]
+
+# Render errors caused by the values content; other failures (helm missing,
+# timeouts) say nothing about individual fixes and are not bisected.
+_CONTENT_RENDER_ERRORS = frozenset({"render_failed", "yaml_parse_error", "parent_render_failed"})
+
+
+def verify_values_fixes_bulk(
+    *,
+    chart_dir: Path,
+    values_path: Path,
+    candidates: list[ValuesFixCandidate],
+    release_name: str | None = None,
+    timeout_seconds: int = 30,
+    renderer: Renderer = render_chart,
+) -> BulkFixVerificationResult:
+    """Verify all values fixes of one chart with a single merged render.
+
+    Every candidate's patch is merged into one values document and rendered
+    once; each fix is then verified by re-running its rule over the rendered
+    workloads. Only when the merged render fails is the candidate set
+    bisected to isolate the fixes that break rendering. Each bisected group
+    is rendered on top of the fixes already kept, so the final kept set is
+    always rendered together (fixes that only break in combination are
+    caught) and every kept fix is verified against that render.
+
+    Args:
+        chart_dir: Chart directory to render.
+        values_path: Values file the patches apply to.
+        candidates: Accepted fixes, in application order.
+        release_name: Helm release name used for rendering.
+        timeout_seconds: Timeout for each ``helm template`` run.
+        renderer: Render function (``render_chart`` signature).
+
+    Returns:
+        Results keyed by ``ValuesFixCandidate.key`` and the number of renders.
+    """
+    result = BulkFixVerificationResult()
+    if not candidates:
+        return result
+    try:
+        base_content = values_path.read_text(encoding="utf-8")
+    except OSError as exc:
+        for candidate in candidates:
+            result.per_fix[candidate.key] = FixVerificationResult(
+                status="unverified",
+                note=f"Values file could not be read: {exc!s}",
+            )
+        return result
+
+    patchable: list[ValuesFixCandidate] = []
+    for candidate in candidates:
+        try:
+            apply_values_yaml_patch(base_content, candidate.values_patch)
+        except Exception as exc:
+            result.per_fix[candidate.key] = FixVerificationResult(
+                status="unverified",
+                note=f"Values patch could not be applied: {exc!s}",
+            )
+            continue
+        patchable.append(candidate)
+
+    kept: list[ValuesFixCandidate] = []
+    workloads: list[RenderedWorkload] = []
+    pending = [patchable] if patchable else []
+    while pending:
+        group = pending.pop()
+        content = base_content
+        for candidate in (*kept, *group):
+            content = apply_values_yaml_patch(content, candidate.values_patch)
+        render_result = renderer(
+            chart_dir=chart_dir,
+            values_file=values_path,
+            release_name=release_name,
+            timeout_seconds=timeout_seconds,
+            values_content=content,
+        )
+        result.render_count += 1
+        if render_result.ok:
+            kept.extend(group)
+            workloads = build_rendered_workloads(
+                render_result.docs,
+                chart_name=release_name or chart_dir.name,
+            )
+            continue
+        error = render_result.error_message or render_result.error_kind or "render failed"
+        if render_result.error_kind not in _CONTENT_RENDER_ERRORS:
+            for candidate in group:
+                result.per_fix[candidate.key] = FixVerificationResult(
+                    status="unverified",
+                    note=f"Render unavailable: {error}",
+                )
+            continue
+        if len(group) == 1:
+            result.per_fix[group[0].key] = FixVerificationResult(
+                status="unverified",
+                note=f"Render failed with this fix applied: {error}",
+            )
+            result.render_failed.add(group[0].key)
+            continue
+        middle = len(group) // 2
+        # Pop order renders the first half before the second.
+        pending.extend((group[middle:], group[:middle]))
+    # The last successful render contained exactly the kept fixes.
+    for candidate in kept:
+        result.per_fix[candidate.key] = _verify_against_render(candidate, workloads)
+    return result
+
+
+def _verify_against_render(
+    candidate: ValuesFixCandidate,
+    workloads: list[RenderedWorkload],
+) -> FixVerificationResult:
+    rule = RULES_BY_ID.get(candidate.rule_id)
+    if rule is None:
+        return FixVerificationResult(
+            status="unverified",
+            note=f"Rule {candidate.rule_id} cannot be checked on rendered output.",
+        )
+    if not workloads:
+        return FixVerificationResult(
+            status="unverified",
+            note="Rendered output contains no workloads to check.",
+        )
+    still_violating = any(
+        rule.evaluate(workload.features)
+        if rule.evaluate is not None
+        else rule.check(workload.rule_input)
+        for workload in workloads
+    )
+    if still_violating:
+        return FixVerificationResult(
+            status="unresolved",
+            note="Violation still present in rendered manifests after fix.",
+            after_has_violation=True,
+        )
+    return FixVerificationResult(
+        status="verified",
+        note="Violation resolved in rendered manifests.",
+        after_has_violation=False,
+    )
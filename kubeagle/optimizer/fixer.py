@@ -1,15 +1,22 @@
 """Fix generator for optimization violations."""
 
+import contextlib
 import logging
+import os
+import tempfile
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
+from kubeagle.optimizer.full_fix_applier import _chart_lock
 from kubeagle.optimizer.rules import (
     BURSTABLE_TARGET_RATIO,
     OptimizationViolation,
     _parse_cpu,
     _parse_memory,
 )
-from kubeagle.optimizer.yaml_patcher import apply_values_yaml_patch
+from kubeagle.optimizer.yaml_patcher import ValuesPatchSession
 
 logger = logging.getLogger(__name__)
 
@@ -405,6 +412,29 @@ class FixGenerator:
         return probe
 
 
+@dataclass(slots=True)
+class ValuesFixBatchResult:
+    """Outcome of applying several fixes to one values file.
+
+    Attributes:
+        values_path: The values file that was patched.
+        applied: Per-fix success flags, in input order.
+        errors: Error message per failed fix index.
+        diff: Unified diff of the written change (empty when nothing changed).
+        cancelled: True when the write was skipped because of cancellation.
+    """
+
+    values_path: str
+    applied: list[bool]
+    errors: dict[int, str]
+    diff: str = ""
+    cancelled: bool = False
+
+    @property
+    def applied_count(self) -> int:
+        return sum(self.applied)
+
+
 def apply_fix(values_path: str, fix: dict[str, Any]) -> bool:
     """Apply a fix to a values.yaml file.
 
@@ -415,33 +445,114 @@ def apply_fix(values_path: str, fix: dict[str, Any]) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    # Read file content once for both backup and processing
-    try:
-        with open(values_path) as f:
-            content = f.read()
-    except OSError as e:
-        logger.error("Failed to read values file %s: %s", values_path, e)
-        return False
+    return apply_fixes(values_path, [fix]).applied[0]
 
-    try:
-        updated_content = apply_values_yaml_patch(content, fix)
-        with open(values_path, "w") as f:
-            f.write(updated_content)
-    except OSError as e:
-        logger.error("Failed to write values file %s: %s", values_path, e)
-        # Best-effort in-memory rollback without leaving backup artifacts.
+
+def apply_fixes(
+    values_path: str,
+    fixes: list[dict[str, Any]],
+    should_stop: Callable[[], bool] | None = None,
+) -> ValuesFixBatchResult:
+    """Apply many fixes to one values file with a single load and write.
+
+    Fixes are merged into one ``ValuesPatchSession`` and rendered once. If the
+    combined patch fails, fixes are replayed one by one so only the failing
+    ones are dropped. The file is written atomically, once, while holding the
+    chart lock shared with full-fix bundle applies.
+
+    Args:
+        values_path: Path to the values.yaml file
+        fixes: Fix dictionaries, in the order they should apply
+        should_stop: Optional callable checked right before the write; when
+            it returns True the file is left untouched
+
+    Returns:
+        Per-fix outcome and the diff that was written
+    """
+    result = ValuesFixBatchResult(
+        values_path=values_path, applied=[False] * len(fixes), errors={},
+    )
+    if not fixes:
+        return result
+    target = Path(values_path).expanduser().resolve()
+    with _chart_lock(target.parent):
         try:
-            with open(values_path, "w") as f:
-                f.write(content)
-        except OSError as rollback_error:
-            logger.error(
-                "Failed to rollback values file %s after write error: %s",
-                values_path,
-                rollback_error,
-            )
-        return False
+            content = target.read_text()
+        except OSError as e:
+            logger.error("Failed to read values file %s: %s", values_path, e)
+            result.errors = dict.fromkeys(range(len(fixes)), str(e))
+            return result
+
+        session = _build_patch_session(content, fixes, result)
+        if not any(result.applied):
+            return result
+        updated_content = session.render()
+        if updated_content == content:
+            return result
+        if should_stop is not None and should_stop():
+            logger.debug("Skipped writing %s: fix apply cancelled", values_path)
+            result.applied = [False] * len(fixes)
+            result.cancelled = True
+            return result
+        try:
+            _write_atomic(target, updated_content)
+        except OSError as e:
+            logger.error("Failed to write values file %s: %s", values_path, e)
+            for index, applied in enumerate(result.applied):
+                if applied:
+                    result.errors[index] = str(e)
+            result.applied = [False] * len(fixes)
+            return result
+        result.diff = session.diff(target.name)
+    return result
+
+
+def _build_patch_session(
+    content: str,
+    fixes: list[dict[str, Any]],
+    result: ValuesFixBatchResult,
+) -> ValuesPatchSession:
+    session = ValuesPatchSession(content)
+    try:
+        for fix in fixes:
+            session.add(fix)
+        session.render()
     except Exception as e:
-        logger.error("Failed to apply fix to values file %s: %s", values_path, e)
-        return False
-
-    return True
+        logger.debug(
+            "Combined patch failed for %s, replaying fixes one by one: %s",
+            result.values_path,
+            e,
+        )
+    else:
+        result.applied = [True] * len(fixes)
+        return session
+
+    # Replay one by one to isolate the fixes that cannot be applied.
+    session = ValuesPatchSession(content)
+    for index, fix in enumerate(fixes):
+        candidate = ValuesPatchSession(content)
+        try:
+            candidate.add(session.patch)
+            candidate.add(fix)
+            candidate.render()
+        except Exception as e:
+            logger.error("Failed to apply fix to values file %s: %s", result.values_path, e)
+            result.errors[index] = str(e)
+            continue
+        session = candidate
+        result.applied[index] = True
+    return session
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        with contextlib.suppress(OSError):
+            os.chmod(temp_name, path.stat().st_mode & 0o7777)
+        os.replace(temp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_name)
+        raise
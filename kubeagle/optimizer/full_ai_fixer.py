@@ -26,6 +26,7 @@ from kubeagle.optimizer.llm_patch_protocol import (
     FullFixViolationCoverage,
     with_system_prompt_override,
 )
+from kubeagle.optimizer.staged_workspace import TreeSnapshot, clone_tree
 
 # Single-shot direct-edit policy: one provider attempt per run.
 _MAX_DIRECT_EDIT_PROVIDER_ATTEMPTS = 1
@@ -314,204 +315,215 @@ def _generate_ai_full_fix_direct_edit(
     rel_values_path = _resolve_values_relative_path(chart_dir=chart_dir, values_path=values_path)
     allowed_scope = set(allowed_files)
     allowed_scope.add(rel_values_path)
-    for provider in _provider_order_direct_edit(preferred_provider):
-        tried.append(provider.value)
-        if not provider_supports_direct_edit(provider):
-            reason = provider_unavailable_reason(provider)
-            detail = f" ({reason})" if reason else ""
-            errors.append(f"{provider.value}: direct-edit backend unavailable{detail}, skipping provider.")
-            continue
-        model = None
-        if provider_models is not None and provider in provider_models:
-            raw_model = str(provider_models[provider] or "").strip()
-            model = raw_model or None
-
-        retry_error = ""
-        for attempt in range(1, _MAX_DIRECT_EDIT_PROVIDER_ATTEMPTS + 1):
-            _notify(f"Direct-edit: {provider.value} (attempt {attempt})...")
-            stage_root, staged_chart_dir = _create_staged_workspace(chart_dir)
-            source_guard_root, source_guard_chart_dir = _create_staged_workspace(chart_dir)
-            direct_prompt = _build_direct_edit_prompt(
-                chart_dir=chart_dir,
-                rel_values_path=rel_values_path,
-                violations=violations,
-                seed_fix_payload=seed_fix_payload,
-                allowed_files=allowed_files,
-                retry_error=retry_error,
-                system_prompt_override=full_fix_system_prompt,
-            )
-            direct_result = run_llm_direct_edit(
-                provider=provider,
-                prompt=direct_prompt,
-                timeout_seconds=max(1, int(timeout_seconds)),
-                cwd=staged_chart_dir,
-                model=model,
-                attempts=attempt,
-            )
-            last_log_text = direct_result.log_text
-            source_touched, _, _ = _detect_workspace_delta(
-                before_hashes=_snapshot_relative_hashes(source_guard_chart_dir),
-                after_hashes=_snapshot_relative_hashes(chart_dir),
-            )
-            if source_touched:
-                _restore_workspace_from_snapshot(
-                    target_root=chart_dir,
-                    snapshot_root=source_guard_chart_dir,
-                    touched_paths=source_touched,
+    # One pristine clone of the chart guards the source and resets the staged
+    # workspace between attempts, so each attempt only restores what it touched.
+    source_guard_root, source_guard_chart_dir = _create_staged_workspace(chart_dir)
+    source_guard = TreeSnapshot.capture(source_guard_chart_dir)
+    stage_root: Path | None = None
+    staged_chart_dir = source_guard_chart_dir
+    try:
+        for provider in _provider_order_direct_edit(preferred_provider):
+            tried.append(provider.value)
+            if not provider_supports_direct_edit(provider):
+                reason = provider_unavailable_reason(provider)
+                detail = f" ({reason})" if reason else ""
+                errors.append(f"{provider.value}: direct-edit backend unavailable{detail}, skipping provider.")
+                continue
+            model = None
+            if provider_models is not None and provider in provider_models:
+                raw_model = str(provider_models[provider] or "").strip()
+                model = raw_model or None
+
+            retry_error = ""
+            for attempt in range(1, _MAX_DIRECT_EDIT_PROVIDER_ATTEMPTS + 1):
+                _notify(f"Direct-edit: {provider.value} (attempt {attempt})...")
+                if stage_root is None:
+                    stage_root, staged_chart_dir = _create_staged_workspace(chart_dir)
+                else:
+                    _reset_staged_workspace(
+                        staged_chart_dir=staged_chart_dir,
+                        source_guard=source_guard,
+                    )
+                direct_prompt = _build_direct_edit_prompt(
+                    chart_dir=chart_dir,
+                    rel_values_path=rel_values_path,
+                    violations=violations,
+                    seed_fix_payload=seed_fix_payload,
+                    allowed_files=allowed_files,
+                    retry_error=retry_error,
+                    system_prompt_override=full_fix_system_prompt,
                 )
-                changed_sample = ", ".join(source_touched[:3])
-                extra = "..." if len(source_touched) > 3 else ""
-                retry_error = (
-                    "Unsafe source-chart mutation detected and reverted "
-                    f"({changed_sample}{extra})."
+                direct_result = run_llm_direct_edit(
+                    provider=provider,
+                    prompt=direct_prompt,
+                    timeout_seconds=max(1, int(timeout_seconds)),
+                    cwd=staged_chart_dir,
+                    model=model,
+                    attempts=attempt,
                 )
-                errors.append(f"{provider.value}: {retry_error}")
-                _cleanup_stage_root(source_guard_root)
-                if attempt < _MAX_DIRECT_EDIT_PROVIDER_ATTEMPTS:
-                    _cleanup_stage_root(stage_root)
-                    continue
-                errors.append(
-                    f"{provider.value}: retained failed workspace for debugging at {stage_root}"
+                last_log_text = direct_result.log_text
+                source_touched, _, _ = _detect_workspace_delta(
+                    before=source_guard,
+                    after=TreeSnapshot.capture(chart_dir),
                 )
-                break
-            touched_paths, created_paths, deleted_paths = _detect_workspace_changes(
-                original_chart_dir=chart_dir,
-                staged_chart_dir=staged_chart_dir,
-            )
-            discarded_out_of_scope = _discard_out_of_scope_workspace_changes(
-                original_chart_dir=chart_dir,
-                staged_chart_dir=staged_chart_dir,
-                touched_paths=touched_paths,
-                allowed_scope=allowed_scope,
-            )
-            if discarded_out_of_scope:
-                sample = ", ".join(discarded_out_of_scope[:3])
-                extra = "..." if len(discarded_out_of_scope) > 3 else ""
-                _notify(f"Scope guard: discarded out-of-scope edits ({sample}{extra}).")
+                if source_touched:
+                    _restore_workspace_from_snapshot(
+                        target_root=chart_dir,
+                        snapshot_root=source_guard_chart_dir,
+                        touched_paths=source_touched,
+                    )
+                    changed_sample = ", ".join(source_touched[:3])
+                    extra = "..." if len(source_touched) > 3 else ""
+                    retry_error = (
+                        "Unsafe source-chart mutation detected and reverted "
+                        f"({changed_sample}{extra})."
+                    )
+                    errors.append(f"{provider.value}: {retry_error}")
+                    if attempt < _MAX_DIRECT_EDIT_PROVIDER_ATTEMPTS:
+                        continue
+                    errors.append(
+                        f"{provider.value}: retained failed workspace for debugging at {stage_root}"
+                    )
+                    stage_root = None
+                    break
                 touched_paths, created_paths, deleted_paths = _detect_workspace_changes(
-                    original_chart_dir=chart_dir,
+                    source_guard=source_guard,
                     staged_chart_dir=staged_chart_dir,
                 )
-            changed_rel_paths = sorted(
-                [path for path in touched_paths if path in allowed_scope]
-            )
-            scope_error = _validate_direct_edit_scope(
-                touched_paths=touched_paths,
-                created_paths=created_paths,
-                deleted_paths=deleted_paths,
-                allowed_scope=allowed_scope,
-                rel_values_path=rel_values_path,
-            )
-            if not direct_result.ok:
-                retry_error = direct_result.error_message or "direct-edit command failed."
-                errors.append(f"{provider.value}: {retry_error}")
-                _cleanup_stage_root(source_guard_root)
-                if attempt < _MAX_DIRECT_EDIT_PROVIDER_ATTEMPTS:
-                    _cleanup_stage_root(stage_root)
-                    continue
-                errors.append(
-                    f"{provider.value}: retained failed workspace for debugging at {stage_root}"
+                discarded_out_of_scope = _discard_out_of_scope_workspace_changes(
+                    original_chart_dir=source_guard_chart_dir,
+                    staged_chart_dir=staged_chart_dir,
+                    touched_paths=touched_paths,
+                    allowed_scope=allowed_scope,
+                )
+                if discarded_out_of_scope:
+                    sample = ", ".join(discarded_out_of_scope[:3])
+                    extra = "..." if len(discarded_out_of_scope) > 3 else ""
+                    _notify(f"Scope guard: discarded out-of-scope edits ({sample}{extra}).")
+                    touched_paths, created_paths, deleted_paths = _detect_workspace_changes(
+                        source_guard=source_guard,
+                        staged_chart_dir=staged_chart_dir,
+                    )
+                changed_rel_paths = sorted(
+                    [path for path in touched_paths if path in allowed_scope]
+                )
+                scope_error = _validate_direct_edit_scope(
+                    touched_paths=touched_paths,
+                    created_paths=created_paths,
+                    deleted_paths=deleted_paths,
+                    allowed_scope=allowed_scope,
+                    rel_values_path=rel_values_path,
                 )
-                break
-            if scope_error:
-                retry_error = scope_error
-                errors.append(f"{provider.value}: {scope_error}")
-                _cleanup_stage_root(source_guard_root)
-                if attempt < _MAX_DIRECT_EDIT_PROVIDER_ATTEMPTS:
+                if not direct_result.ok:
+                    retry_error = direct_result.error_message or "direct-edit command failed."
+                    errors.append(f"{provider.value}: {retry_error}")
+                    if attempt < _MAX_DIRECT_EDIT_PROVIDER_ATTEMPTS:
+                        continue
+                    errors.append(
+                        f"{provider.value}: retained failed workspace for debugging at {stage_root}"
+                    )
+                    stage_root = None
+                    break
+                if scope_error:
+                    retry_error = scope_error
+                    errors.append(f"{provider.value}: {scope_error}")
+                    if attempt < _MAX_DIRECT_EDIT_PROVIDER_ATTEMPTS:
+                        continue
+                    errors.append(
+                        f"{provider.value}: retained failed workspace for debugging at {stage_root}"
+                    )
+                    stage_root = None
+                    break
+                if not changed_rel_paths:
                     _cleanup_stage_root(stage_root)
-                    continue
-                errors.append(
-                    f"{provider.value}: retained failed workspace for debugging at {stage_root}"
+                    stage_root = None
+                    response = FullFixResponse(
+                        result="no_change",
+                        summary="Direct-edit run completed with no file changes.",
+                        values_patch={},
+                        template_patches=[],
+                        violation_coverage=[
+                            FullFixViolationCoverage(
+                                rule_id=item.rule_id,
+                                status="unchanged",
+                                note="No file changes generated.",
+                            )
+                            for item in violations
+                        ],
+                    )
+                    return AIFullFixResult(
+                        ok=True,
+                        status="no_change",
+                        provider=provider.value,
+                        prompt=direct_prompt,
+                        response=response,
+                        note=f"Direct-edit mode completed with `{provider.value}` and produced no changes.",
+                        tried_providers=tried,
+                        errors=errors,
+                        raw_output_text=direct_result.log_text,
+                    )
+
+                response, response_error = _build_response_from_staged_workspace(
+                    chart_dir=chart_dir,
+                    staged_chart_dir=staged_chart_dir,
+                    rel_values_path=rel_values_path,
+                    changed_rel_paths=changed_rel_paths,
+                    violations=violations,
                 )
-                break
-            if not changed_rel_paths:
-                _cleanup_stage_root(source_guard_root)
-                _cleanup_stage_root(stage_root)
-                response = FullFixResponse(
-                    result="no_change",
-                    summary="Direct-edit run completed with no file changes.",
-                    values_patch={},
-                    template_patches=[],
-                    violation_coverage=[
-                        FullFixViolationCoverage(
-                            rule_id=item.rule_id,
-                            status="unchanged",
-                            note="No file changes generated.",
-                        )
-                        for item in violations
-                    ],
+                if response_error:
+                    retry_error = response_error
+                    errors.append(f"{provider.value}: {response_error}")
+                    if attempt < _MAX_DIRECT_EDIT_PROVIDER_ATTEMPTS:
+                        continue
+                    errors.append(
+                        f"{provider.value}: retained failed workspace for debugging at {stage_root}"
+                    )
+                    stage_root = None
+                    break
+                if response is None:
+                    retry_error = "Internal error: staged response generation returned no payload."
+                    errors.append(f"{provider.value}: {retry_error}")
+                    if attempt < _MAX_DIRECT_EDIT_PROVIDER_ATTEMPTS:
+                        continue
+                    errors.append(
+                        f"{provider.value}: retained failed workspace for debugging at {stage_root}"
+                    )
+                    stage_root = None
+                    break
+                source_hashes = {
+                    rel_path: source_guard.digest(rel_path) or ""
+                    for rel_path in changed_rel_paths
+                }
+                execution_log = (
+                    f"{direct_result.log_text}\n\nStaged Workspace: {stage_root}\n"
+                    f"Staged Chart: {staged_chart_dir}"
+                ).strip()
+                artifact = AIFullFixStagedArtifact(
+                    stage_root=stage_root,
+                    staged_chart_dir=staged_chart_dir,
+                    rel_values_path=rel_values_path,
+                    changed_rel_paths=changed_rel_paths,
+                    source_hashes=source_hashes,
+                    provider=provider.value,
+                    execution_log=execution_log,
                 )
+                stage_root = None
                 return AIFullFixResult(
                     ok=True,
-                    status="no_change",
+                    status=response.result,
                     provider=provider.value,
                     prompt=direct_prompt,
                     response=response,
-                    note=f"Direct-edit mode completed with `{provider.value}` and produced no changes.",
+                    note=f"Direct-edit full fix generated using `{provider.value}`.",
                     tried_providers=tried,
                     errors=errors,
-                    raw_output_text=direct_result.log_text,
+                    raw_output_text=execution_log,
+                    staged_artifact=artifact,
                 )
-
-            response, response_error = _build_response_from_staged_workspace(
-                chart_dir=chart_dir,
-                staged_chart_dir=staged_chart_dir,
-                rel_values_path=rel_values_path,
-                changed_rel_paths=changed_rel_paths,
-                violations=violations,
-            )
-            if response_error:
-                retry_error = response_error
-                errors.append(f"{provider.value}: {response_error}")
-                _cleanup_stage_root(source_guard_root)
-                if attempt < _MAX_DIRECT_EDIT_PROVIDER_ATTEMPTS:
-                    _cleanup_stage_root(stage_root)
-                    continue
-                errors.append(
-                    f"{provider.value}: retained failed workspace for debugging at {stage_root}"
-                )
-                break
-            if response is None:
-                retry_error = "Internal error: staged response generation returned no payload."
-                errors.append(f"{provider.value}: {retry_error}")
-                _cleanup_stage_root(source_guard_root)
-                if attempt < _MAX_DIRECT_EDIT_PROVIDER_ATTEMPTS:
-                    _cleanup_stage_root(stage_root)
-                    continue
-                errors.append(
-                    f"{provider.value}: retained failed workspace for debugging at {stage_root}"
-                )
-                break
-            source_hashes = {
-                rel_path: _hash_file_sha256((chart_dir / rel_path).resolve())
-                for rel_path in changed_rel_paths
-            }
-            _cleanup_stage_root(source_guard_root)
-            execution_log = (
-                f"{direct_result.log_text}\n\nStaged Workspace: {stage_root}\n"
-                f"Staged Chart: {staged_chart_dir}"
-            ).strip()
-            artifact = AIFullFixStagedArtifact(
-                stage_root=stage_root,
-                staged_chart_dir=staged_chart_dir,
-                rel_values_path=rel_values_path,
-                changed_rel_paths=changed_rel_paths,
-                source_hashes=source_hashes,
-                provider=provider.value,
-                execution_log=execution_log,
-            )
-            return AIFullFixResult(
-                ok=True,
-                status=response.result,
-                provider=provider.value,
-                prompt=direct_prompt,
-                response=response,
-                note=f"Direct-edit full fix generated using `{provider.value}`.",
-                tried_providers=tried,
-                errors=errors,
-                raw_output_text=execution_log,
-                staged_artifact=artifact,
-            )
+    finally:
+        _cleanup_stage_root(source_guard_root)
+        if stage_root is not None:
+            _cleanup_stage_root(stage_root)
 
     return AIFullFixResult(
         ok=False,
@@ -639,10 +651,19 @@ def _all_canonical_values_guidance_block() -> str:
 def _create_staged_workspace(chart_dir: Path) -> tuple[Path, Path]:
     stage_root = Path(tempfile.mkdtemp(prefix="kubeagle-direct-edit-"))
     staged_chart_dir = stage_root / chart_dir.name
-    shutil.copytree(chart_dir, staged_chart_dir)
+    clone_tree(chart_dir, staged_chart_dir)
     return stage_root, staged_chart_dir
 
 
+def _reset_staged_workspace(*, staged_chart_dir: Path, source_guard: TreeSnapshot) -> None:
+    """Restore the files a previous attempt changed from the pristine source clone."""
+    _restore_workspace_from_snapshot(
+        target_root=staged_chart_dir,
+        snapshot_root=source_guard.root,
+        touched_paths=source_guard.changed_paths(TreeSnapshot.capture(staged_chart_dir)),
+    )
+
+
 def _cleanup_stage_root(stage_root: Path) -> None:
     with contextlib.suppress(OSError):
         shutil.rmtree(stage_root)
@@ -658,37 +679,21 @@ def _resolve_values_relative_path(*, chart_dir: Path, values_path: Path) -> str:
     return rel_path.as_posix()
 
 
-def _snapshot_relative_hashes(root: Path) -> dict[str, str]:
-    hashes: dict[str, str] = {}
-    for file_path in sorted(root.rglob("*")):
-        if not file_path.is_file():
-            continue
-        rel_path = file_path.relative_to(root).as_posix()
-        with contextlib.suppress(OSError):
-            hashes[rel_path] = _hash_file_sha256(file_path)
-    return hashes
-
-
 def _detect_workspace_delta(
     *,
-    before_hashes: dict[str, str],
-    after_hashes: dict[str, str],
+    before: TreeSnapshot,
+    after: TreeSnapshot,
 ) -> tuple[list[str], list[str], list[str]]:
     touched: list[str] = []
     created: list[str] = []
     deleted: list[str] = []
-    all_paths = sorted(set(before_hashes) | set(after_hashes))
-    for rel_path in all_paths:
+    for rel_path in before.changed_paths(after):
         if _is_ignored_direct_edit_path(rel_path):
             continue
-        before = before_hashes.get(rel_path)
-        after = after_hashes.get(rel_path)
-        if before == after:
-            continue
         touched.append(rel_path)
-        if before is None:
+        if rel_path not in before:
             created.append(rel_path)
-        elif after is None:
+        elif rel_path not in after:
             deleted.append(rel_path)
     return touched, created, deleted
 
@@ -716,12 +721,12 @@ def _restore_workspace_from_snapshot(
 
 def _detect_workspace_changes(
     *,
-    original_chart_dir: Path,
+    source_guard: TreeSnapshot,
     staged_chart_dir: Path,
 ) -> tuple[list[str], list[str], list[str]]:
     return _detect_workspace_delta(
-        before_hashes=_snapshot_relative_hashes(original_chart_dir),
-        after_hashes=_snapshot_relative_hashes(staged_chart_dir),
+        before=source_guard,
+        after=TreeSnapshot.capture(staged_chart_dir),
     )
 
 
@@ -893,9 +898,3 @@ def _mapping_overlay_patch(
         if before_value != after_value:
             patch[key] = after_value
     return patch
-
-
-def _hash_file_sha256(path: Path) -> str:
-    import hashlib
-
-    return hashlib.sha256(path.read_bytes()).hexdigest()
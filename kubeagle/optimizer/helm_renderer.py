@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import io
-import shutil
 import subprocess
 import tempfile
 from dataclasses import dataclass, field
@@ -14,6 +13,11 @@ import yaml
 from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap
 
+from kubeagle.optimizer.stripped_chart_cache import (
+    StrippedChartCache,
+    StrippedChartSetupError,
+)
+
 
 @dataclass(slots=True)
 class HelmRenderResult:
@@ -62,6 +66,19 @@ def render_chart(
             error_message=f"Values file not found: {values_file}",
         )
 
+    stripped_digest = STRIPPED_CHART_CACHE.current_digest(chart_dir)
+    if stripped_digest is not None:
+        # Known to miss dependencies and unchanged since: skip the failing
+        # full render and go straight to the stripped workspace.
+        return _retry_with_parent_chart_only_render(
+            chart_dir=chart_dir,
+            values_file=values_file,
+            values_content=values_content,
+            release_name=resolved_release_name,
+            timeout_seconds=timeout_seconds,
+            digest=stripped_digest,
+        )
+
     temp_path: Path | None = None
     try:
         effective_values_file = values_file
@@ -208,49 +225,66 @@ def _retry_with_parent_chart_only_render(
     values_content: str | None,
     release_name: str,
     timeout_seconds: int,
+    digest: str | None = None,
 ) -> HelmRenderResult | None:
-    with tempfile.TemporaryDirectory(prefix="kubeagle-chart-") as tmp_dir:
-        temp_chart_dir = Path(tmp_dir) / chart_dir.name
-        try:
-            shutil.copytree(chart_dir, temp_chart_dir)
-        except OSError as exc:
-            return HelmRenderResult(
-                ok=False,
+    try:
+        with STRIPPED_CHART_CACHE.lease(chart_dir, digest) as stripped_chart_dir:
+            return _render_stripped_chart(
                 chart_dir=chart_dir,
+                stripped_chart_dir=stripped_chart_dir,
                 values_file=values_file,
-                error_kind="parent_render_setup_failed",
-                error_message=f"Failed to stage chart copy for parent-only render: {exc!s}",
-                parent_only_render_attempted=True,
+                values_content=values_content,
+                release_name=release_name,
+                timeout_seconds=timeout_seconds,
             )
+    except StrippedChartSetupError as exc:
+        return HelmRenderResult(
+            ok=False,
+            chart_dir=chart_dir,
+            values_file=values_file,
+            error_kind="parent_render_setup_failed",
+            error_message=str(exc),
+            parent_only_render_attempted=True,
+        )
 
-        strip_error = _strip_chart_dependencies(temp_chart_dir / "Chart.yaml")
-        if strip_error:
-            return HelmRenderResult(
-                ok=False,
-                chart_dir=chart_dir,
-                values_file=values_file,
-                error_kind="parent_render_setup_failed",
-                error_message=strip_error,
-                parent_only_render_attempted=True,
-            )
 
+def _render_stripped_chart(
+    *,
+    chart_dir: Path,
+    stripped_chart_dir: Path,
+    values_file: Path,
+    values_content: str | None,
+    release_name: str,
+    timeout_seconds: int,
+) -> HelmRenderResult:
+    temp_values_path: Path | None = None
+    try:
         effective_values_file = values_file
         if values_content is None:
             try:
                 relative_values = values_file.relative_to(chart_dir)
-                effective_values_file = temp_chart_dir / relative_values
+                effective_values_file = stripped_chart_dir / relative_values
             except ValueError:
                 effective_values_file = values_file
         else:
-            temp_values_file = temp_chart_dir / "__verification_values__.yaml"
-            temp_values_file.write_text(values_content, encoding="utf-8")
-            effective_values_file = temp_values_file
+            # Workspaces are shared between renders; keep per-render values
+            # outside them.
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                suffix=".yaml",
+                prefix="kubeagle-values-",
+                delete=False,
+            ) as tmp_file:
+                tmp_file.write(values_content)
+                temp_values_path = Path(tmp_file.name)
+            effective_values_file = temp_values_path
 
         template_cmd = [
             "helm",
             "template",
             release_name,
-            str(temp_chart_dir),
+            str(stripped_chart_dir),
             "-f",
             str(effective_values_file),
             "--namespace",
@@ -307,6 +341,9 @@ def _retry_with_parent_chart_only_render(
             docs=docs,
             parent_only_render_attempted=True,
         )
+    finally:
+        if temp_values_path is not None:
+            temp_values_path.unlink(missing_ok=True)
 
 
 def _strip_chart_dependencies(chart_yaml_path: Path) -> str | None:
@@ -340,6 +377,9 @@ def _strip_chart_dependencies(chart_yaml_path: Path) -> str | None:
     return None
 
 
+STRIPPED_CHART_CACHE = StrippedChartCache(_strip_chart_dependencies)
+
+
 def _safe_text(value: str | bytes | None) -> str:
     """Normalize subprocess output fields that may be bytes in type stubs."""
     if value is None:
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import os
 import shutil
 import subprocess
@@ -11,6 +10,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
+from kubeagle.optimizer.staged_workspace import TreeSnapshot
+
 _AGENT_SDK_MAX_TURNS = 10
 
 
@@ -152,7 +153,7 @@ def run_llm_direct_edit(
         )
 
     if provider == LLMProvider.CLAUDE:
-        before_snapshot = _snapshot_tree_hashes(working_dir)
+        before_snapshot = TreeSnapshot.capture(working_dir)
         result = _run_claude_agent_sdk_direct_edit(
             prompt=prompt,
             working_dir=working_dir,
@@ -162,8 +163,9 @@ def run_llm_direct_edit(
         )
         if not result.ok:
             return result
-        after_snapshot = _snapshot_tree_hashes(working_dir)
-        result.changed_rel_paths = _collect_changed_paths(before_snapshot, after_snapshot)
+        result.changed_rel_paths = before_snapshot.changed_paths(
+            TreeSnapshot.capture(working_dir)
+        )
         result.attempts = max(1, int(attempts))
         return result
 
@@ -186,7 +188,7 @@ def _run_direct_edit_subprocess(
     attempts: int,
 ) -> LLMDirectEditResult:
     """Execute a direct-edit CLI command via subprocess with snapshot diffing."""
-    before_snapshot = _snapshot_tree_hashes(working_dir)
+    before_snapshot = TreeSnapshot.capture(working_dir)
     try:
         process = subprocess.run(
             command,
@@ -250,8 +252,7 @@ def _run_direct_edit_subprocess(
             ),
         )
 
-    after_snapshot = _snapshot_tree_hashes(working_dir)
-    changed_rel_paths = _collect_changed_paths(before_snapshot, after_snapshot)
+    changed_rel_paths = before_snapshot.changed_paths(TreeSnapshot.capture(working_dir))
     stdout_tail = _tail_text(process.stdout or "")
     stderr_tail = _tail_text(process.stderr or "")
     error_message = ""
@@ -504,31 +505,6 @@ def _safe_text(value: str | bytes | None) -> str:
     return value
 
 
-def _snapshot_tree_hashes(root: Path) -> dict[str, str]:
-    snapshot: dict[str, str] = {}
-    for path in sorted(root.rglob("*")):
-        if not path.is_file():
-            continue
-        rel_path = path.relative_to(root).as_posix()
-        with contextlib.suppress(OSError):
-            snapshot[rel_path] = _hash_path(path)
-    return snapshot
-
-
-def _hash_path(path: Path) -> str:
-    import hashlib
-
-    return hashlib.sha256(path.read_bytes()).hexdigest()
-
-
-def _collect_changed_paths(
-    before: dict[str, str],
-    after: dict[str, str],
-) -> list[str]:
-    keys = sorted(set(before) | set(after))
-    return [key for key in keys if before.get(key) != after.get(key)]
-
-
 def _tail_text(
     text: str,
     *,
@@ -0,0 +1,334 @@
+"""Cheapest instance-type mix for a fleet of replica requests.
+
+Candidate mixes are ranked by a volume lower bound first and only the most
+promising ones are bin-packed (``pack_first_fit_decreasing``), so the search
+stays interactive for dozens of instance types:
+
+- every single instance type that fits all replicas;
+- each replica shape on its cheapest type (per-replica cost share);
+- pairs of the cheapest single types, each shape on the cheaper of the two.
+
+The time budget covers candidate generation and packing: after the first
+candidate, nothing is packed that the slowest pack so far says would finish
+past the deadline. Candidates whose lower bound cannot beat the ranked
+options already found are skipped.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from kubeagle.constants.instance_types import (
+    DEFAULT_INSTANCE_TYPES,
+    INSTANCE_FAMILY_GIB_PER_VCPU,
+    INSTANCE_SHAPE_OVERRIDES,
+    INSTANCE_SIZE_VCPUS,
+    NODE_MIX_MAX_OPTIONS,
+    NODE_MIX_TIME_BUDGET_SECONDS,
+    SPOT_PRICES,
+)
+from kubeagle.optimizer.bin_packing import ReplicaDemand, pack_first_fit_decreasing
+
+InstanceTypeRow = tuple[str, int, float, float, float]
+
+# Cheapest single types combined pairwise.
+_PAIR_CANDIDATES = 6
+
+
+@dataclass(frozen=True, slots=True)
+class NodeShape:
+    """Schedulable capacity and price of one instance type.
+
+    Attributes:
+        name: Instance type name.
+        cpu_capacity: Schedulable CPU per node (millicores).
+        memory_capacity: Schedulable memory per node (bytes).
+        max_pods: Workload pods per node.
+        hourly_price: Price per node-hour (USD).
+    """
+
+    name: str
+    cpu_capacity: float
+    memory_capacity: float
+    max_pods: int
+    hourly_price: float
+
+
+@dataclass(frozen=True, slots=True)
+class NodeMix:
+    """A packed instance-type mix.
+
+    Attributes:
+        nodes: ``(instance type, node count)`` pairs, largest count first.
+        hourly_cost: Total price per hour (USD).
+        unschedulable: Replicas that fit no candidate type.
+    """
+
+    nodes: tuple[tuple[str, int], ...]
+    hourly_cost: float
+    unschedulable: int = 0
+
+
+def _derive_shape(name: str) -> tuple[int, float] | None:
+    """Return ``(vcpus, memory_gib)`` for well-known instance type names."""
+    if name in INSTANCE_SHAPE_OVERRIDES:
+        return INSTANCE_SHAPE_OVERRIDES[name]
+    family, _, size = name.partition(".")
+    vcpus = INSTANCE_SIZE_VCPUS.get(size)
+    gib_per_vcpu = INSTANCE_FAMILY_GIB_PER_VCPU.get(family)
+    if vcpus is None or gib_per_vcpu is None:
+        return None
+    return vcpus, vcpus * gib_per_vcpu
+
+
+def _price(value: Any, *, name: str, key: str) -> float:
+    if value is None:
+        return 0.0
+    try:
+        price = float(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid {key} for instance type '{name}': {value!r}") from exc
+    if price < 0:
+        raise ValueError(f"Negative {key} for instance type '{name}'")
+    return price
+
+
+def load_instance_price_table(path: Path) -> list[InstanceTypeRow]:
+    """Load a local instance price table (YAML or JSON).
+
+    The file holds a list of entries, or a mapping of instance type name to
+    entry, with ``vcpus``, ``memory_gib``, ``on_demand_hourly_usd`` and
+    ``spot_hourly_usd``. ``vcpus``/``memory_gib`` may be omitted for
+    well-known types; missing prices count as unknown (0.0).
+
+    Raises:
+        ValueError: If the file is unreadable or an entry is malformed.
+    """
+    try:
+        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    except (OSError, yaml.YAMLError) as exc:
+        raise ValueError(f"Cannot read instance price table {path}: {exc}") from exc
+    if isinstance(data, dict):
+        entries = [{"name": name, **(entry or {})} for name, entry in data.items()]
+    elif isinstance(data, list):
+        entries = data
+    else:
+        raise ValueError(f"Instance price table {path} must be a list or mapping")
+
+    rows: list[InstanceTypeRow] = []
+    for entry in entries:
+        if not isinstance(entry, dict) or not str(entry.get("name") or "").strip():
+            raise ValueError(f"Instance price table entry without a name: {entry!r}")
+        name = str(entry["name"]).strip()
+        derived = _derive_shape(name)
+        try:
+            vcpus = int(entry.get("vcpus") or (derived[0] if derived else 0))
+            memory_gib = float(entry.get("memory_gib") or (derived[1] if derived else 0.0))
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"Invalid shape for instance type '{name}'") from exc
+        if vcpus <= 0 or memory_gib <= 0:
+            raise ValueError(f"Unknown vcpus/memory_gib for instance type '{name}'")
+        rows.append(
+            (
+                name,
+                vcpus,
+                memory_gib,
+                _price(entry.get("on_demand_hourly_usd"), name=name, key="on_demand_hourly_usd"),
+                _price(entry.get("spot_hourly_usd"), name=name, key="spot_hourly_usd"),
+            )
+        )
+    return rows
+
+
+def instance_type_catalog(
+    price_table: Sequence[InstanceTypeRow] | None = None,
+) -> list[InstanceTypeRow]:
+    """Return every instance type with a known shape.
+
+    ``DEFAULT_INSTANCE_TYPES`` come first, then ``SPOT_PRICES`` types with
+    shapes derived from their names (on-demand price unknown). Entries of
+    ``price_table`` replace or extend the catalog by name.
+    """
+    catalog: dict[str, InstanceTypeRow] = {row[0]: row for row in DEFAULT_INSTANCE_TYPES}
+    for name, spot_price in SPOT_PRICES.items():
+        if name in catalog:
+            continue
+        derived = _derive_shape(name)
+        if derived is not None:
+            catalog[name] = (name, derived[0], derived[1], 0.0, spot_price)
+    for row in price_table or ():
+        catalog[row[0]] = row
+    return list(catalog.values())
+
+
+def _replica_costs(demands: Sequence[ReplicaDemand], shape: NodeShape) -> list[float]:
+    """Per-replica cost share of ``shape`` for each demand (inf if it does not fit)."""
+    cpu_capacity = shape.cpu_capacity
+    memory_capacity = shape.memory_capacity
+    pod_share = 1.0 / shape.max_pods
+    price = shape.hourly_price
+    return [
+        math.inf
+        if cpu > cpu_capacity or mem > memory_capacity
+        else price * max(cpu / cpu_capacity, mem / memory_capacity, pod_share)
+        for cpu, mem, _ in demands
+    ]
+
+
+def _lower_bound(
+    demands: Sequence[ReplicaDemand],
+    assignment: Sequence[int],
+    shapes: Sequence[NodeShape],
+) -> float:
+    """Hourly cost if every type could be filled perfectly (volume bound)."""
+    totals: dict[int, list[float]] = {}
+    for (cpu, mem, count), shape_index in zip(demands, assignment, strict=True):
+        total = totals.setdefault(shape_index, [0.0, 0.0, 0.0])
+        total[0] += cpu * count
+        total[1] += mem * count
+        total[2] += count
+    cost = 0.0
+    for shape_index, (cpu, mem, count) in totals.items():
+        shape = shapes[shape_index]
+        nodes = max(
+            math.ceil(cpu / shape.cpu_capacity - 1e-9),
+            math.ceil(mem / shape.memory_capacity - 1e-9),
+            math.ceil(count / shape.max_pods),
+        )
+        cost += nodes * shape.hourly_price
+    return cost
+
+
+def _pack_assignment(
+    demands: Sequence[ReplicaDemand],
+    assignment: Sequence[int],
+    shapes: Sequence[NodeShape],
+) -> tuple[tuple[tuple[str, int], ...], float]:
+    grouped: dict[int, list[ReplicaDemand]] = {}
+    for demand, shape_index in zip(demands, assignment, strict=True):
+        grouped.setdefault(shape_index, []).append(demand)
+    nodes: list[tuple[str, int]] = []
+    cost = 0.0
+    for shape_index, shape_demands in grouped.items():
+        shape = shapes[shape_index]
+        packed = pack_first_fit_decreasing(
+            shape_demands,
+            cpu_capacity=shape.cpu_capacity,
+            memory_capacity=shape.memory_capacity,
+            max_pods=shape.max_pods,
+        ).nodes
+        if packed:
+            nodes.append((shape.name, packed))
+            cost += packed * shape.hourly_price
+    nodes.sort(key=lambda item: (-item[1], item[0]))
+    return tuple(nodes), cost
+
+
+def solve_node_mix(
+    demands: Sequence[ReplicaDemand],
+    shapes: Sequence[NodeShape],
+    *,
+    max_options: int = NODE_MIX_MAX_OPTIONS,
+    time_budget_seconds: float = NODE_MIX_TIME_BUDGET_SECONDS,
+    clock: Callable[[], float] = time.monotonic,
+) -> list[NodeMix]:
+    """Return the cheapest instance-type mixes found, cheapest first.
+
+    Args:
+        demands: ``(cpu_millicores, memory_bytes, replica_count)`` per shape.
+        shapes: Candidate node shapes; unpriced shapes are ignored.
+        max_options: Number of ranked options to return.
+        time_budget_seconds: Search budget; the best-bounded candidate is
+            always packed, further candidates only while they are projected
+            to finish within it.
+        clock: Monotonic clock, injectable for tests.
+
+    Returns:
+        Up to ``max_options`` distinct mixes.
+    """
+    deadline = clock() + max(time_budget_seconds, 0.0)
+    shapes = [
+        shape
+        for shape in shapes
+        if shape.hourly_price > 0
+        and shape.cpu_capacity > 0
+        and shape.memory_capacity > 0
+        and shape.max_pods >= 1
+    ]
+    demands = [demand for demand in demands if demand[2] > 0]
+    if not shapes or not demands or max_options < 1:
+        return []
+
+    costs = [_replica_costs(demands, shape) for shape in shapes]
+    cheapest = [
+        min(range(len(shapes)), key=lambda shape_index: costs[shape_index][index])
+        for index in range(len(demands))
+    ]
+    schedulable = [
+        index
+        for index, shape_index in enumerate(cheapest)
+        if costs[shape_index][index] < math.inf
+    ]
+    unschedulable = sum(demands[index][2] for index in range(len(demands))) - sum(
+        demands[index][2] for index in schedulable
+    )
+    if not schedulable:
+        return []
+    demands = [demands[index] for index in schedulable]
+    costs = [[row[index] for index in schedulable] for row in costs]
+    cheapest = [cheapest[index] for index in schedulable]
+
+    candidates: dict[tuple[int, ...], float] = {}
+
+    def _add(assignment: list[int]) -> None:
+        key = tuple(assignment)
+        if key not in candidates:
+            candidates[key] = _lower_bound(demands, assignment, shapes)
+
+    _add(cheapest)
+    fractional: list[tuple[float, int]] = []
+    for shape_index, row in enumerate(costs):
+        total = sum(cost * demand[2] for cost, demand in zip(row, demands, strict=True))
+        fractional.append((total, shape_index))
+        if total < math.inf and clock() <= deadline:
+            _add([shape_index] * len(demands))
+    fractional.sort()
+    leaders = [shape_index for _, shape_index in fractional[:_PAIR_CANDIDATES]]
+    for position, first in enumerate(leaders):
+        for second in leaders[position + 1 :]:
+            if clock() > deadline:
+                break
+            _add(
+                [
+                    first if costs[first][index] <= costs[second][index] else second
+                    for index in range(len(demands))
+                ]
+            )
+
+    ranked: dict[tuple[tuple[str, int], ...], float] = {}
+    slowest_pack = 0.0
+    for assignment, bound in sorted(candidates.items(), key=lambda item: item[1]):
+        if bound == math.inf:
+            continue
+        started = clock()
+        if ranked and started + slowest_pack > deadline:
+            break
+        if len(ranked) >= max_options and bound >= max(ranked.values()):
+            break
+        nodes, cost = _pack_assignment(demands, assignment, shapes)
+        slowest_pack = max(slowest_pack, clock() - started)
+        ranked[nodes] = cost
+        if len(ranked) > max_options:
+            del ranked[max(ranked, key=ranked.__getitem__)]
+
+    return [
+        NodeMix(nodes=nodes, hourly_cost=cost, unschedulable=unschedulable)
+        for nodes, cost in sorted(ranked.items(), key=lambda item: item[1])
+    ]
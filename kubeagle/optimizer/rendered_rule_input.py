@@ -1,9 +1,18 @@
-"""Convert rendered manifests to optimizer rule input payloads."""
+"""Convert rendered manifests to optimizer rule input payloads.
+
+Rendered docs are scanned once: workloads, the first PodDisruptionBudget and
+HorizontalPodAutoscaler targets are collected in the same pass, and each
+unique workload becomes one compact ``RenderedWorkload`` record whose
+``ChartFeatures`` every rule evaluates.
+"""
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
+from kubeagle.optimizer.rule_features import ChartFeatures
+
 _WORKLOAD_KINDS = {
     "Deployment",
     "StatefulSet",
@@ -15,17 +24,65 @@ _WORKLOAD_KINDS = {
 }
 
 
+@dataclass(slots=True)
+class RenderedWorkload:
+    """One rendered workload, extracted once and shared by all rules.
+
+    Attributes:
+        identity: ``(kind, name, namespace)``, None for unnamed workloads.
+        rule_input: Rule-input dict (used by dict-based rules and for
+            rendered current-value display).
+        features: Features of ``rule_input`` for feature evaluators.
+        fingerprint: ``features.fingerprint()``, for outcome caching.
+    """
+
+    identity: tuple[str, str, str] | None
+    rule_input: dict[str, Any]
+    features: ChartFeatures
+    fingerprint: str
+
+
+def build_rendered_workloads(
+    docs: list[dict[str, Any]],
+    *,
+    chart_name: str,
+) -> list[RenderedWorkload]:
+    """Build one feature record per rendered workload in a single scan."""
+    workloads: list[RenderedWorkload] = []
+    for identity, rule_input in _workload_rule_inputs(docs, chart_name=chart_name):
+        features = ChartFeatures.from_rule_input(rule_input)
+        workloads.append(
+            RenderedWorkload(
+                identity=identity,
+                rule_input=rule_input,
+                features=features,
+                fingerprint=features.fingerprint(),
+            )
+        )
+    return workloads
+
+
 def build_rule_inputs_from_rendered(
     docs: list[dict[str, Any]],
     *,
     chart_name: str,
 ) -> list[dict[str, Any]]:
     """Build one rule-input dict per rendered workload."""
-    pdb = _extract_pdb(docs)
-    hpa_min_replicas = _extract_hpa_min_replicas(docs)
-    workload_inputs: list[dict[str, Any]] = []
+    return [
+        rule_input
+        for _identity, rule_input in _workload_rule_inputs(docs, chart_name=chart_name)
+    ]
+
+
+def _workload_rule_inputs(
+    docs: list[dict[str, Any]],
+    *,
+    chart_name: str,
+) -> list[tuple[tuple[str, str, str] | None, dict[str, Any]]]:
+    pdb, hpa_min_replicas, unique_docs = _scan_rendered_docs(docs)
+    workload_inputs: list[tuple[tuple[str, str, str] | None, dict[str, Any]]] = []
 
-    for doc, pod_spec in _iter_unique_workload_docs(docs):
+    for doc, pod_spec in unique_docs:
         identity = _workload_identity(doc)
         hpa_replicas = (
             _resolve_hpa_min_replicas(identity, hpa_min_replicas)
@@ -39,11 +96,54 @@ def build_rule_inputs_from_rendered(
             pdb=pdb,
             hpa_min_replicas=hpa_replicas,
         )
-        workload_inputs.append(rule_input)
+        workload_inputs.append((identity, rule_input))
 
     return workload_inputs
 
 
+def _scan_rendered_docs(
+    docs: list[dict[str, Any]],
+) -> tuple[
+    dict[str, Any] | None,
+    dict[tuple[str, str, str], int],
+    list[tuple[dict[str, Any], dict[str, Any]]],
+]:
+    """Collect the first PDB, HPA targets and unique workloads in one pass."""
+    pdb: dict[str, Any] | None = None
+    hpa_min_replicas: dict[tuple[str, str, str], int] = {}
+    selected: dict[tuple[str, str, str], tuple[dict[str, Any], dict[str, Any], int]] = {}
+    anonymous: list[tuple[dict[str, Any], dict[str, Any]]] = []
+
+    for doc in docs:
+        kind = str(doc.get("kind", "") or "")
+        if kind == "PodDisruptionBudget":
+            if pdb is None:
+                pdb = _pdb_payload(doc)
+            continue
+        if kind == "HorizontalPodAutoscaler":
+            _add_hpa_target(doc, hpa_min_replicas)
+            continue
+        if kind not in _WORKLOAD_KINDS:
+            continue
+        pod_spec = _extract_pod_spec(doc)
+        if not isinstance(pod_spec, dict):
+            continue
+
+        identity = _workload_identity(doc)
+        if identity is None:
+            anonymous.append((doc, pod_spec))
+            continue
+
+        score = _workload_doc_score(doc, pod_spec)
+        existing = selected.get(identity)
+        if existing is None or score > existing[2]:
+            selected[identity] = (doc, pod_spec, score)
+
+    unique_docs = [(doc, pod_spec) for doc, pod_spec, _ in selected.values()]
+    unique_docs.extend(anonymous)
+    return pdb, hpa_min_replicas, unique_docs
+
+
 def _build_rule_input(
     *,
     chart_name: str,
@@ -105,35 +205,6 @@ def _build_rule_input(
     return rule_input
 
 
-def _iter_unique_workload_docs(
-    docs: list[dict[str, Any]],
-) -> list[tuple[dict[str, Any], dict[str, Any]]]:
-    selected: dict[tuple[str, str, str], tuple[dict[str, Any], dict[str, Any], int]] = {}
-    anonymous: list[tuple[dict[str, Any], dict[str, Any]]] = []
-
-    for doc in docs:
-        kind = str(doc.get("kind", "") or "")
-        if kind not in _WORKLOAD_KINDS:
-            continue
-        pod_spec = _extract_pod_spec(doc)
-        if not isinstance(pod_spec, dict):
-            continue
-
-        identity = _workload_identity(doc)
-        if identity is None:
-            anonymous.append((doc, pod_spec))
-            continue
-
-        score = _workload_doc_score(doc, pod_spec)
-        existing = selected.get(identity)
-        if existing is None or score > existing[2]:
-            selected[identity] = (doc, pod_spec, score)
-
-    unique_docs = [(doc, pod_spec) for doc, pod_spec, _ in selected.values()]
-    unique_docs.extend(anonymous)
-    return unique_docs
-
-
 def _workload_identity(doc: dict[str, Any]) -> tuple[str, str, str] | None:
     kind = str(doc.get("kind", "") or "").strip()
     metadata = doc.get("metadata")
@@ -178,38 +249,34 @@ def _workload_doc_score(doc: dict[str, Any], pod_spec: dict[str, Any]) -> int:
     return score
 
 
-def _extract_hpa_min_replicas(docs: list[dict[str, Any]]) -> dict[tuple[str, str, str], int]:
-    target_map: dict[tuple[str, str, str], int] = {}
-
-    for doc in docs:
-        if str(doc.get("kind", "") or "") != "HorizontalPodAutoscaler":
-            continue
-        spec = doc.get("spec")
-        if not isinstance(spec, dict):
-            continue
-        min_replicas = spec.get("minReplicas")
-        if not isinstance(min_replicas, int):
-            continue
-
-        target_ref = spec.get("scaleTargetRef")
-        if not isinstance(target_ref, dict):
-            continue
-        target_kind = str(target_ref.get("kind", "") or "").strip()
-        target_name = str(target_ref.get("name", "") or "").strip()
-        if not target_kind or not target_name:
-            continue
-
-        metadata = doc.get("metadata")
-        namespace = ""
-        if isinstance(metadata, dict):
-            namespace = str(metadata.get("namespace", "") or "").strip()
+def _add_hpa_target(
+    doc: dict[str, Any],
+    target_map: dict[tuple[str, str, str], int],
+) -> None:
+    spec = doc.get("spec")
+    if not isinstance(spec, dict):
+        return
+    min_replicas = spec.get("minReplicas")
+    if not isinstance(min_replicas, int):
+        return
+
+    target_ref = spec.get("scaleTargetRef")
+    if not isinstance(target_ref, dict):
+        return
+    target_kind = str(target_ref.get("kind", "") or "").strip()
+    target_name = str(target_ref.get("name", "") or "").strip()
+    if not target_kind or not target_name:
+        return
 
-        key = (target_kind, target_name, namespace)
-        existing = target_map.get(key)
-        if existing is None or min_replicas > existing:
-            target_map[key] = min_replicas
+    metadata = doc.get("metadata")
+    namespace = ""
+    if isinstance(metadata, dict):
+        namespace = str(metadata.get("namespace", "") or "").strip()
 
-    return target_map
+    key = (target_kind, target_name, namespace)
+    existing = target_map.get(key)
+    if existing is None or min_replicas > existing:
+        target_map[key] = min_replicas
 
 
 def _resolve_hpa_min_replicas(
@@ -291,22 +358,18 @@ def _extract_pod_spec(doc: dict[str, Any]) -> dict[str, Any] | None:
     return pod_spec if isinstance(pod_spec, dict) else None
 
 
-def _extract_pdb(docs: list[dict[str, Any]]) -> dict[str, Any] | None:
-    for doc in docs:
-        if str(doc.get("kind", "") or "") != "PodDisruptionBudget":
-            continue
-        spec = doc.get("spec")
-        if not isinstance(spec, dict):
-            continue
-        payload: dict[str, Any] = {
-            "enabled": True,
-        }
-        if "minAvailable" in spec:
-            payload["minAvailable"] = spec.get("minAvailable")
-        if "maxUnavailable" in spec:
-            payload["maxUnavailable"] = spec.get("maxUnavailable")
-        return payload
-    return None
+def _pdb_payload(doc: dict[str, Any]) -> dict[str, Any] | None:
+    spec = doc.get("spec")
+    if not isinstance(spec, dict):
+        return None
+    payload: dict[str, Any] = {
+        "enabled": True,
+    }
+    if "minAvailable" in spec:
+        payload["minAvailable"] = spec.get("minAvailable")
+    if "maxUnavailable" in spec:
+        payload["maxUnavailable"] = spec.get("maxUnavailable")
+    return payload
 
 
 def _extract_security_context(
@@ -6,16 +6,22 @@ import json
 import logging
 import math
 import subprocess
-from pathlib import PurePosixPath
+import threading
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path, PurePosixPath
 from typing import Any
 
 from kubeagle.constants.instance_types import (
     ALLOCATABLE_RATIO,
+    DAEMONSET_PODS_PER_NODE,
     DEFAULT_INSTANCE_TYPES,
+    DEFAULT_MAX_PODS,
     DEFAULT_OVERHEAD_PCT,
     HOURS_PER_MONTH,
+    MAX_PODS,
     SPOT_PRICES,
 )
+from kubeagle.models.cache.cluster_join_index import WorkloadReplicaMap
 from kubeagle.models.charts.chart_info import ChartInfo
 from kubeagle.models.optimization.resource_impact import (
     ChartResourceSnapshot,
@@ -23,9 +29,21 @@ from kubeagle.models.optimization.resource_impact import (
     FleetResourceSummary,
     InstanceTypeSpec,
     NodeEstimation,
+    NodeMixOption,
     ResourceDelta,
     ResourceImpactResult,
 )
+from kubeagle.optimizer.bin_packing import (
+    ReplicaDemand,
+    pack_first_fit_decreasing,
+    sort_by_dominant_share,
+)
+from kubeagle.optimizer.node_mix_solver import (
+    NodeShape,
+    instance_type_catalog,
+    load_instance_price_table,
+    solve_node_mix,
+)
 import kubeagle.optimizer.rules as _optimizer_rules
 from kubeagle.optimizer.rules import _parse_cpu
 from kubeagle.utils.resource_parser import memory_str_to_bytes
@@ -36,7 +54,7 @@ logger = logging.getLogger(__name__)
 def fetch_workload_replica_map(
     context: str | None = None,
     timeout: int = 30,
-) -> dict[tuple[str, str], int]:
+) -> WorkloadReplicaMap:
     """Fetch actual desired replica counts from the cluster.
 
     Runs a lightweight ``kubectl get deployments,statefulsets`` to retrieve
@@ -49,6 +67,9 @@ def fetch_workload_replica_map(
     (e.g. ``contact-service-redis``) and won't be summed into the parent
     chart's entry (``contact-service``).
 
+    Prefer the join index's ``replica_map()`` when the workloads screen has
+    already loaded the inventory; this is the fallback when it has not.
+
     Returns:
         Mapping of ``(workload_name, namespace) -> desired_replicas``.
     """
@@ -67,15 +88,15 @@ def fetch_workload_replica_map(
         )
         if result.returncode != 0:
             logger.warning("kubectl workload fetch failed: %s", (result.stderr or "").strip())
-            return {}
+            return WorkloadReplicaMap()
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as exc:
         logger.warning("kubectl workload fetch error: %s", exc)
-        return {}
+        return WorkloadReplicaMap()
 
     try:
         data = json.loads(result.stdout)
     except (json.JSONDecodeError, TypeError):
-        return {}
+        return WorkloadReplicaMap()
 
     replica_map: dict[tuple[str, str], int] = {}
     for item in data.get("items", []):
@@ -98,7 +119,7 @@ def fetch_workload_replica_map(
         # with the same name, which is rare but possible).
         replica_map[map_key] = replica_map.get(map_key, 0) + desired
 
-    return replica_map
+    return WorkloadReplicaMap(replica_map)
 
 
 def _deduplicate_charts_by_name(
@@ -197,7 +218,9 @@ class ResourceImpactCalculator:
         instance_types: list[tuple[str, int, float, float, float]] | None = None,
         optimizer_controller: Any | None = None,
         cluster_nodes: list[Any] | None = None,
-        workload_replica_map: dict[tuple[str, str], int] | None = None,
+        workload_replica_map: Mapping[tuple[str, str], int] | None = None,
+        price_table_path: str | None = None,
+        node_mix_pricing: str = "spot",
     ) -> ResourceImpactResult:
         """Compute the full resource impact analysis.
 
@@ -211,14 +234,49 @@ class ResourceImpactCalculator:
             workload_replica_map: Optional mapping of (release_name, namespace) to
                 actual desired replica counts from the cluster.  When provided the
                 calculator uses real replica counts instead of values-file defaults.
+            price_table_path: Optional local YAML/JSON instance price table that
+                extends or overrides the built-in catalog for the node-mix search.
+            node_mix_pricing: ``"spot"`` or ``"on_demand"`` prices for the node-mix search.
 
         Returns:
             ResourceImpactResult with before/after summaries, delta, and node estimations.
         """
-        specs = _build_instance_types(instance_types)
-
+        return self.build_impact_model(
+            charts,
+            violations,
+            overhead_pct=overhead_pct,
+            instance_types=instance_types,
+            optimizer_controller=optimizer_controller,
+            cluster_nodes=cluster_nodes,
+            workload_replica_map=workload_replica_map,
+            price_table_path=price_table_path,
+            node_mix_pricing=node_mix_pricing,
+        ).result()
+
+    def build_impact_model(
+        self,
+        charts: list[ChartInfo],
+        violations: list[Any],
+        *,
+        overhead_pct: float = DEFAULT_OVERHEAD_PCT,
+        instance_types: list[tuple[str, int, float, float, float]] | None = None,
+        optimizer_controller: Any | None = None,
+        cluster_nodes: list[Any] | None = None,
+        workload_replica_map: Mapping[tuple[str, str], int] | None = None,
+        price_table_path: str | None = None,
+        node_mix_pricing: str = "spot",
+    ) -> ResourceImpactModel:
+        """Build the per-chart snapshots once for incremental what-if changes.
+
+        Takes the same arguments as :meth:`compute_impact`; the returned
+        model's ``result()`` equals ``compute_impact`` for the same input.
+        """
         # Deduplicate charts by name (merge multiple values-file variants)
         charts = _deduplicate_charts_by_name(charts)
+        # Index replicas by workload name once so local charts avoid a full
+        # scan of the map each.
+        if workload_replica_map and not isinstance(workload_replica_map, WorkloadReplicaMap):
+            workload_replica_map = WorkloadReplicaMap(workload_replica_map)
 
         # Group violations by (chart_name, parent_chart), only resource/replica rules.
         # Including parent_chart prevents umbrella sub-charts with the same alias
@@ -251,43 +309,20 @@ class ResourceImpactCalculator:
             )
             after_charts.append(after)
 
-        before_summary = self._aggregate(before_charts)
-        after_summary = self._aggregate(after_charts)
-        delta = self._compute_delta(before_summary, after_summary)
-
-        # Estimate nodes from hardcoded instance types (fallback)
-        node_estimations = self._estimate_nodes(
-            before_summary, after_summary, specs, overhead_pct
-        )
-
-        # Estimate from real cluster nodes when available
-        cluster_node_groups: list[ClusterNodeGroup] = []
-        if cluster_nodes:
-            cluster_node_groups = self._estimate_from_cluster_nodes(
-                after_summary, cluster_nodes, overhead_pct
-            )
-
-        # Total spot savings from whichever source is active
-        if cluster_node_groups:
-            total_savings = sum(g.cost_savings_monthly for g in cluster_node_groups)
-        else:
-            total_savings = sum(e.cost_savings_monthly for e in node_estimations)
-
-        return ResourceImpactResult(
-            before=before_summary,
-            after=after_summary,
-            delta=delta,
-            before_charts=before_charts,
-            after_charts=after_charts,
-            node_estimations=node_estimations,
-            cluster_node_groups=cluster_node_groups,
-            total_spot_savings_monthly=total_savings,
+        return ResourceImpactModel(
+            before_charts,
+            after_charts,
+            overhead_pct=overhead_pct,
+            instance_types=instance_types,
+            cluster_nodes=cluster_nodes,
+            price_table_path=price_table_path,
+            node_mix_pricing=node_mix_pricing,
         )
 
     def _build_before_snapshot(
         self,
         chart: ChartInfo,
-        workload_replica_map: dict[tuple[str, str], int] | None = None,
+        workload_replica_map: Mapping[tuple[str, str], int] | None = None,
     ) -> ChartResourceSnapshot:
         """Build a resource snapshot from current chart values.
 
@@ -328,7 +363,7 @@ class ResourceImpactCalculator:
         chart_violations: list[Any],
         *,
         optimizer_controller: Any | None = None,
-        workload_replica_map: dict[tuple[str, str], int] | None = None,
+        workload_replica_map: Mapping[tuple[str, str], int] | None = None,
     ) -> ChartResourceSnapshot:
         """Compute the after-optimization snapshot for a chart.
 
@@ -438,7 +473,7 @@ class ResourceImpactCalculator:
     @staticmethod
     def _resolve_replicas(
         chart: ChartInfo,
-        workload_replica_map: dict[tuple[str, str], int] | None,
+        workload_replica_map: Mapping[tuple[str, str], int] | None,
     ) -> tuple[int, int, int, int]:
         """Resolve total replica count, release count, min and max for a chart.
 
@@ -465,14 +500,16 @@ class ResourceImpactCalculator:
                 return cluster_replicas, 1, cluster_replicas, cluster_replicas
         else:
             # Local chart: sum actual replicas across all matching releases.
-            total_replicas = 0
-            total_releases = 0
-            per_release: list[int] = []
-            for (rel_name, _ns), rep in workload_replica_map.items():
-                if rel_name == chart.name:
-                    total_replicas += rep
-                    total_releases += 1
-                    per_release.append(rep)
+            if isinstance(workload_replica_map, WorkloadReplicaMap):
+                per_release = workload_replica_map.replicas_named(chart.name)
+            else:
+                per_release = [
+                    rep
+                    for (rel_name, _ns), rep in workload_replica_map.items()
+                    if rel_name == chart.name
+                ]
+            total_replicas = sum(per_release)
+            total_releases = len(per_release)
             if total_releases > 0 and total_replicas > 0:
                 return total_replicas, total_releases, min(per_release), max(per_release)
 
@@ -563,34 +600,6 @@ class ResourceImpactCalculator:
 
         return cpu_req, cpu_lim, mem_req, mem_lim
 
-    @staticmethod
-    def _aggregate(snapshots: list[ChartResourceSnapshot]) -> FleetResourceSummary:
-        """Sum resource totals across all chart snapshots."""
-        cpu_req = 0.0
-        cpu_lim = 0.0
-        mem_req = 0.0
-        mem_lim = 0.0
-        total_replicas = 0
-        total_releases = 0
-
-        for snap in snapshots:
-            cpu_req += snap.cpu_request_total
-            cpu_lim += snap.cpu_limit_total
-            mem_req += snap.memory_request_total
-            mem_lim += snap.memory_limit_total
-            total_replicas += snap.replicas
-            total_releases += snap.release_count
-
-        return FleetResourceSummary(
-            cpu_request_total=cpu_req,
-            cpu_limit_total=cpu_lim,
-            memory_request_total=mem_req,
-            memory_limit_total=mem_lim,
-            chart_count=len(snapshots),
-            total_replicas=total_replicas,
-            total_releases=total_releases,
-        )
-
     @staticmethod
     def _compute_delta(
         before: FleetResourceSummary,
@@ -619,32 +628,64 @@ class ResourceImpactCalculator:
         )
 
     @staticmethod
-    def _estimate_nodes(
-        before: FleetResourceSummary,
-        after: FleetResourceSummary,
+    def _pack_instance_types(
+        demands: list[ReplicaDemand],
         instance_types: list[InstanceTypeSpec],
         overhead_pct: float,
-    ) -> list[NodeEstimation]:
-        """Estimate node counts per instance type before and after optimization."""
-        estimations: list[NodeEstimation] = []
+    ) -> list[tuple[int, int] | None]:
+        """Bin-pack replica requests onto each instance shape.
 
+        Returns ``(nodes, unschedulable replicas)`` per instance type, None
+        for types without usable capacity. Fragmentation and the max-pods
+        cap are reflected in the counts. Demands are sorted once per
+        CPU/memory ratio and identical shapes are packed once.
+        """
+        sorted_by_ratio: dict[float, list[ReplicaDemand]] = {}
+        packed_by_shape: dict[tuple[float, float, int], tuple[int, int]] = {}
+        packs: list[tuple[int, int] | None] = []
         for spec in instance_types:
             usable_cpu = spec.cpu_millicores * ALLOCATABLE_RATIO * (1 - overhead_pct)
             usable_mem = spec.memory_bytes * ALLOCATABLE_RATIO * (1 - overhead_pct)
 
             if usable_cpu <= 0 or usable_mem <= 0:
+                packs.append(None)
                 continue
 
-            nodes_before = max(
-                math.ceil(before.cpu_request_total / usable_cpu),
-                math.ceil(before.memory_request_total / usable_mem),
-                1,
-            )
-            nodes_after = max(
-                math.ceil(after.cpu_request_total / usable_cpu),
-                math.ceil(after.memory_request_total / usable_mem),
-                1,
-            )
+            max_pods = _schedulable_pods(MAX_PODS.get(spec.name, DEFAULT_MAX_PODS))
+            shape = (usable_cpu, usable_mem, max_pods)
+            pack = packed_by_shape.get(shape)
+            if pack is None:
+                # Exact for proportional shapes, which share one ordering.
+                ratio = spec.cpu_millicores / spec.memory_bytes
+                ordered = sorted_by_ratio.get(ratio)
+                if ordered is None:
+                    ordered = sort_by_dominant_share(
+                        demands, cpu_capacity=usable_cpu, memory_capacity=usable_mem,
+                    )
+                    sorted_by_ratio[ratio] = ordered
+                pack = _packed_node_count(
+                    ordered, usable_cpu, usable_mem, max_pods, presorted=True,
+                )
+                packed_by_shape[shape] = pack
+            packs.append(pack)
+        return packs
+
+    @staticmethod
+    def _estimate_nodes(
+        instance_types: list[InstanceTypeSpec],
+        before_packs: list[tuple[int, int] | None],
+        after_packs: list[tuple[int, int] | None],
+    ) -> list[NodeEstimation]:
+        """Node counts and costs per instance type before and after optimization."""
+        estimations: list[NodeEstimation] = []
+
+        for spec, before_pack, after_pack in zip(
+            instance_types, before_packs, after_packs, strict=True,
+        ):
+            if before_pack is None or after_pack is None:
+                continue
+            nodes_before, unschedulable_before = before_pack
+            nodes_after, unschedulable_after = after_pack
 
             reduction = nodes_before - nodes_after
             reduction_pct = (
@@ -667,26 +708,69 @@ class ResourceImpactCalculator:
                     cost_before_monthly=cost_before,
                     cost_after_monthly=cost_after,
                     cost_savings_monthly=cost_before - cost_after,
+                    unschedulable_before=unschedulable_before,
+                    unschedulable_after=unschedulable_after,
                 )
             )
 
         return estimations
 
+    @staticmethod
+    def _solve_node_mix(
+        after_demands: list[ReplicaDemand],
+        overhead_pct: float,
+        *,
+        price_table_path: str | None,
+        pricing: str,
+    ) -> list[NodeMixOption]:
+        """Rank the cheapest instance-type mixes for the optimized fleet."""
+        price_table = None
+        if price_table_path:
+            try:
+                price_table = load_instance_price_table(Path(price_table_path).expanduser())
+            except ValueError:
+                logger.warning("Ignoring instance price table", exc_info=True)
+        shapes: list[NodeShape] = []
+        for spec in _build_instance_types(instance_type_catalog(price_table)):
+            shapes.append(
+                NodeShape(
+                    name=spec.name,
+                    cpu_capacity=spec.cpu_millicores * ALLOCATABLE_RATIO * (1 - overhead_pct),
+                    memory_capacity=spec.memory_bytes * ALLOCATABLE_RATIO * (1 - overhead_pct),
+                    max_pods=_schedulable_pods(MAX_PODS.get(spec.name, DEFAULT_MAX_PODS)),
+                    hourly_price=(
+                        spec.hourly_price_usd if pricing == "on_demand" else spec.spot_price_usd
+                    ),
+                )
+            )
+        return [
+            NodeMixOption(
+                nodes=dict(mix.nodes),
+                pricing=pricing,
+                hourly_cost_usd=mix.hourly_cost,
+                monthly_cost_usd=mix.hourly_cost * HOURS_PER_MONTH,
+                unschedulable=mix.unschedulable,
+            )
+            for mix in solve_node_mix(after_demands, shapes)
+        ]
+
     @staticmethod
     def _estimate_from_cluster_nodes(
-        after: FleetResourceSummary,
+        after_demands: list[ReplicaDemand],
         cluster_nodes: list[Any],
         overhead_pct: float,
     ) -> list[ClusterNodeGroup]:
         """Estimate node needs using real cluster node data.
 
-        Groups nodes by instance_type, then estimates how many nodes of each
-        type would be needed after optimization (proportional allocation).
+        Groups nodes by instance_type, gives each group its share of the
+        after-optimization replicas (proportional to its CPU allocatable) and
+        bin-packs that share onto the group's node shape.
         """
         # Single pass: group nodes by instance type and accumulate totals.
         groups: dict[str, list[Any]] = {}
         group_cpu_totals: dict[str, float] = {}
         group_mem_totals: dict[str, float] = {}
+        group_pod_capacity: dict[str, list[int]] = {}
         total_cluster_cpu = 0.0
         total_cluster_mem = 0.0
 
@@ -697,6 +781,9 @@ class ResourceImpactCalculator:
             mem_alloc = getattr(node, "memory_allocatable", 0.0)
             group_cpu_totals[itype] = group_cpu_totals.get(itype, 0.0) + cpu_alloc
             group_mem_totals[itype] = group_mem_totals.get(itype, 0.0) + mem_alloc
+            pod_capacity = getattr(node, "pod_capacity", None)
+            if isinstance(pod_capacity, int) and pod_capacity > 0:
+                group_pod_capacity.setdefault(itype, []).append(pod_capacity)
             total_cluster_cpu += cpu_alloc
             total_cluster_mem += mem_alloc
 
@@ -723,13 +810,16 @@ class ResourceImpactCalculator:
             cpu_share = (cpu_total / total_cluster_cpu) if total_cluster_cpu > 0 else 0.0
             mem_share = (mem_total / total_cluster_mem) if total_cluster_mem > 0 else 0.0
 
-            group_cpu_needed = after.cpu_request_total * cpu_share
-            group_mem_needed = after.memory_request_total * mem_share
-
-            nodes_needed = max(
-                math.ceil(group_cpu_needed / usable_cpu_per_node),
-                math.ceil(group_mem_needed / usable_mem_per_node),
-                1,
+            share = cpu_share if total_cluster_cpu > 0 else mem_share
+            capacities = group_pod_capacity.get(itype)
+            pod_capacity = (
+                min(capacities) if capacities else MAX_PODS.get(itype, DEFAULT_MAX_PODS)
+            )
+            nodes_needed, unschedulable = _packed_node_count(
+                _share_demands(after_demands, share),
+                usable_cpu_per_node,
+                usable_mem_per_node,
+                _schedulable_pods(pod_capacity),
             )
 
             reduction = node_count - nodes_needed
@@ -755,7 +845,349 @@ class ResourceImpactCalculator:
                     cost_current_monthly=cost_current,
                     cost_after_monthly=cost_after,
                     cost_savings_monthly=cost_current - cost_after,
+                    unschedulable_after=unschedulable,
                 )
             )
 
         return result
+
+
+def _share_demands(demands: list[ReplicaDemand], share: float) -> list[ReplicaDemand]:
+    """Scale replica counts by ``share``, keeping the rounded total exact."""
+    scaled: list[ReplicaDemand] = []
+    exact = 0.0
+    assigned = 0
+    for cpu, mem, count in demands:
+        exact += count * share
+        target = round(exact)
+        if target > assigned:
+            scaled.append((cpu, mem, target - assigned))
+            assigned = target
+    return scaled
+
+
+def _schedulable_pods(max_pods: int) -> int:
+    """Pods left for workloads once DaemonSet pods take their slots."""
+    return max(max_pods - DAEMONSET_PODS_PER_NODE, 1)
+
+
+def _packed_node_count(
+    demands: list[ReplicaDemand],
+    usable_cpu: float,
+    usable_mem: float,
+    max_pods: int,
+    *,
+    presorted: bool = False,
+) -> tuple[int, int]:
+    """Return ``(nodes, unschedulable replicas)`` for one node shape.
+
+    Replicas larger than a node cannot be packed; their requests are still
+    counted by volume so oversized workloads are not silently dropped.
+    """
+    packing = pack_first_fit_decreasing(
+        demands,
+        cpu_capacity=usable_cpu,
+        memory_capacity=usable_mem,
+        max_pods=max_pods,
+        presorted=presorted,
+    )
+    nodes = packing.nodes
+    if packing.unschedulable:
+        nodes += max(
+            math.ceil(packing.unschedulable_cpu / usable_cpu),
+            math.ceil(packing.unschedulable_memory / usable_mem),
+        )
+    return max(nodes, 1), packing.unschedulable
+
+
+# Snapshot fields summed into a FleetResourceSummary, in column order.
+_TOTAL_FIELDS: tuple[str, ...] = (
+    "cpu_request_total",
+    "cpu_limit_total",
+    "memory_request_total",
+    "memory_limit_total",
+    "replicas",
+    "release_count",
+)
+
+_BEFORE = 0
+_AFTER = 1
+
+
+class ResourceImpactModel:
+    """Incremental before/after impact of a fleet for what-if changes.
+
+    Per-chart before/after contributions are kept as column arrays; fleet
+    totals and the replica demand counts fed to bin packing are maintained by
+    delta. Including or excluding charts, toggling one chart's fixes or
+    changing the overhead percentage therefore never rebuilds snapshots, and
+    node estimates are re-packed only for the side (before/after) whose
+    demands or capacity changed.
+
+    The model is safe to mutate from a worker thread while another reads
+    ``result()``.
+    """
+
+    def __init__(
+        self,
+        before_charts: list[ChartResourceSnapshot],
+        after_charts: list[ChartResourceSnapshot],
+        *,
+        overhead_pct: float = DEFAULT_OVERHEAD_PCT,
+        instance_types: list[tuple[str, int, float, float, float]] | None = None,
+        cluster_nodes: list[Any] | None = None,
+        price_table_path: str | None = None,
+        node_mix_pricing: str = "spot",
+    ) -> None:
+        if len(before_charts) != len(after_charts):
+            raise ValueError("before_charts and after_charts must have the same length")
+        self.before_charts = list(before_charts)
+        self.after_charts = list(after_charts)
+        self._specs = _build_instance_types(instance_types)
+        self._cluster_nodes = list(cluster_nodes or [])
+        self._price_table_path = price_table_path
+        self._node_mix_pricing = node_mix_pricing
+        self._overhead_pct = overhead_pct
+        self._lock = threading.RLock()
+
+        count = len(self.before_charts)
+        self._columns = (
+            [[float(getattr(snap, name)) for snap in self.before_charts] for name in _TOTAL_FIELDS],
+            [[float(getattr(snap, name)) for snap in self.after_charts] for name in _TOTAL_FIELDS],
+        )
+        self._included = [True] * count
+        self._fix_enabled = [True] * count
+        self._included_count = count
+        self._totals = ([0.0] * len(_TOTAL_FIELDS), [0.0] * len(_TOTAL_FIELDS))
+        self._demands: tuple[dict[tuple[float, float], int], dict[tuple[float, float], int]] = (
+            {},
+            {},
+        )
+        # Bumped whenever a side's demands change; keys the packing caches.
+        self._versions = [0, 0]
+        self._derived: dict[str, tuple[tuple[int, float], Any]] = {}
+        for index in range(count):
+            self._contribute(index, _BEFORE, 1)
+            self._contribute(index, _AFTER, 1)
+
+    def __len__(self) -> int:
+        return len(self.before_charts)
+
+    @property
+    def overhead_pct(self) -> float:
+        """System overhead percentage (0.0-1.0) used for node estimates."""
+        return self._overhead_pct
+
+    def is_included(self, index: int) -> bool:
+        """Return whether chart ``index`` counts towards the fleet."""
+        return self._included[index]
+
+    def is_fix_enabled(self, index: int) -> bool:
+        """Return whether chart ``index`` uses its optimized snapshot."""
+        return self._fix_enabled[index]
+
+    def _effective(self, index: int, side: int) -> int:
+        """Return which snapshot column set chart ``index`` uses on ``side``."""
+        if side == _AFTER and not self._fix_enabled[index]:
+            return _BEFORE
+        return side
+
+    def _contribute(self, index: int, side: int, sign: int) -> None:
+        """Add (``sign=1``) or remove (``sign=-1``) one chart from one side."""
+        source = self._effective(index, side)
+        columns = self._columns[source]
+        totals = self._totals[side]
+        for field_index, column in enumerate(columns):
+            totals[field_index] += sign * column[index]
+
+        snap = (self.before_charts if source == _BEFORE else self.after_charts)[index]
+        if snap.replicas > 0:
+            demands = self._demands[side]
+            key = (
+                max(float(snap.cpu_request_per_replica), 0.0),
+                max(float(snap.memory_request_per_replica), 0.0),
+            )
+            remaining = demands.get(key, 0) + sign * snap.replicas
+            if remaining > 0:
+                demands[key] = remaining
+            else:
+                demands.pop(key, None)
+            self._versions[side] += 1
+
+    def set_included(self, indices: Iterable[int] | None) -> None:
+        """Count only charts ``indices`` (all charts when None)."""
+        with self._lock:
+            wanted = [indices is None] * len(self)
+            if indices is not None:
+                for index in indices:
+                    wanted[index] = True
+            for index, include in enumerate(wanted):
+                if include == self._included[index]:
+                    continue
+                sign = 1 if include else -1
+                self._contribute(index, _BEFORE, sign)
+                self._contribute(index, _AFTER, sign)
+                self._included[index] = include
+                self._included_count += sign
+            if not self._included_count:
+                # Drop float residue left by repeated deltas.
+                for totals in self._totals:
+                    totals[:] = [0.0] * len(totals)
+
+    def set_fix_enabled(self, index: int, enabled: bool) -> None:
+        """Apply (or revert) chart ``index``'s fixes in the after state."""
+        with self._lock:
+            if self._fix_enabled[index] == enabled:
+                return
+            if self._included[index]:
+                self._contribute(index, _AFTER, -1)
+            self._fix_enabled[index] = enabled
+            if self._included[index]:
+                self._contribute(index, _AFTER, 1)
+
+    def set_overhead_pct(self, overhead_pct: float) -> None:
+        """Change the system overhead used for node capacity."""
+        with self._lock:
+            self._overhead_pct = overhead_pct
+
+    def _demand_list(self, side: int) -> list[ReplicaDemand]:
+        return [(cpu, mem, count) for (cpu, mem), count in sorted(self._demands[side].items())]
+
+    def _summary(self, side: int) -> FleetResourceSummary:
+        cpu_req, cpu_lim, mem_req, mem_lim, replicas, releases = self._totals[side]
+        return FleetResourceSummary(
+            cpu_request_total=cpu_req,
+            cpu_limit_total=cpu_lim,
+            memory_request_total=mem_req,
+            memory_limit_total=mem_lim,
+            chart_count=self._included_count,
+            total_replicas=round(replicas),
+            total_releases=round(releases),
+        )
+
+    def _derived_value(
+        self, name: str, key: tuple[int, float], compute: Callable[[], Any],
+    ) -> Any:
+        """Return a value derived from one side's demands, reused until ``key`` changes.
+
+        ``compute`` runs without the lock so toggles are never blocked by
+        bin packing.
+        """
+        with self._lock:
+            cached = self._derived.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = compute()
+        with self._lock:
+            self._derived[name] = (key, value)
+        return value
+
+    def included_charts(
+        self,
+    ) -> list[tuple[int, ChartResourceSnapshot, ChartResourceSnapshot]]:
+        """Return ``(index, before, after)`` for included charts.
+
+        ``after`` is the chart's optimized snapshot even when its fixes are
+        toggled off, so callers can show what the toggle would change.
+        """
+        with self._lock:
+            return [
+                (index, self.before_charts[index], self.after_charts[index])
+                for index, included in enumerate(self._included)
+                if included
+            ]
+
+    def result(self, *, estimate_nodes: bool = True) -> ResourceImpactResult:
+        """Return the impact of the current selection, toggles and overhead.
+
+        Args:
+            estimate_nodes: When False, skip bin packing and leave node
+                estimates and node-mix options empty; totals and deltas are
+                then available in time linear in the chart count.
+        """
+        with self._lock:
+            before_charts: list[ChartResourceSnapshot] = []
+            after_charts: list[ChartResourceSnapshot] = []
+            for index, included in enumerate(self._included):
+                if included:
+                    before_charts.append(self.before_charts[index])
+                    after_charts.append(
+                        self.after_charts[index]
+                        if self._fix_enabled[index]
+                        else self.before_charts[index]
+                    )
+
+            before_summary = self._summary(_BEFORE)
+            after_summary = self._summary(_AFTER)
+            overhead_pct = self._overhead_pct
+            before_key = (self._versions[_BEFORE], overhead_pct)
+            after_key = (self._versions[_AFTER], overhead_pct)
+            before_demands = self._demand_list(_BEFORE) if estimate_nodes else []
+            after_demands = self._demand_list(_AFTER) if estimate_nodes else []
+        delta = ResourceImpactCalculator._compute_delta(before_summary, after_summary)
+
+        node_estimations: list[NodeEstimation] = []
+        cluster_node_groups: list[ClusterNodeGroup] = []
+        node_mix_options: list[NodeMixOption] = []
+        if estimate_nodes:
+            # Estimate nodes from hardcoded instance types (fallback)
+            node_estimations = ResourceImpactCalculator._estimate_nodes(
+                self._specs,
+                self._derived_value(
+                    "before_packs",
+                    before_key,
+                    lambda: ResourceImpactCalculator._pack_instance_types(
+                        before_demands, self._specs, overhead_pct,
+                    ),
+                ),
+                self._derived_value(
+                    "after_packs",
+                    after_key,
+                    lambda: ResourceImpactCalculator._pack_instance_types(
+                        after_demands, self._specs, overhead_pct,
+                    ),
+                ),
+            )
+
+            # Estimate from real cluster nodes when available
+            if self._cluster_nodes:
+                cluster_node_groups = list(
+                    self._derived_value(
+                        "cluster_node_groups",
+                        after_key,
+                        lambda: ResourceImpactCalculator._estimate_from_cluster_nodes(
+                            after_demands, self._cluster_nodes, overhead_pct,
+                        ),
+                    )
+                )
+
+            node_mix_options = list(
+                self._derived_value(
+                    "node_mix_options",
+                    after_key,
+                    lambda: ResourceImpactCalculator._solve_node_mix(
+                        after_demands,
+                        overhead_pct,
+                        price_table_path=self._price_table_path,
+                        pricing=self._node_mix_pricing,
+                    ),
+                )
+            )
+
+        # Total spot savings from whichever source is active
+        if cluster_node_groups:
+            total_savings = sum(g.cost_savings_monthly for g in cluster_node_groups)
+        else:
+            total_savings = sum(e.cost_savings_monthly for e in node_estimations)
+
+        return ResourceImpactResult(
+            before=before_summary,
+            after=after_summary,
+            delta=delta,
+            before_charts=before_charts,
+            after_charts=after_charts,
+            node_estimations=node_estimations,
+            cluster_node_groups=cluster_node_groups,
+            total_spot_savings_monthly=total_savings,
+            node_mix_options=node_mix_options,
+        )
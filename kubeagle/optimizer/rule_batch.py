@@ -0,0 +1,304 @@
+"""Fleet-wide batch evaluation of optimizer rules.
+
+Most rules are threshold predicates over a handful of numeric columns
+(limit/request ratio, low requests, missing probes, replica counts). A
+``ChartFeatureTable`` stores the features of every chart column-wise so each
+such rule is evaluated as one column expression over the whole fleet. The
+expressions only select candidate rows; the rule's own evaluator then builds
+the violation for those rows, so messages and edge cases stay identical to
+per-chart evaluation. Rules with structural logic (blocking PDB parsing,
+custom rules) are evaluated per row.
+
+Thresholds are read from ``kubeagle.optimizer.rules`` at evaluation time, so
+re-running a cached table after ``configure_rule_thresholds`` reflects the
+new settings without re-extracting features. With a ``ViolationCache``, rules
+that do not read a changed threshold also reuse their previous violations.
+"""
+
+from __future__ import annotations
+
+import logging
+from array import array
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+from kubeagle.models.optimization.optimization_rule import OptimizationRule
+from kubeagle.models.optimization.optimization_violation import (
+    OptimizationViolation,
+)
+from kubeagle.optimizer import rules as _rules
+from kubeagle.optimizer.rule_features import ChartFeatures
+from kubeagle.optimizer.rules import RuleEvaluator, current_rule_thresholds
+from kubeagle.optimizer.violation_cache import ViolationCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ChartFeatureTable:
+    """Column-oriented view over many ``ChartFeatures`` records.
+
+    Unset quantities are stored as ``0.0``; every threshold rule treats a
+    missing value and zero the same way.
+    """
+
+    features: list[ChartFeatures]
+    cpu_request: array
+    cpu_limit: array
+    memory_request: array
+    memory_limit: array
+    has_cpu_request: list[bool]
+    has_cpu_limit: list[bool]
+    has_memory_request: list[bool]
+    has_memory_limit: list[bool]
+    best_effort: list[bool]
+    has_liveness: list[bool]
+    has_readiness: list[bool]
+    has_startup: list[bool]
+    has_topology_spread: list[bool]
+    has_anti_affinity: list[bool]
+    has_pdb: list[bool]
+    replicas: list[int]
+    single_replica: list[bool]
+    runs_as_root: list[bool]
+    _fingerprints: list[str] | None = field(default=None, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    @classmethod
+    def from_features(cls, features: Sequence[ChartFeatures]) -> ChartFeatureTable:
+        """Build the table from per-chart feature records."""
+        rows = list(features)
+        return cls(
+            features=rows,
+            cpu_request=array("d", (f.cpu_request or 0.0 for f in rows)),
+            cpu_limit=array("d", (f.cpu_limit or 0.0 for f in rows)),
+            memory_request=array("d", (f.memory_request or 0.0 for f in rows)),
+            memory_limit=array("d", (f.memory_limit or 0.0 for f in rows)),
+            has_cpu_request=[f.has_cpu_request for f in rows],
+            has_cpu_limit=[f.has_cpu_limit for f in rows],
+            has_memory_request=[f.has_memory_request for f in rows],
+            has_memory_limit=[f.has_memory_limit for f in rows],
+            best_effort=[f.is_best_effort for f in rows],
+            has_liveness=[f.has_liveness for f in rows],
+            has_readiness=[f.has_readiness for f in rows],
+            has_startup=[f.has_startup for f in rows],
+            has_topology_spread=[f.has_topology_spread for f in rows],
+            has_anti_affinity=[f.has_anti_affinity for f in rows],
+            has_pdb=[f.has_pdb for f in rows],
+            replicas=[f.effective_replicas for f in rows],
+            single_replica=[f.replicas is not None and f.replicas == 1 for f in rows],
+            runs_as_root=[f.run_as_user == 0 for f in rows],
+        )
+
+    @property
+    def fingerprints(self) -> list[str]:
+        """Per-row feature fingerprints, computed on first use."""
+        if self._fingerprints is None:
+            self._fingerprints = [f.fingerprint() for f in self.features]
+        return self._fingerprints
+
+
+RowMask = Callable[[ChartFeatureTable], list[int]]
+
+
+def _false_rows(column: list[bool]) -> list[int]:
+    return [index for index, value in enumerate(column) if not value]
+
+
+def _true_rows(column: list[bool]) -> list[int]:
+    return [index for index, value in enumerate(column) if value]
+
+
+def _mask_no_cpu_limits(table: ChartFeatureTable) -> list[int]:
+    if "cpu_limit" in _rules.FIXED_RESOURCE_FIELDS:
+        return []
+    return _false_rows(table.has_cpu_limit)
+
+
+def _mask_no_memory_limits(table: ChartFeatureTable) -> list[int]:
+    if "memory_limit" in _rules.FIXED_RESOURCE_FIELDS:
+        return []
+    return _false_rows(table.has_memory_limit)
+
+
+def _mask_no_resource_requests(table: ChartFeatureTable) -> list[int]:
+    fixed = _rules.FIXED_RESOURCE_FIELDS
+    if "cpu_request" in fixed and "memory_request" in fixed:
+        return []
+    return [
+        index
+        for index, (has_cpu, has_memory) in enumerate(
+            zip(table.has_cpu_request, table.has_memory_request, strict=True)
+        )
+        if not has_cpu and not has_memory
+    ]
+
+
+def _ratio_rows(
+    limits: array, requests: array, best_effort: list[bool], threshold: float,
+) -> list[int]:
+    return [
+        index
+        for index, (limit, request, is_best_effort) in enumerate(
+            zip(limits, requests, best_effort, strict=True)
+        )
+        if limit and request > 0 and not is_best_effort and limit / request >= threshold
+    ]
+
+
+def _mask_high_cpu_ratio(table: ChartFeatureTable) -> list[int]:
+    if "cpu_request" in _rules.FIXED_RESOURCE_FIELDS:
+        return []
+    return _ratio_rows(
+        table.cpu_limit,
+        table.cpu_request,
+        table.best_effort,
+        _rules.LIMIT_REQUEST_RATIO_THRESHOLD,
+    )
+
+
+def _mask_high_memory_ratio(table: ChartFeatureTable) -> list[int]:
+    if "memory_request" in _rules.FIXED_RESOURCE_FIELDS:
+        return []
+    return _ratio_rows(
+        table.memory_limit,
+        table.memory_request,
+        table.best_effort,
+        _rules.LIMIT_REQUEST_RATIO_THRESHOLD,
+    )
+
+
+def _low_request_rows(
+    requests: array, limits: array, request_threshold: float, limit_floor: float,
+) -> list[int]:
+    # A missing limit is stored as 0.0, which is always below the bump floor.
+    return [
+        index
+        for index, (request, limit) in enumerate(zip(requests, limits, strict=True))
+        if request and request < request_threshold and limit < limit_floor
+    ]
+
+
+def _mask_very_low_cpu_request(table: ChartFeatureTable) -> list[int]:
+    return _low_request_rows(
+        table.cpu_request,
+        table.cpu_limit,
+        _rules.LOW_CPU_THRESHOLD_MILLICORES,
+        _rules.CPU_BUMP_MIN_MILLICORES,
+    )
+
+
+def _mask_very_low_memory_request(table: ChartFeatureTable) -> list[int]:
+    return _low_request_rows(
+        table.memory_request,
+        table.memory_limit,
+        _rules.LOW_MEMORY_THRESHOLD_MI,
+        _rules.MEMORY_BUMP_MIN_MI,
+    )
+
+
+def _mask_no_memory_request(table: ChartFeatureTable) -> list[int]:
+    if "memory_request" in _rules.FIXED_RESOURCE_FIELDS:
+        return []
+    return [
+        index
+        for index, (has_cpu, has_memory) in enumerate(
+            zip(table.has_cpu_request, table.has_memory_request, strict=True)
+        )
+        if has_cpu and not has_memory
+    ]
+
+
+def _multi_replica_rows_without(table: ChartFeatureTable, column: list[bool]) -> list[int]:
+    return [
+        index
+        for index, (replicas, present) in enumerate(zip(table.replicas, column, strict=True))
+        if replicas > 1 and not present
+    ]
+
+
+# Built-in evaluator -> candidate-row expression. Keyed by the evaluator
+# (not the rule id) so a custom rule reusing an id never inherits a mask.
+# Evaluators missing here run on every row.
+ROW_MASKS: dict[RuleEvaluator, RowMask] = {
+    _rules._eval_no_cpu_limits: _mask_no_cpu_limits,
+    _rules._eval_no_memory_limits: _mask_no_memory_limits,
+    _rules._eval_no_resource_requests: _mask_no_resource_requests,
+    _rules._eval_high_cpu_limit_request_ratio: _mask_high_cpu_ratio,
+    _rules._eval_high_memory_limit_request_ratio: _mask_high_memory_ratio,
+    _rules._eval_very_low_cpu_request: _mask_very_low_cpu_request,
+    _rules._eval_no_memory_request: _mask_no_memory_request,
+    _rules._eval_very_low_memory_request: _mask_very_low_memory_request,
+    _rules._eval_missing_liveness_probe: lambda table: _false_rows(table.has_liveness),
+    _rules._eval_missing_readiness_probe: lambda table: _false_rows(table.has_readiness),
+    _rules._eval_missing_startup_probe: lambda table: _false_rows(table.has_startup),
+    _rules._eval_no_pdb: lambda table: _multi_replica_rows_without(table, table.has_pdb),
+    _rules._eval_no_pod_anti_affinity: lambda table: _multi_replica_rows_without(
+        table, table.has_anti_affinity,
+    ),
+    _rules._eval_missing_topology_spread: lambda table: _multi_replica_rows_without(
+        table, table.has_topology_spread,
+    ),
+    _rules._eval_single_replica: lambda table: _true_rows(table.single_replica),
+    _rules._eval_running_as_root: lambda table: _true_rows(table.runs_as_root),
+}
+
+
+def evaluate_feature_table(
+    table: ChartFeatureTable,
+    rules: Sequence[OptimizationRule],
+    *,
+    cache: ViolationCache | None = None,
+) -> list[list[tuple[OptimizationRule, OptimizationViolation]]]:
+    """Evaluate rules with feature evaluators over every row of ``table``.
+
+    Rules without ``evaluate`` are skipped; callers must evaluate those per
+    chart (or fall back to per-chart checks entirely to keep rule order).
+
+    Args:
+        table: Feature table for the fleet.
+        rules: Rules to evaluate, in output order.
+        cache: Optional outcome cache consulted for each candidate row.
+
+    Returns:
+        Per-row lists of ``(rule, violation)`` pairs, in rule order.
+    """
+    features = table.features
+    fingerprints = table.fingerprints if cache is not None else None
+    thresholds = current_rule_thresholds()
+    results: list[list[tuple[OptimizationRule, OptimizationViolation]]] = [
+        [] for _ in features
+    ]
+    for rule in rules:
+        evaluate = rule.evaluate
+        if evaluate is None:
+            continue
+        mask = ROW_MASKS.get(evaluate)
+        rows: Sequence[int] = range(len(features))
+        if mask is not None:
+            try:
+                rows = mask(table)
+            except Exception:
+                logger.debug("Batch mask failed for rule '%s'", rule.id, exc_info=True)
+        for index in rows:
+            try:
+                if cache is None or fingerprints is None:
+                    violations = evaluate(features[index])
+                else:
+                    violations = cache.evaluate(
+                        rule,
+                        features[index],
+                        fingerprint=fingerprints[index],
+                        thresholds=thresholds,
+                    )
+            except Exception:
+                logger.warning(
+                    "Rule check failed for rule '%s'",
+                    rule.id,
+                    exc_info=True,
+                )
+                continue
+            results[index].extend((rule, violation) for violation in violations)
+    return results
@@ -0,0 +1,282 @@
+"""Typed per-chart features evaluated by optimizer rules.
+
+Rules used to receive a loosely-typed chart dict and re-parse quantity strings
+("250m", "512Mi") on every check. ``ChartFeatures`` is extracted once per
+chart (or rendered workload) and carries the numeric values and flags every
+rule needs, so all rules can be evaluated in a single pass without string
+round-trips.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from kubeagle.utils.quantity import parse_quantity
+
+if TYPE_CHECKING:
+    from kubeagle.models.charts.chart_info import ChartInfo
+
+_BYTES_PER_MI = 1024**2
+
+# Binary SI suffixes accepted case-insensitively by the memory rules ("128MI").
+_BINARY_SUFFIXES_LOWER: dict[str, str] = {
+    "ki": "Ki",
+    "mi": "Mi",
+    "gi": "Gi",
+    "ti": "Ti",
+    "pi": "Pi",
+    "ei": "Ei",
+}
+
+
+def parse_cpu_millicores(cpu_str: object) -> float | None:
+    """Parse a CPU quantity to millicores (None for empty/invalid input)."""
+    if not cpu_str:
+        return None
+    return parse_quantity(cpu_str, unit="m")
+
+
+def parse_memory_mi(mem_str: object) -> float | None:
+    """Parse a memory quantity to Mi; plain numbers are treated as Mi."""
+    if not mem_str:
+        return None
+    text = str(mem_str).strip()
+
+    try:
+        return float(text)
+    except ValueError:
+        pass
+
+    canonical_suffix = _BINARY_SUFFIXES_LOWER.get(text[-2:].lower())
+    if canonical_suffix is not None:
+        text = text[:-2] + canonical_suffix
+    return parse_quantity(text, unit="Mi")
+
+
+def format_cpu_millicores(cpu_millicores: float) -> str:
+    """Format millicores as a quantity string (``"250m"``, ``"0.5m"``)."""
+    value = float(cpu_millicores)
+    if value.is_integer():
+        return f"{int(value)}m"
+    formatted = f"{value:.3f}".rstrip("0").rstrip(".")
+    return f"{formatted}m"
+
+
+def format_memory_mi(memory_mi: float) -> str:
+    """Format Mi as a quantity string (``"512Mi"``, ``"0.95Mi"``)."""
+    rounded = round(memory_mi)
+    if abs(memory_mi - rounded) < 1e-6:
+        return f"{int(rounded)}Mi"
+    formatted = f"{memory_mi:.2f}".rstrip("0").rstrip(".")
+    return f"{formatted}Mi"
+
+
+def _quantize_cpu_millicores(cpu_millicores: float) -> float:
+    """Return the value ``format_cpu_millicores`` would round-trip to."""
+    value = float(cpu_millicores)
+    return value if value.is_integer() else round(value, 3)
+
+
+def _quantize_memory_mi(memory_mi: float) -> float:
+    """Return the value ``format_memory_mi`` would round-trip to."""
+    rounded = round(memory_mi)
+    if abs(memory_mi - rounded) < 1e-6:
+        return float(rounded)
+    return round(memory_mi, 2)
+
+
+def _mapping(value: object) -> Mapping[str, Any]:
+    return value if isinstance(value, Mapping) else {}
+
+
+@dataclass(slots=True)
+class ChartFeatures:
+    """Rule-relevant facts about one chart or rendered workload.
+
+    Attributes:
+        qos_class: Declared QoS class, if known.
+        cpu_request: CPU request in millicores (None when unset/invalid).
+        cpu_limit: CPU limit in millicores.
+        memory_request: Memory request in Mi.
+        memory_limit: Memory limit in Mi.
+        has_cpu_request: Whether a CPU request value is present at all.
+        has_cpu_limit: Whether a CPU limit value is present at all.
+        has_memory_request: Whether a memory request value is present at all.
+        has_memory_limit: Whether a memory limit value is present at all.
+        has_liveness: Whether a liveness probe is configured.
+        has_readiness: Whether a readiness probe is configured.
+        has_startup: Whether a startup probe is configured.
+        has_topology_spread: Whether topology spread constraints exist.
+        replicas: Replica count, None when not declared.
+        has_anti_affinity: Whether pod anti-affinity is configured.
+        has_pdb: Whether an enabled PodDisruptionBudget is configured.
+        pdb: PodDisruptionBudget settings (``minAvailable``/``maxUnavailable``).
+        run_as_user: ``securityContext.runAsUser`` value.
+        resource_texts: Original quantity strings keyed by ``"section.resource"``
+            for messages; values are formatted from numbers when absent.
+    """
+
+    qos_class: str | None = None
+    cpu_request: float | None = None
+    cpu_limit: float | None = None
+    memory_request: float | None = None
+    memory_limit: float | None = None
+    has_cpu_request: bool = False
+    has_cpu_limit: bool = False
+    has_memory_request: bool = False
+    has_memory_limit: bool = False
+    has_liveness: bool = False
+    has_readiness: bool = False
+    has_startup: bool = False
+    has_topology_spread: bool = False
+    replicas: int | None = None
+    has_anti_affinity: bool = False
+    has_pdb: bool = False
+    pdb: Mapping[str, Any] | None = None
+    run_as_user: Any = None
+    resource_texts: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def effective_replicas(self) -> int:
+        """Replica count with the Kubernetes default of 1."""
+        return 1 if self.replicas is None else self.replicas
+
+    @property
+    def is_best_effort(self) -> bool:
+        """Whether the workload is explicitly or effectively BestEffort."""
+        if self.qos_class is not None:
+            return self.qos_class.lower() == "besteffort"
+        return not any(
+            value is not None and value > 0
+            for value in (
+                self.cpu_request,
+                self.cpu_limit,
+                self.memory_request,
+                self.memory_limit,
+            )
+        )
+
+    def fingerprint(self) -> str:
+        """Return a content key; equal features always evaluate identically."""
+        return repr(self)
+
+    def resource_text(self, section: str, resource: str) -> str:
+        """Return the quantity string for ``section``/``resource`` for messages."""
+        raw = self.resource_texts.get(f"{section}.{resource}")
+        if raw is not None:
+            return str(raw)
+        if resource == "cpu":
+            value = self.cpu_request if section == "requests" else self.cpu_limit
+            return "None" if value is None else format_cpu_millicores(value)
+        value = self.memory_request if section == "requests" else self.memory_limit
+        return "None" if value is None else format_memory_mi(value)
+
+    @classmethod
+    def from_chart_info(cls, chart: ChartInfo) -> ChartFeatures:
+        """Extract features straight from a parsed ``ChartInfo``.
+
+        Values are quantized exactly as the former string formatting did
+        (3 decimals for millicores, 2 for Mi) so thresholds behave the same.
+        """
+        cpu_request = (
+            _quantize_cpu_millicores(chart.cpu_request) if chart.cpu_request > 0 else None
+        )
+        cpu_limit = (
+            _quantize_cpu_millicores(chart.cpu_limit) if chart.cpu_limit > 0 else None
+        )
+        memory_request = (
+            _quantize_memory_mi(chart.memory_request / _BYTES_PER_MI)
+            if chart.memory_request > 0
+            else None
+        )
+        memory_limit = (
+            _quantize_memory_mi(chart.memory_limit / _BYTES_PER_MI)
+            if chart.memory_limit > 0
+            else None
+        )
+
+        pdb: dict[str, Any] | None = None
+        if chart.pdb_enabled:
+            pdb = {}
+            if chart.pdb_min_available is not None:
+                pdb["minAvailable"] = chart.pdb_min_available
+            if chart.pdb_max_unavailable is not None:
+                pdb["maxUnavailable"] = chart.pdb_max_unavailable
+
+        qos_class = str(chart.qos_class.value).strip() or None
+        return cls(
+            qos_class=qos_class,
+            cpu_request=cpu_request,
+            cpu_limit=cpu_limit,
+            memory_request=memory_request,
+            memory_limit=memory_limit,
+            has_cpu_request=chart.cpu_request > 0,
+            has_cpu_limit=chart.cpu_limit > 0,
+            has_memory_request=chart.memory_request > 0,
+            has_memory_limit=chart.memory_limit > 0,
+            has_liveness=chart.has_liveness,
+            has_readiness=chart.has_readiness,
+            has_startup=chart.has_startup,
+            has_topology_spread=chart.has_topology_spread,
+            replicas=chart.replicas,
+            has_anti_affinity=chart.replicas is not None and chart.has_anti_affinity,
+            has_pdb=chart.pdb_enabled,
+            pdb=pdb,
+        )
+
+    @classmethod
+    def from_rule_input(cls, chart: Mapping[str, Any]) -> ChartFeatures:
+        """Extract features from a rule-input dict (values or rendered)."""
+        resources = _mapping(chart.get("resources"))
+        requests = _mapping(resources.get("requests"))
+        limits = _mapping(resources.get("limits"))
+        raw_qos = chart.get("qos_class")
+        qos_text = None if raw_qos is None else str(getattr(raw_qos, "value", raw_qos)).strip()
+
+        probes = _mapping(chart.get("probes"))
+
+        has_pdb = False
+        for key in ("podDisruptionBudget", "pdb"):
+            pdb_value = chart.get(key)
+            if pdb_value is None:
+                continue
+            if isinstance(pdb_value, Mapping) and pdb_value.get("enabled") is False:
+                continue
+            has_pdb = True
+            break
+        pdb = chart.get("podDisruptionBudget", chart.get("pdb"))
+
+        pod_anti_affinity = _mapping(_mapping(chart.get("affinity")).get("podAntiAffinity"))
+        has_anti_affinity = bool(chart.get("has_anti_affinity", False)) or bool(
+            pod_anti_affinity.get("preferredDuringSchedulingIgnoredDuringExecution")
+            or pod_anti_affinity.get("requiredDuringSchedulingIgnoredDuringExecution")
+        )
+
+        return cls(
+            qos_class=qos_text or None,
+            cpu_request=parse_cpu_millicores(requests.get("cpu")),
+            cpu_limit=parse_cpu_millicores(limits.get("cpu")),
+            memory_request=parse_memory_mi(requests.get("memory")),
+            memory_limit=parse_memory_mi(limits.get("memory")),
+            has_cpu_request=bool(requests.get("cpu")),
+            has_cpu_limit=bool(limits.get("cpu")),
+            has_memory_request=bool(requests.get("memory")),
+            has_memory_limit=bool(limits.get("memory")),
+            has_liveness="livenessProbe" in chart or bool(probes.get("liveness")),
+            has_readiness="readinessProbe" in chart or bool(probes.get("readiness")),
+            has_startup="startupProbe" in chart or bool(probes.get("startup")),
+            has_topology_spread=bool(chart.get("topologySpreadConstraints")),
+            replicas=chart.get("replicas"),
+            has_anti_affinity=has_anti_affinity,
+            has_pdb=has_pdb,
+            pdb=pdb if isinstance(pdb, Mapping) and pdb else None,
+            run_as_user=_mapping(chart.get("securityContext")).get("runAsUser"),
+            resource_texts={
+                "requests.cpu": requests.get("cpu"),
+                "limits.cpu": limits.get("cpu"),
+                "requests.memory": requests.get("memory"),
+                "limits.memory": limits.get("memory"),
+            },
+        )
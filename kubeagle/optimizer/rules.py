@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Hashable
+
 from kubeagle.constants.optimizer import (
     CPU_BUMP_MIN_MILLICORES as DEFAULT_CPU_BUMP_MIN_MILLICORES,
     LIMIT_REQUEST_RATIO_THRESHOLD as DEFAULT_LIMIT_REQUEST_RATIO_THRESHOLD,
@@ -14,6 +16,12 @@ from kubeagle.models.optimization.optimization_rule import OptimizationRule
 from kubeagle.models.optimization.optimization_violation import (
     OptimizationViolation,
 )
+from kubeagle.optimizer.rule_features import (
+    ChartFeatures,
+    parse_cpu_millicores,
+    parse_memory_mi,
+)
+from kubeagle.optimizer.violation_cache import VIOLATION_CACHE
 
 # Runtime thresholds (defaults align with shared constants and can be updated from settings).
 LIMIT_REQUEST_RATIO_THRESHOLD = DEFAULT_LIMIT_REQUEST_RATIO_THRESHOLD
@@ -29,6 +37,20 @@ BURSTABLE_TARGET_RATIO = 1.5
 FIXED_RESOURCE_FIELDS: set[str] = {"cpu_limit", "memory_limit"}
 
 
+def current_rule_thresholds() -> dict[str, Hashable]:
+    """Return every threshold rules read, keyed by lower-case setting name."""
+    return {
+        "limit_request_ratio_threshold": LIMIT_REQUEST_RATIO_THRESHOLD,
+        "low_cpu_threshold_millicores": LOW_CPU_THRESHOLD_MILLICORES,
+        "low_memory_threshold_mi": LOW_MEMORY_THRESHOLD_MI,
+        "pdb_blocking_threshold": PDB_BLOCKING_THRESHOLD,
+        "fixed_resource_fields": frozenset(FIXED_RESOURCE_FIELDS),
+        "cpu_bump_min_millicores": CPU_BUMP_MIN_MILLICORES,
+        "memory_bump_min_mi": MEMORY_BUMP_MIN_MI,
+        "burstable_target_ratio": BURSTABLE_TARGET_RATIO,
+    }
+
+
 def configure_rule_thresholds(
     *,
     limit_request_ratio_threshold: float | None = None,
@@ -36,14 +58,22 @@ def configure_rule_thresholds(
     low_memory_threshold_mi: int | None = None,
     pdb_blocking_threshold: int | None = None,
     fixed_resource_fields: set[str] | None = None,
-) -> None:
-    """Update rule thresholds at runtime."""
+) -> frozenset[str]:
+    """Update rule thresholds at runtime.
+
+    Cached outcomes of rules reading a changed threshold are dropped; all
+    other cached outcomes stay valid.
+
+    Returns:
+        Names of the thresholds whose value changed.
+    """
     global LIMIT_REQUEST_RATIO_THRESHOLD
     global LOW_CPU_THRESHOLD_MILLICORES
     global LOW_MEMORY_THRESHOLD_MI
     global PDB_BLOCKING_THRESHOLD
     global FIXED_RESOURCE_FIELDS
 
+    previous = current_rule_thresholds()
     if (
         limit_request_ratio_threshold is not None
         and limit_request_ratio_threshold > 0
@@ -58,95 +88,46 @@ def configure_rule_thresholds(
     if fixed_resource_fields is not None:
         FIXED_RESOURCE_FIELDS = fixed_resource_fields
 
+    changed = frozenset(
+        name
+        for name, value in current_rule_thresholds().items()
+        if previous[name] != value
+    )
+    VIOLATION_CACHE.invalidate_thresholds(changed)
+    return changed
+
 
 def _parse_cpu(cpu_str: str | None) -> float | None:
     """Parse CPU string to millicores (for internal rule checking)."""
-    if not cpu_str:
-        return None
-    cpu_str = str(cpu_str).strip()
-
-    # Handle millicores (e.g., "100m" -> 100.0)
-    if cpu_str.endswith("m"):
-        try:
-            return float(cpu_str[:-1])
-        except ValueError:
-            return None
-
-    # Handle plain numbers (cores)
-    try:
-        return float(cpu_str) * 1000  # Convert cores to millicores
-    except ValueError:
-        return None
+    return parse_cpu_millicores(cpu_str)
 
 
 def _parse_memory(mem_str: str | None) -> float | None:
     """Parse memory string to Mi."""
-    if not mem_str:
-        return None
-    mem_str = str(mem_str).strip().lower()
-
-    # Unit multipliers for conversion to Mi
-    multipliers: dict[str, float] = {
-        "ki": 1 / 1024,
-        "mi": 1,
-        "gi": 1024,
-        "ti": 1024 * 1024,
-    }
+    return parse_memory_mi(mem_str)
 
-    for suffix, multiplier in multipliers.items():
-        if mem_str.endswith(suffix):
-            try:
-                return float(mem_str[: -len(suffix)]) * multiplier
-            except ValueError:
-                return None
-
-    # Plain number (no suffix) - treat as Mi
-    try:
-        return float(mem_str)
-    except ValueError:
-        return None
-
-
-def _normalize_qos_class(raw_qos: object) -> str | None:
-    """Normalize QoS input that may arrive as enum value or plain string."""
-    if raw_qos is None:
-        return None
-    value = getattr(raw_qos, "value", raw_qos)
-    text = str(value).strip()
-    return text or None
-
-
-def _is_best_effort_qos(chart: dict) -> bool:
-    """Return True when chart is explicitly or effectively BestEffort."""
-    qos_class = _normalize_qos_class(chart.get("qos_class"))
-    if qos_class is not None:
-        return qos_class.lower() == "besteffort"
-
-    resources = chart.get("resources", {})
-    resources_dict = resources if isinstance(resources, dict) else {}
-    requests = resources_dict.get("requests")
-    limits = resources_dict.get("limits")
-    requests_dict = requests if isinstance(requests, dict) else {}
-    limits_dict = limits if isinstance(limits, dict) else {}
-
-    parsed_values = (
-        _parse_cpu(requests_dict.get("cpu")),
-        _parse_cpu(limits_dict.get("cpu")),
-        _parse_memory(requests_dict.get("memory")),
-        _parse_memory(limits_dict.get("memory")),
-    )
-    has_any_resources = any(value is not None and value > 0 for value in parsed_values)
-    return not has_any_resources
 
+RuleEvaluator = Callable[[ChartFeatures], list[OptimizationViolation]]
+
+
+def _dict_check(evaluate: RuleEvaluator) -> Callable[[dict], list[OptimizationViolation]]:
+    """Adapt a feature evaluator to the rule-input dict ``check`` signature."""
+
+    def _check(chart: dict) -> list[OptimizationViolation]:
+        return evaluate(ChartFeatures.from_rule_input(chart))
 
-def _check_no_cpu_limits(chart: dict) -> list[OptimizationViolation]:
+    name = getattr(evaluate, "__name__", "_eval_rule")
+    _check.__name__ = name.replace("_eval_", "_check_", 1)
+    _check.__qualname__ = _check.__name__
+    _check.__doc__ = evaluate.__doc__
+    return _check
+
+
+def _eval_no_cpu_limits(features: ChartFeatures) -> list[OptimizationViolation]:
     """RES002 - Detect charts without CPU limits defined."""
     if "cpu_limit" in FIXED_RESOURCE_FIELDS:
         return []
-    resources = chart.get("resources", {})
-    limits = resources.get("limits", {})
-
-    if not limits.get("cpu"):
+    if not features.has_cpu_limit:
         return [
             OptimizationViolation(
                 rule_id="RES002",
@@ -161,14 +142,11 @@ def _check_no_cpu_limits(chart: dict) -> list[OptimizationViolation]:
     return []
 
 
-def _check_no_memory_limits(chart: dict) -> list[OptimizationViolation]:
+def _eval_no_memory_limits(features: ChartFeatures) -> list[OptimizationViolation]:
     """RES003 - Detect charts without memory limits defined."""
     if "memory_limit" in FIXED_RESOURCE_FIELDS:
         return []
-    resources = chart.get("resources", {})
-    limits = resources.get("limits", {})
-
-    if not limits.get("memory"):
+    if not features.has_memory_limit:
         return [
             OptimizationViolation(
                 rule_id="RES003",
@@ -183,15 +161,12 @@ def _check_no_memory_limits(chart: dict) -> list[OptimizationViolation]:
     return []
 
 
-def _check_no_resource_requests(chart: dict) -> list[OptimizationViolation]:
+def _eval_no_resource_requests(features: ChartFeatures) -> list[OptimizationViolation]:
     """RES004 - Detect charts without any resource requests."""
     if "cpu_request" in FIXED_RESOURCE_FIELDS and "memory_request" in FIXED_RESOURCE_FIELDS:
         return []
-    resources = chart.get("resources", {})
-    requests = resources.get("requests", {})
-
-    if not requests.get("cpu") and not requests.get("memory"):
-        is_best_effort = _is_best_effort_qos(chart)
+    if not features.has_cpu_request and not features.has_memory_request:
+        is_best_effort = features.is_best_effort
         return [
             OptimizationViolation(
                 rule_id="RES004",
@@ -212,7 +187,7 @@ def _check_no_resource_requests(chart: dict) -> list[OptimizationViolation]:
     return []
 
 
-def _check_high_cpu_limit_request_ratio(chart: dict) -> list[OptimizationViolation]:
+def _eval_high_cpu_limit_request_ratio(features: ChartFeatures) -> list[OptimizationViolation]:
     """RES005 - CPU limit/request ratio >= threshold.
 
     The fix always increases the *request* to bring the ratio in line.
@@ -220,15 +195,11 @@ def _check_high_cpu_limit_request_ratio(chart: dict) -> list[OptimizationViolati
     """
     if "cpu_request" in FIXED_RESOURCE_FIELDS:
         return []
-    if _is_best_effort_qos(chart):
+    if features.is_best_effort:
         return []
 
-    resources = chart.get("resources", {})
-    limits = resources.get("limits", {})
-    requests = resources.get("requests", {})
-
-    cpu_limit = _parse_cpu(limits.get("cpu"))
-    cpu_request = _parse_cpu(requests.get("cpu"))
+    cpu_limit = features.cpu_limit
+    cpu_request = features.cpu_request
 
     if cpu_limit and cpu_request and cpu_request > 0:
         ratio = cpu_limit / cpu_request
@@ -239,8 +210,8 @@ def _check_high_cpu_limit_request_ratio(chart: dict) -> list[OptimizationViolati
                     rule_id="RES005",
                     name="High CPU Limit/Request Ratio",
                     description=(
-                        f"CPU limit ({limits.get('cpu')}) is {ratio:.1f}x the request "
-                        f"({requests.get('cpu')}), increasing request to bring "
+                        f"CPU limit ({features.resource_text('limits', 'cpu')}) is {ratio:.1f}x the request "
+                        f"({features.resource_text('requests', 'cpu')}), increasing request to bring "
                         f"ratio to {BURSTABLE_TARGET_RATIO:.1f}x"
                     ),
                     severity="warning",
@@ -256,7 +227,7 @@ def _check_high_cpu_limit_request_ratio(chart: dict) -> list[OptimizationViolati
     return []
 
 
-def _check_high_memory_limit_request_ratio(chart: dict) -> list[OptimizationViolation]:
+def _eval_high_memory_limit_request_ratio(features: ChartFeatures) -> list[OptimizationViolation]:
     """RES006 - Memory limit/request ratio >= threshold.
 
     The fix always increases the *request* to bring the ratio in line.
@@ -264,15 +235,11 @@ def _check_high_memory_limit_request_ratio(chart: dict) -> list[OptimizationViol
     """
     if "memory_request" in FIXED_RESOURCE_FIELDS:
         return []
-    if _is_best_effort_qos(chart):
+    if features.is_best_effort:
         return []
 
-    resources = chart.get("resources", {})
-    limits = resources.get("limits", {})
-    requests = resources.get("requests", {})
-
-    mem_limit = _parse_memory(limits.get("memory"))
-    mem_request = _parse_memory(requests.get("memory"))
+    mem_limit = features.memory_limit
+    mem_request = features.memory_request
 
     if mem_limit and mem_request and mem_request > 0:
         ratio = mem_limit / mem_request
@@ -283,8 +250,8 @@ def _check_high_memory_limit_request_ratio(chart: dict) -> list[OptimizationViol
                     rule_id="RES006",
                     name="High Memory Limit/Request Ratio",
                     description=(
-                        f"Memory limit ({limits.get('memory')}) is {ratio:.1f}x the request "
-                        f"({requests.get('memory')}), increasing request to bring "
+                        f"Memory limit ({features.resource_text('limits', 'memory')}) is {ratio:.1f}x the request "
+                        f"({features.resource_text('requests', 'memory')}), increasing request to bring "
                         f"ratio to {BURSTABLE_TARGET_RATIO:.1f}x"
                     ),
                     severity="warning",
@@ -302,18 +269,15 @@ def _check_high_memory_limit_request_ratio(chart: dict) -> list[OptimizationViol
     return []
 
 
-def _check_very_low_cpu_request(chart: dict) -> list[OptimizationViolation]:
+def _eval_very_low_cpu_request(features: ChartFeatures) -> list[OptimizationViolation]:
     """RES007 - CPU request < 10m may cause throttling.
 
     Only fires when the CPU *limit* is also low (or missing).  When the limit
     is reasonable but the request is low, RES005 handles it by increasing the
     request instead, so we avoid the bump-then-reduce-limit sequence.
     """
-    resources = chart.get("resources", {})
-    requests = resources.get("requests", {})
-    limits = resources.get("limits", {})
-    cpu_request = _parse_cpu(requests.get("cpu"))
-    cpu_limit = _parse_cpu(limits.get("cpu"))
+    cpu_request = features.cpu_request
+    cpu_limit = features.cpu_limit
 
     if cpu_request and cpu_request < LOW_CPU_THRESHOLD_MILLICORES:
         # Only bump when the limit is also low (or absent).  If the limit is
@@ -325,7 +289,7 @@ def _check_very_low_cpu_request(chart: dict) -> list[OptimizationViolation]:
                 OptimizationViolation(
                     rule_id="RES007",
                     name="Very Low CPU Request",
-                    description=f"CPU request ({requests.get('cpu')}) is below {LOW_CPU_THRESHOLD_MILLICORES}m, which may cause CPU throttling",
+                    description=f"CPU request ({features.resource_text('requests', 'cpu')}) is below {LOW_CPU_THRESHOLD_MILLICORES}m, which may cause CPU throttling",
                     severity="warning",
                     category="resources",
                     fix_preview={"resources": {"requests": {"cpu": "100m"}}},
@@ -335,18 +299,15 @@ def _check_very_low_cpu_request(chart: dict) -> list[OptimizationViolation]:
     return []
 
 
-def _check_very_low_memory_request(chart: dict) -> list[OptimizationViolation]:
+def _eval_very_low_memory_request(features: ChartFeatures) -> list[OptimizationViolation]:
     """RES009 - Memory request < 32Mi may cause OOM.
 
     Only fires when the memory *limit* is also low (or missing).  When the
     limit is reasonable but the request is low, RES006 handles it by
     increasing the request instead.
     """
-    resources = chart.get("resources", {})
-    requests = resources.get("requests", {})
-    limits = resources.get("limits", {})
-    mem_request = _parse_memory(requests.get("memory"))
-    mem_limit = _parse_memory(limits.get("memory"))
+    mem_request = features.memory_request
+    mem_limit = features.memory_limit
 
     if mem_request and mem_request < LOW_MEMORY_THRESHOLD_MI:
         limit_is_also_low = mem_limit is None or mem_limit < MEMORY_BUMP_MIN_MI
@@ -355,7 +316,7 @@ def _check_very_low_memory_request(chart: dict) -> list[OptimizationViolation]:
                 OptimizationViolation(
                     rule_id="RES009",
                     name="Very Low Memory Request",
-                    description=f"Memory request ({requests.get('memory')}) is below {LOW_MEMORY_THRESHOLD_MI}Mi, which may cause OOM kills",
+                    description=f"Memory request ({features.resource_text('requests', 'memory')}) is below {LOW_MEMORY_THRESHOLD_MI}Mi, which may cause OOM kills",
                     severity="warning",
                     category="resources",
                     fix_preview={"resources": {"requests": {"memory": "128Mi"}}},
@@ -365,17 +326,15 @@ def _check_very_low_memory_request(chart: dict) -> list[OptimizationViolation]:
     return []
 
 
-def _check_no_memory_request(chart: dict) -> list[OptimizationViolation]:
+def _eval_no_memory_request(features: ChartFeatures) -> list[OptimizationViolation]:
     """RES008 - Detect charts without memory requests defined."""
     if "memory_request" in FIXED_RESOURCE_FIELDS:
         return []
-    resources = chart.get("resources", {})
-    requests = resources.get("requests", {})
     # RES004 already covers the stronger case where both requests are missing.
-    if not requests.get("cpu") and not requests.get("memory"):
+    if not features.has_cpu_request and not features.has_memory_request:
         return []
 
-    if not requests.get("memory"):
+    if not features.has_memory_request:
         return [
             OptimizationViolation(
                 rule_id="RES008",
@@ -390,18 +349,10 @@ def _check_no_memory_request(chart: dict) -> list[OptimizationViolation]:
     return []
 
 
-def _check_missing_probe(
-    chart: dict, probe_name: str, probe_key: str, rule_id: str, severity: str, fix_preview: dict
+def _missing_probe(
+    has_probe: bool, probe_name: str, rule_id: str, severity: str, fix_preview: dict
 ) -> list[OptimizationViolation]:
-    """Helper to check for missing probe (reduces duplication)."""
-    # Check if probe is defined at root level
-    has_probe = probe_key in chart
-
-    # Also check nested probes structure
-    if not has_probe:
-        probes = chart.get("probes", {})
-        has_probe = bool(probes.get(probe_name))
-
+    """Helper to report a missing probe (reduces duplication)."""
     if not has_probe:
         return [
             OptimizationViolation(
@@ -417,12 +368,11 @@ def _check_missing_probe(
     return []
 
 
-def _check_missing_startup_probe(chart: dict) -> list[OptimizationViolation]:
+def _eval_missing_startup_probe(features: ChartFeatures) -> list[OptimizationViolation]:
     """PRB003 - Detect missing startupProbe in Helm values."""
-    return _check_missing_probe(
-        chart=chart,
+    return _missing_probe(
+        has_probe=features.has_startup,
         probe_name="startup",
-        probe_key="startupProbe",
         rule_id="PRB003",
         severity="info",
         fix_preview={
@@ -437,12 +387,11 @@ def _check_missing_startup_probe(chart: dict) -> list[OptimizationViolation]:
     )
 
 
-def _check_missing_liveness_probe(chart: dict) -> list[OptimizationViolation]:
+def _eval_missing_liveness_probe(features: ChartFeatures) -> list[OptimizationViolation]:
     """PRB001 - Detect missing livenessProbe in Helm values."""
-    return _check_missing_probe(
-        chart=chart,
+    return _missing_probe(
+        has_probe=features.has_liveness,
         probe_name="liveness",
-        probe_key="livenessProbe",
         rule_id="PRB001",
         severity="warning",
         fix_preview={
@@ -457,12 +406,11 @@ def _check_missing_liveness_probe(chart: dict) -> list[OptimizationViolation]:
     )
 
 
-def _check_missing_readiness_probe(chart: dict) -> list[OptimizationViolation]:
+def _eval_missing_readiness_probe(features: ChartFeatures) -> list[OptimizationViolation]:
     """PRB002 - Detect missing readinessProbe in Helm values."""
-    return _check_missing_probe(
-        chart=chart,
+    return _missing_probe(
+        has_probe=features.has_readiness,
         probe_name="readiness",
-        probe_key="readinessProbe",
         rule_id="PRB002",
         severity="warning",
         fix_preview={
@@ -477,15 +425,12 @@ def _check_missing_readiness_probe(chart: dict) -> list[OptimizationViolation]:
     )
 
 
-def _check_missing_topology_spread(chart: dict) -> list[OptimizationViolation]:
+def _eval_missing_topology_spread(features: ChartFeatures) -> list[OptimizationViolation]:
     """AVL004 - Detect missing topology spread for multi-replica workloads."""
-    replicas = chart.get("replicas", 1)
-    if replicas <= 1:
+    if features.effective_replicas <= 1:
         return []
 
-    topology = chart.get("topologySpreadConstraints", [])
-
-    if not topology:
+    if not features.has_topology_spread:
         return [
             OptimizationViolation(
                 rule_id="AVL004",
@@ -512,24 +457,12 @@ def _check_missing_topology_spread(chart: dict) -> list[OptimizationViolation]:
     return []
 
 
-def _check_no_pdb(chart: dict) -> list[OptimizationViolation]:
+def _eval_no_pdb(features: ChartFeatures) -> list[OptimizationViolation]:
     """AVL001 - Detect missing PodDisruptionBudget for multi-replica workloads."""
-    replicas = chart.get("replicas", 1)
-    if replicas <= 1:
+    if features.effective_replicas <= 1:
         return []
 
-    # Treat explicit enabled: false as disabled/missing.
-    has_pdb = False
-    for key in ("podDisruptionBudget", "pdb"):
-        pdb = chart.get(key)
-        if pdb is None:
-            continue
-        if isinstance(pdb, dict) and pdb.get("enabled") is False:
-            continue
-        has_pdb = True
-        break
-
-    if not has_pdb and replicas > 1:
+    if not features.has_pdb:
         return [
             OptimizationViolation(
                 rule_id="AVL001",
@@ -551,19 +484,9 @@ def _check_no_pdb(chart: dict) -> list[OptimizationViolation]:
     return []
 
 
-def _check_no_pod_anti_affinity(chart: dict) -> list[OptimizationViolation]:
+def _eval_no_pod_anti_affinity(features: ChartFeatures) -> list[OptimizationViolation]:
     """AVL002 - Detect missing podAntiAffinity (#10 - flag for all charts)."""
-    affinity = chart.get("affinity", {})
-    pod_anti_affinity = affinity.get("podAntiAffinity", {})
-
-    has_anti_affinity = chart.get("has_anti_affinity", False) or bool(
-        pod_anti_affinity.get("preferredDuringSchedulingIgnoredDuringExecution")
-        or pod_anti_affinity.get("requiredDuringSchedulingIgnoredDuringExecution")
-    )
-
-    replicas = chart.get("replicas", 1)
-
-    if not has_anti_affinity and replicas > 1:
+    if not features.has_anti_affinity and features.effective_replicas > 1:
         return [
             OptimizationViolation(
                 rule_id="AVL002",
@@ -594,10 +517,9 @@ def _check_no_pod_anti_affinity(chart: dict) -> list[OptimizationViolation]:
     return []
 
 
-def _check_single_replica(chart: dict) -> list[OptimizationViolation]:
+def _eval_single_replica(features: ChartFeatures) -> list[OptimizationViolation]:
     """AVL005 - Detect single-replica charts with no redundancy (spec 3.2)."""
-    replicas = chart.get("replicas")
-    if replicas is not None and replicas == 1:
+    if features.replicas is not None and features.replicas == 1:
         return [
             OptimizationViolation(
                 rule_id="AVL005",
@@ -612,13 +534,13 @@ def _check_single_replica(chart: dict) -> list[OptimizationViolation]:
     return []
 
 
-def _check_blocking_pdb(chart: dict) -> list[OptimizationViolation]:
+def _eval_blocking_pdb(features: ChartFeatures) -> list[OptimizationViolation]:
     """AVL003 - Detect blocking PDB configurations (minAvailable >= replicas or maxUnavailable = 0)."""
-    pdb = chart.get("podDisruptionBudget", chart.get("pdb", {}))
+    pdb = features.pdb
     if not pdb:
         return []
 
-    replicas = chart.get("replicas", 1)
+    replicas = features.effective_replicas
     min_available = pdb.get("minAvailable")
     max_unavailable = pdb.get("maxUnavailable")
 
@@ -706,12 +628,9 @@ def _check_blocking_pdb(chart: dict) -> list[OptimizationViolation]:
     return violations
 
 
-def _check_running_as_root(chart: dict) -> list[OptimizationViolation]:
+def _eval_running_as_root(features: ChartFeatures) -> list[OptimizationViolation]:
     """SEC001 - Detect securityContext.runAsUser == 0 (running as root)."""
-    sc = chart.get("securityContext", {})
-    run_as_user = sc.get("runAsUser")
-
-    if run_as_user == 0:
+    if features.run_as_user == 0:
         return [
             OptimizationViolation(
                 rule_id="SEC001",
@@ -732,6 +651,26 @@ def _check_running_as_root(chart: dict) -> list[OptimizationViolation]:
     return []
 
 
+# Dict-input entry points (rule-input payloads from values or rendered manifests).
+_check_no_cpu_limits = _dict_check(_eval_no_cpu_limits)
+_check_no_memory_limits = _dict_check(_eval_no_memory_limits)
+_check_no_resource_requests = _dict_check(_eval_no_resource_requests)
+_check_high_cpu_limit_request_ratio = _dict_check(_eval_high_cpu_limit_request_ratio)
+_check_high_memory_limit_request_ratio = _dict_check(_eval_high_memory_limit_request_ratio)
+_check_very_low_cpu_request = _dict_check(_eval_very_low_cpu_request)
+_check_very_low_memory_request = _dict_check(_eval_very_low_memory_request)
+_check_no_memory_request = _dict_check(_eval_no_memory_request)
+_check_missing_startup_probe = _dict_check(_eval_missing_startup_probe)
+_check_missing_liveness_probe = _dict_check(_eval_missing_liveness_probe)
+_check_missing_readiness_probe = _dict_check(_eval_missing_readiness_probe)
+_check_missing_topology_spread = _dict_check(_eval_missing_topology_spread)
+_check_no_pdb = _dict_check(_eval_no_pdb)
+_check_no_pod_anti_affinity = _dict_check(_eval_no_pod_anti_affinity)
+_check_single_replica = _dict_check(_eval_single_replica)
+_check_blocking_pdb = _dict_check(_eval_blocking_pdb)
+_check_running_as_root = _dict_check(_eval_running_as_root)
+
+
 # All optimization rules
 RULES: list[OptimizationRule] = [
     # Resources rules
@@ -742,6 +681,8 @@ RULES: list[OptimizationRule] = [
         severity="warning",
         category="resources",
         check=_check_no_cpu_limits,
+        evaluate=_eval_no_cpu_limits,
+        thresholds=("fixed_resource_fields",),
         auto_fixable=True,
     ),
     OptimizationRule(
@@ -751,6 +692,8 @@ RULES: list[OptimizationRule] = [
         severity="warning",
         category="resources",
         check=_check_no_memory_limits,
+        evaluate=_eval_no_memory_limits,
+        thresholds=("fixed_resource_fields",),
         auto_fixable=True,
     ),
     OptimizationRule(
@@ -760,6 +703,8 @@ RULES: list[OptimizationRule] = [
         severity="error",
         category="resources",
         check=_check_no_resource_requests,
+        evaluate=_eval_no_resource_requests,
+        thresholds=("fixed_resource_fields",),
         auto_fixable=True,
     ),
     OptimizationRule(
@@ -769,6 +714,12 @@ RULES: list[OptimizationRule] = [
         severity="warning",
         category="resources",
         check=_check_high_cpu_limit_request_ratio,
+        evaluate=_eval_high_cpu_limit_request_ratio,
+        thresholds=(
+            "fixed_resource_fields",
+            "limit_request_ratio_threshold",
+            "burstable_target_ratio",
+        ),
         auto_fixable=True,
     ),
     OptimizationRule(
@@ -778,6 +729,12 @@ RULES: list[OptimizationRule] = [
         severity="warning",
         category="resources",
         check=_check_high_memory_limit_request_ratio,
+        evaluate=_eval_high_memory_limit_request_ratio,
+        thresholds=(
+            "fixed_resource_fields",
+            "limit_request_ratio_threshold",
+            "burstable_target_ratio",
+        ),
         auto_fixable=True,
     ),
     OptimizationRule(
@@ -787,6 +744,8 @@ RULES: list[OptimizationRule] = [
         severity="warning",
         category="resources",
         check=_check_very_low_cpu_request,
+        evaluate=_eval_very_low_cpu_request,
+        thresholds=("low_cpu_threshold_millicores", "cpu_bump_min_millicores"),
         auto_fixable=True,
     ),
     OptimizationRule(
@@ -796,6 +755,8 @@ RULES: list[OptimizationRule] = [
         severity="warning",
         category="resources",
         check=_check_no_memory_request,
+        evaluate=_eval_no_memory_request,
+        thresholds=("fixed_resource_fields",),
         auto_fixable=True,
     ),
     OptimizationRule(
@@ -805,6 +766,8 @@ RULES: list[OptimizationRule] = [
         severity="warning",
         category="resources",
         check=_check_very_low_memory_request,
+        evaluate=_eval_very_low_memory_request,
+        thresholds=("low_memory_threshold_mi", "memory_bump_min_mi"),
         auto_fixable=True,
     ),
     # Probes rules
@@ -815,6 +778,8 @@ RULES: list[OptimizationRule] = [
         severity="warning",
         category="probes",
         check=_check_missing_liveness_probe,
+        evaluate=_eval_missing_liveness_probe,
+        thresholds=(),
         auto_fixable=True,
     ),
     OptimizationRule(
@@ -824,6 +789,8 @@ RULES: list[OptimizationRule] = [
         severity="warning",
         category="probes",
         check=_check_missing_readiness_probe,
+        evaluate=_eval_missing_readiness_probe,
+        thresholds=(),
         auto_fixable=True,
     ),
     OptimizationRule(
@@ -833,6 +800,8 @@ RULES: list[OptimizationRule] = [
         severity="info",
         category="probes",
         check=_check_missing_startup_probe,
+        evaluate=_eval_missing_startup_probe,
+        thresholds=(),
         auto_fixable=True,
     ),
     # Availability rules
@@ -843,6 +812,8 @@ RULES: list[OptimizationRule] = [
         severity="warning",
         category="availability",
         check=_check_no_pdb,
+        evaluate=_eval_no_pdb,
+        thresholds=(),
         auto_fixable=True,
     ),
     OptimizationRule(
@@ -852,6 +823,8 @@ RULES: list[OptimizationRule] = [
         severity="info",
         category="availability",
         check=_check_no_pod_anti_affinity,
+        evaluate=_eval_no_pod_anti_affinity,
+        thresholds=(),
         auto_fixable=True,
     ),
     OptimizationRule(
@@ -861,6 +834,8 @@ RULES: list[OptimizationRule] = [
         severity="error",
         category="availability",
         check=_check_blocking_pdb,
+        evaluate=_eval_blocking_pdb,
+        thresholds=("pdb_blocking_threshold",),
         auto_fixable=True,
     ),
     OptimizationRule(
@@ -870,6 +845,8 @@ RULES: list[OptimizationRule] = [
         severity="info",
         category="availability",
         check=_check_missing_topology_spread,
+        evaluate=_eval_missing_topology_spread,
+        thresholds=(),
         auto_fixable=True,
     ),
     OptimizationRule(
@@ -879,6 +856,8 @@ RULES: list[OptimizationRule] = [
         severity="warning",
         category="availability",
         check=_check_single_replica,
+        evaluate=_eval_single_replica,
+        thresholds=(),
         auto_fixable=True,
     ),
     # Security rules
@@ -889,6 +868,8 @@ RULES: list[OptimizationRule] = [
         severity="error",
         category="security",
         check=_check_running_as_root,
+        evaluate=_eval_running_as_root,
+        thresholds=(),
         auto_fixable=True,
     ),
 ]
@@ -901,3 +882,4 @@ RULES_BY_ID: dict[str, OptimizationRule] = {rule.id: rule for rule in RULES}
 def get_rule_by_id(rule_id: str) -> OptimizationRule | None:
     """Get a rule by its ID."""
     return RULES_BY_ID.get(rule_id)
+
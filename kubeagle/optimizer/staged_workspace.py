@@ -0,0 +1,191 @@
+"""Chart workspace cloning and change detection for direct-edit AI fixes.
+
+Direct-edit fixes run the LLM against a staged copy of the chart and compare
+trees before and after the run. Comparing by SHA-256 of every file made
+charts with large vendored dependencies spend more time hashing than in the
+model call, so trees are compared by stat signature (size and mtime) and a
+file is only hashed when its signature differs from the other side.
+
+Workspaces are cloned with reflinks (copy-on-write) where the filesystem
+supports them and plain copies otherwise. Hardlinks are never used: LLM
+tools rewrite files in place, which would write through a shared inode into
+the source chart. Clones keep the source mtimes, so unchanged files have
+equal signatures on both sides.
+
+Files modified shortly before a snapshot are hashed eagerly ("racily clean"
+files, as in git's index): a rewrite within the filesystem's timestamp
+granularity can leave size and mtime unchanged.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import shutil
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+# ioctl request cloning a whole file (Linux FICLONE).
+_FICLONE = 0x40049409
+
+# Files modified this recently before a snapshot are hashed at capture time.
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Bytes read per chunk when hashing a file.
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# (source device, destination device) pairs where reflinks failed.
+_REFLINK_UNSUPPORTED: set[tuple[int, int]] = set()
+
+FileSignature = tuple[int, int]
+
+
+def _reflink(source: str, destination: str) -> bool:
+    """Clone ``source`` to ``destination`` sharing extents; False if unsupported."""
+    if fcntl is None:
+        return False
+    try:
+        source_device = os.stat(source).st_dev
+        destination_device = os.stat(os.path.dirname(destination) or ".").st_dev
+    except OSError:
+        return False
+    devices = (source_device, destination_device)
+    if devices in _REFLINK_UNSUPPORTED:
+        return False
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        _REFLINK_UNSUPPORTED.add(devices)
+        with contextlib.suppress(OSError):
+            os.unlink(destination)
+        return False
+    return True
+
+
+def clone_file(source: str, destination: str) -> str:
+    """Copy ``source`` to ``destination`` with metadata, reflinking when possible."""
+    if _reflink(source, destination):
+        shutil.copystat(source, destination)
+    else:
+        shutil.copy2(source, destination)
+    return destination
+
+
+def clone_tree(source_dir: Path, destination_dir: Path) -> None:
+    """Clone ``source_dir`` to the new directory ``destination_dir``."""
+    shutil.copytree(source_dir, destination_dir, copy_function=clone_file)
+
+
+def _hash_file(path: Path) -> str | None:
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as handle:
+            while chunk := handle.read(_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+class TreeSnapshot:
+    """Stat signatures of every file below a root, with lazily computed digests."""
+
+    __slots__ = ("_digests", "_signatures", "root")
+
+    def __init__(
+        self,
+        root: Path,
+        signatures: dict[str, FileSignature],
+        digests: dict[str, str] | None = None,
+    ) -> None:
+        self.root = root
+        self._signatures = signatures
+        self._digests = digests if digests is not None else {}
+
+    @classmethod
+    def capture(cls, root: Path) -> TreeSnapshot:
+        """Record the signature of every regular file below ``root``."""
+        racy_after_ns = time.time_ns() - _RACY_WINDOW_NS
+        signatures: dict[str, FileSignature] = {}
+        racy: list[str] = []
+        prefix_length = len(str(root)) + 1
+        pending = [str(root)]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                                continue
+                            if not entry.is_file():
+                                continue
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        rel_path = entry.path[prefix_length:].replace(os.sep, "/")
+                        signatures[rel_path] = (stat.st_size, stat.st_mtime_ns)
+                        if stat.st_mtime_ns >= racy_after_ns:
+                            racy.append(rel_path)
+            except OSError:
+                continue
+        snapshot = cls(root, signatures)
+        for rel_path in racy:
+            snapshot.digest(rel_path)
+        return snapshot
+
+    def __contains__(self, rel_path: object) -> bool:
+        return rel_path in self._signatures
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def paths(self) -> list[str]:
+        """Relative paths of the recorded files."""
+        return sorted(self._signatures)
+
+    def digest(self, rel_path: str) -> str | None:
+        """SHA-256 of ``rel_path``, hashed from disk on first use."""
+        cached = self._digests.get(rel_path)
+        if cached is None and rel_path in self._signatures:
+            cached = _hash_file(self.root / rel_path)
+            if cached is not None:
+                self._digests[rel_path] = cached
+        return cached
+
+    def changed_paths(self, after: TreeSnapshot) -> list[str]:
+        """Relative paths whose content differs between this snapshot and ``after``.
+
+        Equal signatures count as unchanged unless the file was racily clean
+        at capture time. When both snapshots share a root, files whose
+        signature changed are reported without hashing unless a digest was
+        recorded at capture time, because the earlier content no longer
+        exists on disk.
+        """
+        same_root = self.root == after.root
+        changed: list[str] = []
+        for rel_path in sorted(self._signatures.keys() | after._signatures.keys()):
+            before_signature = self._signatures.get(rel_path)
+            after_signature = after._signatures.get(rel_path)
+            if before_signature is None or after_signature is None:
+                changed.append(rel_path)
+                continue
+            before_digest = self._digests.get(rel_path)
+            if before_digest is None:
+                if before_signature == after_signature:
+                    continue
+                if same_root:
+                    changed.append(rel_path)
+                    continue
+                before_digest = self.digest(rel_path)
+            if before_digest != after.digest(rel_path):
+                changed.append(rel_path)
+        return changed
@@ -0,0 +1,234 @@
+"""Reusable dependency-stripped chart workspaces for parent-only renders.
+
+Charts whose ``charts/`` directory lacks the dependencies declared in
+Chart.yaml cannot be rendered by ``helm template`` as they are. The renderer
+retries them from a copy whose Chart.yaml has no ``dependencies``. Building
+that copy for every render made these charts far slower than others, so
+workspaces are kept per chart directory and reused while the chart's digest
+(relative path, size and mtime of every file) is unchanged.
+
+Workspace files are hardlinks to the chart's files where the filesystem
+allows it (plain copies otherwise); only Chart.yaml is written. Renders
+hold a lease on their workspace, and a stale or evicted workspace is removed
+once its last lease is released. The cache is process-wide because renders
+come from short-lived optimizer controllers and fix verification alike.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+# Maximum number of chart workspaces kept on disk.
+_STRIPPED_CHART_CACHE_SIZE = 64
+
+
+class StrippedChartSetupError(Exception):
+    """Raised when a stripped chart workspace cannot be built."""
+
+
+def chart_digest(chart_dir: Path) -> str:
+    """Digest of every file below ``chart_dir`` by relative path, size and mtime."""
+    digest = hashlib.sha1(usedforsecurity=False)
+    pending = [str(chart_dir)]
+    prefix_length = len(str(chart_dir)) + 1
+    records: list[str] = []
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            pending.append(entry.path)
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    records.append(
+                        f"{entry.path[prefix_length:]}\0{stat.st_size}\0{stat.st_mtime_ns}"
+                    )
+        except OSError:
+            continue
+    for record in sorted(records):
+        digest.update(record.encode("utf-8", errors="surrogateescape"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _link_or_copy(source: str, destination: str) -> str:
+    """Hardlink ``source`` to ``destination``, copying across filesystems."""
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+    return destination
+
+
+@dataclass(slots=True)
+class _Workspace:
+    digest: str
+    chart_dir: Path
+    leases: int = 0
+    stale: bool = False
+
+
+class StrippedChartCache:
+    """Bounded LRU of stripped chart workspaces keyed by chart directory.
+
+    Args:
+        strip_dependencies: Rewrites a Chart.yaml in place without its
+            dependencies; returns an error message or None.
+        max_entries: Workspaces kept on disk.
+        root: Directory holding the workspaces (a private temporary
+            directory, removed at exit, by default).
+    """
+
+    def __init__(
+        self,
+        strip_dependencies: Callable[[Path], str | None],
+        max_entries: int = _STRIPPED_CHART_CACHE_SIZE,
+        root: Path | None = None,
+    ) -> None:
+        self._strip_dependencies = strip_dependencies
+        self._max_entries = max(1, max_entries)
+        self._root = root
+        self._entries: OrderedDict[str, _Workspace] = OrderedDict()
+        # Guards the entries; per-chart locks serialise workspace builds.
+        self._lock = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _workspace_root(self) -> Path:
+        if self._root is None:
+            self._root = Path(tempfile.mkdtemp(prefix="kubeagle-stripped-charts-"))
+            atexit.register(shutil.rmtree, self._root, True)
+        return self._root
+
+    def current_digest(self, chart_dir: Path) -> str | None:
+        """Return the chart's digest if it has an up-to-date workspace.
+
+        Charts without a workspace return None without touching the disk, so
+        the check is free for charts that render normally.
+        """
+        entry = self._entries.get(str(chart_dir))
+        if entry is None:
+            return None
+        digest = chart_digest(chart_dir)
+        return digest if digest == entry.digest else None
+
+    @contextmanager
+    def lease(self, chart_dir: Path, digest: str | None = None) -> Generator[Path, None, None]:
+        """Yield a stripped copy of ``chart_dir``, building it if needed.
+
+        Workspaces are built under a per-chart lock, so concurrent renders
+        of one chart share a single build while other charts proceed.
+
+        Args:
+            chart_dir: Resolved chart directory.
+            digest: The chart's current digest, when already computed.
+
+        Raises:
+            StrippedChartSetupError: If the workspace cannot be built.
+        """
+        key = str(chart_dir)
+        digest = digest or chart_digest(chart_dir)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry.digest == digest:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    entry.leases += 1
+                else:
+                    entry = None
+            if entry is None:
+                built = self._build(chart_dir, digest)
+                entry = _Workspace(digest=digest, chart_dir=built, leases=1)
+                with self._lock:
+                    self.misses += 1
+                    retired = [self._entries.pop(key, None)]
+                    self._entries[key] = entry
+                    while len(self._entries) > self._max_entries:
+                        evicted_key, evicted = self._entries.popitem(last=False)
+                        self._key_locks.pop(evicted_key, None)
+                        retired.append(evicted)
+                    removable = self._retire_all(retired)
+                self._remove(removable)
+        try:
+            yield entry.chart_dir
+        finally:
+            with self._lock:
+                entry.leases -= 1
+                removable = [entry] if entry.stale and entry.leases == 0 else []
+            self._remove(removable)
+
+    def discard(self, chart_dir: Path) -> None:
+        """Forget the workspace of ``chart_dir`` (renders go back to normal)."""
+        with self._lock:
+            removable = self._retire_all([self._entries.pop(str(chart_dir), None)])
+        self._remove(removable)
+
+    def clear(self) -> None:
+        """Remove every workspace that is not in use."""
+        with self._lock:
+            removable = self._retire_all(list(self._entries.values()))
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+        self._remove(removable)
+
+    @staticmethod
+    def _retire_all(entries: list[_Workspace | None]) -> list[_Workspace]:
+        """Mark ``entries`` stale; return those no render holds (lock held)."""
+        removable: list[_Workspace] = []
+        for entry in entries:
+            if entry is None:
+                continue
+            entry.stale = True
+            if entry.leases == 0:
+                removable.append(entry)
+        return removable
+
+    @staticmethod
+    def _remove(entries: list[_Workspace]) -> None:
+        for entry in entries:
+            shutil.rmtree(entry.chart_dir.parent, ignore_errors=True)
+
+    def _build(self, chart_dir: Path, digest: str) -> Path:
+        container = Path(
+            tempfile.mkdtemp(prefix=f"{digest[:12]}-", dir=self._workspace_root())
+        )
+        workspace = container / chart_dir.name
+        try:
+            shutil.copytree(chart_dir, workspace, copy_function=_link_or_copy)
+            # Chart.yaml is rewritten, so it must not share the original inode.
+            chart_yaml = workspace / "Chart.yaml"
+            chart_yaml.unlink(missing_ok=True)
+            shutil.copy2(chart_dir / "Chart.yaml", chart_yaml)
+        except OSError as exc:
+            shutil.rmtree(container, ignore_errors=True)
+            raise StrippedChartSetupError(
+                f"Failed to stage chart copy for parent-only render: {exc!s}"
+            ) from exc
+
+        strip_error = self._strip_dependencies(chart_yaml)
+        if strip_error:
+            shutil.rmtree(container, ignore_errors=True)
+            raise StrippedChartSetupError(strip_error)
+        return workspace
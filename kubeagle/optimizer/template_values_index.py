@@ -0,0 +1,370 @@
+"""Static index of the ``.Values`` paths a chart's templates reference.
+
+Used to decide whether a values edit can change ``helm template`` output:
+
+- edits touching only paths no template references reuse the previous render;
+- edits touching only resource quantities (``...resources.limits.cpu``) are
+  patched into the previously rendered docs;
+- anything else needs a real render.
+
+The index is conservative. A referenced path covers its whole subtree and its
+ancestors (``with``/``range``/``toYaml`` blocks), and any bare ``.Values`` use
+or ``tpl`` call marks the chart as fully dynamic. Subchart roots and
+``global`` always count as referenced. Templates of unpacked subcharts and
+library charts are scanned too, since ``include "lib.tpl" .`` runs them
+against the parent's ``.Values``; a dependency that is only available as an
+archive (or not vendored at all) marks the chart as dynamic.
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+import re
+import threading
+from collections.abc import Hashable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+ValuesPath = tuple[str, ...]
+
+# ``.Values`` followed by an optional ``.key.key`` chain. ``$.Values`` and
+# ``$root.Values`` match as well.
+_VALUES_REF_PATTERN = re.compile(r"\.Values\b((?:\.[A-Za-z_][A-Za-z0-9_]*)*)")
+_TPL_PATTERN = re.compile(r"\btpl\b")
+_TGZ_NAME_PATTERN = re.compile(r"^(?P<name>.+?)-\d[^/]*\.tgz$")
+_TEMPLATE_SUFFIXES = (".yaml", ".yml", ".tpl", ".txt", ".json")
+_RESOURCE_SECTIONS = frozenset({"requests", "limits"})
+_RESOURCE_NAMES = frozenset({"cpu", "memory"})
+
+# Maximum number of charts whose template index is kept.
+_INDEX_CACHE_SIZE = 2_048
+
+
+@dataclass(frozen=True, slots=True)
+class TemplateValuesIndex:
+    """Values paths referenced by a chart's templates.
+
+    Attributes:
+        paths: Referenced dotted paths, as key tuples.
+        roots: Top-level keys referenced wholesale (subcharts, ``global``).
+        dynamic: Whether templates can read arbitrary values (bare
+            ``.Values`` or ``tpl``); every path is then referenced.
+    """
+
+    paths: frozenset[ValuesPath]
+    roots: frozenset[str] = frozenset()
+    dynamic: bool = False
+
+    def references(self, path: ValuesPath) -> bool:
+        """Return whether a change at ``path`` can affect rendered output."""
+        if self.dynamic or not path:
+            return True
+        if path[0] in self.roots:
+            return True
+        for length in range(1, len(path) + 1):
+            if path[:length] in self.paths:
+                return True
+        return any(ref[: len(path)] == path for ref in self.paths if len(ref) > len(path))
+
+
+def _iter_template_files(chart_dir: Path) -> Iterator[Path]:
+    pending = [chart_dir / "templates"]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as iterator:
+                for entry in iterator:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+                    elif entry.name.endswith(_TEMPLATE_SUFFIXES):
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
+def _dependency_names(chart_dir: Path) -> list[tuple[str, str]]:
+    """Return ``(name, alias)`` of the dependencies declared in Chart.yaml."""
+    try:
+        chart_yaml = yaml.safe_load((chart_dir / "Chart.yaml").read_text(encoding="utf-8"))
+    except (OSError, yaml.YAMLError):
+        chart_yaml = None
+    dependencies = chart_yaml.get("dependencies") if isinstance(chart_yaml, dict) else None
+    names: list[tuple[str, str]] = []
+    for dependency in dependencies if isinstance(dependencies, list) else []:
+        if not isinstance(dependency, dict):
+            continue
+        names.append(
+            (
+                str(dependency.get("name") or "").strip(),
+                str(dependency.get("alias") or "").strip(),
+            )
+        )
+    return names
+
+
+def _scan_dependencies(chart_dir: Path) -> tuple[set[str], list[Path], bool]:
+    """Collect subchart roots and unpacked dependency chart dirs (recursively).
+
+    Returns:
+        Top-level subchart roots of ``chart_dir`` (plus ``global``), every
+        unpacked dependency chart dir, and whether some dependency could not
+        be scanned (archived or missing from ``charts/``).
+    """
+    roots = {"global"}
+    chart_dirs: list[Path] = []
+    unscannable = False
+    pending = [chart_dir]
+    while pending:
+        current = pending.pop()
+        declared = _dependency_names(current)
+        unpacked: set[str] = set()
+        try:
+            with os.scandir(current / "charts") as iterator:
+                for entry in iterator:
+                    if entry.is_dir():
+                        unpacked.add(entry.name)
+                        chart_dirs.append(Path(entry.path))
+                        pending.append(Path(entry.path))
+                        continue
+                    match = _TGZ_NAME_PATTERN.match(entry.name)
+                    if match is not None:
+                        unpacked.add(match.group("name"))
+                        unscannable = True
+        except OSError:
+            pass
+        if any(name and name not in unpacked for name, _alias in declared):
+            unscannable = True
+        if current == chart_dir:
+            roots.update(unpacked)
+            roots.update(value for pair in declared for value in pair if value)
+    return roots, chart_dirs, unscannable
+
+
+def build_template_values_index(chart_dir: Path) -> TemplateValuesIndex:
+    """Scan the templates of a chart and its dependencies for ``.Values`` paths."""
+    roots, dependency_dirs, unscannable = _scan_dependencies(chart_dir)
+    paths: set[ValuesPath] = set()
+    dynamic = unscannable
+    for template_dir in (chart_dir, *dependency_dirs):
+        for template_path in _iter_template_files(template_dir):
+            try:
+                text = template_path.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                return TemplateValuesIndex(paths=frozenset(), dynamic=True)
+            if "{{" not in text:
+                continue
+            if _TPL_PATTERN.search(text):
+                dynamic = True
+            for match in _VALUES_REF_PATTERN.finditer(text):
+                chain = match.group(1)
+                if not chain:
+                    dynamic = True
+                    continue
+                paths.add(tuple(chain[1:].split(".")))
+    return TemplateValuesIndex(
+        paths=frozenset(paths),
+        roots=frozenset(roots),
+        dynamic=dynamic,
+    )
+
+
+_index_cache: dict[str, tuple[Hashable, TemplateValuesIndex]] = {}
+_index_lock = threading.Lock()
+
+
+def get_template_values_index(chart_dir: Path, stamp: Hashable) -> TemplateValuesIndex:
+    """Return the index for ``chart_dir``, rebuilt when ``stamp`` changes."""
+    key = str(chart_dir)
+    with _index_lock:
+        cached = _index_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+    index = build_template_values_index(chart_dir)
+    with _index_lock:
+        _index_cache[key] = (stamp, index)
+        while len(_index_cache) > _INDEX_CACHE_SIZE:
+            _index_cache.pop(next(iter(_index_cache)))
+    return index
+
+
+def load_values_document(values_file: Path) -> dict[str, Any] | None:
+    """Load a values file as a mapping; None when unreadable or not a mapping."""
+    try:
+        data = yaml.safe_load(values_file.read_text(encoding="utf-8"))
+    except (OSError, yaml.YAMLError):
+        return None
+    if data is None:
+        return {}
+    return data if isinstance(data, dict) else None
+
+
+def changed_values_paths(
+    old: Mapping[str, Any],
+    new: Mapping[str, Any],
+    prefix: ValuesPath = (),
+) -> list[ValuesPath]:
+    """Return the paths whose value differs between two values documents.
+
+    Lists and scalars are compared as leaves; added and removed keys are
+    reported at the key itself.
+    """
+    changed: list[ValuesPath] = []
+    for key in old.keys() | new.keys():
+        path = (*prefix, str(key))
+        if key not in old or key not in new:
+            changed.append(path)
+            continue
+        old_value = old[key]
+        new_value = new[key]
+        if isinstance(old_value, Mapping) and isinstance(new_value, Mapping):
+            changed.extend(changed_values_paths(old_value, new_value, path))
+        elif old_value != new_value or type(old_value) is not type(new_value):
+            changed.append(path)
+    return changed
+
+
+def _is_resource_leaf(path: ValuesPath) -> bool:
+    return (
+        len(path) >= 3
+        and path[-3] == "resources"
+        and path[-2] in _RESOURCE_SECTIONS
+        and path[-1] in _RESOURCE_NAMES
+    )
+
+
+def _lookup(values: Mapping[str, Any], path: ValuesPath) -> Any:
+    current: Any = values
+    for key in path:
+        if not isinstance(current, Mapping) or key not in current:
+            return None
+        current = current[key]
+    return current
+
+
+def _iter_resource_leaves(
+    values: Mapping[str, Any],
+    prefix: ValuesPath = (),
+) -> Iterator[tuple[ValuesPath, Any]]:
+    for key, value in values.items():
+        path = (*prefix, str(key))
+        if isinstance(value, Mapping):
+            yield from _iter_resource_leaves(value, path)
+        elif _is_resource_leaf(path):
+            yield path, value
+
+
+def _quantity_text(value: Any) -> str:
+    return str(value).strip()
+
+
+def _patch_resource_quantity(
+    node: Any,
+    *,
+    section: str,
+    resource: str,
+    old_text: str,
+    new_value: Any,
+) -> int:
+    """Replace matching ``resources.<section>.<resource>`` values in ``node``."""
+    patched = 0
+    if isinstance(node, dict):
+        resources = node.get("resources")
+        if isinstance(resources, dict):
+            section_payload = resources.get(section)
+            if (
+                isinstance(section_payload, dict)
+                and resource in section_payload
+                and _quantity_text(section_payload[resource]) == old_text
+            ):
+                section_payload[resource] = new_value
+                patched += 1
+        for value in node.values():
+            patched += _patch_resource_quantity(
+                value,
+                section=section,
+                resource=resource,
+                old_text=old_text,
+                new_value=new_value,
+            )
+    elif isinstance(node, list):
+        for item in node:
+            patched += _patch_resource_quantity(
+                item,
+                section=section,
+                resource=resource,
+                old_text=old_text,
+                new_value=new_value,
+            )
+    return patched
+
+
+def patch_rendered_resources(
+    docs: list[dict[str, Any]],
+    old_values: Mapping[str, Any],
+    new_values: Mapping[str, Any],
+    changed: list[ValuesPath],
+) -> list[dict[str, Any]] | None:
+    """Apply resource-quantity value edits to previously rendered docs.
+
+    Every changed path must be a resource leaf whose old and new values are
+    scalars. The old quantity must not also appear at another resource leaf
+    of the same kind, and it must appear exactly once in the rendered docs
+    (a second match may be hardcoded in a template). Returns None when the
+    edit cannot be patched safely, so the caller should render.
+    """
+    if not changed or not all(_is_resource_leaf(path) for path in changed):
+        return None
+
+    old_leaves = list(_iter_resource_leaves(old_values))
+    patched_docs = copy.deepcopy(docs)
+    for path in changed:
+        old_value = _lookup(old_values, path)
+        new_value = _lookup(new_values, path)
+        if old_value is None or new_value is None:
+            return None
+        if isinstance(old_value, (dict, list)) or isinstance(new_value, (dict, list)):
+            return None
+        old_text = _quantity_text(old_value)
+        section, resource = path[-2], path[-1]
+        if any(
+            other_path != path
+            and other_path[-2:] == (section, resource)
+            and _quantity_text(other_value) == old_text
+            for other_path, other_value in old_leaves
+        ):
+            return None
+        if (
+            _patch_resource_quantity(
+                patched_docs,
+                section=section,
+                resource=resource,
+                old_text=old_text,
+                new_value=new_value,
+            )
+            != 1
+        ):
+            return None
+    return patched_docs
+
+
+def reuse_render_for_values_change(
+    index: TemplateValuesIndex,
+    docs: list[dict[str, Any]],
+    old_values: Mapping[str, Any],
+    new_values: Mapping[str, Any],
+) -> list[dict[str, Any]] | None:
+    """Return rendered docs for ``new_values`` without running helm, if possible.
+
+    Returns ``docs`` itself when no referenced path changed, patched copies
+    when only resource quantities changed, or None when a render is needed.
+    """
+    referenced = [
+        path for path in changed_values_paths(old_values, new_values) if index.references(path)
+    ]
+    if not referenced:
+        return docs
+    return patch_rendered_resources(docs, old_values, new_values, referenced)
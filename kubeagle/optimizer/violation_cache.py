@@ -0,0 +1,253 @@
+"""Caches for optimizer rule outcomes and rendered rule inputs.
+
+Rule outcomes depend only on a chart's extracted features and the runtime
+thresholds the rule reads, so they are cached by ``(feature fingerprint, rule
+id, evaluator, threshold values)``. Changing one threshold in Settings then
+re-evaluates only the rules that read it; every other rule returns its cached
+``OptimizationViolation`` objects without rebuilding them.
+
+Rendered analysis additionally caches each chart's last render (docs, workload
+records and the values it used), keyed by chart directory, values file and
+release and validated against file stamps, so a threshold change never
+re-renders an unchanged chart.
+
+Both caches are process-wide because optimizer controllers are short-lived
+(one per analysis run).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from kubeagle.models.optimization.optimization_rule import OptimizationRule
+    from kubeagle.models.optimization.optimization_violation import (
+        OptimizationViolation,
+    )
+    from kubeagle.optimizer.rendered_rule_input import RenderedWorkload
+    from kubeagle.optimizer.rule_features import ChartFeatures
+
+# Maximum number of (features, rule, thresholds) outcomes kept.
+_VIOLATION_CACHE_SIZE = 200_000
+
+# Maximum number of rendered charts kept.
+_RENDERED_INPUT_CACHE_SIZE = 2_048
+
+_OutcomeKey = tuple[str, str, Any, tuple[Hashable, ...]]
+
+
+class ViolationCache:
+    """Bounded LRU cache of rule outcomes with threshold-aware invalidation.
+
+    Only rules that declare ``thresholds`` (possibly empty) are cached; a rule
+    with undeclared dependencies could read any setting and is always
+    evaluated.
+    """
+
+    def __init__(self, max_entries: int = _VIOLATION_CACHE_SIZE) -> None:
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[_OutcomeKey, list[OptimizationViolation]] = (
+            OrderedDict()
+        )
+        self._rule_thresholds: dict[str, frozenset[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(
+        fingerprint: str,
+        rule: OptimizationRule,
+        thresholds: Mapping[str, Hashable],
+    ) -> _OutcomeKey | None:
+        names = rule.thresholds
+        if names is None or rule.evaluate is None:
+            return None
+        return (
+            fingerprint,
+            rule.id,
+            rule.evaluate,
+            tuple(thresholds.get(name) for name in names),
+        )
+
+    def evaluate(
+        self,
+        rule: OptimizationRule,
+        features: ChartFeatures,
+        *,
+        fingerprint: str,
+        thresholds: Mapping[str, Hashable],
+    ) -> list[OptimizationViolation]:
+        """Return ``rule.evaluate(features)``, reusing a cached outcome.
+
+        Args:
+            rule: Rule with a feature evaluator.
+            features: Features of the chart or rendered workload.
+            fingerprint: ``features.fingerprint()``, computed once by callers.
+            thresholds: Snapshot from ``current_rule_thresholds()``.
+
+        Returns:
+            The rule's violations; callers must not mutate the list.
+        """
+        evaluate = rule.evaluate
+        if evaluate is None:
+            raise ValueError(f"Rule '{rule.id}' has no feature evaluator")
+        key = self._key(fingerprint, rule, thresholds)
+        if key is None:
+            return evaluate(features)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        violations = evaluate(features)
+        with self._lock:
+            self._entries[key] = violations
+            self._rule_thresholds[rule.id] = frozenset(rule.thresholds or ())
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return violations
+
+    def invalidate_thresholds(self, names: Iterable[str]) -> int:
+        """Drop outcomes of rules that read any of ``names``.
+
+        Entries are keyed by threshold values, so stale outcomes are never
+        returned anyway; this frees them when a setting changes.
+
+        Returns:
+            Number of entries removed.
+        """
+        changed = frozenset(names)
+        if not changed:
+            return 0
+        with self._lock:
+            affected = {
+                rule_id
+                for rule_id, reads in self._rule_thresholds.items()
+                if reads & changed
+            }
+            if not affected:
+                return 0
+            stale = [key for key in self._entries if key[1] in affected]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached outcome."""
+        with self._lock:
+            self._entries.clear()
+            self._rule_thresholds.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def file_stamp(path: Path) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for ``path``, None when it cannot be stat'ed."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def chart_tree_stamp(chart_dir: Path, *, exclude: Path | None = None) -> tuple[int, int] | None:
+    """Return a cheap change stamp for everything under ``chart_dir``.
+
+    The stamp is the newest mtime and the entry count below ``chart_dir``;
+    subdirectory mtimes and the count catch added or removed files. The
+    chart directory's own mtime and ``exclude`` (normally the values file)
+    are left out, so atomically replacing the values file does not change
+    the stamp. Returns None when the tree cannot be scanned.
+    """
+    excluded = str(exclude) if exclude is not None else None
+    newest = 0
+    entries = 0
+    pending = [str(chart_dir)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as iterator:
+                for entry in iterator:
+                    if entry.path == excluded:
+                        continue
+                    entries += 1
+                    try:
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    newest = max(newest, stat.st_mtime_ns)
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+        except OSError:
+            return None
+    return (newest, entries)
+
+
+@dataclass(slots=True)
+class RenderedChart:
+    """Cached render of one chart with one values file.
+
+    Attributes:
+        tree_stamp: ``chart_tree_stamp`` of the chart, excluding the values file.
+        values_stamp: ``file_stamp`` of the values file.
+        values: Parsed values document the render used, when loadable.
+        docs: Rendered manifests.
+        workloads: Workload records extracted from ``docs``.
+    """
+
+    tree_stamp: tuple[int, int]
+    values_stamp: tuple[int, int]
+    values: dict[str, Any] | None
+    docs: list[dict[str, Any]]
+    workloads: list[RenderedWorkload]
+
+
+class RenderedInputCache:
+    """Bounded LRU cache of chart renders per chart, values file and release."""
+
+    def __init__(self, max_entries: int = _RENDERED_INPUT_CACHE_SIZE) -> None:
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[tuple[str, str, str], RenderedChart] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple[str, str, str]) -> RenderedChart | None:
+        """Return the last render stored for ``key``; callers check stamps."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple[str, str, str], entry: RenderedChart) -> None:
+        """Store ``entry`` as the latest render for ``key``."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached render."""
+        with self._lock:
+            self._entries.clear()
+
+
+VIOLATION_CACHE = ViolationCache()
+RENDERED_INPUT_CACHE = RenderedInputCache()
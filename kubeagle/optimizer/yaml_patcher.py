@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+import difflib
 import io
 from typing import Any
 
@@ -65,6 +67,62 @@ def apply_values_yaml_patch(content: str, patch: dict[str, Any]) -> str:
     return "\n".join(updated_lines) + "\n"
 
 
+class ValuesPatchSession:
+    """Accumulate many patches for one values document and apply them at once.
+
+    Patches are deep-merged in memory (mappings merge, anything else replaces,
+    exactly as sequential ``apply_values_yaml_patch`` calls would), so the
+    document is round-tripped through ruamel once no matter how many patches
+    were added.
+    """
+
+    def __init__(self, content: str) -> None:
+        self.original = content
+        self._patch: dict[str, Any] = {}
+        self._rendered: str | None = content
+
+    @property
+    def patch(self) -> dict[str, Any]:
+        """Combined patch of everything added so far."""
+        return self._patch
+
+    def add(self, patch: dict[str, Any]) -> None:
+        """Merge ``patch`` over the patches added so far."""
+        if not isinstance(patch, dict):
+            raise ValueError("values patch root must be mapping.")
+        _deep_merge_plain(self._patch, patch)
+        self._rendered = None
+
+    def render(self) -> str:
+        """Return the document with every added patch applied."""
+        if self._rendered is None:
+            self._rendered = (
+                apply_values_yaml_patch(self.original, self._patch)
+                if self._patch
+                else self.original
+            )
+        return self._rendered
+
+    def diff(self, path: str = "values.yaml") -> str:
+        """Return a unified diff from the original document to ``render()``."""
+        return "".join(
+            difflib.unified_diff(
+                self.original.splitlines(keepends=True),
+                self.render().splitlines(keepends=True),
+                fromfile=f"a/{path}",
+                tofile=f"b/{path}",
+            )
+        )
+
+
+def _deep_merge_plain(base: dict[str, Any], override: dict[str, Any]) -> None:
+    for key, value in override.items():
+        if key in base and isinstance(base[key], dict) and isinstance(value, dict):
+            _deep_merge_plain(base[key], value)
+        else:
+            base[key] = copy.deepcopy(value)
+
+
 def _deep_merge_roundtrip(base: dict[str, Any], override: dict[str, Any]) -> None:
     for key, value in override.items():
         if key in base and isinstance(base[key], dict) and isinstance(value, dict):
@@ -6,6 +6,7 @@ import asyncio
 import contextlib
 import hashlib
 import logging
+import os
 import re
 import time
 from pathlib import Path
@@ -88,6 +89,7 @@ from kubeagle.widgets import (
     CustomStatic,
     CustomTabs,
     CustomVertical,
+    make_row_key,
 )
 
 logger = logging.getLogger(__name__)
@@ -135,6 +137,24 @@ class ChartsExplorerViolationsLoaded(Message):
         self.violation_counts = violation_counts
 
 
+class ChartsExplorerChartsChanged(Message):
+    """Message: charts edited on disk were re-analyzed and re-checked."""
+
+    def __init__(
+        self,
+        *,
+        base_charts: list[ChartInfo],
+        results: dict[Path, list[ChartInfo]],
+        violations: list[ViolationResult],
+        violations_signature: str | None,
+    ) -> None:
+        super().__init__()
+        self.base_charts = base_charts
+        self.results = results
+        self.violations = violations
+        self.violations_signature = violations_signature
+
+
 class ChartsExplorerOptimizerPartialLoaded(Message):
     """Message: incremental optimizer violations during analysis."""
 
@@ -1214,7 +1234,7 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
         self._last_filter_signature: tuple[Any, ...] | None = None
         self._table_content_signature: tuple[Any, ...] | None = None
         self._charts_controller: Any | None = None
-        self._charts_controller_cache_key: tuple[str, str, str, str] | None = None
+        self._charts_controller_cache_key: tuple[str, str, str, str, str] | None = None
         self._violations_signature: str | None = None
         self._cached_violation_counts: dict[str, int] | None = None
         self._cached_violations: list[ViolationResult] | None = None
@@ -1222,7 +1242,6 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
         self._streaming_optimizer_charts: list[ChartInfo] = []
         self._last_optimizer_partial_ui_update_monotonic: float = 0.0
         self._violations_view_initialized = False
-        self._chart_search_index: dict[int, str] = {}
         self._chart_values_file_type_index: dict[int, str] = {}
         self._charts_load_progress = 0
         self._charts_progress_display = 0
@@ -1241,6 +1260,10 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
         self._last_partial_table_repaint_chart_count: int = 0
         self._sync_charts_state_seq = 0
         self._apply_filters_seq = 0
+        self._charts_repo_watcher: Any | None = None
+        self._charts_repo_watcher_controller: Any | None = None
+        self._pending_watch_chart_dirs: set[Path] = set()
+        self._watch_refresh_running = False
 
     @classmethod
     def _partial_update_step(cls, total: int) -> int:
@@ -1322,20 +1345,28 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
         active_charts_path: Path | None,
     ) -> Any:
         """Reuse ChartsController across refreshes when inputs stay the same."""
+        use_git_index = bool(
+            getattr(getattr(self.app, "settings", None), "use_git_index_discovery", False)
+        )
         cache_key = (
             str(charts_path.resolve()),
             context or "",
             str(codeowners_path.resolve()) if codeowners_path is not None else "",
             str(active_charts_path.resolve()) if active_charts_path is not None else "",
+            "git-index" if use_git_index else "",
         )
         if self._charts_controller is not None and cache_key == self._charts_controller_cache_key:
             return self._charts_controller
 
         from kubeagle.controllers import ChartsController
+        from kubeagle.controllers.cluster.release_index import get_release_index
+        from kubeagle.models.cache.cluster_join_index import get_cluster_join_index
 
         self._charts_controller = ChartsController(
             charts_path,
             context=context,
+            release_index=get_release_index(context),
+            join_index=get_cluster_join_index(context),
             codeowners_path=codeowners_path,
             active_charts_path=active_charts_path,
             progressive_yield_interval=getattr(
@@ -1348,6 +1379,7 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
                 "progressive_parallelism",
                 2,
             ),
+            use_git_index=use_git_index,
         )
         self._charts_controller_cache_key = cache_key
         return self._charts_controller
@@ -1695,6 +1727,7 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
     def on_unmount(self) -> None:
         """Cancel all workers and timers when screen is removed from DOM."""
         self._release_background_work_for_navigation()
+        self._stop_charts_repo_watcher()
         with contextlib.suppress(Exception):
             self.workers.cancel_all()
 
@@ -1791,6 +1824,7 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
             if self._active_tab == TAB_CHARTS:
                 self._schedule_charts_tab_repopulate(force=False)
                 self._ensure_violation_counts_available()
+        self._start_watch_refresh_worker()
 
     def _schedule_resize_update(self) -> None:
         """Debounce responsive relayout work during rapid terminal resizing."""
@@ -2417,6 +2451,7 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
         except Exception:
             logger.debug("Failed to update optimizer views", exc_info=True)
         self._apply_optimizer_team_filter()
+        self._start_watch_refresh_worker()
 
     def on_optimizer_data_load_failed(self, event: OptimizerDataLoadFailed) -> None:
         if (
@@ -2985,6 +3020,8 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
         self._active_charts = active_charts
         self._sync_charts_state_seq += 1
         seq = self._sync_charts_state_seq
+        if not partial_update:
+            self._presenter.invalidate_rows()
 
         if partial_update:
             async def _do_partial_sync() -> None:
@@ -3059,9 +3096,31 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
                 self._parent_chart_filter_values = set()
 
             self._sync_current_team_from_filter()
+            self._start_row_cache_warmup(charts)
 
         self.call_later(_do_full_sync)
 
+    def _start_row_cache_warmup(self, charts: list[ChartInfo]) -> None:
+        """Pre-format chart rows in a background thread after a full load."""
+        presenter = self._presenter
+        presenter.set_theme(str(getattr(self.app, "theme", "") or ""))
+
+        def _warm() -> None:
+            worker = get_current_worker()
+            presenter.warm_row_cache(
+                charts,
+                should_stop=lambda: worker.is_cancelled,
+            )
+
+        self.run_worker(
+            _warm,
+            name="charts-row-cache",
+            group="charts-row-cache",
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
+
     def on_charts_explorer_partial_data_loaded(
         self,
         event: ChartsExplorerPartialDataLoaded,
@@ -3111,6 +3170,7 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
         self._stop_partial_charts_refresh_timer()
         self._presenter.set_violations({})
         self._sync_loaded_charts_state(event.charts, event.active_charts)
+        self._sync_charts_repo_watcher()
         if not self.is_current:
             self._render_data_on_resume = True
             return
@@ -3156,6 +3216,7 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
             return
         self._schedule_charts_tab_repopulate(force=True)
         self.app.notify("Violation analysis completed", timeout=3)
+        self._start_watch_refresh_worker()
 
     def on_charts_explorer_data_load_failed(self, event: ChartsExplorerDataLoadFailed) -> None:
         """Show worker loading failures in the screen overlay."""
@@ -3175,6 +3236,207 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
         self.show_error_state(event.error)
         self._show_retry_button()
 
+    # =========================================================================
+    # Live Repository Watcher
+    # =========================================================================
+
+    def _sync_charts_repo_watcher(self) -> None:
+        """Watch the local charts repo for edits after a local-mode load."""
+        settings = getattr(self.app, "settings", None)
+        controller = self._charts_controller
+        if (
+            self._testing
+            or self.use_cluster_mode
+            or controller is None
+            or not bool(getattr(settings, "watch_charts_repo", False))
+        ):
+            self._stop_charts_repo_watcher()
+            return
+        chart_dirs = {
+            Path(os.path.dirname(chart.values_file))
+            for chart in self.charts
+            if chart.values_file and not chart.values_file.startswith("cluster:")
+        }
+        watcher = self._charts_repo_watcher
+        if watcher is not None and self._charts_repo_watcher_controller is controller:
+            watcher.set_chart_dirs(chart_dirs)
+            return
+        self._stop_charts_repo_watcher()
+        app = self.app
+
+        def _on_change(changed: frozenset[Path]) -> None:
+            # Runs on the watcher thread.
+            with contextlib.suppress(Exception):
+                app.call_from_thread(self._queue_changed_chart_dirs, changed)
+
+        watcher = controller.create_repo_watcher(_on_change)
+        watcher.set_chart_dirs(chart_dirs)
+        self._charts_repo_watcher = watcher
+        self._charts_repo_watcher_controller = controller
+
+        def _start() -> None:
+            try:
+                watcher.start()
+            except Exception:
+                logger.debug("Failed to start charts repo watcher", exc_info=True)
+
+        self.run_worker(
+            _start,
+            name="charts-explorer-watcher-start",
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def _stop_charts_repo_watcher(self) -> None:
+        """Stop the repo watcher and drop changes not applied yet."""
+        watcher = self._charts_repo_watcher
+        self._charts_repo_watcher = None
+        self._charts_repo_watcher_controller = None
+        self._pending_watch_chart_dirs.clear()
+        if watcher is not None:
+            with contextlib.suppress(Exception):
+                watcher.stop()
+
+    def _queue_changed_chart_dirs(self, chart_dirs: frozenset[Path]) -> None:
+        """Collect chart directories reported by the repo watcher."""
+        if self._charts_repo_watcher is None:
+            return
+        self._pending_watch_chart_dirs.update(chart_dirs)
+        self._start_watch_refresh_worker()
+
+    def _start_watch_refresh_worker(self) -> None:
+        """Re-analyze queued chart directories once no full analysis is running.
+
+        Batches wait while charts, violation counts or optimizer results are
+        loading (those passes already see the new files) and while the screen
+        is hidden; one batch runs at a time.
+        """
+        controller = self._charts_controller
+        if (
+            not self._pending_watch_chart_dirs
+            or self._watch_refresh_running
+            or self._loading
+            or self._optimizer_loading
+            or self._violation_counts_loading
+            or self.use_cluster_mode
+            or controller is None
+            or not self.charts
+            or not self._screen_is_current()
+        ):
+            return
+        chart_dirs = frozenset(self._pending_watch_chart_dirs)
+        self._pending_watch_chart_dirs.clear()
+        self._watch_refresh_running = True
+        base_charts = self.charts
+        needs_violations = (
+            self._cached_violations is not None or self._optimizer_loaded
+        )
+
+        async def _worker() -> None:
+            worker = get_current_worker()
+            try:
+                results = await controller.reanalyze_chart_dirs(chart_dirs)
+                if worker.is_cancelled:
+                    return
+                violations: list[ViolationResult] = []
+                violations_signature: str | None = None
+                if needs_violations:
+                    changed_rows = [row for rows in results.values() for row in rows]
+                    if changed_rows:
+                        from kubeagle.models.optimization.optimizer_controller import (
+                            UnifiedOptimizerController,
+                        )
+
+                        analysis_source, render_timeout_seconds = (
+                            self._optimizer_settings_signature()
+                        )
+                        optimizer = UnifiedOptimizerController(
+                            analysis_source=analysis_source,
+                            render_timeout_seconds=render_timeout_seconds,
+                        )
+                        violations = await asyncio.to_thread(
+                            optimizer.check_all_charts, changed_rows,
+                        )
+                    violations_signature = await self._violations_payload_signature_async(
+                        controller.replace_chart_dir_results(base_charts, results),
+                    )
+                if worker.is_cancelled or not self.is_attached:
+                    return
+                self.post_message(
+                    ChartsExplorerChartsChanged(
+                        base_charts=base_charts,
+                        results=results,
+                        violations=violations,
+                        violations_signature=violations_signature,
+                    )
+                )
+            except Exception:
+                logger.exception("Failed to re-analyze changed charts")
+            finally:
+                self._watch_refresh_running = False
+
+        self.run_worker(
+            _worker,
+            name="charts-explorer-watch",
+            exclusive=False,
+        )
+
+    def on_charts_explorer_charts_changed(self, event: ChartsExplorerChartsChanged) -> None:
+        """Splice re-analyzed charts and their violations into both tables."""
+        if self.charts is not event.base_charts or self._loading:
+            # A full load replaced the charts meanwhile; retry against it
+            # unless that load is still running and will see the changes.
+            if not self._loading:
+                self._pending_watch_chart_dirs.update(event.results)
+            self.call_later(self._start_watch_refresh_worker)
+            return
+        controller = self._charts_controller
+        if controller is None:
+            return
+        changed_dirs = {str(chart_dir) for chart_dir in event.results}
+
+        def _splice(violations: list[ViolationResult]) -> list[ViolationResult]:
+            kept = [
+                violation
+                for violation in violations
+                if os.path.dirname(violation.chart_path or "") not in changed_dirs
+            ]
+            kept.extend(event.violations)
+            return kept
+
+        self.charts = controller.replace_chart_dir_results(self.charts, event.results)
+        self._extend_chart_runtime_indexes(self.charts)
+        if self._charts_repo_watcher is not None:
+            self._charts_repo_watcher.set_chart_dirs(
+                Path(os.path.dirname(chart.values_file)) for chart in self.charts
+            )
+
+        if self._cached_violations is not None and event.violations_signature is not None:
+            self._cache_violations_payload(
+                violations_signature=event.violations_signature,
+                violations=_splice(self._cached_violations),
+            )
+            if self._cached_violation_counts is not None:
+                self._presenter.set_violations(dict(self._cached_violation_counts))
+
+        if self._optimizer_loaded:
+            self._streaming_optimizer_violations = _splice(
+                self._streaming_optimizer_violations,
+            )
+            self._streaming_optimizer_charts = list(self.charts)
+            with contextlib.suppress(Exception):
+                self.query_one("#violations-view", ViolationsView).update_changed_charts(
+                    self._streaming_optimizer_violations,
+                    self._streaming_optimizer_charts,
+                )
+
+        if self._active_tab == TAB_CHARTS:
+            self._schedule_charts_tab_repopulate(force=True)
+        else:
+            self._last_filter_signature = None
+            self._table_content_signature = None
+        self.call_later(self._start_watch_refresh_worker)
+
     # =========================================================================
     # Central Update Method
     # =========================================================================
@@ -3246,7 +3508,7 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
         current_sort = self.current_sort
         sort_desc = self.sort_desc
         presenter = self._presenter
-        search_haystack_fn = self._chart_search_haystack
+        search_index = presenter.search_index
         vft_fn = self._chart_values_file_type
 
         # Check violations requirement before going async
@@ -3267,13 +3529,17 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
                 )
                 # Combine search + QoS + values-file-type + parent-chart into one pass
                 has_search = bool(normalized_query)
+                matched_ids: frozenset[int] = frozenset()
+                if has_search:
+                    search_index.sync(charts_snapshot)
+                    matched_ids = search_index.match_ids(normalized_query)
                 has_qos = bool(qos_filter_values)
                 has_vft = bool(vft_filter_values)
                 has_pc = bool(pc_filter_values)
                 if has_search or has_qos or has_vft or has_pc:
                     combined: list[ChartInfo] = []
                     for chart in filtered:
-                        if has_search and normalized_query not in search_haystack_fn(chart):
+                        if has_search and id(chart) not in matched_ids:
                             continue
                         if has_qos and chart.qos_class.value not in qos_filter_values:
                             continue
@@ -3356,6 +3622,8 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
 
         # Capture presenter ref for the async closure
         presenter = self._presenter
+        with contextlib.suppress(Exception):
+            presenter.set_theme(str(getattr(self.app, "theme", "") or ""))
 
         # Threshold above which row formatting is offloaded to a worker thread
         # to avoid blocking the Textual event loop.
@@ -3386,57 +3654,75 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
 
             inner = table.data_table
 
-            # Phase 1 — clear + column setup in a single batch so the user
-            # never sees an intermediate state with wrong columns.
-            with table.batch_update():
-                if inner is not None:
-                    inner.fixed_columns = self._locked_fixed_column_count(
-                        visible_indices,
-                    )
-                if columns_changed:
-                    table.clear(columns=True)
-                    self._configure_explorer_table_header_tooltips(table)
-                    for col_index in visible_indices:
-                        col_name, _ = EXPLORER_TABLE_COLUMNS[col_index]
-                        table.add_column(col_name)
-                    self._last_table_columns_signature = visible_indices
-                else:
-                    table.clear(columns=False)
+            # Refresh of an already-populated table: apply a keyed diff so
+            # only changed rows/cells re-render and the cursor/scroll stay put.
+            keyed_applied = False
+            row_keys = self._chart_row_keys(charts_for_rows, len(visible_rows))
+            if not columns_changed and table.row_count and row_keys is not None:
+                keyed_rows = list(zip(row_keys, visible_rows, strict=True))
+                with table.batch_update():
+                    if inner is not None:
+                        inner.fixed_columns = self._locked_fixed_column_count(
+                            visible_indices,
+                        )
+                    table.update_rows_keyed(keyed_rows)
+                    keyed_applied = True
 
             if sorted_charts is not None and len(sorted_charts) == len(visible_rows):
                 self._row_chart_map = dict(enumerate(sorted_charts))
             else:
                 self._row_chart_map = {}
 
-            # Phase 2 — insert rows in per-chunk batches.  Each chunk gets
-            # its own batch_update so _on_idle → _update_dimensions only
-            # measures that chunk's new rows, keeping the UI responsive.
-            row_count = len(visible_rows)
-            chunk_size = self._table_chunk_size(row_count)
-
-            if row_count and chunk_size < row_count:
-                for start in range(0, row_count, chunk_size):
-                    if (
-                        not self._screen_is_current()
-                        or self._active_tab != TAB_CHARTS
-                        or sequence != self._table_populate_sequence
-                    ):
-                        return
-                    end = min(start + chunk_size, row_count)
-                    with table.batch_update():
-                        table.add_rows(visible_rows[start:end])
-                    if end < row_count:
-                        # Yield so _on_idle measures only this chunk's rows
-                        await asyncio.sleep(0)
-                    # Reset scroll after each chunk (and after yielding)
-                    # to counteract any auto-scroll triggered by idle
-                    # dimension updates.
-                    if inner is not None:
-                        inner.scroll_y = 0
-                        inner.scroll_target_y = 0
-            elif row_count:
+            if not keyed_applied:
+                # Phase 1 — clear + column setup in a single batch so the user
+                # never sees an intermediate state with wrong columns.
                 with table.batch_update():
-                    table.add_rows(visible_rows)
+                    if inner is not None:
+                        inner.fixed_columns = self._locked_fixed_column_count(
+                            visible_indices,
+                        )
+                    if columns_changed:
+                        table.clear(columns=True)
+                        self._configure_explorer_table_header_tooltips(table)
+                        for col_index in visible_indices:
+                            col_name, _ = EXPLORER_TABLE_COLUMNS[col_index]
+                            table.add_column(col_name)
+                        self._last_table_columns_signature = visible_indices
+                    else:
+                        table.clear(columns=False)
+
+                # Phase 2 — insert rows in per-chunk batches.  Each chunk gets
+                # its own batch_update so _on_idle → _update_dimensions only
+                # measures that chunk's new rows, keeping the UI responsive.
+                row_count = len(visible_rows)
+                chunk_size = self._table_chunk_size(row_count)
+
+                if row_count and chunk_size < row_count:
+                    for start in range(0, row_count, chunk_size):
+                        if (
+                            not self._screen_is_current()
+                            or self._active_tab != TAB_CHARTS
+                            or sequence != self._table_populate_sequence
+                        ):
+                            return
+                        end = min(start + chunk_size, row_count)
+                        with table.batch_update():
+                            table.add_rows(
+                                visible_rows[start:end],
+                                keys=row_keys[start:end] if row_keys else None,
+                            )
+                        if end < row_count:
+                            # Yield so _on_idle measures only this chunk's rows
+                            await asyncio.sleep(0)
+                        # Reset scroll after each chunk (and after yielding)
+                        # to counteract any auto-scroll triggered by idle
+                        # dimension updates.
+                        if inner is not None:
+                            inner.scroll_y = 0
+                            inner.scroll_target_y = 0
+                elif row_count:
+                    with table.batch_update():
+                        table.add_rows(visible_rows, keys=row_keys)
 
             if sequence != self._table_populate_sequence:
                 return
@@ -3462,11 +3748,11 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
             else:
                 self._clear_selected_chart()
 
-            # Force scroll to top after population completes.
+            # Force scroll to top after a full population completes.
             # Schedule after refresh so it runs AFTER any pending
             # _on_idle → _update_dimensions → layout cycles that
             # may adjust scroll position.
-            if inner is not None:
+            if inner is not None and not keyed_applied:
                 inner.scroll_y = 0
                 inner.scroll_target_y = 0
 
@@ -3767,34 +4053,21 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
 
     def _rebuild_chart_runtime_indexes(self) -> None:
         """Build per-chart search/type indexes used by repeated filter passes."""
-        self._chart_search_index = {}
         self._chart_values_file_type_index = {}
+        self._presenter.search_index.rebuild(self.charts)
         self._extend_chart_runtime_indexes(self.charts)
 
     def _extend_chart_runtime_indexes(self, charts: list[ChartInfo]) -> None:
         """Add missing chart search/type entries without rebuilding existing ones."""
-        search_index: dict[int, str] = {}
+        self._presenter.search_index.sync(charts)
         values_type_index: dict[int, str] = {}
         for chart in charts:
             chart_id = id(chart)
-            if (
-                chart_id in self._chart_search_index
-                and chart_id in self._chart_values_file_type_index
-            ):
+            if chart_id in self._chart_values_file_type_index:
                 continue
-            values_type = ChartsExplorerPresenter._classify_values_file_type(chart.values_file)
-            values_type_index[chart_id] = values_type
-            search_index[chart_id] = "|".join(
-                (
-                    str(chart.name).lower(),
-                    str(chart.namespace or "").lower(),
-                    str(chart.team).lower(),
-                    str(chart.values_file).lower(),
-                    str(chart.qos_class.value).lower(),
-                    values_type.lower(),
-                )
+            values_type_index[chart_id] = ChartsExplorerPresenter._classify_values_file_type(
+                chart.values_file
             )
-        self._chart_search_index.update(search_index)
         self._chart_values_file_type_index.update(values_type_index)
 
     def _chart_values_file_type(self, chart: ChartInfo) -> str:
@@ -3808,25 +4081,8 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
         return value
 
     def _chart_search_haystack(self, chart: ChartInfo) -> str:
-        """Return cached lowercase search haystack for a chart row."""
-        chart_id = id(chart)
-        cached = self._chart_search_index.get(chart_id)
-        if cached is not None:
-            return cached
-        values_type = self._chart_values_file_type(chart)
-        haystack = "|".join(
-            (
-                str(chart.name).lower(),
-                str(chart.namespace or "").lower(),
-                str(chart.team).lower(),
-                str(chart.values_file).lower(),
-                str(chart.qos_class.value).lower(),
-                values_type.lower(),
-                str(chart.parent_chart or "").lower(),
-            )
-        )
-        self._chart_search_index[chart_id] = haystack
-        return haystack
+        """Return the lowercase search haystack for a chart row."""
+        return self._presenter.search_index.text_for(chart)
 
     def _sync_view_tabs(self) -> None:
         """Keep the view tab widget in sync with current_view."""
@@ -4015,6 +4271,8 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
 
     def watch_use_cluster_mode(self) -> None:
         """React to mode changes by syncing mode button text."""
+        if self.use_cluster_mode:
+            self._stop_charts_repo_watcher()
         self._sync_mode_column_state()
         self._update_mode_button()
         if self._active_tab == TAB_CHARTS and self.charts:
@@ -4444,6 +4702,28 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
         """Set selected chart."""
         self._selected_chart = chart
 
+    @staticmethod
+    def _chart_row_keys(
+        charts: list[ChartInfo],
+        row_count: int,
+    ) -> list[str] | None:
+        """Return stable table row keys for charts, or None if not unique."""
+        if len(charts) != row_count:
+            return None
+        row_keys = [
+            make_row_key(
+                chart.namespace or "",
+                "HelmChart",
+                chart.name,
+                chart.values_file,
+                chart.team,
+            )
+            for chart in charts
+        ]
+        if len(set(row_keys)) != len(row_keys):
+            return None
+        return row_keys
+
     @staticmethod
     def _chart_selection_key(chart: ChartInfo) -> tuple[str, str, str, str]:
         """Return stable key used to preserve selection across table re-renders."""
@@ -4500,11 +4780,34 @@ class ChartsExplorerScreen(MainNavigationTabsMixin, BaseScreen):
         except OSError:
             return "Failed to read values file."
 
+    async def _ensure_deployed_values_content(self, chart: ChartInfo) -> None:
+        """Fetch deployed values of a cluster release row that has none.
+
+        Rows served from the persistent release index never carry raw
+        values, which may hold secrets.
+        """
+        controller = self._charts_controller
+        if (
+            controller is None
+            or chart.deployed_values_content
+            or chart.parent_chart is not None
+            or not chart.namespace
+            or not str(chart.values_file or "").startswith("cluster:")
+        ):
+            return
+        try:
+            chart.deployed_values_content = (
+                await controller.fetch_deployed_values_content(chart.name, chart.namespace)
+            )
+        except Exception:
+            logger.debug("Failed to fetch deployed values for %s", chart.name, exc_info=True)
+
     async def _open_chart_preview_dialog(self, chart: ChartInfo) -> None:
         """Open chart details preview dialog for selected chart.
 
         File I/O is offloaded to a thread to prevent blocking the UI.
         """
+        await self._ensure_deployed_values_content(chart)
         values_content = await asyncio.to_thread(self._load_values_file_content, chart)
         modal = _ChartDetailsModal(
             chart=chart,
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from kubeagle.screens.charts_explorer.config import (
+    EXPLORER_TABLE_COLUMNS,
     EXTREME_RATIO_THRESHOLD,
     SortBy,
     ViewFilter,
 )
+from kubeagle.utils.row_cache import FormattedRowCache
+from kubeagle.utils.search_index import SearchIndex
 
 if TYPE_CHECKING:
     from kubeagle.models.charts.chart_info import ChartInfo
@@ -23,9 +27,16 @@ class ChartsExplorerPresenter:
 
     _chart_path_cache: dict[str, str] = {}
 
+    # format_chart_row always returns every column; the screen picks the
+    # visible subset, so the row cache column key is constant.
+    _ROW_CACHE_COLUMNS: tuple[str, ...] = tuple(name for name, _ in EXPLORER_TABLE_COLUMNS)
+
     def __init__(self) -> None:
         self._violations: dict[str, int] = {}
         self._violation_revision = 0
+        self._row_cache = FormattedRowCache()
+        self._theme = ""
+        self._search_index = SearchIndex(self._search_fields, separator="|")
 
     def set_violations(self, violations: dict[str, int]) -> None:
         """Store violation counts per chart name.
@@ -47,6 +58,23 @@ class ChartsExplorerPresenter:
     # Filtering
     # =========================================================================
 
+    @property
+    def search_index(self) -> SearchIndex:
+        """Trigram index over chart search fields."""
+        return self._search_index
+
+    @classmethod
+    def _search_fields(cls, chart: ChartInfo) -> tuple[str, ...]:
+        return (
+            str(chart.name),
+            str(chart.namespace or ""),
+            str(chart.team),
+            str(chart.values_file),
+            str(chart.qos_class.value),
+            cls._classify_values_file_type(chart.values_file),
+            str(chart.parent_chart or ""),
+        )
+
     def apply_filters(
         self,
         charts: list[ChartInfo],
@@ -90,8 +118,11 @@ class ChartsExplorerPresenter:
         if not has_view and not has_team and not has_active and not has_search:
             return charts
 
-        # Pre-compute search query once
-        q = search_query.lower() if has_search else ""
+        # Resolve search matches once through the trigram index
+        matched_ids: frozenset[int] = frozenset()
+        if has_search:
+            self._search_index.sync(charts)
+            matched_ids = self._search_index.match_ids(search_query)
 
         # Resolve view predicate
         violations = self._violations
@@ -122,14 +153,8 @@ class ChartsExplorerPresenter:
             if has_active and c.name not in active_charts:  # type: ignore[operator]
                 continue
 
-            # Search filter — pre-compute lowered fields to avoid repeated .lower()
-            if has_search and (
-                q not in c.name.lower()
-                and q not in c.team.lower()
-                and q not in c.values_file.lower()
-                and q not in c.qos_class.value.lower()
-                and (c.parent_chart is None or q not in c.parent_chart.lower())
-            ):
+            # Search filter
+            if has_search and id(c) not in matched_ids:
                 continue
 
             result.append(c)
@@ -196,13 +221,60 @@ class ChartsExplorerPresenter:
         present.sort(key=lambda item: item[1], reverse=descending)
         return [chart for chart, _ in present] + missing
 
+    @property
+    def row_cache(self) -> FormattedRowCache:
+        """Formatted-row cache backing format_chart_row."""
+        return self._row_cache
+
+    def set_theme(self, theme: str) -> None:
+        """Set the active theme name used in the row cache key."""
+        self._theme = str(theme or "")
+
+    def invalidate_rows(self) -> None:
+        """Drop cached rows after a full charts reload."""
+        self._row_cache.bump_revision()
+
+    @staticmethod
+    def _row_identity(chart: ChartInfo) -> tuple[str, str, str, str]:
+        return (chart.namespace or "", chart.name, chart.values_file, chart.team)
+
     def format_chart_row(self, chart: ChartInfo) -> tuple[str, ...]:
-        """Format a single chart into a row tuple.
+        """Format a single chart into a row tuple (cached per chart object).
 
         Columns: Chart, Parent Chart, Namespace, Team, Values File Type,
                  QoS, CPU R/L, Mem R/L, Replicas, Probes, Affinity, PDB,
                  Chart Path
         """
+        return self._row_cache.get_or_format(
+            chart,
+            identity=self._row_identity(chart),
+            columns=self._ROW_CACHE_COLUMNS,
+            formatter=self._format_chart_row,
+            theme=self._theme,
+        )
+
+    def warm_row_cache(
+        self,
+        charts: list[ChartInfo],
+        *,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> int:
+        """Pre-format rows for ``charts`` (run from a background thread).
+
+        Returns:
+            Number of rows formatted.
+        """
+        return self._row_cache.warm(
+            charts,
+            identity=self._row_identity,
+            columns=self._ROW_CACHE_COLUMNS,
+            formatter=self._format_chart_row,
+            theme=self._theme,
+            should_stop=should_stop,
+        )
+
+    def _format_chart_row(self, chart: ChartInfo) -> tuple[str, ...]:
+        """Build the row tuple for a chart (uncached)."""
         chart_name = self._format_chart_name(chart)
         parent_chart = f"☂︎ {chart.parent_chart}" if chart.parent_chart else "-"
         namespace = chart.namespace or "-"
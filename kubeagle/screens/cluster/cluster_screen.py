@@ -68,6 +68,7 @@ from kubeagle.widgets import (
     CustomStatic,
     CustomTabs,
     CustomVertical,
+    make_row_key,
 )
 
 logger = logging.getLogger(__name__)
@@ -897,6 +898,13 @@ class ClusterScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scree
         "nodes-table": ("Name", "Node Group"),
         "node-groups-table": ("Node Group", "Nodes"),
     }
+    # Row identity per table: (kind, identity column labels). Rows are keyed
+    # as namespace/kind/name so refreshes apply as keyed diffs.
+    _TABLE_ROW_KEY_COLUMNS: dict[str, tuple[str, tuple[str, ...]]] = {
+        "events-detail-table": ("Event", ("Type", "Reason", "Object")),
+        "nodes-table": ("Node", ("Name",)),
+        "node-groups-table": ("NodeGroup", ("Node Group",)),
+    }
     _TAB_CONTROL_PROFILES: dict[str, dict[str, tuple[tuple[str, str], ...]]] = {
         "tab-events": {
             "filters": (
@@ -3708,6 +3716,35 @@ class ClusterScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scree
             slug = f"col_{index}"
         return f"{slug}_{index}"
 
+    @classmethod
+    def _keyed_table_rows(
+        cls,
+        table_id: str,
+        columns: list[tuple[str, int]],
+        rows: list[tuple],
+    ) -> list[tuple[str, tuple]] | None:
+        """Pair rows with stable keys, or None when rows have no unique identity."""
+        key_spec = cls._TABLE_ROW_KEY_COLUMNS.get(table_id)
+        if key_spec is None:
+            return None
+        kind, key_labels = key_spec
+        labels = [name for name, _ in columns]
+        if any(label not in labels for label in key_labels):
+            return None
+        key_indices = [labels.index(label) for label in key_labels]
+        keyed_rows: list[tuple[str, tuple]] = []
+        seen: set[str] = set()
+        for row in rows:
+            name = "/".join(
+                str(getattr(row[index], "plain", row[index])) for index in key_indices
+            )
+            key = make_row_key("", kind, name)
+            if key in seen:
+                return None
+            seen.add(key)
+            keyed_rows.append((key, row))
+        return keyed_rows
+
     def _compute_table_update_data(
         self,
         table_id: str,
@@ -3728,8 +3765,10 @@ class ClusterScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scree
         rows_signature = self._rows_signature(controlled_rows)
         fixed_columns = self._fixed_column_count_for_table(table_id, columns)
         header_tooltips = self._cluster_table_header_tooltips(table_id, columns)
+        keyed_rows = self._keyed_table_rows(table_id, columns, controlled_rows)
         return {
             "controlled_rows": controlled_rows,
+            "keyed_rows": keyed_rows,
             "column_signature": column_signature,
             "rows_signature": rows_signature,
             "fixed_columns": fixed_columns,
@@ -3749,6 +3788,7 @@ class ClusterScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scree
         rows_signature: int = computed["rows_signature"]
         fixed_columns: int = computed["fixed_columns"]
         header_tooltips: dict[str, str] = computed["header_tooltips"]
+        keyed_rows: list[tuple[str, tuple]] | None = computed.get("keyed_rows")
 
         with suppress(NoMatches):
             table = self.query_one(f"#{table_id}", CustomDataTable)
@@ -3758,7 +3798,16 @@ class ClusterScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scree
             previous_rows_signature = self._table_row_signatures.get(table_id)
             columns_changed = previous_column_signature != column_signature
             rows_changed = previous_rows_signature != rows_signature
-            if columns_changed or rows_changed:
+            if rows_changed and not columns_changed and keyed_rows is not None:
+                # Auto-refresh / partial loads: patch rows in place so the
+                # cursor and scroll position survive and unchanged cells are
+                # not re-rendered.
+                with table.batch_update():
+                    if table.data_table is not None:
+                        table.data_table.fixed_columns = fixed_columns
+                    table.update_rows_keyed(keyed_rows)
+                self._table_row_signatures[table_id] = rows_signature
+            elif columns_changed or rows_changed:
                 previous_selected_row: int | None = None
                 previous_selected_row_data: tuple[Any, ...] | None = None
                 current_cursor_row = table.cursor_row
@@ -3779,7 +3828,9 @@ class ClusterScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scree
                                 key=self._column_key_from_label(col_name, index),
                             )
                         self._table_column_signatures[table_id] = column_signature
-                    if controlled_rows:
+                    if keyed_rows is not None:
+                        table.update_rows_keyed(keyed_rows)
+                    elif controlled_rows:
                         table.add_rows(controlled_rows)
                 restored_row_index: int | None = None
                 if previous_selected_row_data is not None:
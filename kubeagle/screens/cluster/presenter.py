@@ -16,6 +16,7 @@ from textual.worker import get_current_worker
 
 from kubeagle.constants.timeouts import CLUSTER_CHECK_TIMEOUT
 from kubeagle.controllers import ClusterController
+from kubeagle.models.cache.cluster_join_index import get_cluster_join_index
 from kubeagle.models.events.event_summary import EventSummary
 from kubeagle.screens.cluster.config import (
     NODE_GROUPS_TABLE_COLUMNS,
@@ -856,6 +857,7 @@ class ClusterPresenter:
                     "progressive_parallelism",
                     2,
                 ),
+                join_index=get_cluster_join_index(configured_context),
             )
             # Regression guard: explicit default event window contract.
             # ctrl.fetch_events(max_age_hours=self._DEFAULT_EVENT_WINDOW_HOURS)
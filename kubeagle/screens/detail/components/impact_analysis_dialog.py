@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import contextlib
 import logging
+from collections.abc import Mapping
 from typing import TYPE_CHECKING
 
 from textual.app import ComposeResult
@@ -16,6 +17,7 @@ from textual.screen import ModalScreen
 
 from kubeagle.screens.detail.components.resource_impact_view import (
     ResourceImpactView,
+    instance_price_table_path_from_app,
 )
 from kubeagle.widgets import (
     CustomButton,
@@ -78,6 +80,7 @@ class ImpactAnalysisDialog(ModalScreen[None]):
     def _compute_impact(self) -> None:
         """Run ResourceImpactCalculator in a background thread."""
         try:
+            from kubeagle.models.cache.cluster_join_index import get_cluster_join_index
             from kubeagle.optimizer.resource_impact_calculator import (
                 ResourceImpactCalculator,
                 fetch_workload_replica_map,
@@ -93,18 +96,20 @@ class ImpactAnalysisDialog(ModalScreen[None]):
         cluster_context = self._cluster_context
 
         def _do_compute() -> None:
-            # Fetch actual replica counts from cluster (lightweight kubectl call).
-            # Always attempt the fetch — for cluster charts the map is keyed by
-            # exact (release, namespace); for local charts _resolve_replicas
-            # aggregates all namespaces matching the chart name.
-            replica_map: dict[tuple[str, str], int] | None = None
+            # Actual replica counts come from the join index when the workloads
+            # screen has loaded them; otherwise they are fetched from the
+            # cluster (lightweight kubectl call). For cluster charts the map is
+            # keyed by exact (release, namespace); for local charts
+            # _resolve_replicas aggregates all namespaces matching the chart name.
+            replica_map = get_cluster_join_index(cluster_context).replica_map()
             try:
-                self.app.call_from_thread(
-                    self._update_loading, "Fetching workload replicas..."
-                )
-                replica_map = fetch_workload_replica_map(
-                    context=cluster_context,
-                )
+                if replica_map is None:
+                    self.app.call_from_thread(
+                        self._update_loading, "Fetching workload replicas..."
+                    )
+                    replica_map = fetch_workload_replica_map(
+                        context=cluster_context,
+                    )
             except Exception:
                 logger.debug(
                     "Failed to fetch workload replicas, using values-file defaults",
@@ -114,15 +119,17 @@ class ImpactAnalysisDialog(ModalScreen[None]):
             self.app.call_from_thread(
                 self._update_loading, "Computing impact analysis..."
             )
-            result = calculator.compute_impact(
+            model = calculator.build_impact_model(
                 charts,
                 violations,
                 optimizer_controller=controller,
                 workload_replica_map=replica_map,
+                price_table_path=instance_price_table_path_from_app(self.app),
             )
+            result = model.result()
             self.app.call_from_thread(
                 self._apply_result, result, charts, violations, controller,
-                replica_map,
+                replica_map, model,
             )
 
         self.run_worker(_do_compute, thread=True, name="impact-dialog-compute", exclusive=True)
@@ -139,7 +146,8 @@ class ImpactAnalysisDialog(ModalScreen[None]):
         charts: list[object],
         violations: list[object],
         controller: object,
-        workload_replica_map: dict[tuple[str, str], int] | None,
+        workload_replica_map: Mapping[tuple[str, str], int] | None,
+        impact_model: object = None,
     ) -> None:
         """Apply the computed result to the impact view on the main thread."""
         with contextlib.suppress(Exception):
@@ -150,6 +158,7 @@ class ImpactAnalysisDialog(ModalScreen[None]):
                 violations=violations,  # type: ignore[arg-type]
                 optimizer_controller=controller,
                 workload_replica_map=workload_replica_map,
+                impact_model=impact_model,  # type: ignore[arg-type]
             )
 
     def on_button_pressed(self, event: CustomButton.Pressed) -> None:
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import contextlib
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING, Any, TypedDict
 
 from textual import on
@@ -16,12 +16,15 @@ from textual.app import ComposeResult
 from textual.message import Message
 from textual.screen import ModalScreen
 
+from kubeagle.constants.instance_types import DEFAULT_OVERHEAD_PCT
 from kubeagle.models.optimization.resource_impact import (
     ChartResourceSnapshot,
+    NodeMixOption,
     ResourceImpactResult,
 )
 from kubeagle.screens.detail.config import (
     IMPACT_CHART_TABLE_COLUMNS,
+    IMPACT_OVERHEAD_OPTIONS,
     IMPACT_SORT_CHART,
     IMPACT_SORT_CPU_LIM,
     IMPACT_SORT_CPU_REQ,
@@ -49,6 +52,7 @@ from kubeagle.widgets import (
 if TYPE_CHECKING:
     from kubeagle.models.analysis.violation import ViolationResult
     from kubeagle.models.charts.chart_info import ChartInfo
+    from kubeagle.optimizer.resource_impact_calculator import ResourceImpactModel
 
 logger = logging.getLogger(__name__)
 
@@ -133,6 +137,22 @@ def _ba_int(before: int, after: int) -> str:
     return f"{base} {pct}" if pct else base
 
 
+def instance_price_table_path_from_app(app: object) -> str | None:
+    """Return the configured local instance price table, if any."""
+    settings = getattr(app, "settings", None)
+    return str(getattr(settings, "instance_price_table_path", "") or "") or None
+
+
+def _format_node_mix(options: list[NodeMixOption]) -> str:
+    """Summarize the cheapest node mix, e.g. ``$1,234/mo (12× m6i.xlarge +1)``."""
+    if not options:
+        return "-"
+    best = options[0]
+    (instance_type, count), *others = best.nodes.items()
+    extra = f" +{len(others)}" if others else ""
+    return f"${best.monthly_cost_usd:,.0f}/mo ({count:,}\u00d7 {instance_type}{extra})"
+
+
 def _impact_style(value: float, *, invert: bool = False) -> tuple[str, str]:
     """Return (arrow, impact_class) for a metric delta.
 
@@ -489,6 +509,11 @@ class ResourceImpactView(CustomVertical):
         self._source_charts: list[ChartInfo] = []
         self._source_violations: list[ViolationResult] = []
         self._optimizer_controller: Any | None = None
+        # Incremental model for filter, overhead and fix-toggle changes
+        self._impact_model: ResourceImpactModel | None = None
+        self._impact_generation = 0
+        # Model chart index per chart table row
+        self._table_indices: list[int | None] = []
         # Filter state (empty set = all selected)
         self._team_filter: set[str] = set()
         self._parent_chart_filter: set[str] = set()
@@ -546,6 +571,13 @@ class ResourceImpactView(CustomVertical):
                     id="impact-sort-order-select",
                     classes="filter-select",
                 ),
+                Select(
+                    IMPACT_OVERHEAD_OPTIONS,
+                    value=str(DEFAULT_OVERHEAD_PCT),
+                    allow_blank=False,
+                    id="impact-overhead-select",
+                    classes="filter-select",
+                ),
                 CustomButton(
                     "Refresh",
                     id="impact-refresh-btn",
@@ -577,6 +609,7 @@ class ResourceImpactView(CustomVertical):
             CustomHorizontal(
                 CustomKPI("Charts", "0", id="impact-kpi-s-charts", classes="kpi-inline"),
                 CustomKPI("Releases", "0", id="impact-kpi-s-releases", classes="kpi-inline"),
+                CustomKPI("Cheapest Nodes", "-", id="impact-kpi-s-node-mix", classes="kpi-inline"),
                 id="impact-summary-bar",
             ),
             id="impact-chart-section",
@@ -619,25 +652,93 @@ class ResourceImpactView(CustomVertical):
         charts: list[ChartInfo],
         violations: list[ViolationResult],
         optimizer_controller: Any | None = None,
-        workload_replica_map: dict[tuple[str, str], int] | None = None,
+        workload_replica_map: Mapping[tuple[str, str], int] | None = None,
+        impact_model: ResourceImpactModel | None = None,
     ) -> None:
-        """Store source data for recomputation and display initial result."""
+        """Store source data for recomputation and display initial result.
+
+        When *impact_model* is given, filter, overhead and fix-toggle changes
+        are applied to it as deltas instead of recomputing the impact.
+        """
         self._source_charts = charts
         self._source_violations = violations
         self._optimizer_controller = optimizer_controller
         self._workload_replica_map = workload_replica_map
+        self._impact_model = impact_model
+        self._impact_generation += 1
+        if impact_model is not None:
+            with contextlib.suppress(Exception):
+                self.query_one("#impact-overhead-select", Select).value = str(
+                    impact_model.overhead_pct
+                )
         self._team_filter = set()
         self._parent_chart_filter = set()
         self._chart_filter = set()
         self.set_data(result)
 
-    def set_data(self, result: ResourceImpactResult) -> None:
-        """Update all sub-widgets with computed impact data."""
+    def set_data(
+        self, result: ResourceImpactResult, *, nodes_pending: bool = False,
+    ) -> None:
+        """Update all sub-widgets with computed impact data.
+
+        ``nodes_pending`` marks a result without node estimates whose full
+        version is still being computed.
+        """
         self._result = result
         self.set_loading(False)
         self._update_metrics(result)
         self._update_chart_table(result)
-        self._update_summary_bar(result)
+        self._update_summary_bar(result, nodes_pending=nodes_pending)
+
+    # ------------------------------------------------------------------
+    # What-if changes (incremental model)
+    # ------------------------------------------------------------------
+
+    def _apply_what_if(self) -> None:
+        """Show the model's totals now and its node estimates when packed."""
+        model = self._impact_model
+        if model is None:
+            return
+        self._impact_generation += 1
+        generation = self._impact_generation
+        self.set_data(model.result(estimate_nodes=False), nodes_pending=True)
+
+        def _do_estimate() -> None:
+            result = model.result()
+            self.app.call_from_thread(self._apply_estimated, generation, result)
+
+        self.run_worker(_do_estimate, thread=True, name="impact-estimate", exclusive=True)
+
+    def _apply_estimated(self, generation: int, result: ResourceImpactResult) -> None:
+        # A newer what-if change has already superseded this estimate.
+        if generation == self._impact_generation:
+            self.set_data(result)
+
+    def _toggle_fix_at(self, row_index: int) -> None:
+        """Toggle the fixes of the chart shown at *row_index*."""
+        model = self._impact_model
+        if model is None or not 0 <= row_index < len(self._table_indices):
+            return
+        index = self._table_indices[row_index]
+        if index is None:
+            return
+        model.set_fix_enabled(index, not model.is_fix_enabled(index))
+        self._apply_what_if()
+
+    def on_data_table_row_selected(self, event: object) -> None:
+        row_index = getattr(event, "cursor_row", None)
+        if isinstance(row_index, int):
+            self._toggle_fix_at(row_index)
+
+    @on(Select.Changed, "#impact-overhead-select")
+    def _on_impact_overhead_changed(self, event: Select.Changed) -> None:
+        model = self._impact_model
+        if event.value is Select.BLANK or model is None:
+            return
+        overhead_pct = float(str(event.value))
+        if overhead_pct != model.overhead_pct:
+            model.set_overhead_pct(overhead_pct)
+            self._apply_what_if()
 
     # ------------------------------------------------------------------
     # Filters (triggered externally via top bar)
@@ -671,29 +772,40 @@ class ResourceImpactView(CustomVertical):
         self._chart_filter = state["chart_filter"]
         self._recompute_filtered_impact()
 
+    def _matches_filters(self, team: str, parent_chart: str, name: str) -> bool:
+        return (
+            (not self._team_filter or team in self._team_filter)
+            and (
+                not self._parent_chart_filter
+                or (parent_chart or "-") in self._parent_chart_filter
+            )
+            and (not self._chart_filter or name in self._chart_filter)
+        )
+
     def _recompute_filtered_impact(self) -> None:
+        model = self._impact_model
+        if model is not None:
+            model.set_included(
+                index
+                for index, snap in enumerate(model.before_charts)
+                if self._matches_filters(snap.team, snap.parent_chart, snap.name)
+            )
+            self._apply_what_if()
+            return
         with contextlib.suppress(Exception):
             from kubeagle.optimizer.resource_impact_calculator import (
                 ResourceImpactCalculator,
             )
 
             # Filter charts
-            filtered_charts = list(self._source_charts)
-            if self._team_filter:
-                filtered_charts = [
-                    c for c in filtered_charts
-                    if getattr(c, "team", "") in self._team_filter
-                ]
-            if self._parent_chart_filter:
-                filtered_charts = [
-                    c for c in filtered_charts
-                    if (getattr(c, "parent_chart", "") or "-") in self._parent_chart_filter
-                ]
-            if self._chart_filter:
-                filtered_charts = [
-                    c for c in filtered_charts
-                    if getattr(c, "name", "") in self._chart_filter
-                ]
+            filtered_charts = [
+                c for c in self._source_charts
+                if self._matches_filters(
+                    getattr(c, "team", ""),
+                    getattr(c, "parent_chart", "") or "",
+                    getattr(c, "name", ""),
+                )
+            ]
 
             # Filter violations to only those matching filtered chart names
             filtered_chart_names = {getattr(c, "name", "") for c in filtered_charts}
@@ -705,6 +817,7 @@ class ResourceImpactView(CustomVertical):
             calculator = ResourceImpactCalculator()
             optimizer_controller = self._optimizer_controller
             replica_map = getattr(self, "_workload_replica_map", None)
+            price_table_path = instance_price_table_path_from_app(self.app)
             self.set_loading(True, "Recomputing impact...")
 
             def _do_compute() -> None:
@@ -713,6 +826,7 @@ class ResourceImpactView(CustomVertical):
                     filtered_violations,
                     optimizer_controller=optimizer_controller,
                     workload_replica_map=replica_map,
+                    price_table_path=price_table_path,
                 )
                 self.app.call_from_thread(self.set_data, result)
 
@@ -894,15 +1008,25 @@ class ResourceImpactView(CustomVertical):
             table = self.query_one("#impact-chart-table", CustomDataTable)
             table.clear()
 
-            before_map = {s.name: s for s in result.before_charts}
-            after_map = {s.name: s for s in result.after_charts}
+            # With a model, every included chart shows its optimized snapshot
+            # (even when its fixes are toggled off) so rows stay toggleable.
+            candidates: list[tuple[int | None, ChartResourceSnapshot, ChartResourceSnapshot]]
+            model = self._impact_model
+            if model is not None:
+                candidates = model.included_charts()
+            else:
+                before_map = {s.name: s for s in result.before_charts}
+                candidates = [
+                    (None, before_map[key], after)
+                    for key, after in {s.name: s for s in result.after_charts}.items()
+                    if key in before_map
+                ]
 
             # Collect rows with changes
-            changed_pairs: list[tuple[ChartResourceSnapshot, ChartResourceSnapshot]] = []
-            for key, after in after_map.items():
-                before = before_map.get(key)
-                if before is None:
-                    continue
+            changed_pairs: list[
+                tuple[int | None, ChartResourceSnapshot, ChartResourceSnapshot]
+            ] = []
+            for index, before, after in candidates:
                 if (
                     before.cpu_request_per_replica == after.cpu_request_per_replica
                     and before.cpu_limit_per_replica == after.cpu_limit_per_replica
@@ -913,13 +1037,13 @@ class ResourceImpactView(CustomVertical):
                     and before.replicas == after.replicas
                 ):
                     continue
-                changed_pairs.append((before, after))
+                changed_pairs.append((index, before, after))
 
             # Search filter
             query = self._search_query
             if query:
                 changed_pairs = [
-                    (b, a) for b, a in changed_pairs
+                    (i, b, a) for i, b, a in changed_pairs
                     if query in b.name.lower()
                     or query in b.team.lower()
                     or query in b.parent_chart.lower()
@@ -928,11 +1052,12 @@ class ResourceImpactView(CustomVertical):
             # Sort
             sort_field = self._sort_field
             changed_pairs.sort(
-                key=lambda pair: self._sort_key(pair[0], pair[1], sort_field),
+                key=lambda pair: self._sort_key(pair[1], pair[2], sort_field),
                 reverse=self._sort_reverse,
             )
+            self._table_indices = [index for index, _, _ in changed_pairs]
 
-            for before, after in changed_pairs:
+            for index, before, after in changed_pairs:
                 parent_chart_display = f"☂︎ {after.parent_chart}" if after.parent_chart else "-"
                 # Format min/max replicas: show before→after when changed
                 if before.min_replicas != after.min_replicas:
@@ -943,8 +1068,11 @@ class ResourceImpactView(CustomVertical):
                     max_rep_display = f"{before.max_replicas} \u2192 {after.max_replicas}"
                 else:
                     max_rep_display = str(before.max_replicas)
+                fix_off = (
+                    model is not None and index is not None and not model.is_fix_enabled(index)
+                )
                 table.add_row(
-                    after.name,
+                    f"{after.name} [dim](fix off)[/dim]" if fix_off else after.name,
                     parent_chart_display,
                     after.team,
                     str(before.release_count),
@@ -972,7 +1100,9 @@ class ResourceImpactView(CustomVertical):
                     "#impact-chart-empty", CustomStatic
                 ).display = not has_changes
 
-    def _update_summary_bar(self, result: ResourceImpactResult) -> None:
+    def _update_summary_bar(
+        self, result: ResourceImpactResult, *, nodes_pending: bool = False,
+    ) -> None:
         """Update the summary info bar below the chart table."""
         b = result.before
         with contextlib.suppress(Exception):
@@ -983,3 +1113,7 @@ class ResourceImpactView(CustomVertical):
             self.query_one("#impact-kpi-s-releases", CustomKPI).set_value(
                 str(b.total_releases)
             )
+        with contextlib.suppress(Exception):
+            self.query_one("#impact-kpi-s-node-mix", CustomKPI).set_value(
+                "Estimating..." if nodes_pending else _format_node_mix(result.node_mix_options)
+            )
@@ -46,14 +46,17 @@ from kubeagle.constants.ui import (
     SEVERITIES as FILTER_SEVERITIES,
 )
 from kubeagle.models.analysis.violation import ViolationResult
+from kubeagle.optimizer.ai_fix_jobs import AIFixJobSpec, get_ai_fix_scheduler
 from kubeagle.optimizer.fix_verifier import (
+    BulkFixVerificationResult,
     FixVerificationResult,
     FullFixBundleVerificationResult,
+    ValuesFixCandidate,
+    verify_values_fixes_bulk,
 )
 from kubeagle.optimizer.full_ai_fixer import (
     AIFullFixResult,
     AIFullFixStagedArtifact,
-    generate_ai_full_fix_for_chart,
     generate_ai_full_fix_for_violation,
 )
 from kubeagle.optimizer.full_fix_applier import (
@@ -93,6 +96,7 @@ from kubeagle.screens.detail.config import (
 from kubeagle.screens.cluster.cluster_screen import (
     _ForwardGradientProgressBar,
 )
+from kubeagle.utils.search_index import SearchIndex
 from kubeagle.widgets import (
     CustomButton,
     CustomCollapsible,
@@ -110,12 +114,15 @@ from kubeagle.widgets import (
     CustomStatic,
     CustomTree,
     CustomVertical,
+    RowProvider,
+    make_row_key,
 )
 
 if TYPE_CHECKING:
     from kubeagle.app import EKSHelmReporterApp
     from kubeagle.models.charts.chart_info import ChartInfo
     from kubeagle.models.optimization import UnifiedOptimizerController
+    from kubeagle.optimizer.fixer import ValuesFixBatchResult
 
 logger = logging.getLogger(__name__)
 
@@ -203,6 +210,9 @@ _DESCRIPTION_FALLBACK_BY_RULE: dict[str, str] = {
     ),
 }
 
+# Values files patched concurrently by "apply all".
+_APPLY_FIXES_FILE_CONCURRENCY = 8
+
 _BUNDLE_VERIFICATION_COUNTS_PATTERN = re.compile(
     (
         r"bundle verification:\s*(\d+)\s+verified,\s*(\d+)\s+"
@@ -3639,6 +3649,7 @@ class ViolationsView(CustomVertical):
         self._fix_yaml_cache: str = ""
         self._optimizer_controller: UnifiedOptimizerController | None = None
         self._cancel_fixes: bool = False
+        self._offered_ai_fix_job_ids: list[str] = []
         self._applying_fixes: bool = False
         self._search_debounce_timer: Timer | None = None
         self._resize_debounce_timer: Timer | None = None
@@ -3648,8 +3659,10 @@ class ViolationsView(CustomVertical):
         self._last_table_render_signature: tuple[Any, ...] | None = None
         self._last_table_columns_signature: tuple[int, ...] | None = None
         self._table_populate_sequence: int = 0
+        self._keyed_repaint_pending: bool = False
         self._optimizer_controller_signature: tuple[str, int] | None = None
         self._violation_meta: dict[int, _ViolationMeta] = {}
+        self._search_index = SearchIndex(lambda v: (self._meta(v).search_text,))
         self._ai_full_fix_cache: dict[str, dict[str, Any]] = {}
         self._ai_full_fix_artifacts: dict[str, AIFullFixStagedArtifact] = {}
         self._background_tasks: set[asyncio.Task[Any]] = set()
@@ -3832,7 +3845,7 @@ class ViolationsView(CustomVertical):
                     CustomVertical(
                         CustomStatic("Violations Table (0)", id="violations-header"),
                         CustomContainer(
-                            CustomDataTable(id="violations-table"),
+                            CustomDataTable(id="violations-table", virtual=True),
                             CustomContainer(
                                 CustomVertical(
                                     CustomLoadingIndicator(id="viol-loading-indicator"),
@@ -3890,6 +3903,12 @@ class ViolationsView(CustomVertical):
                     CustomButton("Dismiss", id="ai-fix-result-dismiss-btn"),
                     id="ai-fix-result-banner",
                 ),
+                CustomHorizontal(
+                    CustomStatic("", id="ai-fix-resume-status"),
+                    CustomButton("Resume", id="ai-fix-resume-btn"),
+                    CustomButton("Discard", id="ai-fix-discard-btn"),
+                    id="ai-fix-resume-banner",
+                ),
                 CustomStatic("No active AI fix runs", id="ai-fix-pane-empty"),
                 id="ai-fix-pane",
             ),
@@ -3954,6 +3973,7 @@ class ViolationsView(CustomVertical):
     def on_mount(self) -> None:
         """Adapt responsive layout to initial terminal width."""
         self.call_later(self._update_responsive_layout)
+        self.call_later(self._offer_interrupted_ai_fix_jobs)
 
     def update_data(self, violations: list[ViolationResult], charts: list) -> None:
         """Receive data from the parent screen after worker completes."""
@@ -3995,6 +4015,8 @@ class ViolationsView(CustomVertical):
             self._chart_by_path = indexes_and_meta["by_path"]
             self._chart_by_name = indexes_and_meta["by_name"]
             self._violation_meta = indexes_and_meta["meta"]
+            # Search texts depend on the team/path maps just rebuilt.
+            self._search_index.clear()
 
             if not charts:
                 self._show_no_charts_state()
@@ -4042,6 +4064,8 @@ class ViolationsView(CustomVertical):
             self._chart_by_path = indexes_and_meta["by_path"]
             self._chart_by_name = indexes_and_meta["by_name"]
             self._violation_meta = indexes_and_meta["meta"]
+            # Search texts depend on the team/path maps just rebuilt.
+            self._search_index.clear()
 
             if charts:
                 self._update_filter_dropdowns()
@@ -4056,6 +4080,65 @@ class ViolationsView(CustomVertical):
 
         self.call_later(_do_partial)
 
+    def update_changed_charts(
+        self,
+        violations: list[ViolationResult],
+        charts: list,
+    ) -> None:
+        """Apply violations re-checked for a few changed charts.
+
+        Unlike ``update_data`` this keeps the selection and fix state, derives
+        row metadata only for new violations and repaints only the table rows
+        whose cells changed.
+        """
+        if self._table_loading or not self.violations:
+            self.update_data(violations, charts)
+            return
+        self.violations = violations
+        self.charts = charts
+        self._keyed_repaint_pending = True
+
+        self._data_update_seq = getattr(self, "_data_update_seq", 0) + 1
+        seq = self._data_update_seq
+        known_meta = dict(self._violation_meta)
+
+        def _rebuild() -> dict[str, Any]:
+            fresh = [v for v in violations if id(v) not in known_meta]
+            indexes_and_meta = self._build_indexes_and_meta(charts, fresh)
+            meta = {id(v): known_meta[id(v)] for v in violations if id(v) in known_meta}
+            meta.update(indexes_and_meta["meta"])
+            indexes_and_meta["meta"] = meta
+            return indexes_and_meta
+
+        async def _do_update() -> None:
+            if getattr(self, "_data_update_seq", 0) != seq:
+                return
+            indexes_and_meta = await asyncio.to_thread(_rebuild)
+            if getattr(self, "_data_update_seq", 0) != seq:
+                return
+            self._chart_team_map = indexes_and_meta["team_map"]
+            self._chart_path_map = indexes_and_meta["path_map"]
+            self._chart_by_path = indexes_and_meta["by_path"]
+            self._chart_by_name = indexes_and_meta["by_name"]
+            self._violation_meta = indexes_and_meta["meta"]
+            self._update_filter_dropdowns()
+            if violations:
+                self.populate_violations_table()
+            else:
+                self._keyed_repaint_pending = False
+                self._show_no_violations_state()
+            self._update_filter_status()
+
+        self.call_later(_do_update)
+
+    def _violation_row_key(self, violation: ViolationResult) -> str:
+        """Return the row key used for keyed repaints of the violations table."""
+        return make_row_key(
+            self._meta(violation).chart_key,
+            violation.chart_name,
+            violation.rule_id,
+        )
+
     def _schedule_resize_update(self) -> None:
         """Debounce expensive resize-driven relayout/refresh to avoid flicker."""
         if self._resize_debounce_timer is not None:
@@ -4297,8 +4380,14 @@ class ViolationsView(CustomVertical):
         has_any = team_f or cat_f or sev_f or rule_f or pc_f or chart_f or vft_f or q
         if not has_any:
             return violations
+        matched_ids: frozenset[int] = frozenset()
+        if q:
+            self._search_index.sync(violations)
+            matched_ids = self._search_index.match_ids(q)
         result: list[ViolationResult] = []
         for v in violations:
+            if q and id(v) not in matched_ids:
+                continue
             meta = self._meta(v)
             if team_f and meta.team not in team_f:
                 continue
@@ -4316,8 +4405,6 @@ class ViolationsView(CustomVertical):
                 continue
             if vft_f and meta.values_file_type.lower() not in vft_f:
                 continue
-            if q and q not in meta.search_text:
-                continue
             result.append(v)
         return result
 
@@ -4365,6 +4452,8 @@ class ViolationsView(CustomVertical):
         self._last_table_render_signature = render_signature
         self._table_populate_sequence += 1
         sequence = self._table_populate_sequence
+        keyed_repaint = self._keyed_repaint_pending
+        self._keyed_repaint_pending = False
 
         def _filter_and_sort(
             violations: list[ViolationResult], sf: str, sr: bool,
@@ -4463,7 +4552,22 @@ class ViolationsView(CustomVertical):
                         )
                     ]
 
-                if result and len(result) > 50:
+                row_provider: RowProvider | None = None
+                visible_rows: list[tuple[str | Text, ...]] = []
+                if table.is_virtual:
+                    # Rows are formatted lazily as they scroll into view.
+                    def _format_visible_row(
+                        violation: ViolationResult,
+                    ) -> tuple[str | Text, ...]:
+                        row_values = self._build_violation_table_row(violation)
+                        return tuple(row_values[index] for index in visible_column_indices)
+
+                    row_provider = RowProvider(
+                        result,
+                        formatter=_format_visible_row,
+                        key=self._violation_selection_key,
+                    )
+                elif result and len(result) > 50:
                     visible_rows = await asyncio.to_thread(
                         _build_visible_rows,
                         result,
@@ -4474,6 +4578,34 @@ class ViolationsView(CustomVertical):
                 if sequence != self._table_populate_sequence:
                     return
 
+                row_keys: list[str] | None = None
+                if (
+                    keyed_repaint
+                    and row_provider is None
+                    and visible_rows
+                    and not columns_changed
+                    and table.row_count
+                ):
+                    row_keys = [self._violation_row_key(v) for v in result]
+                    if len(set(row_keys)) != len(row_keys):
+                        row_keys = None
+                if row_keys is not None:
+                    # Changed-charts refresh: touch only rows whose cells differ
+                    # and keep the cursor and scroll position.
+                    async with table.batch():
+                        if sequence != self._table_populate_sequence:
+                            return
+                        table.update_rows_keyed(zip(row_keys, visible_rows, strict=True))
+                        if selected_row is not None:
+                            table.cursor_row = selected_row
+                        with contextlib.suppress(Exception):
+                            self.query_one("#violations-header", CustomStatic).update(
+                                f"Violations Table ({len(result)})"
+                            )
+                        self._update_filter_status(result)
+                        self._update_action_states()
+                    return
+
                 async with table.batch():
                     if sequence != self._table_populate_sequence:
                         return
@@ -4500,8 +4632,17 @@ class ViolationsView(CustomVertical):
                         hdr.remove_class("loading")
                     except Exception:
                         pass
-                    if visible_rows:
-                        table.add_rows(visible_rows)
+                    if row_provider is not None and result:
+                        table.set_row_provider(row_provider)
+                        if selected_row is not None:
+                            table.cursor_row = selected_row
+                    elif visible_rows:
+                        # Keyed rows let later changed-chart refreshes diff in place.
+                        keys = [self._violation_row_key(v) for v in result]
+                        table.add_rows(
+                            visible_rows,
+                            keys=keys if len(set(keys)) == len(keys) else None,
+                        )
                         if selected_row is not None:
                             table.cursor_row = selected_row
                     # Restore cursor after bulk insert
@@ -5896,9 +6037,9 @@ class ViolationsView(CustomVertical):
         if status_callback is not None:
             status_callback("Generating fix...")
         full_fix_system_prompt = self._ai_fix_full_fix_system_prompt()
-        # Wrap callback for thread-safety: generate_ai_full_fix_for_chart runs
-        # in a worker thread via asyncio.to_thread, so widget updates from the
-        # callback must be posted back to the main event loop.
+        # Wrap callback for thread-safety: the fix runs in an AI fix job
+        # scheduler worker thread, so widget updates from the callback must be
+        # posted back to the main event loop.
         _worker_cb = None
         if status_callback is not None:
             _app_ref = self.app
@@ -5907,8 +6048,11 @@ class ViolationsView(CustomVertical):
                 _app_ref.call_from_thread(status_callback, text)
 
             _worker_cb = _thread_safe_cb
-        result = await asyncio.to_thread(
-            generate_ai_full_fix_for_chart,
+        # Chart bundles run on the shared job scheduler so a closed modal does
+        # not lose the run and identical chart states reuse finished results.
+        scheduler = get_ai_fix_scheduler()
+        scheduler.set_max_workers(self._ai_fix_bulk_parallelism())
+        job_spec = AIFixJobSpec(
             chart_dir=chart_dir,
             values_path=values_path,
             violations=violations,
@@ -5917,7 +6061,14 @@ class ViolationsView(CustomVertical):
             preferred_provider=self._preferred_ai_fix_provider(),
             provider_models=self._ai_fix_provider_models(),
             full_fix_system_prompt=full_fix_system_prompt,
-            status_callback=_worker_cb,
+        )
+        result = await asyncio.wrap_future(
+            await asyncio.to_thread(
+                scheduler.submit,
+                job_spec,
+                status_callback=_worker_cb,
+                use_cache=not force_refresh,
+            )
         )
         chart_name = str(getattr(chart, "chart_name", "") or getattr(chart, "name", "") or "chart")
         self._notify_claude_agent_sdk_error(
@@ -7594,6 +7745,46 @@ class ViolationsView(CustomVertical):
             banner = self.query_one("#ai-fix-result-banner")
             banner.remove_class("visible")
 
+    async def _offer_interrupted_ai_fix_jobs(self) -> None:
+        """Show AI fix jobs a previous session left unfinished, if any.
+
+        They are only run again when the user presses Resume, since each one
+        calls the LLM.
+        """
+        try:
+            scheduler = await asyncio.to_thread(get_ai_fix_scheduler)
+        except Exception:
+            logger.debug("AI fix job scheduler could not be loaded", exc_info=True)
+            return
+        jobs = scheduler.interrupted_jobs()
+        if not jobs:
+            return
+        self._offered_ai_fix_job_ids = list(jobs)
+        chart_names = sorted({spec.chart_dir.name for spec in jobs.values()})
+        shown = ", ".join(chart_names[:5]) + (", ..." if len(chart_names) > 5 else "")
+        with contextlib.suppress(Exception):
+            self.query_one("#ai-fix-resume-status", CustomStatic).update(
+                f"{len(jobs)} AI fix job(s) were interrupted: {shown}"
+            )
+            self.query_one("#ai-fix-resume-banner").add_class("visible")
+
+    async def _decide_interrupted_ai_fix_jobs(self, *, resume: bool) -> None:
+        """Resume or discard the interrupted AI fix jobs shown in the banner."""
+        job_ids, self._offered_ai_fix_job_ids = self._offered_ai_fix_job_ids, []
+        with contextlib.suppress(Exception):
+            self.query_one("#ai-fix-resume-banner").remove_class("visible")
+        scheduler = get_ai_fix_scheduler()
+        if resume:
+            scheduler.set_max_workers(self._ai_fix_bulk_parallelism())
+            count = await asyncio.to_thread(scheduler.resume, job_ids)
+            self.notify(
+                f"Resumed {count} AI fix job(s); their results are reused when you open those fixes",
+                severity="information",
+            )
+        else:
+            count = await asyncio.to_thread(scheduler.discard_interrupted, job_ids)
+            self.notify(f"Discarded {count} interrupted AI fix job(s)", severity="information")
+
     async def _apply_all_fixes(
         self,
         fixable_violations: list[ViolationResult] | None = None,
@@ -7605,7 +7796,7 @@ class ViolationsView(CustomVertical):
         probe_overrides: dict[str, dict[str, str]] | None = None,
         global_fix_defaults: dict[str, str] | None = None,
     ) -> None:
-        from kubeagle.optimizer.fixer import apply_fix
+        from kubeagle.optimizer.fixer import apply_fixes
         fixable_source = (
             fixable_violations
             if fixable_violations is not None
@@ -7626,11 +7817,16 @@ class ViolationsView(CustomVertical):
         optimizer = self._get_optimizer_controller()
         success, errors, skipped = 0, 0, 0
         failed_details: list[str] = []
+        unresolved_details: list[str] = []
+        # Fixes are grouped per values file so each file is loaded, patched
+        # and written once; files are then patched in parallel.
+        pending_by_file: dict[str, list[tuple[str, str, dict]]] = {}
+        cancelled = False
         for i, violation in enumerate(fixable, 1):
             if self._cancel_fixes:
-                self.notify(f"Cancelled after {success} fixes applied", severity="warning")
+                cancelled = True
                 break
-            self.update_loading_message(f"Applying fix {i}/{total}...")
+            self.update_loading_message(f"Preparing fix {i}/{total}...")
             chart = None
             try:
                 chart = self._find_chart_for_violation(violation)
@@ -7671,14 +7867,66 @@ class ViolationsView(CustomVertical):
                     continue
                 values_path = chart.values_file
                 if values_path and Path(values_path).exists():
-                    await asyncio.to_thread(apply_fix, values_path, fix)
-                    success += 1
+                    chart_name = getattr(chart, "chart_name", violation.chart_name)
+                    pending_by_file.setdefault(
+                        str(Path(values_path).expanduser().resolve()), []
+                    ).append((chart_name, violation.rule_id, fix))
                 else:
                     skipped += 1
             except Exception as exc:
                 errors += 1
                 chart_name = getattr(chart, "chart_name", violation.chart_name) if chart else violation.chart_name
                 failed_details.append(f"{chart_name} ({violation.rule_id}): {exc}")
+        if pending_by_file and not cancelled and app.settings.verify_fixes_with_render:
+            self.update_loading_message(
+                f"Verifying fixes for {len(pending_by_file)} values files with helm template..."
+            )
+            errors += await self._drop_fixes_breaking_render(
+                pending_by_file, failed_details, unresolved_details,
+            )
+        if pending_by_file:
+            pending_count = sum(len(entries) for entries in pending_by_file.values())
+            self.update_loading_message(
+                f"Applying {pending_count} fixes to {len(pending_by_file)} values files..."
+            )
+            limit = asyncio.Semaphore(_APPLY_FIXES_FILE_CONCURRENCY)
+
+            async def _apply_file(
+                values_path: str, entries: list[tuple[str, str, dict]],
+            ) -> ValuesFixBatchResult:
+                async with limit:
+                    return await asyncio.to_thread(
+                        apply_fixes,
+                        values_path,
+                        [fix for _, _, fix in entries],
+                        lambda: self._cancel_fixes,
+                    )
+
+            outcomes = await asyncio.gather(
+                *(
+                    _apply_file(values_path, entries)
+                    for values_path, entries in pending_by_file.items()
+                ),
+                return_exceptions=True,
+            )
+            for entries, outcome in zip(pending_by_file.values(), outcomes, strict=True):
+                if not isinstance(outcome, BaseException) and outcome.cancelled:
+                    cancelled = True
+                    skipped += len(entries)
+                    continue
+                for index, (chart_name, rule_id, _) in enumerate(entries):
+                    if isinstance(outcome, BaseException):
+                        errors += 1
+                        failed_details.append(f"{chart_name} ({rule_id}): {outcome}")
+                    elif outcome.applied[index]:
+                        success += 1
+                    else:
+                        errors += 1
+                        failed_details.append(
+                            f"{chart_name} ({rule_id}): {outcome.errors.get(index, 'not applied')}"
+                        )
+        if cancelled:
+            self.notify(f"Cancelled after {success} fixes applied", severity="warning")
         self._applying_fixes = False
         self.set_table_loading(False)
         self._update_action_states()
@@ -7686,10 +7934,15 @@ class ViolationsView(CustomVertical):
             f"Applied {success} fixes"
             + (f", {skipped} skipped" if skipped else "")
             + (f", {errors} failed" if errors else "")
+            + (f", {len(unresolved_details)} unresolved" if unresolved_details else "")
         )
         if success > 0 or errors > 0:
-            severity = "error" if errors else ("warning" if skipped else "success")
-            self._show_fix_result_banner(summary, failed_details, severity)
+            severity = (
+                "error" if errors else ("warning" if skipped or unresolved_details else "success")
+            )
+            self._show_fix_result_banner(
+                summary, failed_details + unresolved_details, severity,
+            )
             if success > 0:
                 self.post_message(ViolationRefreshRequested())
         else:
@@ -7699,6 +7952,71 @@ class ViolationsView(CustomVertical):
                 "warning",
             )
 
+    async def _drop_fixes_breaking_render(
+        self,
+        pending_by_file: dict[str, list[tuple[str, str, dict]]],
+        failed_details: list[str],
+        unresolved_details: list[str],
+    ) -> int:
+        """Render each values file once with its pending fixes merged.
+
+        Fixes that break ``helm template`` are removed from
+        ``pending_by_file`` and reported in ``failed_details``. Fixes whose
+        violation is still present in the rendered manifests are kept and
+        reported in ``unresolved_details``. Returns the number of dropped
+        fixes.
+        """
+        limit = asyncio.Semaphore(_APPLY_FIXES_FILE_CONCURRENCY)
+
+        async def _verify_file(
+            values_path: str, entries: list[tuple[str, str, dict]],
+        ) -> BulkFixVerificationResult | None:
+            values_file = Path(values_path)
+            chart_dir = values_file.parent
+            if not (chart_dir / "Chart.yaml").exists():
+                return None
+            candidates = [
+                ValuesFixCandidate(key=str(index), rule_id=rule_id, values_patch=fix)
+                for index, (_, rule_id, fix) in enumerate(entries)
+            ]
+            async with limit:
+                return await asyncio.to_thread(
+                    verify_values_fixes_bulk,
+                    chart_dir=chart_dir,
+                    values_path=values_file,
+                    candidates=candidates,
+                    release_name=entries[0][0],
+                )
+
+        items = list(pending_by_file.items())
+        outcomes = await asyncio.gather(
+            *(_verify_file(values_path, entries) for values_path, entries in items),
+            return_exceptions=True,
+        )
+        dropped = 0
+        for (values_path, entries), outcome in zip(items, outcomes, strict=True):
+            if outcome is None or isinstance(outcome, BaseException):
+                continue
+            kept: list[tuple[str, str, dict]] = []
+            for index, entry in enumerate(entries):
+                chart_name, rule_id, _ = entry
+                verification = outcome.per_fix.get(str(index))
+                if str(index) in outcome.render_failed:
+                    dropped += 1
+                    note = verification.note if verification is not None else "render failed"
+                    failed_details.append(f"{chart_name} ({rule_id}): {note}")
+                    continue
+                if verification is not None and verification.status == "unresolved":
+                    unresolved_details.append(
+                        f"{chart_name} ({rule_id}) unresolved: {verification.note}"
+                    )
+                kept.append(entry)
+            if kept:
+                pending_by_file[values_path] = kept
+            else:
+                del pending_by_file[values_path]
+        return dropped
+
     def copy_yaml(self) -> None:
         if not self._fix_yaml_cache:
             self.notify("No fix YAML to copy - select a violation first", severity="warning")
@@ -7723,6 +8041,9 @@ class ViolationsView(CustomVertical):
         if btn == "ai-fix-result-dismiss-btn":
             self._hide_fix_result_banner()
             return
+        if btn in ("ai-fix-resume-btn", "ai-fix-discard-btn"):
+            await self._decide_interrupted_ai_fix_jobs(resume=btn == "ai-fix-resume-btn")
+            return
         if btn == "apply-all-btn":
             self.apply_all()
         elif btn == "fix-selected-btn":
@@ -98,6 +98,11 @@ IMPACT_SORT_OPTIONS: list[tuple[str, str]] = [
     ("Mem Limit", IMPACT_SORT_MEM_LIM),
 ]
 
+# System overhead choices for what-if node estimates (value = fraction).
+IMPACT_OVERHEAD_OPTIONS: list[tuple[str, str]] = [
+    (f"Overhead: {pct}%", str(pct / 100)) for pct in (0, 5, 10, 15, 20, 25, 30)
+]
+
 IMPACT_CHART_TABLE_COLUMNS: list[tuple[str, int]] = [
     ("Chart", 22),
     ("Parent Chart", 18),
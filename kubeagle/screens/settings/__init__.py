@@ -30,10 +30,12 @@ from kubeagle.screens.settings.config import (
     SETTING_CODEOWNERS,
     SETTING_EVENT_AGE,
     SETTING_EXPORT_PATH,
+    SETTING_GIT_INDEX_DISCOVERY,
     SETTING_HIGH_CPU,
     SETTING_HIGH_MEMORY,
     SETTING_HIGH_POD,
     SETTING_HIGH_POD_PERCENT,
+    SETTING_INSTANCE_PRICE_TABLE,
     SETTING_LIMIT_REQUEST,
     SETTING_REFRESH_INTERVAL,
     SETTING_USE_CLUSTER_MODE,
@@ -74,10 +76,12 @@ __all__ = [
     "SETTING_CODEOWNERS",
     "SETTING_EVENT_AGE",
     "SETTING_EXPORT_PATH",
+    "SETTING_GIT_INDEX_DISCOVERY",
     "SETTING_HIGH_CPU",
     "SETTING_HIGH_MEMORY",
     "SETTING_HIGH_POD",
     "SETTING_HIGH_POD_PERCENT",
+    "SETTING_INSTANCE_PRICE_TABLE",
     "SETTING_LIMIT_REQUEST",
     "SETTING_REFRESH_INTERVAL",
     "SETTING_USE_CLUSTER_MODE",
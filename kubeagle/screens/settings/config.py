@@ -33,6 +33,8 @@ SETTING_CODEOWNERS = "codeowners-input"
 SETTING_REFRESH_INTERVAL = "refresh-interval-input"
 SETTING_AUTO_REFRESH = "auto-refresh-switch"
 SETTING_EXPORT_PATH = "export-path-input"
+SETTING_INSTANCE_PRICE_TABLE = "instance-price-table-input"
+SETTING_GIT_INDEX_DISCOVERY = "git-index-discovery-switch"
 SETTING_EVENT_AGE = "event-age-input"
 SETTING_HIGH_CPU = "high-cpu-input"
 SETTING_HIGH_MEMORY = "high-memory-input"
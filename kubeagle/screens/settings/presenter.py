@@ -71,6 +71,8 @@ class SettingsPresenter:
             "refresh-interval-input": self._settings.refresh_interval,
             "auto-refresh-switch": self._settings.auto_refresh,
             "export-path-input": self._settings.export_path,
+            "instance-price-table-input": self._settings.instance_price_table_path,
+            "git-index-discovery-switch": self._settings.use_git_index_discovery,
             "event-age-input": self._settings.event_age_hours,
             "high-cpu-input": self._settings.high_cpu_threshold,
             "high-memory-input": self._settings.high_memory_threshold,
@@ -142,6 +144,10 @@ class SettingsPresenter:
         refresh_interval = self._parse_int(input_values.get("refresh-interval-input", ""), REFRESH_INTERVAL_DEFAULT)
         auto_refresh = switch_values.get("auto-refresh-switch", False)
         export_path = input_values.get("export-path-input", "")
+        instance_price_table_path = self._normalize_path(
+            input_values.get("instance-price-table-input", "")
+        )
+        use_git_index_discovery = switch_values.get("git-index-discovery-switch", False)
         event_age_hours = self._parse_float(input_values.get("event-age-input", ""), EVENT_AGE_HOURS_DEFAULT)
         limit_request_ratio_threshold = self._parse_float(input_values.get("limit-request-input", ""), LIMIT_REQUEST_RATIO_THRESHOLD_DEFAULT)
         optimizer_analysis_source = (
@@ -222,6 +228,13 @@ class SettingsPresenter:
             errors.append(f"Invalid active charts file: '{active_charts_path}'. Path must be a file.")
         if codeowners_path and not Path(codeowners_path).is_file():
             errors.append(f"Invalid CODEOWNERS file: '{codeowners_path}'. Path must be a file.")
+        if instance_price_table_path:
+            from kubeagle.optimizer.node_mix_solver import load_instance_price_table
+
+            try:
+                load_instance_price_table(Path(instance_price_table_path))
+            except ValueError as exc:
+                errors.append(f"Invalid instance price table: {exc}")
 
         # Validate refresh interval
         if refresh_interval < REFRESH_INTERVAL_MIN:
@@ -301,6 +314,8 @@ class SettingsPresenter:
         self._settings.refresh_interval = refresh_interval
         self._settings.auto_refresh = auto_refresh
         self._settings.export_path = export_path
+        self._settings.instance_price_table_path = instance_price_table_path
+        self._settings.use_git_index_discovery = use_git_index_discovery
         self._settings.event_age_hours = event_age_hours
         self._settings.limit_request_ratio_threshold = limit_request_ratio_threshold
         self._settings.use_cluster_values = use_cluster_values
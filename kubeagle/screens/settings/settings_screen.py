@@ -19,6 +19,7 @@ from kubeagle.constants.screens.settings import (
 )
 from kubeagle.constants.values import (
     PLACEHOLDER_EXPORT_PATH,
+    PLACEHOLDER_INSTANCE_PRICE_TABLE,
     PLACEHOLDER_LIMIT_REQUEST,
     PLACEHOLDER_REFRESH_INTERVAL,
 )
@@ -54,6 +55,9 @@ from kubeagle.widgets.containers import (
 )
 
 INPUT_TOOLTIPS: dict[str, str] = {
+    "instance-price-table-input": (
+        "Optional YAML/JSON file with instance prices for the node-mix search."
+    ),
     "limit-request-input": (
         "Ratio of limits to requests to flag (e.g., 3.0 = limits 3x requests)."
     ),
@@ -196,6 +200,20 @@ class SettingsScreen(MainNavigationTabsMixin, BaseScreen):
                                 placeholder=PLACEHOLDER_EXPORT_PATH,
                                 id="export-path-input",
                             ),
+                            CustomStatic("Instance Price Table", classes="setting-label"),
+                            CustomInput(
+                                value=self._settings.instance_price_table_path,
+                                placeholder=PLACEHOLDER_INSTANCE_PRICE_TABLE,
+                                id="instance-price-table-input",
+                            ),
+                            CustomStatic(
+                                "Discover Charts from Git Index",
+                                classes="setting-label",
+                            ),
+                            CustomSwitch(
+                                value=self._settings.use_git_index_discovery,
+                                id="git-index-discovery-switch",
+                            ),
                             CustomStatic(
                                 "Optimizer Analysis Source (auto/rendered/values)",
                                 classes="setting-label",
@@ -655,6 +673,12 @@ class SettingsScreen(MainNavigationTabsMixin, BaseScreen):
         self.query_one("#export-path-input", CustomInput).value = (
             settings.export_path
         )
+        self.query_one("#instance-price-table-input", CustomInput).value = (
+            settings.instance_price_table_path
+        )
+        self.query_one("#git-index-discovery-switch", CustomSwitch).value = (
+            settings.use_git_index_discovery
+        )
         self.query_one("#limit-request-input", CustomInput).value = str(
             settings.limit_request_ratio_threshold
         )
@@ -733,6 +757,9 @@ class SettingsScreen(MainNavigationTabsMixin, BaseScreen):
                 "refresh-interval-input"
             ),
             "export-path-input": self._get_input_value("export-path-input"),
+            "instance-price-table-input": self._get_input_value(
+                "instance-price-table-input"
+            ),
             "event-age-input": str(self._settings.event_age_hours),
             "limit-request-input": self._get_input_value("limit-request-input"),
             "optimizer-analysis-source-input": self._get_select_value(
@@ -777,6 +804,9 @@ class SettingsScreen(MainNavigationTabsMixin, BaseScreen):
             "auto-refresh-switch": self.query_one(
                 "#auto-refresh-switch", CustomSwitch
             ).value,
+            "git-index-discovery-switch": self.query_one(
+                "#git-index-discovery-switch", CustomSwitch
+            ).value,
             "fix-cpu-request-switch": self.query_one(
                 "#fix-cpu-request-switch", CustomSwitch
             ).value,
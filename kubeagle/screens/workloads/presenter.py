@@ -5,15 +5,14 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+from collections.abc import Callable
 from typing import Any
 
-# Pre-compiled regex for _extract_percent — avoids re-compiling on every sort comparison.
-_PERCENT_RE = re.compile(r"(-?\d+(?:\.\d+)?)\s*%")
-
 from textual.message import Message
 from textual.worker import get_current_worker
 
 from kubeagle.controllers import ClusterController
+from kubeagle.models.cache.cluster_join_index import get_cluster_join_index
 from kubeagle.models.core.workload_inventory_info import (
     WorkloadLiveUsageSampleInfo,
 )
@@ -45,9 +44,14 @@ from kubeagle.screens.workloads.config import (
     SORT_BY_WORKLOAD_MEM_USAGE_P95,
     WORKLOADS_RESOURCE_BASE_COLUMNS,
 )
+from kubeagle.utils.row_cache import FormattedRowCache
+from kubeagle.utils.search_index import SearchIndex
 
 logger = logging.getLogger(__name__)
 
+# Pre-compiled regex for _extract_percent — avoids re-compiling on every sort comparison.
+_PERCENT_RE = re.compile(r"(-?\d+(?:\.\d+)?)\s*%")
+
 
 class WorkloadsSourceLoaded(Message):
     """Message indicating one workloads data source has completed."""
@@ -127,6 +131,12 @@ class WorkloadsPresenter:
         # Reusable controller instance — avoids re-creating ClusterController
         # (and re-resolving context) for each fetch_live_usage_sample call.
         self._cached_ctrl: ClusterController | None = None
+        # Formatted rows keyed by (identity, data revision, columns, theme);
+        # filter/sort changes reuse rows instead of re-formatting markup.
+        self._row_cache = FormattedRowCache()
+        # Trigram index over the search fields of all_workloads; synced
+        # incrementally as streamed batches replace the workload list.
+        self._search_index = SearchIndex(self._search_fields, separator=" ")
 
     @property
     def is_loading(self) -> bool:
@@ -192,6 +202,7 @@ class WorkloadsPresenter:
             self._partial_errors.clear()
             self._loaded_keys.clear()
             self._data["all_workloads"] = []
+            self._row_cache.bump_revision()
 
             app = self._screen.app
             configured_context = (
@@ -215,6 +226,7 @@ class WorkloadsPresenter:
                     "progressive_parallelism",
                     2,
                 ),
+                join_index=get_cluster_join_index(configured_context),
             )
             # Cache controller for reuse by fetch_live_usage_sample
             self._cached_ctrl = ctrl
@@ -232,6 +244,7 @@ class WorkloadsPresenter:
                 has_new_rows = current_row_count > streamed_row_count
                 if has_new_rows:
                     self._data["all_workloads"] = list(partial_rows)
+                    self._row_cache.bump_revision()
                     streamed_row_count = current_row_count
                 msg(
                     "Loading workloads "
@@ -257,6 +270,7 @@ class WorkloadsPresenter:
             )
             self._partial_errors.update(ctrl.get_last_nonfatal_warnings())
             self._data["all_workloads"] = all_workloads
+            self._row_cache.bump_revision()
             self._loaded_keys.add("all_workloads")
             msg("Loading workloads (1/1)...")
             if bool(getattr(self._screen, "is_current", True)):
@@ -317,6 +331,7 @@ class WorkloadsPresenter:
                     "progressive_parallelism",
                     2,
                 ),
+                join_index=get_cluster_join_index(configured_context),
             )
             self._cached_ctrl = ctrl
         return await ctrl.fetch_workload_live_usage_sample(
@@ -733,20 +748,24 @@ class WorkloadsPresenter:
         if not query:
             return workloads
 
-        filtered: list[Any] = []
-        for workload in workloads:
-            haystack = " ".join(
-                [
-                    self._normalize_text(getattr(workload, "namespace", "")),
-                    self._normalize_text(getattr(workload, "kind", "")),
-                    self._normalize_text(getattr(workload, "name", "")),
-                    self._normalize_text(getattr(workload, "helm_release", "")),
-                    self._normalize_text(getattr(workload, "status", "")),
-                ]
-            )
-            if query in haystack:
-                filtered.append(workload)
-        return filtered
+        self._search_index.sync(self.get_all_workloads())
+        matched_ids = self._search_index.match_ids(query)
+        return [workload for workload in workloads if id(workload) in matched_ids]
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """Trigram index over workload search fields."""
+        return self._search_index
+
+    @classmethod
+    def _search_fields(cls, workload: Any) -> tuple[str, ...]:
+        return (
+            cls._normalize_text(getattr(workload, "namespace", "")),
+            cls._normalize_text(getattr(workload, "kind", "")),
+            cls._normalize_text(getattr(workload, "name", "")),
+            cls._normalize_text(getattr(workload, "helm_release", "")),
+            cls._normalize_text(getattr(workload, "status", "")),
+        )
 
     def _sort_workloads(
         self,
@@ -978,25 +997,118 @@ class WorkloadsPresenter:
         workloads = self._sort_workloads(workloads, sort_by=sort_by, descending=descending)
         return self.format_workload_rows(workloads, columns=effective_columns)
 
+    @property
+    def row_cache(self) -> FormattedRowCache:
+        """Formatted-row cache shared by all workloads tables."""
+        return self._row_cache
+
+    @staticmethod
+    def _row_identity(workload: Any) -> tuple[str, str, str]:
+        return (
+            str(getattr(workload, "namespace", "") or ""),
+            str(getattr(workload, "kind", "") or ""),
+            str(getattr(workload, "name", "") or ""),
+        )
+
+    def _row_theme(self) -> str:
+        """Return the active theme name (part of the row cache key)."""
+        try:
+            return str(getattr(self._screen.app, "theme", "") or "")
+        except Exception:
+            return ""
+
+    def _row_formatter(
+        self,
+        columns: list[tuple[str, int]],
+    ) -> tuple[tuple[str, ...], Any]:
+        """Return the row cache column key and a formatter for ``columns``."""
+        column_names = tuple(name for name, _ in columns)
+        # A frozenset of needed column names lets _format_workload_row skip
+        # computing expensive columns that aren't displayed.
+        needed = frozenset(column_names)
+
+        def _format(workload: Any) -> tuple[str, ...]:
+            return self._format_workload_row(
+                workload,
+                columns=columns,
+                _needed_columns=needed,
+            )
+
+        return column_names, _format
+
+    def format_workload_row(
+        self,
+        workload: Any,
+        *,
+        columns: list[tuple[str, int]] | None = None,
+    ) -> tuple[str, ...]:
+        """Format a single workload for the given columns (lazy row rendering)."""
+        column_key, formatter = self._row_formatter(
+            columns or WORKLOADS_RESOURCE_BASE_COLUMNS,
+        )
+        return self._row_cache.get_or_format(
+            workload,
+            identity=self._row_identity(workload),
+            columns=column_key,
+            formatter=formatter,
+            theme=self._row_theme(),
+        )
+
     def format_workload_rows(
         self,
         workloads: list[Any],
         *,
         columns: list[tuple[str, int]] | None = None,
     ) -> list[tuple[str, ...]]:
-        effective_columns = columns or WORKLOADS_RESOURCE_BASE_COLUMNS
-        # Build a frozenset of needed column names so _format_workload_row
-        # can skip computing expensive columns that aren't displayed.
-        needed = frozenset(name for name, _ in effective_columns)
+        column_key, formatter = self._row_formatter(
+            columns or WORKLOADS_RESOURCE_BASE_COLUMNS,
+        )
+        theme = self._row_theme()
+        get_or_format = self._row_cache.get_or_format
+        row_identity = self._row_identity
         return [
-            self._format_workload_row(
+            get_or_format(
                 workload,
-                columns=effective_columns,
-                _needed_columns=needed,
+                identity=row_identity(workload),
+                columns=column_key,
+                formatter=formatter,
+                theme=theme,
             )
             for workload in workloads
         ]
 
+    def warm_row_cache(
+        self,
+        columns: list[tuple[str, int]],
+        *,
+        theme: str,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> int:
+        """Pre-format all loaded workloads for one column set.
+
+        Intended to run in a background thread after loading completes so
+        later filter/sort changes only select cached rows. Only the active
+        column set is warmed; warming every tab would evict the active
+        view's rows once the cache is full.
+
+        Args:
+            columns: Column definitions of the active view.
+            theme: Active theme name captured on the UI thread.
+            should_stop: Optional callable polled between rows to abort.
+
+        Returns:
+            Number of rows formatted.
+        """
+        column_key, formatter = self._row_formatter(columns)
+        return self._row_cache.warm(
+            list(self.get_all_workloads()),
+            identity=self._row_identity,
+            columns=column_key,
+            formatter=formatter,
+            theme=theme,
+            should_stop=should_stop,
+        )
+
     def get_filtered_workloads(
         self,
         *,
@@ -16,6 +16,7 @@ from textual.app import ComposeResult
 from textual.css.query import NoMatches
 from textual.screen import ModalScreen, Screen
 from textual.widgets import ContentSwitcher, ProgressBar
+from textual.worker import get_current_worker
 
 from kubeagle.keyboard import WORKLOADS_SCREEN_BINDINGS
 from kubeagle.keyboard.navigation import ScreenNavigator
@@ -61,6 +62,8 @@ from kubeagle.widgets import (
     CustomStatic,
     CustomTabs,
     CustomVertical,
+    RowProvider,
+    make_row_key,
 )
 
 PlotextPlot: Any | None
@@ -1496,6 +1499,7 @@ class WorkloadsScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scr
                                 CustomDataTable(
                                     id=WORKLOADS_TABLE_ID_BY_TAB[tab_id],
                                     zebra_stripes=True,
+                                    virtual=True,
                                 ),
                                 id=f"{WORKLOADS_TABLE_ID_BY_TAB[tab_id]}-container",
                             ),
@@ -2157,6 +2161,8 @@ class WorkloadsScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scr
         active_tab_id = self._active_tab_id
         presenter = self._presenter
         columns = self._columns_for_tab(active_tab_id)
+        # Virtual tables format rows lazily while scrolling.
+        lazy_rows = self._is_virtual_table(WORKLOADS_TABLE_ID_BY_TAB[active_tab_id])
 
         async def _do_refresh() -> None:
             if getattr(self, "_refresh_active_tab_seq", 0) != seq:
@@ -2188,7 +2194,11 @@ class WorkloadsScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scr
                     filtered_workloads=filtered,
                     scoped_total=scoped,
                 )
-                rows = presenter.format_workload_rows(filtered, columns=columns)
+                rows = (
+                    []
+                    if lazy_rows
+                    else presenter.format_workload_rows(filtered, columns=columns)
+                )
                 column_names = tuple(name for name, _width in columns)
                 content_sig = (
                     len(filtered),
@@ -2200,6 +2210,8 @@ class WorkloadsScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scr
                         )
                         for w in filtered
                     ),
+                    # Cell values, so value-only changes reach the keyed refresh.
+                    tuple(rows) if rows else tuple(filtered),
                     column_names,
                     sort_by,
                     sort_desc,
@@ -2252,6 +2264,57 @@ class WorkloadsScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scr
             kpi.set_value(value)
             kpi.set_status(status)
 
+    def _is_virtual_table(self, table_id: str) -> bool:
+        with suppress(NoMatches):
+            return self.query_one(f"#{table_id}", CustomDataTable).is_virtual
+        return False
+
+    def _build_row_provider(
+        self,
+        workloads: list[Any],
+        columns: list[tuple[str, int]],
+    ) -> RowProvider:
+        presenter = self._presenter
+        return RowProvider(
+            workloads,
+            formatter=lambda workload: presenter.format_workload_row(
+                workload,
+                columns=columns,
+            ),
+            key=self._workload_identity_key,
+        )
+
+    def _apply_keyed_refresh(
+        self,
+        table: CustomDataTable,
+        workloads: list[Any],
+        rows: list[Any],
+        columns: list[tuple[str, int]],
+    ) -> bool:
+        """Refresh an already-populated table in place, keyed by workload identity.
+
+        Returns:
+            True if the refresh was applied, False if a full repopulate is needed.
+        """
+        if getattr(table, "is_virtual", False):
+            table.set_row_provider(
+                self._build_row_provider(workloads, columns),
+                keep_position=True,
+            )
+            return True
+        update_rows_keyed = getattr(table, "update_rows_keyed", None)
+        if not callable(update_rows_keyed) or len(rows) != len(workloads):
+            return False
+        keyed_rows = [
+            (make_row_key(*self._workload_identity_key(workload)), row)
+            for workload, row in zip(workloads, rows, strict=True)
+        ]
+        try:
+            update_rows_keyed(keyed_rows)
+        except ValueError:
+            return False
+        return True
+
     @staticmethod
     def _workload_identity_key(workload: Any) -> tuple[str, str, str]:
         return (
@@ -2319,14 +2382,23 @@ class WorkloadsScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scr
                         table.add_column(name, key=f"col-{index}")
                     self._initialized_table_ids.add(table_id)
                     self._table_column_names_by_id[table_id] = column_names
-                else:
-                    table.clear(columns=False)
-                if rows:
-                    table.add_rows(rows)
-                # Force scroll to top after population to prevent
-                # auto-scroll to bottom during data load.
+                keyed_refresh = not needs_reconfigure and self._apply_keyed_refresh(
+                    table, filtered_workloads, rows, columns,
+                )
+                if not keyed_refresh:
+                    if not needs_reconfigure:
+                        table.clear(columns=False)
+                    if getattr(table, "is_virtual", False):
+                        table.set_row_provider(
+                            self._build_row_provider(filtered_workloads, columns)
+                        )
+                    elif rows:
+                        table.add_rows(rows)
+                # Force scroll to top after a full repopulate to prevent
+                # auto-scroll to bottom during data load. Keyed refreshes keep
+                # the user's scroll position and cursor row.
                 dt = table.data_table
-                if dt is not None:
+                if dt is not None and not keyed_refresh:
                     dt.scroll_y = 0
                     dt.scroll_target_y = 0
 
@@ -2337,7 +2409,7 @@ class WorkloadsScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scr
 
                     dt.call_after_refresh(_reset_scroll)
             self._table_content_sig_by_id[table_id] = content_sig
-            if selected_identity is not None:
+            if selected_identity is not None and not keyed_refresh:
                 restored_index = identity_to_index.get(selected_identity)
                 if restored_index is not None:
                     table.cursor_row = restored_index
@@ -2345,6 +2417,7 @@ class WorkloadsScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scr
     def _set_active_tab(self, tab_id: str) -> None:
         if tab_id not in WORKLOADS_TAB_IDS:
             return
+        tab_changed = tab_id != self._active_tab_id
         self._active_tab_id = tab_id
         with suppress(NoMatches):
             tabs = self.query_one("#workloads-view-tabs", CustomTabs)
@@ -2355,6 +2428,8 @@ class WorkloadsScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scr
             self.query_one("#workloads-content-switcher", ContentSwitcher).current = tab_id
         # Defer table rebuild so the tab switch renders immediately
         self.call_later(self._refresh_active_tab)
+        if tab_changed and not self._is_loading and self._presenter.get_all_workloads():
+            self._start_row_cache_warmup()
 
     @on(CustomTabs.TabActivated, "#workloads-view-tabs")
     def _on_view_tab_activated(self, event: CustomTabs.TabActivated) -> None:
@@ -2533,6 +2608,29 @@ class WorkloadsScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scr
         ):
             self._schedule_partial_refresh()
 
+    def _start_row_cache_warmup(self) -> None:
+        """Pre-format rows for the active tab's columns in a background thread."""
+        columns = self._columns_for_tab(self._active_tab_id)
+        theme = str(getattr(self.app, "theme", "") or "")
+        presenter = self._presenter
+
+        def _warm() -> None:
+            worker = get_current_worker()
+            presenter.warm_row_cache(
+                columns,
+                theme=theme,
+                should_stop=lambda: worker.is_cancelled,
+            )
+
+        self.run_worker(
+            _warm,
+            name="workloads-row-cache",
+            group="workloads-row-cache",
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
+
     def on_workloads_data_loaded(self, _: WorkloadsDataLoaded) -> None:
         self._is_loading = False
         self._partial_refresh_scheduled = False
@@ -2545,6 +2643,7 @@ class WorkloadsScreen(MainNavigationTabsMixin, WorkerMixin, ScreenNavigator, Scr
         self._refresh_filter_options()
         self._refresh_active_tab()
         self._mark_partial_table_repaint(total_rows)
+        self._start_row_cache_warmup()
         if self._presenter.partial_errors:
             failed_sources = ", ".join(sorted(self._presenter.partial_errors.keys()))
             self.notify(
@@ -14,6 +14,9 @@ Note: Tests using app.run_test() are kept minimal due to Textual testing overhea
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
 from textual.widgets import Select
 
 from kubeagle.constants.enums import QoSClass
@@ -883,6 +886,45 @@ class TestChartsExplorerScreenInternalMethods:
         )
         assert screen._load_values_file_content(chart) == "replicaCount: 2\n"
 
+    @pytest.mark.asyncio
+    async def test_cluster_values_preview_refetches_values_of_indexed_rows(self) -> None:
+        """Cluster rows served without raw values should fetch them on demand."""
+        screen = ChartsExplorerScreen(testing=True)
+        controller = MagicMock()
+        controller.fetch_deployed_values_content = AsyncMock(
+            return_value="replicaCount: 3\n"
+        )
+        screen._charts_controller = controller
+        chart = ChartInfo(
+            name="svc-a",
+            namespace="team-a",
+            team="Platform",
+            values_file="cluster:team-a",
+            cpu_request=100,
+            cpu_limit=200,
+            memory_request=128,
+            memory_limit=256,
+            qos_class=QoSClass.BURSTABLE,
+            has_liveness=True,
+            has_readiness=True,
+            has_startup=False,
+            has_anti_affinity=False,
+            has_topology_spread=False,
+            has_topology=False,
+            pdb_enabled=True,
+            pdb_template_exists=False,
+            pdb_min_available=None,
+            pdb_max_unavailable=None,
+            replicas=2,
+            priority_class=None,
+        )
+
+        await screen._ensure_deployed_values_content(chart)
+        await screen._ensure_deployed_values_content(chart)
+
+        controller.fetch_deployed_values_content.assert_awaited_once_with("svc-a", "team-a")
+        assert screen._load_values_file_content(chart) == "replicaCount: 3\n"
+
     def test_stale_generation_data_loaded_event_is_ignored(self) -> None:
         """Data events from superseded mode-generation should not update UI state."""
         screen = ChartsExplorerScreen(testing=True)
@@ -41,6 +41,7 @@ from kubeagle.screens.settings.config import (
     SETTING_CODEOWNERS,
     SETTING_EVENT_AGE,
     SETTING_EXPORT_PATH,
+    SETTING_GIT_INDEX_DISCOVERY,
     SETTING_HIGH_CPU,
     SETTING_HIGH_MEMORY,
     SETTING_HIGH_POD,
@@ -213,6 +214,10 @@ class TestSettingsConfigSettingIDs:
         """Test SETTING_AUTO_REFRESH has correct value."""
         assert SETTING_AUTO_REFRESH == "auto-refresh-switch"
 
+    def test_setting_git_index_discovery_value(self) -> None:
+        """Test SETTING_GIT_INDEX_DISCOVERY has correct value."""
+        assert SETTING_GIT_INDEX_DISCOVERY == "git-index-discovery-switch"
+
     def test_setting_export_path_value(self) -> None:
         """Test SETTING_EXPORT_PATH has correct value."""
         assert SETTING_EXPORT_PATH == "export-path-input"
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+import shutil
+import subprocess
 from pathlib import Path
 
 import pytest
@@ -109,6 +112,118 @@ class TestChartFetcher:
             chart_path / "values-preview.yaml",
         ]
 
+    def test_find_chart_directories_prunes_hidden_and_underscore_dirs(
+        self, fetcher: ChartFetcher, tmp_path: Path
+    ) -> None:
+        """Test hidden, underscore and dependency dirs are never descended into."""
+        for rel in (".git/chart", "_archive/chart", "team/_old", "team/api"):
+            chart_dir = tmp_path / rel
+            chart_dir.mkdir(parents=True)
+            (chart_dir / "Chart.yaml").write_text("name: chart")
+            (chart_dir / "values.yaml").write_text("key: value")
+
+        result = fetcher.find_chart_directories()
+
+        assert result == [tmp_path / "team" / "api"]
+
+    def test_find_values_files_reuses_discovery_until_dir_changes(
+        self, fetcher: ChartFetcher, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test values files come from the discovery walk while the dir is unchanged."""
+        chart_dir = tmp_path / "api"
+        chart_dir.mkdir()
+        (chart_dir / "Chart.yaml").write_text("name: api")
+        (chart_dir / "values.yaml").write_text("key: value")
+        (chart_dir / "values-automation.yaml").write_text("key: value")
+        assert fetcher.find_chart_directories() == [chart_dir]
+
+        def _no_glob(*args: object, **kwargs: object) -> None:
+            raise AssertionError("values files globbed again")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(Path, "glob", _no_glob)
+            assert fetcher.find_values_files(chart_dir) == [
+                chart_dir / "values-automation.yaml",
+                chart_dir / "values.yaml",
+            ]
+
+        (chart_dir / "values-preview.yaml").write_text("key: value")
+        stat = chart_dir.stat()
+        os.utime(chart_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert fetcher.find_values_files(chart_dir)[-1] == chart_dir / "values-preview.yaml"
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+    def test_git_index_mode_matches_walk(
+        self, tmp_path: Path
+    ) -> None:
+        """Test git index discovery finds the same charts and values files as the walk."""
+        for name in ("api", "worker"):
+            chart_dir = tmp_path / "team" / name
+            chart_dir.mkdir(parents=True)
+            (chart_dir / "Chart.yaml").write_text(f"name: {name}")
+            (chart_dir / "values.yaml").write_text("key: value")
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        subprocess.run(["git", "-C", str(tmp_path), "add", "-A"], check=True)
+        api_dir = tmp_path / "team" / "api"
+        (api_dir / "values-preview.yaml").write_text("key: untracked")
+        (tmp_path / "team" / "worker" / "values.yaml").write_text("key: modified")
+
+        fetcher = ChartFetcher(repo_path=tmp_path, use_git_index=True)
+        result = fetcher.find_chart_directories()
+
+        assert result == ChartFetcher(repo_path=tmp_path).find_chart_directories()
+        assert fetcher.find_values_files(api_dir) == [
+            api_dir / "values.yaml",
+            api_dir / "values-preview.yaml",
+        ]
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+    def test_git_index_mode_finds_charts_below_the_checkout_root(
+        self, tmp_path: Path
+    ) -> None:
+        """Test charts are found when repo_path is a subdirectory of the checkout."""
+        charts_root = tmp_path / "deploy" / "charts"
+        chart_dir = charts_root / "api"
+        chart_dir.mkdir(parents=True)
+        (chart_dir / "Chart.yaml").write_text("name: api")
+        (chart_dir / "values.yaml").write_text("key: value")
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        subprocess.run(["git", "-C", str(tmp_path), "add", "-A"], check=True)
+        (chart_dir / "values.yaml").write_text("key: modified")
+
+        fetcher = ChartFetcher(repo_path=charts_root, use_git_index=True)
+
+        assert fetcher.find_chart_directories() == [chart_dir]
+
+    def test_git_index_mode_falls_back_to_walk_outside_git(
+        self, tmp_path: Path
+    ) -> None:
+        """Test git index mode still discovers charts in a plain directory."""
+        chart_dir = tmp_path / "api"
+        chart_dir.mkdir()
+        (chart_dir / "Chart.yaml").write_text("name: api")
+        (chart_dir / "values.yaml").write_text("key: value")
+
+        fetcher = ChartFetcher(repo_path=tmp_path, use_git_index=True)
+
+        assert fetcher.find_chart_directories() == [chart_dir]
+
+    def test_walk_does_not_follow_symlinked_directories(
+        self, fetcher: ChartFetcher, tmp_path: Path
+    ) -> None:
+        """Test symlinked chart dirs are skipped, as rglob discovery did."""
+        repo = tmp_path / "repo"
+        outside = tmp_path / "outside" / "linked"
+        for chart_dir in (repo / "team" / "api", outside):
+            chart_dir.mkdir(parents=True)
+            (chart_dir / "Chart.yaml").write_text("name: chart")
+            (chart_dir / "values.yaml").write_text("key: value")
+        (repo / "team" / "linked").symlink_to(outside, target_is_directory=True)
+
+        fetcher = ChartFetcher(repo_path=repo)
+
+        assert fetcher.find_chart_directories() == [repo / "team" / "api"]
+
     def test_parse_values_file_valid(self, fetcher: ChartFetcher, tmp_path: Path) -> None:
         """Test parse_values_file parses valid YAML."""
         values_file = tmp_path / "values.yaml"
@@ -204,8 +204,8 @@ class TestChartsControllerClusterStreaming:
                 self.context = context
 
             async def get_helm_releases(self, on_namespace_update: object | None = None):
-                first = SimpleNamespace(name="svc-a", namespace="team-a")
-                second = SimpleNamespace(name="svc-b", namespace="team-b")
+                first = SimpleNamespace(name="svc-a", namespace="team-a", revision="3")
+                second = SimpleNamespace(name="svc-b", namespace="team-b", revision="1")
                 if on_namespace_update is not None:
                     on_namespace_update([first], 1, 2)
                     on_namespace_update([first, second], 2, 2)
@@ -230,8 +230,8 @@ class TestChartsControllerClusterStreaming:
         )
 
         assert releases == [
-            {"name": "svc-a", "namespace": "team-a"},
-            {"name": "svc-b", "namespace": "team-b"},
+            {"name": "svc-a", "namespace": "team-a", "revision": "3"},
+            {"name": "svc-b", "namespace": "team-b", "revision": "1"},
         ]
         assert updates == [(1, 1, 2), (2, 2, 2)]
 
@@ -436,3 +436,42 @@ class TestChartsControllerClusterStreaming:
 
         assert len(charts) == 1
         assert charts[0].deployed_values_content == raw_values
+
+
+class TestOverlayAnalysis:
+    """Tests for overlays being analyzed on merged values."""
+
+    def test_overlay_inherits_probes_replicas_and_partial_resources(
+        self, tmp_path: Path
+    ) -> None:
+        """Test an overlay row reflects base settings it does not override."""
+        chart_dir = tmp_path / "api"
+        chart_dir.mkdir()
+        (chart_dir / "Chart.yaml").write_text("apiVersion: v2\nname: api\nversion: 0.1.0\n")
+        (chart_dir / "values.yaml").write_text(
+            "replicaCount: 3\n"
+            "livenessProbe:\n  httpGet:\n    path: /health\n"
+            "pdb:\n  enabled: true\n  minAvailable: 1\n"
+            "resources:\n"
+            "  requests:\n    cpu: 100m\n    memory: 128Mi\n"
+            "  limits:\n    cpu: 100m\n    memory: 128Mi\n"
+        )
+        (chart_dir / "values-staging.yaml").write_text(
+            "resources:\n  limits:\n    cpu: 500m\n"
+        )
+
+        controller = ChartsController(repo_path=tmp_path)
+        rows = {
+            Path(chart.values_file).name: chart
+            for chart in controller._analyze_single_chart(chart_dir)
+        }
+
+        main = rows["values.yaml"]
+        staging = rows["values-staging.yaml"]
+        assert main.qos_class == QoSClass.GUARANTEED
+        assert staging.replicas == 3
+        assert staging.has_liveness
+        assert staging.pdb_enabled == main.pdb_enabled
+        assert staging.memory_request == main.memory_request
+        assert staging.cpu_limit == 500.0
+        assert staging.qos_class == QoSClass.BURSTABLE
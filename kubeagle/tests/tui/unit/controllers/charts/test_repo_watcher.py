@@ -0,0 +1,145 @@
+"""Tests for the live charts-repository watcher."""
+
+from __future__ import annotations
+
+import os
+import queue
+import shutil
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+import pytest
+
+from kubeagle.controllers.charts.controller import ChartsController
+from kubeagle.controllers.charts.watcher import ChartsRepoWatcher
+
+_VALUES = """\
+resources:
+  requests:
+    cpu: {cpu}
+    memory: 128Mi
+  limits:
+    cpu: "1"
+    memory: 256Mi
+"""
+
+
+def _write_chart(root: Path, name: str, cpu: str = "100m") -> Path:
+    chart_dir = root / name
+    chart_dir.mkdir(parents=True, exist_ok=True)
+    (chart_dir / "Chart.yaml").write_text(f"apiVersion: v2\nname: {name}\nversion: 0.1.0\n")
+    (chart_dir / "values.yaml").write_text(_VALUES.format(cpu=cpu))
+    return chart_dir
+
+
+def _bump(path: Path, text: str) -> None:
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestChartsRepoWatcher:
+    """Tests for ChartsRepoWatcher batching and chart mapping."""
+
+    @pytest.fixture
+    def batches(self) -> queue.Queue[frozenset[Path]]:
+        return queue.Queue()
+
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> Path:
+        _write_chart(tmp_path, "api")
+        _write_chart(tmp_path, "worker")
+        (tmp_path / ".git").mkdir()
+        return tmp_path.resolve()
+
+    @pytest.fixture
+    def make_watcher(
+        self, repo: Path, batches: queue.Queue[frozenset[Path]],
+    ) -> Generator[Callable[[str], ChartsRepoWatcher], None, None]:
+        watchers: list[ChartsRepoWatcher] = []
+
+        def _make(backend: str) -> ChartsRepoWatcher:
+            watcher = ChartsRepoWatcher(
+                repo,
+                batches.put,
+                backend=backend,
+                debounce_seconds=0.2,
+                poll_interval_seconds=0.05,
+            )
+            watcher.set_chart_dirs([repo / "api", repo / "worker"])
+            watchers.append(watcher)
+            return watcher
+
+        yield _make
+        for watcher in watchers:
+            watcher.stop()
+
+    @pytest.mark.parametrize("backend", ["polling", "inotify"])
+    def test_burst_is_reported_as_one_batch(
+        self,
+        backend: str,
+        repo: Path,
+        batches: queue.Queue[frozenset[Path]],
+        make_watcher: Callable[[str], ChartsRepoWatcher],
+    ) -> None:
+        """Test a checkout-like burst yields one set of chart directories."""
+        watcher = make_watcher(backend)
+        try:
+            watcher.start()
+        except OSError:
+            pytest.skip("inotify is not available")
+        assert watcher.backend_name == backend
+
+        _bump(repo / "api" / "values.yaml", _VALUES.format(cpu="200m"))
+        _bump(repo / "worker" / "values.yaml", _VALUES.format(cpu="300m"))
+        (repo / ".git" / "index").write_text("ignored")
+        _write_chart(repo, "team" + os.sep + "new")
+        (repo / "api" / "charts" / "redis").mkdir(parents=True)
+        (repo / "api" / "charts" / "redis" / "values.yaml").write_text("a: 1\n")
+
+        batch = batches.get(timeout=5)
+        assert batch == {repo / "api", repo / "worker", repo / "team" / "new"}
+        with pytest.raises(queue.Empty):
+            batches.get(timeout=0.5)
+
+    def test_deleted_chart_and_lost_events_are_reported(self, repo: Path) -> None:
+        """Test known charts are mapped after deletion and on a rescan."""
+        watcher = ChartsRepoWatcher(repo, lambda _dirs: None, backend="polling")
+        watcher.set_chart_dirs([repo / "api", repo / "worker"])
+        shutil.rmtree(repo / "worker")
+
+        assert watcher.chart_dirs_for_paths(
+            [str(repo / "worker" / "values.yaml"), str(repo / "README.md")],
+        ) == {repo / "worker"}
+        _write_chart(repo, "extra")
+        assert watcher.chart_dirs_for_paths([], rescan=True) == {
+            repo / "api",
+            repo / "extra",
+        }
+
+
+class TestChartsControllerReanalysis:
+    """Tests for re-analyzing only changed chart directories."""
+
+    @pytest.mark.asyncio
+    async def test_reanalysis_splices_cached_charts(self, tmp_path: Path) -> None:
+        """Test changed charts replace their rows and deleted charts drop out."""
+        _write_chart(tmp_path, "api")
+        _write_chart(tmp_path, "worker")
+        _write_chart(tmp_path, "jobs")
+        controller = ChartsController(repo_path=tmp_path, max_workers=2)
+        await controller.refresh()
+        charts = await controller.analyze_all_charts_async()
+        untouched = {chart.name: chart for chart in charts}
+        repo = controller.repo_path
+
+        _bump(repo / "api" / "values.yaml", _VALUES.format(cpu="750m"))
+        shutil.rmtree(repo / "worker")
+        results = await controller.reanalyze_chart_dirs([repo / "api", repo / "worker"])
+
+        assert results[repo / "worker"] == []
+        assert [chart.cpu_request for chart in results[repo / "api"]] == [750.0]
+        cached = await controller.analyze_all_charts_async()
+        assert sorted(chart.name for chart in cached) == ["api", "jobs"]
+        assert next(c for c in cached if c.name == "jobs") is untouched["jobs"]
+        assert next(c for c in cached if c.name == "api").cpu_request == 750.0
@@ -0,0 +1,156 @@
+"""Tests for the shared sub-chart defaults cache."""
+
+from __future__ import annotations
+
+import io
+import os
+import tarfile
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from kubeagle.controllers.charts.parsers.chart_parser import ChartParser
+from kubeagle.controllers.charts.parsers.sub_chart_defaults import (
+    SUB_CHART_DEFAULTS_CACHE,
+    find_vendored_archive,
+)
+
+_UMBRELLA_CHART = """\
+apiVersion: v2
+name: shop
+version: 0.1.0
+dependencies:
+  - name: api
+    repository: file://./api
+  - name: worker
+    repository: file://./worker
+"""
+
+_SUB_CHART_VALUES = """\
+resources:
+  requests:
+    cpu: {cpu}
+    memory: 128Mi
+"""
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache() -> Generator[None, None, None]:
+    SUB_CHART_DEFAULTS_CACHE.clear()
+    yield
+    SUB_CHART_DEFAULTS_CACHE.clear()
+
+
+def _write_archive(archive: Path, members: dict[str, str]) -> None:
+    archive.parent.mkdir(parents=True, exist_ok=True)
+    with tarfile.open(archive, mode="w:gz") as tar:
+        for name, text in members.items():
+            data = text.encode("utf-8")
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
+def _write_umbrella(root: Path) -> Path:
+    chart_path = root / "shop"
+    (chart_path / "api").mkdir(parents=True)
+    (chart_path / "worker").mkdir()
+    (chart_path / "Chart.yaml").write_text(_UMBRELLA_CHART)
+    (chart_path / "api" / "values.yaml").write_text(_SUB_CHART_VALUES.format(cpu="250m"))
+    _write_archive(
+        chart_path / "charts" / "worker-1.2.0.tgz",
+        {
+            "worker/Chart.yaml": "apiVersion: v2\nname: worker\n",
+            "worker/values.yaml": _SUB_CHART_VALUES.format(cpu="750m"),
+        },
+    )
+    return chart_path
+
+
+class TestSubChartDefaultsCache:
+    """Tests for SubChartDefaultsCache lookups and invalidation."""
+
+    def test_documents_are_shared_until_file_changes(self, tmp_path: Path) -> None:
+        """Test repeated loads reuse the parsed document until mtime changes."""
+        values = tmp_path / "values.yaml"
+        values.write_text("a: 1\n")
+
+        first = SUB_CHART_DEFAULTS_CACHE.load_yaml(values)
+        assert SUB_CHART_DEFAULTS_CACHE.load_yaml(tmp_path / "." / "values.yaml") is first
+
+        values.write_text("a: 2\n")
+        stat = values.stat()
+        os.utime(values, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert SUB_CHART_DEFAULTS_CACHE.load_yaml(values) == {"a": 2}
+        assert SUB_CHART_DEFAULTS_CACHE.load_yaml(tmp_path / "missing.yaml") is None
+
+    def test_archive_values_are_streamed(self, tmp_path: Path) -> None:
+        """Test values.yaml is read from a vendored archive without extracting it."""
+        archive = tmp_path / "charts" / "redis-17.3.1.tgz"
+        _write_archive(archive, {"redis/values.yaml": "replicaCount: 3\n"})
+
+        assert find_vendored_archive(tmp_path, "redis") == archive
+        assert find_vendored_archive(tmp_path, "red") is None
+        assert SUB_CHART_DEFAULTS_CACHE.load_archive_values(archive, "redis") == {
+            "replicaCount": 3,
+        }
+        assert SUB_CHART_DEFAULTS_CACHE.load_archive_values(archive, "other") is None
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["charts"]
+
+    def test_umbrellas_share_parsed_sub_chart_defaults(self, tmp_path: Path) -> None:
+        """Test sub-chart defaults come from directories and archives, parsed once."""
+        chart_path = _write_umbrella(tmp_path)
+        parser = ChartParser()
+
+        defaults = parser._load_sub_chart_defaults(chart_path, ["api", "worker"])
+        misses = SUB_CHART_DEFAULTS_CACHE.misses
+        again = parser._load_sub_chart_defaults(chart_path, ["api", "worker"])
+
+        assert defaults["api"]["resources"]["requests"]["cpu"] == "250m"
+        assert defaults["worker"]["resources"]["requests"]["cpu"] == "750m"
+        assert again["api"] is defaults["api"]
+        assert again["worker"] is defaults["worker"]
+        assert SUB_CHART_DEFAULTS_CACHE.misses == misses
+
+    def test_vendored_repository_dependency_is_not_a_sub_chart(
+        self, tmp_path: Path,
+    ) -> None:
+        """Test vendored repository dependencies only supply archive defaults."""
+        chart_path = tmp_path / "shop"
+        chart_path.mkdir()
+        (chart_path / "Chart.yaml").write_text(
+            "apiVersion: v2\n"
+            "name: shop\n"
+            "version: 0.1.0\n"
+            "dependencies:\n"
+            "  - name: redis\n"
+            "    alias: cache\n"
+            "    repository: https://charts.example.com\n"
+            "  - name: missing\n"
+            "    repository: https://charts.example.com\n"
+        )
+        _write_archive(
+            chart_path / "charts" / "redis-17.3.1.tgz",
+            {"redis/values.yaml": _SUB_CHART_VALUES.format(cpu="500m")},
+        )
+        values = {"cache": {"replicaCount": 2}, "missing": {"replicaCount": 1}}
+        parser = ChartParser()
+
+        aliases = parser._identify_umbrella_sub_charts(chart_path, values)
+        defaults = parser._load_sub_chart_defaults(chart_path, ["cache", "missing"])
+
+        assert aliases == []
+        assert list(defaults) == ["cache"]
+        assert defaults["cache"]["resources"]["requests"]["cpu"] == "500m"
+
+    def test_file_dependency_needs_existing_directory(self, tmp_path: Path) -> None:
+        """Test file:// dependencies are sub-charts only when their directory exists."""
+        chart_path = _write_umbrella(tmp_path)
+        (chart_path / "worker").rmdir()
+        values = {"api": {"replicaCount": 2}, "worker": {"replicaCount": 1}}
+
+        aliases = ChartParser()._identify_umbrella_sub_charts(chart_path, values)
+
+        assert aliases == ["api"]
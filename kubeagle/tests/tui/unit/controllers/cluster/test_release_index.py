@@ -0,0 +1,301 @@
+"""Tests for the persistent Helm release index."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from kubeagle.constants.enums import QoSClass
+from kubeagle.controllers.charts.controller import ChartsController
+from kubeagle.controllers.cluster import release_index
+from kubeagle.controllers.cluster.release_index import (
+    HelmReleaseIndex,
+    resolve_cluster_identity,
+)
+from kubeagle.models.charts.chart_info import ChartInfo, HelmReleaseInfo
+
+_CLUSTER = "prod@https://prod.example:6443"
+
+
+def _release(name: str, namespace: str, revision: str) -> HelmReleaseInfo:
+    return HelmReleaseInfo(
+        name=name,
+        namespace=namespace,
+        chart=f"{name}-1.0.0",
+        version="1.0.0",
+        app_version="1.0.0",
+        status="deployed",
+        revision=revision,
+        updated="2026-01-01 00:00:00 +0000 UTC",
+    )
+
+
+def _chart(name: str, namespace: str, replicas: int | None = None) -> ChartInfo:
+    return ChartInfo(
+        name=name,
+        team="unknown",
+        values_file=f"cluster:{namespace}",
+        namespace=namespace,
+        cpu_request=0.0,
+        cpu_limit=0.0,
+        memory_request=0.0,
+        memory_limit=0.0,
+        qos_class=QoSClass.BEST_EFFORT,
+        has_liveness=False,
+        has_readiness=False,
+        has_startup=False,
+        has_anti_affinity=False,
+        has_topology_spread=False,
+        has_topology=False,
+        pdb_enabled=False,
+        pdb_template_exists=False,
+        pdb_min_available=None,
+        pdb_max_unavailable=None,
+        replicas=replicas,
+        priority_class=None,
+    )
+
+
+def _fetched_values(
+    controller: ChartsController, name: str, namespace: str
+) -> dict[str, object]:
+    # Failed fetches leave no raw output (see ``get_live_chart_values``).
+    if name != "broken":
+        controller._live_values_output_cache[(name, namespace)] = "replicaCount: 1\n"
+    return {}
+
+
+class TestHelmReleaseIndex:
+    """Test HelmReleaseIndex delta detection, revision matching and persistence."""
+
+    def test_record_listing_reports_new_and_changed_releases(self, tmp_path: Path) -> None:
+        """Test only new or re-revisioned releases are reported as changed."""
+        index = HelmReleaseIndex(tmp_path / "index.json", _CLUSTER)
+
+        assert index.record_listing(
+            [_release("api", "team-a", "1"), _release("web", "team-b", "4")]
+        ) == [("team-a", "api"), ("team-b", "web")]
+        assert index.record_listing(
+            [_release("api", "team-a", "2"), _release("web", "team-b", "4")]
+        ) == [("team-a", "api")]
+        assert index.record_listing([{"name": "db", "namespace": "team-c"}]) == [
+            ("team-c", "db")
+        ]
+        assert index.record_listing([{"name": "db", "namespace": "team-c"}]) == [
+            ("team-c", "db")
+        ]
+
+    def test_complete_listing_prunes_uninstalled_releases(self, tmp_path: Path) -> None:
+        """Test releases absent from a complete listing are dropped."""
+        index = HelmReleaseIndex(tmp_path / "index.json", _CLUSTER)
+        index.record_listing([_release("api", "team-a", "1"), _release("web", "team-b", "4")])
+
+        index.record_listing([_release("api", "team-a", "1")])
+        assert len(index) == 2
+
+        index.record_listing([_release("api", "team-a", "1")], complete=True)
+        assert len(index) == 1
+        assert index.get("team-b", "web") is None
+
+    def test_cached_charts_require_matching_revision(self, tmp_path: Path) -> None:
+        """Test indexed charts are served only for the revision they were built from."""
+        index = HelmReleaseIndex(tmp_path / "index.json", _CLUSTER)
+        index.record_listing([_release("api", "team-a", "3")])
+        index.store_charts("team-a", "api", "3", [_chart("api", "team-a", replicas=2)])
+
+        cached = index.cached_charts("team-a", "api", "3")
+        assert cached is not None
+        assert [chart.replicas for chart in cached] == [2]
+        assert index.cached_charts("team-a", "api", "4") is None
+        assert index.cached_charts("team-a", "api", "") is None
+
+        index.record_listing([_release("api", "team-a", "4")])
+        assert index.cached_charts("team-a", "api", "3") is None
+        assert (index.hits, index.misses) == (1, 2)
+
+    def test_cached_charts_require_matching_codeowners(self, tmp_path: Path) -> None:
+        """Test rows analyzed with another CODEOWNERS file are not served."""
+        index = HelmReleaseIndex(tmp_path / "index.json", _CLUSTER)
+        index.store_charts(
+            "team-a", "api", "3", [_chart("api", "team-a")], "/repo/CODEOWNERS"
+        )
+
+        assert index.cached_charts("team-a", "api", "3") is None
+        assert index.cached_charts("team-a", "api", "3", "/other/CODEOWNERS") is None
+        assert index.cached_charts("team-a", "api", "3", "/repo/CODEOWNERS") is not None
+
+    def test_save_and_reload_roundtrip(self, tmp_path: Path) -> None:
+        """Test the index survives a restart and ignores other schema versions."""
+        path = tmp_path / "nested" / "index.json"
+        index = HelmReleaseIndex(path, _CLUSTER)
+        index.record_listing([_release("api", "team-a", "3")])
+        index.store_charts("team-a", "api", "3", [_chart("api", "team-a")], "CODEOWNERS")
+        index.save()
+
+        reloaded = HelmReleaseIndex(path, _CLUSTER)
+        reloaded.load()
+        entry = reloaded.get("team-a", "api")
+        assert entry is not None
+        assert entry.chart == "api-1.0.0"
+        assert entry.codeowners == "CODEOWNERS"
+        cached = reloaded.cached_charts("team-a", "api", "3", "CODEOWNERS")
+        assert cached is not None
+        assert cached[0].name == "api"
+
+        path.write_text('{"schema_version": 2, "releases": []}', encoding="utf-8")
+        assert len(HelmReleaseIndex(path, _CLUSTER)) == 0
+
+    def test_entries_are_not_shared_between_clusters(self, tmp_path: Path) -> None:
+        """Test a release indexed in one cluster is never served in another."""
+        path = tmp_path / "index.json"
+        index = HelmReleaseIndex(path, _CLUSTER)
+        index.record_listing([_release("api", "team-a", "1")])
+        index.store_charts("team-a", "api", "1", [_chart("api", "team-a", replicas=5)])
+        index.save()
+
+        other = HelmReleaseIndex(path, "staging@https://staging.example:6443")
+        other.record_listing([_release("api", "team-a", "1")])
+        assert other.cached_charts("team-a", "api", "1") is None
+        assert HelmReleaseIndex(path, "").cached_charts("team-a", "api", "1") is None
+
+    def test_deployed_values_are_not_persisted(self, tmp_path: Path) -> None:
+        """Test raw helm values output never reaches the index file."""
+        path = tmp_path / "index.json"
+        index = HelmReleaseIndex(path, _CLUSTER)
+        chart = _chart("api", "team-a")
+        chart.deployed_values_content = "password: hunter2\n"
+        index.store_charts("team-a", "api", "3", [chart])
+        index.save()
+
+        assert "hunter2" not in path.read_text(encoding="utf-8")
+        cached = HelmReleaseIndex(path, _CLUSTER).cached_charts("team-a", "api", "3")
+        assert cached is not None
+        assert cached[0].deployed_values_content is None
+
+    def test_load_follows_kube_context_switches(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an index without a fixed cluster re-resolves it on every load."""
+        monkeypatch.setattr(
+            release_index,
+            "release_index_path",
+            lambda cluster: tmp_path / f"{cluster.split('@')[0]}.json",
+        )
+        current = {"cluster": _CLUSTER}
+        monkeypatch.setattr(
+            release_index,
+            "resolve_cluster_identity",
+            lambda _context: current["cluster"],
+        )
+        index = HelmReleaseIndex()
+        index.load()
+        index.record_listing([_release("api", "team-a", "1")])
+        index.store_charts("team-a", "api", "1", [_chart("api", "team-a")])
+        index.save()
+
+        current["cluster"] = "staging@https://staging.example:6443"
+        index.load()
+        assert index.path == tmp_path / "staging.json"
+        assert index.cached_charts("team-a", "api", "1") is None
+
+        current["cluster"] = ""
+        index.load()
+        index.store_charts("team-a", "api", "1", [_chart("api", "team-a")])
+        assert index.cached_charts("team-a", "api", "1") is None
+
+    def test_resolve_cluster_identity_reads_kubeconfig(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the identity pairs the context name with its API server URL."""
+        config = {
+            "current-context": "prod",
+            "clusters": [{"name": "prod", "cluster": {"server": "https://prod:6443"}}],
+        }
+        commands: list[list[str]] = []
+
+        def _fake_run(cmd: list[str], **_kwargs: object) -> SimpleNamespace:
+            commands.append(cmd)
+            return SimpleNamespace(returncode=0, stdout=json.dumps(config))
+
+        monkeypatch.setattr(subprocess, "run", _fake_run)
+        assert resolve_cluster_identity(None) == "prod@https://prod:6443"
+        assert resolve_cluster_identity("other") == "other@https://prod:6443"
+        assert commands[1][-2:] == ["--context", "other"]
+
+        config["clusters"] = []
+        assert resolve_cluster_identity(None) == ""
+
+    @pytest.mark.asyncio
+    async def test_cluster_analysis_skips_unchanged_revisions(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a refresh only fetches values of releases whose revision changed."""
+        index = HelmReleaseIndex(tmp_path / "index.json", _CLUSTER)
+        controller = ChartsController(
+            repo_path=tmp_path, max_workers=2, release_index=index
+        )
+        controller.get_live_chart_values = AsyncMock(  # type: ignore[method-assign]
+            side_effect=lambda name, namespace: _fetched_values(controller, name, namespace)
+        )
+        monkeypatch.setattr(
+            controller,
+            "analyze_live_chart",
+            lambda release, namespace, _values: _chart(release, namespace),
+        )
+
+        first = [
+            {"name": "api", "namespace": "team-a", "revision": "1"},
+            {"name": "web", "namespace": "team-b", "revision": "7"},
+        ]
+        charts = await controller.analyze_all_charts_cluster_async(
+            releases=first, force_refresh=True
+        )
+        assert sorted(chart.name for chart in charts) == ["api", "web"]
+        assert controller.get_live_chart_values.await_count == 2
+        assert (tmp_path / "index.json").exists()
+
+        second = [
+            {"name": "api", "namespace": "team-a", "revision": "2"},
+            {"name": "web", "namespace": "team-b", "revision": "7"},
+        ]
+        charts = await controller.analyze_all_charts_cluster_async(
+            releases=second, force_refresh=True
+        )
+        assert sorted(chart.name for chart in charts) == ["api", "web"]
+        assert controller.get_live_chart_values.await_count == 3
+        controller.get_live_chart_values.assert_awaited_with("api", "team-a")
+
+    @pytest.mark.asyncio
+    async def test_cluster_analysis_does_not_index_failed_value_fetches(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a release whose values fetch failed is fetched again next time."""
+        index = HelmReleaseIndex(tmp_path / "index.json", _CLUSTER)
+        controller = ChartsController(
+            repo_path=tmp_path, max_workers=2, release_index=index
+        )
+        controller.get_live_chart_values = AsyncMock(  # type: ignore[method-assign]
+            side_effect=lambda name, namespace: _fetched_values(controller, name, namespace)
+        )
+        monkeypatch.setattr(
+            controller,
+            "analyze_live_chart",
+            lambda release, namespace, _values: _chart(release, namespace),
+        )
+        releases = [
+            {"name": "api", "namespace": "team-a", "revision": "1"},
+            {"name": "broken", "namespace": "team-b", "revision": "2"},
+        ]
+
+        for _ in range(2):
+            await controller.analyze_all_charts_cluster_async(
+                releases=releases, force_refresh=True
+            )
+
+        assert controller.get_live_chart_values.await_count == 3
+        assert index.cached_charts("team-b", "broken", "2") is None
@@ -0,0 +1,171 @@
+"""Tests for the compiled CODEOWNERS matcher."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from kubeagle.controllers.team.fetchers.team_fetcher import TeamFetcher
+from kubeagle.controllers.team.mappers.team_mapper import TeamMapper
+from kubeagle.controllers.team.parsers.codeowners_parser import (
+    CodeownersMatcher,
+    load_codeowners_file,
+)
+
+_CODEOWNERS = """\
+# ==========
+# TEAM: platform_team @org/platform
+# ==========
+* @org/platform
+/apps/ @org/platform
+
+# @org/mobile-squad
+/apps/mobile/ @org/mobile-squad
+**/payments/ @org/payments
+/apps/*/worker-? @org/workers
+"""
+
+
+class TestCodeownersMatcher:
+    """Tests for gitignore-style matching with last-match-wins."""
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("apps/mobile/ios", 3),
+            ("apps/mobile", 3),
+            ("apps/web", 1),
+            ("apps/web/worker-1", 5),
+            ("apps/web/worker-10", 1),
+            ("apps/web/worker-1/nested", 5),
+            ("services/payments/api", 4),
+            ("payments", 4),
+            ("other/chart", 0),
+            ("approved/chart", 0),
+            ("docs/api", 6),
+            ("docs/a/b", 6),
+            ("docs/index", 0),
+        ],
+    )
+    def test_last_matching_rule_wins(self, path: str, expected: int) -> None:
+        """Test the owning rule of a path is the last one that matches it."""
+        matcher = CodeownersMatcher(
+            [
+                "*",
+                "/apps/",
+                "^regex",
+                "/apps/mobile/",
+                "**/payments/",
+                "/apps/*/worker-?",
+                "/docs/[a-c]*",
+            ]
+        )
+
+        assert matcher.match(path) == expected
+
+    def test_unanchored_name_matches_any_depth(self) -> None:
+        """Test slash-free literal patterns match a directory at any level."""
+        matcher = CodeownersMatcher(["/apps/", "charts"])
+
+        assert matcher.match("apps/charts/api") == 1
+        assert matcher.match("apps/chartsx") == 0
+        assert matcher.match("tools") is None
+
+
+class TestCodeownersFile:
+    """Tests for loading and caching parsed CODEOWNERS files."""
+
+    def test_file_is_cached_until_modified(self, tmp_path: Path) -> None:
+        """Test parsed files are reused until mtime or size changes."""
+        codeowners = tmp_path / "CODEOWNERS"
+        codeowners.write_text("/api/ @org/api\n", encoding="utf-8")
+
+        first = load_codeowners_file(codeowners)
+        assert first is not None
+        assert load_codeowners_file(codeowners) is first
+
+        codeowners.write_text("/api/ @org/api\n/web/ @org/web\n", encoding="utf-8")
+        stat = codeowners.stat()
+        os.utime(codeowners, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = load_codeowners_file(codeowners)
+
+        assert second is not first
+        assert second is not None
+        assert [rule.pattern for rule in second.rules] == ["/api/", "/web/"]
+
+    def test_github_directory_uses_repository_root(self, tmp_path: Path) -> None:
+        """Test .github/CODEOWNERS patterns are relative to the repository."""
+        codeowners = tmp_path / ".github" / "CODEOWNERS"
+        codeowners.parent.mkdir()
+        codeowners.write_text("/charts/api/ @org/api\n", encoding="utf-8")
+
+        parsed = load_codeowners_file(codeowners)
+
+        assert parsed is not None
+        assert parsed.match_rule(tmp_path.resolve() / "charts" / "api") == 0
+        assert parsed.match_rule(tmp_path.resolve() / "charts" / "web") is None
+
+
+class TestSharedTeamResolution:
+    """Tests for TeamMapper and TeamFetcher sharing the compiled matcher."""
+
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> Path:
+        (tmp_path / "CODEOWNERS").write_text(_CODEOWNERS, encoding="utf-8")
+        for chart in ("apps/mobile/ios", "apps/web", "services/payments/api", "tools/cli"):
+            chart_dir = tmp_path / chart
+            chart_dir.mkdir(parents=True)
+            (chart_dir / "Chart.yaml").write_text("apiVersion: v2\nname: demo\n")
+        return tmp_path.resolve()
+
+    def test_mapper_and_fetcher_keep_their_team_names(self, repo: Path) -> None:
+        """Test both classes match paths alike but keep their normalization."""
+        mapper = TeamMapper(repo / "CODEOWNERS")
+        fetcher = TeamFetcher()
+        fetcher.load_codeowners(repo / "CODEOWNERS")
+
+        teams = mapper.resolve_teams(
+            [repo / "apps" / "mobile" / "ios", repo / "apps" / "web", repo / "tools" / "cli"]
+        )
+
+        assert teams == {
+            repo / "apps" / "mobile" / "ios": "Mobile-Squad",
+            repo / "apps" / "web": "Platform-Team",
+            repo / "tools" / "cli": "Platform-Team",
+        }
+        assert fetcher.get_team_for_path(repo / "apps" / "mobile" / "ios") == "Mobile Squad"
+        assert fetcher.get_team_for_path(repo / "services" / "payments" / "api") == "Mobile Squad"
+        assert mapper.team_mapping["apps/mobile"] == "Mobile-Squad"
+        assert [team.pattern for team in fetcher.teams] == [
+            team.pattern for team in mapper.teams
+        ]
+
+    def test_sibling_and_values_inference_are_memoized(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test sibling listing and values-file reads happen once per chart."""
+        parent = tmp_path / "group"
+        for name in ("a", "b", "c"):
+            (parent / name).mkdir(parents=True)
+            (parent / name / "Chart.yaml").write_text("apiVersion: v2\nname: demo\n")
+        for name in ("b", "c"):
+            (parent / name / "values.yaml").write_text("project_team: data_team\n")
+
+        mapper = TeamMapper()
+        opened: list[str] = []
+        real_open = open
+
+        def _tracking_open(file: object, *args: object, **kwargs: object):  # type: ignore[no-untyped-def]
+            opened.append(str(file))
+            return real_open(file, *args, **kwargs)  # type: ignore[call-overload]
+
+        monkeypatch.setattr("builtins.open", _tracking_open)
+        for _ in range(3):
+            assert mapper._infer_team_from_siblings(parent / "a") == "Data-Team"
+
+        assert sorted(opened) == [
+            str(parent / "b" / "values.yaml"),
+            str(parent / "c" / "values.yaml"),
+        ]
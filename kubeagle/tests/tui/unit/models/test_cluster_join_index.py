@@ -0,0 +1,152 @@
+"""Tests for the release/workload join index."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from kubeagle.controllers.cluster.controller import ClusterController
+from kubeagle.models.cache.cluster_join_index import (
+    ClusterJoinIndex,
+    WorkloadReplicaMap,
+    get_cluster_join_index,
+)
+from kubeagle.models.charts.chart_info import HelmReleaseInfo
+from kubeagle.models.core.workload_inventory_info import WorkloadInventoryInfo
+
+
+def _release(name: str, namespace: str, chart: str = "") -> HelmReleaseInfo:
+    return HelmReleaseInfo(
+        name=name,
+        namespace=namespace,
+        chart=chart or f"{name}-1.0.0",
+        version="1.0.0",
+        app_version="1.0.0",
+        status="deployed",
+    )
+
+
+def _workload(
+    name: str,
+    namespace: str,
+    *,
+    kind: str = "Deployment",
+    replicas: int | None = 1,
+    release: str | None = None,
+) -> WorkloadInventoryInfo:
+    return WorkloadInventoryInfo(
+        name=name,
+        namespace=namespace,
+        kind=kind,
+        desired_replicas=replicas,
+        ready_replicas=replicas,
+        status="Ready",
+        helm_release=release,
+    )
+
+
+class TestClusterJoinIndex:
+    """Test ClusterJoinIndex joins and per-namespace replacement."""
+
+    def test_release_lookups_follow_namespace_updates(self) -> None:
+        """Test replacing one namespace leaves the others intact."""
+        index = ClusterJoinIndex()
+        assert index.releases_loaded is False
+
+        index.replace_releases(
+            [_release("api", "team-a", "api-chart-2.1.0"), _release("web", "team-b")]
+        )
+        assert index.release_chart_label("api", "team-a") == "api"
+        assert index.release_names() == frozenset({"api", "web"})
+
+        index.replace_releases([_release("db", "team-a")], namespace="team-a")
+        assert index.release("api", "team-a") is None
+        assert index.has_release_name("web")
+        assert index.release_names() == frozenset({"db", "web"})
+        assert index.releases_loaded is True
+
+    def test_workloads_join_releases_and_replicas(self) -> None:
+        """Test workloads are linked to releases and replicas indexed by name."""
+        index = ClusterJoinIndex()
+        assert index.replica_map() is None
+
+        index.replace_workloads(
+            [
+                _workload("api", "prod", replicas=3, release="api"),
+                _workload("api", "prod", kind="StatefulSet", replicas=2, release="api"),
+                _workload("api", "staging", replicas=1, release="api"),
+                _workload("api-migrate", "prod", kind="Job", replicas=1, release="api"),
+            ]
+        )
+
+        assert index.desired_replicas("api", "prod") == 5
+        assert index.desired_replicas("api-migrate", "prod") is None
+        assert index.replicas_by_namespace("api") == {"prod": 5, "staging": 1}
+        assert index.helm_release_of("api-migrate", "prod") == "api"
+        assert {
+            (row.name, row.kind) for row in index.workloads_for_release("api", "prod")
+        } == {("api", "Deployment"), ("api", "StatefulSet"), ("api-migrate", "Job")}
+
+        replica_map = index.replica_map()
+        assert replica_map == {("api", "prod"): 5, ("api", "staging"): 1}
+        assert sorted(replica_map.replicas_named("api")) == [1, 5]
+
+        index.replace_workloads([], namespace="prod")
+        assert index.workloads_for_release("api", "prod") == []
+        assert index.replicas_by_namespace("api") == {"staging": 1}
+        assert index.replica_map() == {("api", "staging"): 1}
+
+    def test_replica_map_from_plain_mapping(self) -> None:
+        """Test WorkloadReplicaMap indexes any mapping by workload name."""
+        replica_map = WorkloadReplicaMap({("svc", "a"): 2, ("svc", "b"): 4, ("other", "a"): 1})
+
+        assert len(replica_map) == 3
+        assert replica_map[("svc", "b")] == 4
+        assert sorted(replica_map.replicas_named("svc")) == [2, 4]
+        assert replica_map.replicas_named("missing") == []
+
+    def test_registry_returns_one_index_per_context(self) -> None:
+        """Test the process-wide registry shares an index per context."""
+        assert get_cluster_join_index("ctx-join-test") is get_cluster_join_index(
+            "ctx-join-test"
+        )
+        assert get_cluster_join_index("ctx-join-test") is not get_cluster_join_index(
+            "ctx-join-other"
+        )
+
+    @pytest.mark.asyncio
+    async def test_cluster_controller_feeds_index_and_resolves_charts(self) -> None:
+        """Test release listings feed the index used for single-replica chart names."""
+        index = ClusterJoinIndex()
+        controller = ClusterController(context="ctx", join_index=index)
+        controller._list_cluster_namespaces = AsyncMock(  # type: ignore[method-assign]
+            return_value=["ns-a"]
+        )
+        controller._cluster_fetcher.fetch_helm_releases_for_namespace = AsyncMock(  # type: ignore[method-assign]
+            return_value=[_release("api", "ns-a", "api-chart-1.0.0")]
+        )
+        controller._run_kubectl_cached = AsyncMock(  # type: ignore[method-assign]
+            return_value=json.dumps(
+                {
+                    "items": [
+                        {
+                            "kind": "Deployment",
+                            "metadata": {
+                                "name": "api",
+                                "namespace": "ns-a",
+                                "labels": {"app.kubernetes.io/instance": "api"},
+                            },
+                            "spec": {"replicas": 1},
+                            "status": {"readyReplicas": 1},
+                        }
+                    ]
+                }
+            )
+        )
+
+        rows = await controller._fetch_single_replica_incremental()
+
+        assert index.release("api", "ns-a") is not None
+        assert [(row.name, row.chart_name) for row in rows] == [("api", "api")]
@@ -29,6 +29,7 @@ class TestAppSettings:
         assert settings.refresh_interval > 0
         assert settings.optimizer_analysis_source == "auto"
         assert settings.verify_fixes_with_render is True
+        assert settings.watch_charts_repo is False
         assert settings.helm_template_timeout_seconds == 30
         assert settings.ai_fix_llm_provider == "codex"
         assert settings.ai_fix_codex_model == "auto"
@@ -0,0 +1,342 @@
+"""Unit tests for the persistent AI full-fix job scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from types import SimpleNamespace
+
+from kubeagle.constants.enums import Severity
+from kubeagle.models.analysis.violation import ViolationResult
+from kubeagle.optimizer.ai_fix_jobs import (
+    AIFixJobScheduler,
+    AIFixJobSpec,
+    AIFixJobStore,
+)
+from kubeagle.optimizer.full_ai_fixer import AIFullFixResult, AIFullFixStagedArtifact
+from kubeagle.optimizer.llm_cli_runner import LLMProvider
+from kubeagle.optimizer.llm_patch_protocol import FullFixResponse
+
+_WAIT_SECONDS = 10
+
+
+def _build_violation(rule_id: str = "PRB001") -> ViolationResult:
+    return ViolationResult(
+        id=rule_id,
+        chart_name="demo",
+        rule_name="Missing Probe",
+        rule_id=rule_id,
+        category="probes",
+        severity=Severity.WARNING,
+        description="missing probe",
+        current_value="none",
+        recommended_value="add probe",
+        fix_available=True,
+    )
+
+
+def _prepare_chart(tmp_path: Path, name: str = "chart") -> AIFixJobSpec:
+    chart_dir = tmp_path / name
+    (chart_dir / "templates").mkdir(parents=True)
+    (chart_dir / "Chart.yaml").write_text(
+        "apiVersion: v2\nname: demo\nversion: 0.1.0\n",
+        encoding="utf-8",
+    )
+    (chart_dir / "templates" / "deployment.yaml").write_text(
+        "apiVersion: apps/v1\nkind: Deployment\nmetadata:\n  name: demo\n",
+        encoding="utf-8",
+    )
+    values_path = chart_dir / "values.yaml"
+    values_path.write_text("replicaCount: 1\n", encoding="utf-8")
+    return AIFixJobSpec(
+        chart_dir=chart_dir,
+        values_path=values_path,
+        violations=[_build_violation()],
+        preferred_provider=LLMProvider.CODEX,
+    )
+
+
+class _FakeProvider:
+    """Local stand-in for an LLM provider that stages a values edit."""
+
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        self.calls: list[Path] = []
+        self.gate = gate
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, spec: AIFixJobSpec, status: Callable[[str], None]) -> AIFullFixResult:
+        with self._lock:
+            self.calls.append(spec.chart_dir)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            status("Generating fix...")
+            if self.gate is not None:
+                assert self.gate.wait(_WAIT_SECONDS)
+            stage_root = Path(tempfile.mkdtemp(prefix="kubeagle-direct-edit-"))
+            staged_chart_dir = stage_root / spec.chart_dir.name
+            shutil.copytree(spec.chart_dir, staged_chart_dir)
+            (staged_chart_dir / "values.yaml").write_text("replicaCount: 2\n", encoding="utf-8")
+            return AIFullFixResult(
+                ok=True,
+                status="ok",
+                provider="codex",
+                response=FullFixResponse(
+                    result="ok",
+                    summary="raised replicas",
+                    values_patch={"replicaCount": 2},
+                ),
+                staged_artifact=AIFullFixStagedArtifact(
+                    stage_root=stage_root,
+                    staged_chart_dir=staged_chart_dir,
+                    rel_values_path="values.yaml",
+                    changed_rel_paths=["values.yaml"],
+                    provider="codex",
+                ),
+            )
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestAIFixJobScheduler:
+    """Test AIFixJobScheduler deduplication, caching, pooling and resume."""
+
+    def test_identical_jobs_share_one_run_and_get_private_workspaces(
+        self, tmp_path: Path
+    ) -> None:
+        """Test duplicate submits run once and each caller owns its workspace."""
+        gate = threading.Event()
+        provider = _FakeProvider(gate)
+        scheduler = AIFixJobScheduler(AIFixJobStore(tmp_path / "jobs"), runner=provider)
+        spec = _prepare_chart(tmp_path)
+        statuses: list[str] = []
+
+        first = scheduler.submit(spec, status_callback=statuses.append)
+        second = scheduler.submit(spec)
+        gate.set()
+        first_result = first.result(_WAIT_SECONDS)
+        second_result = second.result(_WAIT_SECONDS)
+
+        assert len(provider.calls) == 1
+        assert scheduler.dedup_hits == 1
+        assert statuses == ["Generating fix..."]
+        assert first_result.staged_artifact is not None
+        assert second_result.staged_artifact is not None
+        assert first_result.staged_artifact.stage_root != second_result.staged_artifact.stage_root
+        shutil.rmtree(first_result.staged_artifact.stage_root)
+
+        cached = scheduler.submit(spec).result(_WAIT_SECONDS)
+        assert len(provider.calls) == 1
+        assert scheduler.cache_hits == 1
+        assert cached.staged_artifact is not None
+        assert (cached.staged_artifact.staged_chart_dir / "values.yaml").read_text(
+            encoding="utf-8"
+        ) == "replicaCount: 2\n"
+
+    def test_changed_chart_or_refresh_runs_again(self, tmp_path: Path) -> None:
+        """Test edits to the chart and forced refreshes bypass the result cache."""
+        provider = _FakeProvider()
+        scheduler = AIFixJobScheduler(AIFixJobStore(tmp_path / "jobs"), runner=provider)
+        spec = _prepare_chart(tmp_path)
+
+        scheduler.submit(spec).result(_WAIT_SECONDS)
+        scheduler.submit(spec, use_cache=False).result(_WAIT_SECONDS)
+        assert len(provider.calls) == 2
+
+        values = spec.values_path
+        values.write_text("replicaCount: 5\n", encoding="utf-8")
+        stat = values.stat()
+        os.utime(values, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        scheduler.submit(spec).result(_WAIT_SECONDS)
+        assert len(provider.calls) == 3
+
+    def test_provider_pool_is_bounded_and_jobs_are_timed(self, tmp_path: Path) -> None:
+        """Test one provider never runs more jobs than its pool allows."""
+        provider = _FakeProvider()
+        scheduler = AIFixJobScheduler(
+            AIFixJobStore(tmp_path / "jobs"),
+            runner=provider,
+            max_workers_per_provider=1,
+        )
+        futures = [
+            scheduler.submit(_prepare_chart(tmp_path, f"chart-{index}"))
+            for index in range(3)
+        ]
+        for future in futures:
+            assert future.result(_WAIT_SECONDS).ok
+
+        assert provider.max_active == 1
+        metrics = scheduler.metrics()
+        assert [record.status for record in metrics] == ["done", "done", "done"]
+        assert all(record.wait_seconds is not None for record in metrics)
+        assert all(record.run_seconds is not None for record in metrics)
+
+    def test_cancelled_waiter_does_not_stall_the_queue(
+        self, monkeypatch, tmp_path: Path
+    ) -> None:
+        """Test a cancelled awaiting task frees the pool and gets no workspace clone."""
+        workspaces = tmp_path / "workspaces"
+        workspaces.mkdir()
+        monkeypatch.setattr(tempfile, "tempdir", str(workspaces))
+        gate = threading.Event()
+        scheduler = AIFixJobScheduler(
+            AIFixJobStore(tmp_path / "jobs"),
+            runner=_FakeProvider(gate),
+            max_workers_per_provider=1,
+        )
+        cancelled_spec = _prepare_chart(tmp_path, "chart-0")
+        queued_spec = _prepare_chart(tmp_path, "chart-1")
+
+        async def _cancel_waiter() -> None:
+            waiter = asyncio.ensure_future(
+                asyncio.wrap_future(scheduler.submit(cancelled_spec))
+            )
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+
+        asyncio.run(_cancel_waiter())
+        queued = scheduler.submit(queued_spec)
+        gate.set()
+
+        assert queued.result(_WAIT_SECONDS).ok
+        deadline = time.monotonic() + _WAIT_SECONDS
+        while scheduler.pending_count() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert scheduler.pending_count() == 0
+        assert [record.status for record in scheduler.metrics()] == ["done", "done"]
+        # One staged workspace per job, plus the clone handed to the live waiter.
+        assert len(list(workspaces.iterdir())) == 3
+
+    def test_queued_and_interrupted_jobs_resume_after_restart(self, tmp_path: Path) -> None:
+        """Test interrupted jobs are offered after a restart and run once resumed."""
+        gate = threading.Event()
+        store_dir = tmp_path / "jobs"
+        stalled = AIFixJobScheduler(
+            AIFixJobStore(store_dir),
+            runner=_FakeProvider(gate),
+            max_workers_per_provider=1,
+        )
+        specs = [_prepare_chart(tmp_path, f"chart-{index}") for index in range(2)]
+        for spec in specs:
+            stalled.submit(spec)
+        assert stalled.pending_count() == 2
+
+        provider = _FakeProvider()
+        restarted = AIFixJobScheduler(AIFixJobStore(store_dir), runner=provider)
+        try:
+            assert restarted.load() == 2
+            assert provider.calls == []
+            assert [spec.chart_dir for spec in restarted.interrupted_jobs().values()] == [
+                spec.chart_dir for spec in specs
+            ]
+            assert restarted.resume() == 2
+            assert restarted.interrupted_jobs() == {}
+            results = [restarted.submit(spec).result(_WAIT_SECONDS) for spec in specs]
+        finally:
+            gate.set()
+        deadline = time.monotonic() + _WAIT_SECONDS
+        while stalled.pending_count() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert all(result.ok for result in results)
+        assert sorted(path.name for path in provider.calls) == ["chart-0", "chart-1"]
+        assert restarted.dedup_hits + restarted.cache_hits == 2
+
+        reloaded = AIFixJobScheduler(AIFixJobStore(store_dir), runner=_FakeProvider())
+        assert reloaded.load() == 0
+        assert reloaded.submit(specs[0]).result(_WAIT_SECONDS).ok
+        assert reloaded.cache_hits == 1
+
+    def test_interrupted_jobs_can_be_discarded(self, tmp_path: Path) -> None:
+        """Test discarded interrupted jobs never run and their records are removed."""
+        gate = threading.Event()
+        store_dir = tmp_path / "jobs"
+        stalled = AIFixJobScheduler(
+            AIFixJobStore(store_dir),
+            runner=_FakeProvider(gate),
+            max_workers_per_provider=1,
+        )
+        specs = [_prepare_chart(tmp_path, f"chart-{index}") for index in range(2)]
+        for spec in specs:
+            stalled.submit(spec)
+
+        provider = _FakeProvider()
+        restarted = AIFixJobScheduler(AIFixJobStore(store_dir), runner=provider)
+        try:
+            assert restarted.load() == 2
+            first_id = next(iter(restarted.interrupted_jobs()))
+            assert restarted.discard_interrupted([first_id]) == 1
+            assert restarted.discard_interrupted() == 1
+            assert list(store_dir.glob("*.json")) == []
+        finally:
+            gate.set()
+        deadline = time.monotonic() + _WAIT_SECONDS
+        while stalled.pending_count() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert restarted.resume() == 0
+        assert provider.calls == []
+
+    def test_finished_cache_is_bounded_by_disk_size(self, tmp_path: Path) -> None:
+        """Test the oldest finished jobs are dropped once their disk usage exceeds the budget."""
+        scheduler = AIFixJobScheduler(
+            AIFixJobStore(tmp_path / "jobs"),
+            runner=_FakeProvider(),
+            finished_jobs_max_bytes=1,
+        )
+        specs = [_prepare_chart(tmp_path, f"chart-{index}") for index in range(3)]
+
+        results = [scheduler.submit(spec).result(_WAIT_SECONDS) for spec in specs]
+        deadline = time.monotonic() + _WAIT_SECONDS
+        while scheduler.pending_count() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert all(result.ok for result in results)
+        assert len(scheduler.metrics()) == 1
+        assert scheduler.submit(specs[-1]).result(_WAIT_SECONDS).ok
+        assert scheduler.cache_hits == 1
+
+    def test_default_runner_uses_direct_edit_flow(self, monkeypatch, tmp_path: Path) -> None:
+        """Test jobs run the real direct-edit flow against a fake local provider."""
+        spec = _prepare_chart(tmp_path)
+        monkeypatch.setattr(
+            "kubeagle.optimizer.full_ai_fixer.provider_supports_direct_edit",
+            lambda provider: provider == LLMProvider.CODEX,
+        )
+
+        def _fake_direct_runner(**kwargs):
+            staged_dir = Path(kwargs["cwd"])
+            (staged_dir / "values.yaml").write_text("replicaCount: 3\n", encoding="utf-8")
+            return SimpleNamespace(
+                ok=True,
+                log_text="direct edit ok",
+                error_message="",
+                changed_rel_paths=["values.yaml"],
+                stdout_tail="",
+                stderr_tail="",
+            )
+
+        monkeypatch.setattr(
+            "kubeagle.optimizer.full_ai_fixer.run_llm_direct_edit",
+            _fake_direct_runner,
+        )
+        scheduler = AIFixJobScheduler(AIFixJobStore(tmp_path / "jobs"))
+
+        result = scheduler.submit(spec).result(_WAIT_SECONDS)
+
+        assert result.ok is True
+        assert result.response is not None
+        assert result.response.values_patch.get("replicaCount") == 3
+        assert result.staged_artifact is not None
+        assert result.staged_artifact.changed_rel_paths == ["values.yaml"]
+        assert spec.values_path.read_text(encoding="utf-8") == "replicaCount: 1\n"
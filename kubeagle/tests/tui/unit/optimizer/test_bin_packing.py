@@ -0,0 +1,88 @@
+"""Tests for first-fit-decreasing replica packing."""
+
+from __future__ import annotations
+
+from kubeagle.optimizer.bin_packing import (
+    group_replica_demands,
+    pack_first_fit_decreasing,
+)
+
+_GI = 1024**3
+
+
+def _naive_ffd(
+    demands: list[tuple[float, float, int]],
+    cpu_capacity: float,
+    memory_capacity: float,
+    max_pods: int,
+) -> int:
+    ordered = sorted(
+        demands,
+        key=lambda demand: max(demand[0] / cpu_capacity, demand[1] / memory_capacity),
+        reverse=True,
+    )
+    nodes: list[list[float]] = []
+    for cpu, mem, count in ordered:
+        for _ in range(count):
+            for node in nodes:
+                if node[0] >= cpu and node[1] >= mem and node[2] >= 1:
+                    node[0] -= cpu
+                    node[1] -= mem
+                    node[2] -= 1
+                    break
+            else:
+                nodes.append([cpu_capacity - cpu, memory_capacity - mem, max_pods - 1])
+    return len(nodes)
+
+
+class TestPackFirstFitDecreasing:
+    """Tests for pack_first_fit_decreasing."""
+
+    def test_fragmentation_needs_more_nodes_than_volume(self) -> None:
+        """Test replicas that cannot share a node each get their own."""
+        result = pack_first_fit_decreasing(
+            [(600.0, 1 * _GI, 3)], cpu_capacity=1000.0, memory_capacity=8 * _GI, max_pods=29,
+        )
+
+        assert result.nodes == 3
+
+    def test_pod_cap_limits_replicas_per_node(self) -> None:
+        """Test tiny replicas are bounded by max pods per node."""
+        result = pack_first_fit_decreasing(
+            [(1.0, 1024.0, 100)], cpu_capacity=4000.0, memory_capacity=16 * _GI, max_pods=10,
+        )
+
+        assert result.nodes == 10
+
+    def test_oversized_replicas_are_unschedulable(self) -> None:
+        """Test replicas larger than the node are reported, not packed."""
+        result = pack_first_fit_decreasing(
+            [(5000.0, 1 * _GI, 2), (500.0, 1 * _GI, 2)],
+            cpu_capacity=4000.0,
+            memory_capacity=16 * _GI,
+            max_pods=29,
+        )
+
+        assert result.nodes == 1
+        assert result.unschedulable == 2
+        assert result.unschedulable_cpu == 10000.0
+
+    def test_node_runs_match_per_replica_packing(self) -> None:
+        """Test grouped packing opens the same nodes as packing one by one."""
+        demands = group_replica_demands(
+            [
+                (700.0, 1 * _GI, 5),
+                (300.0, 3 * _GI, 7),
+                (300.0, 3 * _GI, 2),
+                (100.0, 0.5 * _GI, 40),
+                (0.0, 0.0, 9),
+            ]
+        )
+
+        result = pack_first_fit_decreasing(
+            demands, cpu_capacity=2000.0, memory_capacity=8 * _GI, max_pods=12,
+        )
+
+        assert len(demands) == 4
+        assert result.nodes == _naive_ffd(demands, 2000.0, 8 * _GI, 12)
+
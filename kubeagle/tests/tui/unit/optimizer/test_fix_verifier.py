@@ -1,8 +1,14 @@
-"""Unit tests for fix verifier dataclasses."""
+"""Unit tests for fix verifier dataclasses and bulk verification."""
 
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Any
+
+import yaml
+
 from kubeagle.optimizer import fix_verifier
+from kubeagle.optimizer.helm_renderer import HelmRenderResult
 
 
 def test_fix_verification_result_dataclass() -> None:
@@ -26,3 +32,203 @@ def test_full_fix_bundle_verification_result_dataclass() -> None:
     )
     assert result.status == "not_run"
     assert result.per_violation == {}
+
+
+def _fake_renderer(renders: list[str]):
+    def _render(**kwargs: Any) -> HelmRenderResult:
+        content = str(kwargs["values_content"])
+        renders.append(content)
+        values = yaml.safe_load(content) or {}
+        if values.get("broken"):
+            return HelmRenderResult(
+                ok=False,
+                chart_dir=kwargs["chart_dir"],
+                values_file=kwargs["values_file"],
+                error_kind="render_failed",
+                error_message="template: nil pointer",
+            )
+        container: dict[str, Any] = {"name": "app", "resources": values.get("resources", {})}
+        if "readinessProbe" in values:
+            container["readinessProbe"] = values["readinessProbe"]
+        return HelmRenderResult(
+            ok=True,
+            chart_dir=kwargs["chart_dir"],
+            values_file=kwargs["values_file"],
+            docs=[
+                {
+                    "kind": "Deployment",
+                    "metadata": {"name": "app"},
+                    "spec": {"template": {"spec": {"containers": [container]}}},
+                }
+            ],
+        )
+
+    return _render
+
+
+def _write_values(tmp_path: Path) -> Path:
+    values_path = tmp_path / "values.yaml"
+    values_path.write_text(
+        "resources:\n  requests:\n    cpu: 100m\n",
+        encoding="utf-8",
+    )
+    return values_path
+
+
+def test_bulk_verification_renders_merged_values_once(tmp_path: Path) -> None:
+    """All fixes of a chart should be verified from one merged render."""
+    values_path = _write_values(tmp_path)
+    renders: list[str] = []
+    candidates = [
+        fix_verifier.ValuesFixCandidate(
+            key="RES003",
+            rule_id="RES003",
+            values_patch={"resources": {"limits": {"memory": "256Mi"}}},
+        ),
+        fix_verifier.ValuesFixCandidate(
+            key="PRB002",
+            rule_id="PRB002",
+            values_patch={"readinessProbe": {"tcpSocket": {"port": 80}}},
+        ),
+        fix_verifier.ValuesFixCandidate(
+            key="PRB001",
+            rule_id="PRB001",
+            values_patch={"podAnnotations": {"probe": "later"}},
+        ),
+    ]
+
+    result = fix_verifier.verify_values_fixes_bulk(
+        chart_dir=tmp_path,
+        values_path=values_path,
+        candidates=candidates,
+        release_name="app",
+        renderer=_fake_renderer(renders),
+    )
+
+    assert result.render_count == 1
+    assert "256Mi" in renders[0] and "tcpSocket" in renders[0]
+    assert result.per_fix["RES003"].status == "verified"
+    assert result.per_fix["PRB002"].status == "verified"
+    assert result.per_fix["PRB001"].status == "unresolved"
+    assert result.per_fix["PRB001"].after_has_violation is True
+
+
+def test_bulk_verification_bisects_only_when_merged_render_fails(tmp_path: Path) -> None:
+    """A failing merged render should isolate the breaking fix by bisection."""
+    values_path = _write_values(tmp_path)
+    renders: list[str] = []
+    candidates = [
+        fix_verifier.ValuesFixCandidate(
+            key=f"fix-{index}",
+            rule_id="RES003",
+            values_patch={"resources": {"limits": {"memory": f"{256 + index}Mi"}}},
+        )
+        for index in range(3)
+    ]
+    candidates.append(
+        fix_verifier.ValuesFixCandidate(
+            key="bad", rule_id="PRB002", values_patch={"broken": True},
+        )
+    )
+
+    result = fix_verifier.verify_values_fixes_bulk(
+        chart_dir=tmp_path,
+        values_path=values_path,
+        candidates=candidates,
+        renderer=_fake_renderer(renders),
+    )
+
+    assert result.per_fix["bad"].status == "unverified"
+    assert "nil pointer" in result.per_fix["bad"].note
+    assert result.render_failed == {"bad"}
+    assert all(result.per_fix[f"fix-{index}"].status == "verified" for index in range(3))
+    # merged, first half, second half, then the two singles of the failing half.
+    assert result.render_count == 5
+
+
+def test_bulk_verification_does_not_bisect_unavailable_renders(tmp_path: Path) -> None:
+    """Render failures unrelated to the values leave every fix unverified."""
+    values_path = _write_values(tmp_path)
+    renders: list[str] = []
+
+    def _render(**kwargs: Any) -> HelmRenderResult:
+        renders.append(str(kwargs["values_content"]))
+        return HelmRenderResult(
+            ok=False,
+            chart_dir=kwargs["chart_dir"],
+            values_file=kwargs["values_file"],
+            error_kind="helm_missing",
+            error_message="helm not found",
+        )
+
+    result = fix_verifier.verify_values_fixes_bulk(
+        chart_dir=tmp_path,
+        values_path=values_path,
+        candidates=[
+            fix_verifier.ValuesFixCandidate(key=f"fix-{index}", rule_id="RES003", values_patch={})
+            for index in range(2)
+        ],
+        renderer=_render,
+    )
+
+    assert result.render_count == 1
+    assert result.render_failed == set()
+    assert {fix.status for fix in result.per_fix.values()} == {"unverified"}
+
+
+def test_bulk_verification_reports_unknown_rules_as_unverified(tmp_path: Path) -> None:
+    """Fixes for rules that cannot be checked on rendered output stay unverified."""
+    values_path = _write_values(tmp_path)
+
+    result = fix_verifier.verify_values_fixes_bulk(
+        chart_dir=tmp_path,
+        values_path=values_path,
+        candidates=[
+            fix_verifier.ValuesFixCandidate(
+                key="custom", rule_id="CUSTOM001", values_patch={"a": 1},
+            )
+        ],
+        renderer=_fake_renderer([]),
+    )
+
+    assert result.per_fix["custom"].status == "unverified"
+    assert result.render_count == 1
+
+
+def test_bulk_verification_renders_kept_fixes_together(tmp_path: Path) -> None:
+    """Fixes that only break rendering in combination should not both be kept."""
+    values_path = _write_values(tmp_path)
+    renders: list[str] = []
+    render = _fake_renderer(renders)
+
+    def _render(**kwargs: Any) -> HelmRenderResult:
+        values = yaml.safe_load(str(kwargs["values_content"])) or {}
+        if values.get("left") and values.get("right"):
+            renders.append(str(kwargs["values_content"]))
+            return HelmRenderResult(
+                ok=False,
+                chart_dir=kwargs["chart_dir"],
+                values_file=kwargs["values_file"],
+                error_kind="render_failed",
+                error_message="conflicting settings",
+            )
+        return render(**kwargs)
+
+    result = fix_verifier.verify_values_fixes_bulk(
+        chart_dir=tmp_path,
+        values_path=values_path,
+        candidates=[
+            fix_verifier.ValuesFixCandidate(
+                key=side, rule_id="RES003", values_patch={side: True},
+            )
+            for side in ("left", "right")
+        ],
+        renderer=_render,
+    )
+
+    assert result.render_failed == {"right"}
+    assert "conflicting settings" in result.per_fix["right"].note
+    assert result.per_fix["left"].status == "verified"
+    # merged, then "left" alone, then "right" on top of "left".
+    assert result.render_count == 3
+    assert "left: true" in renders[-1] and "right: true" in renders[-1]
@@ -10,6 +10,7 @@ import yaml
 from kubeagle.optimizer.fixer import (
     FixGenerator,
     apply_fix,
+    apply_fixes,
 )
 
 
@@ -580,3 +581,72 @@ class TestApplyFix:
         result = apply_fix(str(values_file), {"key": "value"})
 
         assert result is False
+
+
+class TestApplyFixes:
+    """Tests for apply_fixes batch function."""
+
+    def test_apply_fixes_matches_sequential_apply_fix(self, tmp_path: Path) -> None:
+        """Test one batched write equals applying each fix in turn."""
+        original = (
+            "# service values\n"
+            "replicaCount: 1  # keep low\n"
+            "resources:\n"
+            "  requests:\n"
+            '    cpu: "100m"\n'
+            "  limits:\n"
+            "    memory: 256Mi\n"
+        )
+        fixes = [
+            {"resources": {"requests": {"cpu": "200m"}}},
+            {"resources": {"limits": {"memory": "512Mi"}}},
+            {"replicaCount": 2},
+            {"resources": {"requests": {"cpu": "250m"}}},
+        ]
+        sequential = tmp_path / "sequential.yaml"
+        batched = tmp_path / "values.yaml"
+        sequential.write_text(original)
+        batched.write_text(original)
+
+        for fix in fixes:
+            assert apply_fix(str(sequential), fix) is True
+        result = apply_fixes(str(batched), fixes)
+
+        assert result.applied == [True, True, True, True]
+        assert batched.read_text() == sequential.read_text()
+        assert "# service values" in batched.read_text()
+        assert "-    memory: 256Mi" in result.diff
+        assert "+    memory: 512Mi" in result.diff
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "sequential.yaml",
+            "values.yaml",
+        ]
+
+    def test_apply_fixes_skips_only_failing_fix(self, tmp_path: Path) -> None:
+        """Test a bad fix is reported without dropping the others."""
+        values_file = tmp_path / "values.yaml"
+        values_file.write_text("replicaCount: 1\n")
+
+        result = apply_fixes(
+            str(values_file),
+            [{"replicaCount": 2}, {"bad": object()}, {"image": {"tag": "v2"}}],
+        )
+
+        assert result.applied == [True, False, True]
+        assert set(result.errors) == {1}
+        data = yaml.safe_load(values_file.read_text())
+        assert data == {"replicaCount": 2, "image": {"tag": "v2"}}
+
+    def test_apply_fixes_skips_write_when_cancelled(self, tmp_path: Path) -> None:
+        """Test a cancelled batch leaves the values file untouched."""
+        values_file = tmp_path / "values.yaml"
+        values_file.write_text("replicaCount: 1\n")
+
+        result = apply_fixes(
+            str(values_file), [{"replicaCount": 2}], should_stop=lambda: True,
+        )
+
+        assert result.cancelled is True
+        assert result.applied == [False]
+        assert result.diff == ""
+        assert values_file.read_text() == "replicaCount: 1\n"
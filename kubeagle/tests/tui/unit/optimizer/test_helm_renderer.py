@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import subprocess
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 
 from kubeagle.optimizer import helm_renderer
+from kubeagle.optimizer.stripped_chart_cache import StrippedChartCache
 
 
 def _create_local_chart(tmp_path: Path) -> tuple[Path, Path]:
@@ -204,3 +206,102 @@ def test_render_chart_parent_only_render_failure(monkeypatch, tmp_path: Path) ->
     assert result.error_kind == "parent_render_failed"
     assert result.parent_only_render_attempted is True
     assert "invalid template" in result.error_message
+
+
+def test_parent_only_workspace_is_reused_until_chart_changes(
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    """Charts with missing dependencies should reuse a cached stripped copy."""
+    chart_dir, values_file = _create_local_chart(tmp_path)
+    (chart_dir / "Chart.yaml").write_text(
+        "apiVersion: v2\nname: demo-chart\nversion: 0.1.0\n"
+        "dependencies:\n  - name: redis\n    repository: https://charts.example\n",
+        encoding="utf-8",
+    )
+    (chart_dir / "templates").mkdir()
+    (chart_dir / "templates" / "deployment.yaml").write_text("kind: Deployment\n")
+    rendered_charts: list[Path] = []
+
+    def _fake_run(command, *args, **kwargs):
+        _ = args, kwargs
+        rendered = Path(command[3])
+        if rendered == chart_dir:
+            return SimpleNamespace(
+                returncode=1,
+                stdout="",
+                stderr="Error: found in Chart.yaml, but missing in charts/ directory: redis",
+            )
+        rendered_charts.append(rendered)
+        assert "dependencies" not in (rendered / "Chart.yaml").read_text(encoding="utf-8")
+        assert not Path(command[5]).is_relative_to(rendered)
+        return SimpleNamespace(returncode=0, stdout="kind: Deployment\n", stderr="")
+
+    monkeypatch.setattr(helm_renderer.subprocess, "run", _fake_run)
+
+    def _render() -> helm_renderer.HelmRenderResult:
+        return helm_renderer.render_chart(
+            chart_dir=chart_dir,
+            values_file=values_file,
+            values_content="replicaCount: 2\n",
+        )
+
+    try:
+        assert _render().ok
+        assert _render().ok
+        first, second = rendered_charts
+        assert first == second
+        template = first / "templates" / "deployment.yaml"
+        assert template.stat().st_ino == (chart_dir / "templates" / "deployment.yaml").stat().st_ino
+        assert "dependencies" in (chart_dir / "Chart.yaml").read_text(encoding="utf-8")
+
+        (chart_dir / "templates" / "service.yaml").write_text("kind: Service\n")
+        assert _render().ok
+        assert rendered_charts[2] != first
+        assert not first.exists()
+        assert (rendered_charts[2] / "templates" / "service.yaml").exists()
+    finally:
+        helm_renderer.STRIPPED_CHART_CACHE.discard(chart_dir)
+
+
+def test_stripped_workspace_builds_do_not_block_other_charts(tmp_path: Path) -> None:
+    """A slow workspace build should only hold back renders of the same chart."""
+    slow_chart = tmp_path / "slow"
+    fast_chart = tmp_path / "fast"
+    for chart in (slow_chart, fast_chart):
+        chart.mkdir()
+        (chart / "Chart.yaml").write_text(f"name: {chart.name}\n", encoding="utf-8")
+    slow_build_started = threading.Event()
+    release_slow_build = threading.Event()
+
+    def _strip(chart_yaml: Path) -> None:
+        if chart_yaml.parent.name == "slow":
+            slow_build_started.set()
+            assert release_slow_build.wait(5)
+        return None
+
+    (tmp_path / "workspaces").mkdir()
+    cache = StrippedChartCache(_strip, root=tmp_path / "workspaces")
+    leased: list[Path] = []
+
+    def _lease_slow() -> None:
+        with cache.lease(slow_chart) as workspace:
+            leased.append(workspace)
+
+    workers = [threading.Thread(target=_lease_slow) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    try:
+        assert slow_build_started.wait(5)
+        with cache.lease(fast_chart) as workspace:
+            assert (workspace / "Chart.yaml").exists()
+    finally:
+        release_slow_build.set()
+        for worker in workers:
+            worker.join(5)
+
+    assert len(leased) == 2
+    assert leased[0] == leased[1]
+    assert (cache.hits, cache.misses) == (1, 2)
+    cache.clear()
+    assert not leased[0].exists()
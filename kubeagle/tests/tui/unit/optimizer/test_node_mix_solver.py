@@ -0,0 +1,115 @@
+"""Tests for the cheapest node-mix solver."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from kubeagle.optimizer.node_mix_solver import (
+    NodeShape,
+    instance_type_catalog,
+    load_instance_price_table,
+    solve_node_mix,
+)
+
+_GI = 1024**3
+
+_SMALL = NodeShape("small", 2000.0, 4 * _GI, 20, 0.05)
+_BIG_MEM = NodeShape("bigmem", 2000.0, 32 * _GI, 20, 0.12)
+
+
+class TestSolveNodeMix:
+    """Tests for solve_node_mix."""
+
+    def test_mixes_types_when_cheaper_than_any_single_type(self) -> None:
+        """Test CPU-heavy and memory-heavy replicas land on different types."""
+        demands = [(900.0, 1 * _GI, 10), (100.0, 15 * _GI, 4)]
+
+        options = solve_node_mix(demands, [_SMALL, _BIG_MEM])
+
+        best = options[0]
+        assert best.nodes == (("small", 5), ("bigmem", 2))
+        assert best.hourly_cost == pytest.approx(5 * 0.05 + 2 * 0.12)
+        assert [option.hourly_cost for option in options] == sorted(
+            option.hourly_cost for option in options
+        )
+        assert (("bigmem", 5),) in {option.nodes for option in options}
+
+    def test_reports_replicas_no_type_can_hold(self) -> None:
+        """Test oversized replicas are counted, not packed."""
+        options = solve_node_mix([(100.0, 64 * _GI, 3), (100.0, 1 * _GI, 1)], [_SMALL])
+
+        assert options[0].nodes == (("small", 1),)
+        assert options[0].unschedulable == 3
+
+    def test_stops_packing_at_time_budget(self) -> None:
+        """Test only the best-bounded candidate is packed once time is up."""
+        ticks = iter([0.0, 10.0, 20.0, 30.0])
+
+        options = solve_node_mix(
+            [(900.0, 1 * _GI, 10), (100.0, 15 * _GI, 4)],
+            [_SMALL, _BIG_MEM],
+            time_budget_seconds=1.0,
+            clock=lambda: next(ticks, 40.0),
+        )
+
+        assert len(options) == 1
+
+    def test_skips_packs_projected_past_budget(self) -> None:
+        """Test a pack that would overrun the budget is not started."""
+        now = [0.0]
+
+        def _clock() -> float:
+            # Every reading advances 0.1s, so one pack costs about 0.1s.
+            now[0] += 0.1
+            return now[0]
+
+        options = solve_node_mix(
+            [(900.0, 1 * _GI, 10), (100.0, 15 * _GI, 4)],
+            [_SMALL, _BIG_MEM],
+            time_budget_seconds=0.55,
+            clock=_clock,
+        )
+
+        assert len(options) == 1
+        assert now[0] < 0.7
+
+    def test_skips_unpriced_types(self) -> None:
+        """Test types without a price for the chosen tier are ignored."""
+        free = NodeShape("unpriced", 64000.0, 256 * _GI, 200, 0.0)
+
+        options = solve_node_mix([(100.0, 1 * _GI, 5)], [free, _SMALL])
+
+        assert all("unpriced" not in dict(option.nodes) for option in options)
+
+
+class TestInstancePriceTable:
+    """Tests for price table loading and the instance catalog."""
+
+    def test_local_table_overrides_and_extends_catalog(self, tmp_path: Path) -> None:
+        """Test entries replace built-in prices and add new types."""
+        table = tmp_path / "prices.json"
+        table.write_text(
+            json.dumps(
+                [
+                    {"name": "m5.large", "spot_hourly_usd": 0.02, "on_demand_hourly_usd": 0.09},
+                    {"name": "x9.metal", "vcpus": 8, "memory_gib": 64, "spot_hourly_usd": 0.2},
+                ]
+            )
+        )
+
+        catalog = {row[0]: row for row in instance_type_catalog(load_instance_price_table(table))}
+
+        assert catalog["m5.large"] == ("m5.large", 2, 8.0, 0.09, 0.02)
+        assert catalog["x9.metal"] == ("x9.metal", 8, 64.0, 0.0, 0.2)
+        assert catalog["r6i.xlarge"][1:3] == (4, 32.0)
+
+    def test_unknown_shape_is_rejected(self, tmp_path: Path) -> None:
+        """Test entries without a derivable shape raise ValueError."""
+        table = tmp_path / "prices.yaml"
+        table.write_text("x9.metal:\n  spot_hourly_usd: 0.2\n")
+
+        with pytest.raises(ValueError, match="x9.metal"):
+            load_instance_price_table(table)
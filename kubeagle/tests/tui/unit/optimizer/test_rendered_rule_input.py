@@ -5,8 +5,10 @@ from __future__ import annotations
 from typing import Any
 
 from kubeagle.optimizer.rendered_rule_input import (
+    build_rendered_workloads,
     build_rule_inputs_from_rendered,
 )
+from kubeagle.optimizer.rule_features import ChartFeatures
 
 
 def _deployment_doc() -> dict[str, Any]:
@@ -217,3 +219,37 @@ def test_build_rule_inputs_best_effort_when_resources_missing() -> None:
 
     assert len(mapped) == 1
     assert mapped[0]["qos_class"] == "BestEffort"
+
+
+def test_build_rendered_workloads_shares_pdb_and_hpa_across_workloads() -> None:
+    """PDB and HPA docs anywhere in the stream apply to every workload record."""
+    worker = _deployment_doc()
+    worker["metadata"] = {"name": "worker"}
+    del worker["spec"]["replicas"]
+    docs = [
+        _deployment_doc(),
+        worker,
+        _hpa_doc(target_name="worker", min_replicas=4),
+        {
+            "apiVersion": "policy/v1",
+            "kind": "PodDisruptionBudget",
+            "metadata": {"name": "payments-pdb"},
+            "spec": {"minAvailable": 1},
+        },
+    ]
+
+    workloads = build_rendered_workloads(docs, chart_name="payments")
+
+    assert [w.identity for w in workloads] == [
+        ("Deployment", "payments", ""),
+        ("Deployment", "worker", ""),
+    ]
+    assert [w.rule_input for w in workloads] == build_rule_inputs_from_rendered(
+        docs, chart_name="payments"
+    )
+    assert [w.features.replicas for w in workloads] == [3, 4]
+    assert all(w.features.has_pdb for w in workloads)
+    for workload in workloads:
+        expected = ChartFeatures.from_rule_input(workload.rule_input)
+        assert workload.features == expected
+        assert workload.fingerprint == expected.fingerprint()
@@ -1199,3 +1199,180 @@ class TestMinMaxReplicas:
         snap = result.before_charts[0]
         assert snap.min_replicas == 2
         assert snap.max_replicas == 2
+
+
+class TestBinPackedEstimation:
+    def test_estimation_accounts_for_per_node_fragmentation(self) -> None:
+        """Test half-node replicas are not packed by summed volume."""
+        chart = _make_chart(cpu_request=900.0, memory_request=256 * 1024**2, replicas=4)
+
+        result = ResourceImpactCalculator().compute_impact(
+            [chart], [], instance_types=[("m5.large", 2, 8.0, 0.096, 0.035)],
+        )
+
+        # 1564m usable per m5.large: one 900m replica per node, not ceil(3600/1564)=3.
+        assert result.node_estimations[0].nodes_before == 4
+
+    def test_cluster_group_uses_node_pod_capacity(self) -> None:
+        """Test real node groups cap replicas at their pod capacity."""
+        chart = _make_chart(cpu_request=1.0, memory_request=1024.0, replicas=60)
+        nodes = [_make_node() for _ in range(3)]
+        for node in nodes:
+            node.pod_capacity = 14
+
+        result = ResourceImpactCalculator().compute_impact([chart], [], cluster_nodes=nodes)
+
+        # 14 pods minus 4 DaemonSet pods leaves 10 replicas per node.
+        assert result.cluster_node_groups[0].nodes_needed_after == 6
+
+    def test_node_mix_options_ranked_by_monthly_cost(self) -> None:
+        """Test the impact result carries cheapest-first node mixes."""
+        chart = _make_chart(cpu_request=500.0, memory_request=1024**3, replicas=20)
+
+        result = ResourceImpactCalculator().compute_impact([chart], [])
+
+        costs = [option.monthly_cost_usd for option in result.node_mix_options]
+        assert costs and costs == sorted(costs)
+        best = result.node_mix_options[0]
+        assert best.pricing == "spot"
+        assert best.monthly_cost_usd == pytest.approx(best.hourly_cost_usd * HOURS_PER_MONTH)
+
+
+    def test_default_types_share_one_sort_and_pack_each_shape_once(
+        self, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test proportional shapes reuse one ordering and duplicates one pack."""
+        from kubeagle.constants.instance_types import DEFAULT_INSTANCE_TYPES
+        from kubeagle.optimizer import resource_impact_calculator as module
+
+        sorts: list[int] = []
+        packs: list[float] = []
+        real_sort = module.sort_by_dominant_share
+        real_pack = module._packed_node_count
+
+        def _sort(demands, **kwargs):
+            sorts.append(len(demands))
+            return real_sort(demands, **kwargs)
+
+        def _pack(demands, usable_cpu, usable_mem, max_pods, **kwargs):
+            packs.append(usable_cpu)
+            return real_pack(demands, usable_cpu, usable_mem, max_pods, **kwargs)
+
+        monkeypatch.setattr(module, "sort_by_dominant_share", _sort)
+        monkeypatch.setattr(module, "_packed_node_count", _pack)
+        demands = [(250.0, 512.0 * 1024**2, 40), (1500.0, 1024.0**3, 3)]
+        specs = _build_instance_types(DEFAULT_INSTANCE_TYPES)
+
+        result = ResourceImpactCalculator._pack_instance_types(demands, specs, 0.1)
+
+        assert sorts == [2]
+        # m6i.large and m6i.xlarge have the shapes of m5.large and m5.xlarge.
+        assert len(packs) == 4
+        assert result[4] == result[0]
+        assert result[5] == result[1]
+        assert result == [
+            real_pack(
+                demands,
+                spec.cpu_millicores * module.ALLOCATABLE_RATIO * 0.9,
+                spec.memory_bytes * module.ALLOCATABLE_RATIO * 0.9,
+                module._schedulable_pods(
+                    module.MAX_PODS.get(spec.name, module.DEFAULT_MAX_PODS)
+                ),
+            )
+            for spec in specs
+        ]
+
+
+class TestResourceImpactModel:
+    """Tests for incremental what-if changes on ResourceImpactModel."""
+
+    @staticmethod
+    def _fleet() -> tuple[list[ChartInfo], list[MagicMock]]:
+        charts = [
+            _make_chart(name="api", team="web", cpu_request=100.0, cpu_limit=1000.0, replicas=3),
+            _make_chart(name="worker", team="data", cpu_request=10.0, replicas=4),
+            _make_chart(name="cron", team="data", cpu_request=300.0, replicas=1),
+        ]
+        violations = [
+            _make_violation("RES005", "api"),
+            _make_violation("RES007", "worker"),
+            _make_violation("AVL005", "cron"),
+        ]
+        return charts, violations
+
+    @staticmethod
+    def _assert_same(actual: object, expected: object) -> None:
+        for side in ("before", "after"):
+            assert getattr(actual, side).model_dump() == pytest.approx(
+                getattr(expected, side).model_dump()
+            )
+        assert [e.model_dump() for e in actual.node_estimations] == [  # type: ignore[attr-defined]
+            e.model_dump() for e in expected.node_estimations  # type: ignore[attr-defined]
+        ]
+
+    def test_filter_and_fix_toggle_match_full_recompute(self) -> None:
+        """Test deltas equal compute_impact on the same subset and fixes."""
+        charts, violations = self._fleet()
+        calc = ResourceImpactCalculator()
+        model = calc.build_impact_model(charts, violations)
+        self._assert_same(model.result(), calc.compute_impact(charts, violations))
+
+        model.set_included([0, 2])
+        self._assert_same(
+            model.result(),
+            calc.compute_impact([charts[0], charts[2]], [violations[0], violations[2]]),
+        )
+
+        model.set_fix_enabled(2, False)
+        self._assert_same(
+            model.result(), calc.compute_impact([charts[0], charts[2]], [violations[0]]),
+        )
+
+        model.set_included(None)
+        model.set_fix_enabled(2, True)
+        self._assert_same(model.result(), calc.compute_impact(charts, violations))
+
+    def test_overhead_change_repacks_without_rebuilding_snapshots(
+        self, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test an overhead change only re-derives node estimates."""
+        charts, violations = self._fleet()
+        calc = ResourceImpactCalculator()
+        model = calc.build_impact_model(charts, violations)
+        expected = calc.compute_impact(charts, violations, overhead_pct=0.3)
+
+        def _fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("snapshots rebuilt")
+
+        monkeypatch.setattr(ResourceImpactCalculator, "_build_before_snapshot", _fail)
+        monkeypatch.setattr(ResourceImpactCalculator, "_compute_after_snapshot", _fail)
+        model.set_overhead_pct(0.3)
+
+        self._assert_same(model.result(), expected)
+
+    def test_fix_toggle_repacks_only_the_after_side(
+        self, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test before-side packing is reused and can be skipped entirely."""
+        charts, violations = self._fleet()
+        model = ResourceImpactCalculator().build_impact_model(charts, violations)
+        packed = ResourceImpactCalculator._pack_instance_types
+        calls: list[int] = []
+
+        def _counting(*args: object, **kwargs: object) -> object:
+            calls.append(1)
+            return packed(*args, **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(
+            ResourceImpactCalculator, "_pack_instance_types", staticmethod(_counting),
+        )
+        model.result()
+        assert len(calls) == 2
+
+        model.set_fix_enabled(1, False)
+        quick = model.result(estimate_nodes=False)
+        assert len(calls) == 2
+        assert quick.node_estimations == []
+        full = model.result()
+        assert quick.after.model_dump() == pytest.approx(full.after.model_dump())
+        assert len(calls) == 3
@@ -0,0 +1,134 @@
+"""Tests for fleet-wide batch rule evaluation."""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Generator
+
+import pytest
+
+from kubeagle.constants.enums import QoSClass
+from kubeagle.constants.optimizer import (
+    LIMIT_REQUEST_RATIO_THRESHOLD as DEFAULT_LIMIT_REQUEST_RATIO_THRESHOLD,
+)
+from kubeagle.models.charts.chart_info import ChartInfo
+from kubeagle.models.optimization import UnifiedOptimizerController
+from kubeagle.optimizer.rule_batch import ROW_MASKS, ChartFeatureTable
+from kubeagle.optimizer.rule_features import ChartFeatures
+from kubeagle.optimizer.rules import RULES, configure_rule_thresholds
+
+
+@pytest.fixture(autouse=True)
+def _reset_thresholds() -> Generator[None, None, None]:
+    configure_rule_thresholds(
+        limit_request_ratio_threshold=DEFAULT_LIMIT_REQUEST_RATIO_THRESHOLD,
+        fixed_resource_fields=set(),
+    )
+    yield
+    configure_rule_thresholds(
+        limit_request_ratio_threshold=DEFAULT_LIMIT_REQUEST_RATIO_THRESHOLD,
+        fixed_resource_fields={"cpu_limit", "memory_limit"},
+    )
+
+
+def _fleet() -> list[ChartInfo]:
+    charts: list[ChartInfo] = []
+    combos = itertools.product(
+        (0.0, 5.0, 100.0, 250.0),
+        (0.0, 50.0, 400.0),
+        (0.0, 16 * 1024**2, 128 * 1024**2),
+        (0.0, 512 * 1024**2),
+        (None, 1, 3),
+        (None, 0, 2),
+    )
+    for index, (cpu_req, cpu_lim, mem_req, mem_lim, replicas, min_available) in enumerate(
+        combos
+    ):
+        charts.append(
+            ChartInfo(
+                name=f"chart-{index}",
+                team="platform",
+                values_file=f"charts/chart-{index}/values.yaml",
+                cpu_request=cpu_req,
+                cpu_limit=cpu_lim,
+                memory_request=mem_req,
+                memory_limit=mem_lim,
+                qos_class=QoSClass.BEST_EFFORT if index % 7 == 0 else QoSClass.BURSTABLE,
+                has_liveness=index % 2 == 0,
+                has_readiness=index % 3 == 0,
+                has_startup=index % 5 == 0,
+                has_anti_affinity=index % 4 == 0,
+                has_topology_spread=index % 6 == 0,
+                has_topology=False,
+                pdb_enabled=min_available is not None,
+                pdb_template_exists=False,
+                pdb_min_available=min_available,
+                pdb_max_unavailable=None,
+                replicas=replicas,
+                priority_class=None,
+            )
+        )
+    return charts
+
+
+def _dump(violations: list) -> list[dict]:
+    return [violation.model_dump() for violation in violations]
+
+
+class TestBatchRuleEvaluation:
+    """Tests for check_all_charts_with_progress batch mode."""
+
+    @pytest.mark.parametrize("threshold", [1.5, 2.0, 4.0])
+    def test_batch_matches_per_chart_checks(self, threshold: float) -> None:
+        """Test batched results equal per-chart results, in order."""
+        configure_rule_thresholds(limit_request_ratio_threshold=threshold)
+        controller = UnifiedOptimizerController(analysis_source="values")
+        charts = _fleet()
+
+        per_chart = [v for chart in charts for v in controller.check_chart(chart)]
+        batched = controller.check_all_charts_with_progress(charts)
+
+        assert _dump(batched) == _dump(per_chart)
+
+    def test_threshold_change_reuses_feature_table(self) -> None:
+        """Test re-checking the same charts reuses extracted features."""
+        controller = UnifiedOptimizerController(analysis_source="values")
+        charts = _fleet()
+
+        controller.check_all_charts_with_progress(charts)
+        table = controller._feature_table
+        configure_rule_thresholds(limit_request_ratio_threshold=1000.0)
+        relaxed = controller.check_all_charts_with_progress(charts)
+
+        assert controller._feature_table is table
+        assert not any(v.rule_id in {"RES005", "RES006"} for v in relaxed)
+
+    def test_progress_callback_runs_per_chart(self) -> None:
+        """Test batch mode still reports progress for every chart."""
+        controller = UnifiedOptimizerController(analysis_source="values")
+        charts = _fleet()[:5]
+        seen: list[tuple[str, int, int]] = []
+
+        controller.check_all_charts_with_progress(
+            charts,
+            on_chart_done=lambda chart, _violations, done, total: seen.append(
+                (chart.name, done, total)
+            ),
+        )
+
+        assert seen == [(chart.name, index, 5) for index, chart in enumerate(charts, 1)]
+
+    def test_masks_select_superset_of_violating_rows(self) -> None:
+        """Test every column expression keeps all rows its rule flags."""
+        features = [ChartFeatures.from_chart_info(chart) for chart in _fleet()]
+        table = ChartFeatureTable.from_features(features)
+
+        for rule in RULES:
+            mask = ROW_MASKS.get(rule.evaluate)
+            if mask is None:
+                continue
+            selected = set(mask(table))
+            flagged = {
+                index for index, row in enumerate(features) if rule.evaluate(row)
+            }
+            assert flagged <= selected, rule.id
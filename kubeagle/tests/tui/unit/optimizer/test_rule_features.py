@@ -0,0 +1,112 @@
+"""Tests for typed optimizer rule features."""
+
+from __future__ import annotations
+
+import pytest
+
+from kubeagle.constants.enums import QoSClass
+from kubeagle.models.charts.chart_info import ChartInfo
+from kubeagle.models.optimization import UnifiedOptimizerController
+from kubeagle.optimizer.rule_features import (
+    ChartFeatures,
+    format_cpu_millicores,
+    format_memory_mi,
+)
+
+
+def _make_chart(**overrides: object) -> ChartInfo:
+    values: dict[str, object] = {
+        "name": "api",
+        "team": "platform",
+        "values_file": "values.yaml",
+        "cpu_request": 100.0,
+        "cpu_limit": 400.0,
+        "memory_request": 128 * 1024**2,
+        "memory_limit": 512 * 1024**2,
+        "qos_class": QoSClass.BURSTABLE,
+        "has_liveness": True,
+        "has_readiness": False,
+        "has_startup": False,
+        "has_anti_affinity": False,
+        "has_topology_spread": False,
+        "has_topology": False,
+        "pdb_enabled": True,
+        "pdb_template_exists": True,
+        "pdb_min_available": 2,
+        "pdb_max_unavailable": None,
+        "replicas": 2,
+        "priority_class": None,
+    }
+    values.update(overrides)
+    return ChartInfo(**values)
+
+
+class TestChartFeatures:
+    """Tests for ChartFeatures extraction."""
+
+    def test_from_chart_info_matches_rule_input_dict(self) -> None:
+        """Test direct extraction equals extraction from the legacy dict."""
+        chart = _make_chart(cpu_request=1234.5678, memory_request=100.123456 * 1024**2)
+        controller = UnifiedOptimizerController()
+
+        direct = ChartFeatures.from_chart_info(chart)
+        via_dict = ChartFeatures.from_rule_input(controller._chart_info_to_dict(chart))
+
+        for name in (
+            "qos_class",
+            "cpu_request",
+            "cpu_limit",
+            "memory_request",
+            "memory_limit",
+            "has_liveness",
+            "has_readiness",
+            "replicas",
+            "has_pdb",
+            "pdb",
+        ):
+            assert getattr(direct, name) == getattr(via_dict, name), name
+        assert direct.resource_text("requests", "cpu") == "1234.568m"
+        assert direct.resource_text("requests", "memory") == "100.12Mi"
+
+    def test_from_rule_input_keeps_original_quantity_text(self) -> None:
+        """Test messages reuse the quantity strings from rendered input."""
+        features = ChartFeatures.from_rule_input(
+            {"resources": {"requests": {"cpu": "0.1"}, "limits": {"cpu": "2"}}}
+        )
+
+        assert features.cpu_request == pytest.approx(100.0)
+        assert features.cpu_limit == pytest.approx(2000.0)
+        assert features.resource_text("requests", "cpu") == "0.1"
+
+    def test_best_effort_inferred_without_qos(self) -> None:
+        """Test BestEffort is inferred when no QoS is given and nothing is set."""
+        assert ChartFeatures.from_rule_input({"resources": {}}).is_best_effort
+        assert not ChartFeatures.from_rule_input(
+            {"resources": {"requests": {"memory": "64Mi"}}}
+        ).is_best_effort
+
+    def test_formatters(self) -> None:
+        """Test quantity formatting used for messages and rule inputs."""
+        assert format_cpu_millicores(250) == "250m"
+        assert format_cpu_millicores(0.5) == "0.5m"
+        assert format_memory_mi(512.0000001) == "512Mi"
+        assert format_memory_mi(0.953674) == "0.95Mi"
+
+
+class TestCheckChartSinglePass:
+    """Tests for feature-based rule evaluation in check_chart."""
+
+    def test_check_chart_does_not_build_rule_input_dict(
+        self, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test built-in rules run over features without the dict round-trip."""
+        controller = UnifiedOptimizerController(analysis_source="values")
+
+        def _fail(*_args: object, **_kwargs: object) -> dict:
+            raise AssertionError("rule-input dict should not be built")
+
+        monkeypatch.setattr(UnifiedOptimizerController, "_chart_info_to_dict", _fail)
+
+        rule_ids = {violation.rule_id for violation in controller.check_chart(_make_chart())}
+
+        assert {"RES005", "PRB002", "PRB003", "AVL002", "AVL003", "AVL004"} <= rule_ids
@@ -0,0 +1,87 @@
+"""Tests for staged workspace cloning and snapshot diffing."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from kubeagle.optimizer import staged_workspace
+from kubeagle.optimizer.staged_workspace import TreeSnapshot, clone_tree
+
+_OLD_MTIME_NS = 1_600_000_000_000_000_000
+
+
+def _write_old(path: Path, text: str) -> None:
+    """Write ``path`` with an mtime well outside the racy window."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(_OLD_MTIME_NS, _OLD_MTIME_NS))
+
+
+@pytest.fixture
+def chart_dir(tmp_path: Path) -> Path:
+    chart = tmp_path / "source" / "demo"
+    _write_old(chart / "Chart.yaml", "apiVersion: v2\nname: demo\n")
+    _write_old(chart / "values.yaml", "replicaCount: 1\n")
+    _write_old(chart / "charts" / "redis" / "values.yaml", "big: true\n")
+    return chart
+
+
+class TestTreeSnapshot:
+    """Test TreeSnapshot signature comparison and lazy hashing."""
+
+    def test_clone_keeps_signatures_and_private_inodes(
+        self, chart_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test clones compare equal without hashing and never share inodes."""
+        staged = tmp_path / "stage" / "demo"
+        clone_tree(chart_dir, staged)
+
+        source = TreeSnapshot.capture(chart_dir)
+        assert source.changed_paths(TreeSnapshot.capture(staged)) == []
+        assert source._digests == {}
+        assert (staged / "values.yaml").stat().st_ino != (chart_dir / "values.yaml").stat().st_ino
+
+        (staged / "values.yaml").write_text("replicaCount: 2\n", encoding="utf-8")
+        (staged / "new.yaml").write_text("x: 1\n", encoding="utf-8")
+
+        assert source.changed_paths(TreeSnapshot.capture(staged)) == ["new.yaml", "values.yaml"]
+        assert set(source._digests) == {"values.yaml"}
+        assert (chart_dir / "values.yaml").read_text(encoding="utf-8") == "replicaCount: 1\n"
+
+    def test_touched_file_with_same_content_is_unchanged(
+        self, chart_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test a rewrite with identical content is resolved by hashing."""
+        staged = tmp_path / "stage" / "demo"
+        clone_tree(chart_dir, staged)
+        source = TreeSnapshot.capture(chart_dir)
+        os.utime(staged / "Chart.yaml")
+
+        assert source.changed_paths(TreeSnapshot.capture(staged)) == []
+
+    def test_same_root_rewrite_of_racy_file_is_detected(self, tmp_path: Path) -> None:
+        """Test a recently written file is hashed eagerly so same-size rewrites count."""
+        values = tmp_path / "values.yaml"
+        values.write_text("replicaCount: 1\n", encoding="utf-8")
+        before = TreeSnapshot.capture(tmp_path)
+        assert "values.yaml" in before._digests
+
+        stat = values.stat()
+        values.write_text("replicaCount: 2\n", encoding="utf-8")
+        os.utime(values, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert before.changed_paths(TreeSnapshot.capture(tmp_path)) == ["values.yaml"]
+
+    def test_reflink_failure_falls_back_to_copy(
+        self, chart_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test clones still succeed where reflinks are unsupported."""
+        monkeypatch.setattr(staged_workspace, "_reflink", lambda _src, _dst: False)
+        staged = tmp_path / "stage" / "demo"
+        clone_tree(chart_dir, staged)
+
+        assert (staged / "charts" / "redis" / "values.yaml").read_text(encoding="utf-8") == "big: true\n"
+        assert TreeSnapshot.capture(chart_dir).changed_paths(TreeSnapshot.capture(staged)) == []
@@ -0,0 +1,309 @@
+"""Tests for the template values-path usage index."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from kubeagle.constants.enums import QoSClass
+from kubeagle.models.charts.chart_info import ChartInfo
+from kubeagle.models.optimization import UnifiedOptimizerController
+from kubeagle.optimizer.helm_renderer import HelmRenderResult
+from kubeagle.optimizer.template_values_index import (
+    TemplateValuesIndex,
+    build_template_values_index,
+    changed_values_paths,
+    patch_rendered_resources,
+    reuse_render_for_values_change,
+)
+from kubeagle.optimizer.violation_cache import RENDERED_INPUT_CACHE, VIOLATION_CACHE
+
+_DEPLOYMENT_TEMPLATE = """\
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: {{ include "api.fullname" . }}
+spec:
+  replicas: {{ .Values.replicaCount }}
+  template:
+    spec:
+      containers:
+        - name: api
+          image: "{{ .Values.image.repository }}:{{ $.Values.image.tag }}"
+          resources:
+            {{- toYaml .Values.resources | nindent 12 }}
+"""
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches() -> Generator[None, None, None]:
+    RENDERED_INPUT_CACHE.clear()
+    VIOLATION_CACHE.clear()
+    yield
+    RENDERED_INPUT_CACHE.clear()
+    VIOLATION_CACHE.clear()
+
+
+def _write_chart(tmp_path: Path, values: str) -> tuple[Path, Path]:
+    chart_dir = tmp_path / "api"
+    (chart_dir / "templates").mkdir(parents=True)
+    (chart_dir / "Chart.yaml").write_text(
+        "apiVersion: v2\nname: api\nversion: 0.1.0\n"
+        "dependencies:\n  - name: redis\n    alias: cache\n",
+    )
+    (chart_dir / "templates" / "deployment.yaml").write_text(_DEPLOYMENT_TEMPLATE)
+    (chart_dir / "templates" / "_helpers.tpl").write_text(
+        '{{- define "api.fullname" -}}{{ .Values.nameOverride | default .Chart.Name }}{{- end }}\n'
+    )
+    redis_dir = chart_dir / "charts" / "redis"
+    (redis_dir / "templates").mkdir(parents=True)
+    (redis_dir / "Chart.yaml").write_text("apiVersion: v2\nname: redis\nversion: 1.0.0\n")
+    (redis_dir / "templates" / "_labels.tpl").write_text(
+        '{{- define "redis.labels" -}}{{ toYaml .Values.commonLabels }}{{- end }}\n'
+    )
+    values_path = chart_dir / "values.yaml"
+    values_path.write_text(values)
+    return chart_dir, values_path
+
+
+def _rewrite(path: Path, text: str) -> None:
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def _rendered_docs(cpu_request: str, cpu_limit: str) -> list[dict[str, Any]]:
+    return [
+        {
+            "kind": "Deployment",
+            "metadata": {"name": "api"},
+            "spec": {
+                "replicas": 2,
+                "template": {
+                    "spec": {
+                        "containers": [
+                            {
+                                "name": "api",
+                                "resources": {
+                                    "requests": {"cpu": cpu_request, "memory": "128Mi"},
+                                    "limits": {"cpu": cpu_limit, "memory": "256Mi"},
+                                },
+                            }
+                        ]
+                    }
+                },
+            },
+        }
+    ]
+
+
+_VALUES = """\
+replicaCount: 2
+image:
+  repository: api
+  tag: "1.0"
+resources:
+  requests:
+    cpu: 100m
+    memory: 128Mi
+  limits:
+    cpu: "1"
+    memory: 256Mi
+podAnnotations: {}
+"""
+
+
+class TestTemplateValuesIndex:
+    """Tests for index building and reference checks."""
+
+    def test_collects_paths_helpers_and_subchart_roots(self, tmp_path: Path) -> None:
+        """Test templates, helpers and dependencies feed the index."""
+        chart_dir, _ = _write_chart(tmp_path, _VALUES)
+
+        index = build_template_values_index(chart_dir)
+
+        assert not index.dynamic
+        assert {("replicaCount",), ("image", "tag"), ("nameOverride",)} <= index.paths
+        assert index.references(("resources", "limits", "cpu"))
+        assert index.references(("image",))
+        assert index.references(("cache", "enabled"))
+        assert index.references(("global", "imageRegistry"))
+        assert not index.references(("podAnnotations", "team"))
+
+    def test_dependency_templates_are_indexed(self, tmp_path: Path) -> None:
+        """Test subchart and library templates add paths; archives make it dynamic."""
+        chart_dir, _ = _write_chart(tmp_path, _VALUES)
+
+        index = build_template_values_index(chart_dir)
+
+        assert not index.dynamic
+        assert index.references(("commonLabels", "team"))
+
+        (chart_dir / "charts" / "common-2.0.0.tgz").write_bytes(b"")
+        index = build_template_values_index(chart_dir)
+
+        assert index.dynamic
+        assert index.references(("common", "enabled"))
+
+    def test_unvendored_dependency_marks_index_dynamic(self, tmp_path: Path) -> None:
+        """Test a declared dependency missing from charts/ disables path filtering."""
+        chart_dir, _ = _write_chart(tmp_path, _VALUES)
+        (chart_dir / "Chart.yaml").write_text(
+            "apiVersion: v2\nname: api\nversion: 0.1.0\n"
+            "dependencies:\n  - name: redis\n  - name: postgresql\n",
+        )
+
+        assert build_template_values_index(chart_dir).dynamic
+
+    def test_bare_values_and_tpl_mark_index_dynamic(self, tmp_path: Path) -> None:
+        """Test whole-values access disables path filtering."""
+        chart_dir, _ = _write_chart(tmp_path, _VALUES)
+        (chart_dir / "templates" / "extra.yaml").write_text(
+            '{{ tpl (index .Values "extra-config") . }}\n'
+        )
+
+        index = build_template_values_index(chart_dir)
+
+        assert index.dynamic
+        assert index.references(("podAnnotations", "team"))
+
+    def test_changed_values_paths_reports_leaves_and_key_changes(self) -> None:
+        """Test nested diffs report the deepest changed key."""
+        old = {"a": {"b": 1, "c": [1]}, "d": 1}
+        new = {"a": {"b": 2, "c": [1]}, "e": 1}
+
+        assert sorted(changed_values_paths(old, new)) == [("a", "b"), ("d",), ("e",)]
+
+
+class TestRenderReuse:
+    """Tests for reusing or patching a previous render."""
+
+    def test_unreferenced_change_reuses_docs(self) -> None:
+        """Test edits outside referenced paths keep the rendered docs."""
+        index = TemplateValuesIndex(paths=frozenset({("resources",)}))
+        docs = _rendered_docs("100m", "1")
+
+        reused = reuse_render_for_values_change(
+            index, docs, {"podAnnotations": {}}, {"podAnnotations": {"a": "b"}},
+        )
+
+        assert reused is docs
+
+    def test_resource_change_patches_copy_of_docs(self) -> None:
+        """Test resource quantity edits are patched into rendered docs."""
+        docs = _rendered_docs("100m", "1")
+        old = {"resources": {"requests": {"cpu": "100m"}, "limits": {"cpu": "1"}}}
+        new = {"resources": {"requests": {"cpu": "500m"}, "limits": {"cpu": "1"}}}
+
+        patched = patch_rendered_resources(
+            docs, old, new, [("resources", "requests", "cpu")],
+        )
+
+        assert patched is not None
+        container = patched[0]["spec"]["template"]["spec"]["containers"][0]
+        assert container["resources"]["requests"]["cpu"] == "500m"
+        assert docs[0]["spec"]["template"]["spec"]["containers"][0]["resources"][
+            "requests"
+        ]["cpu"] == "100m"
+
+    def test_ambiguous_or_missing_quantities_need_render(self) -> None:
+        """Test patching is refused when the rendered source is unclear."""
+        docs = _rendered_docs("100m", "1")
+        shared = {
+            "resources": {"requests": {"cpu": "100m"}},
+            "sidecar": {"resources": {"requests": {"cpu": "100m"}}},
+        }
+        changed = dict(shared, resources={"requests": {"cpu": "200m"}})
+
+        assert patch_rendered_resources(
+            docs, shared, changed, [("resources", "requests", "cpu")],
+        ) is None
+        assert patch_rendered_resources(
+            docs,
+            {"resources": {"requests": {"cpu": "300m"}}},
+            {"resources": {"requests": {"cpu": "400m"}}},
+            [("resources", "requests", "cpu")],
+        ) is None
+        assert patch_rendered_resources(
+            docs, {"replicaCount": 1}, {"replicaCount": 2}, [("replicaCount",)],
+        ) is None
+
+    def test_quantity_rendered_twice_needs_render(self) -> None:
+        """Test a quantity also hardcoded elsewhere in the render is not patched."""
+        docs = _rendered_docs("100m", "1") + _rendered_docs("100m", "1")
+
+        assert patch_rendered_resources(
+            docs,
+            {"resources": {"requests": {"cpu": "100m"}}},
+            {"resources": {"requests": {"cpu": "200m"}}},
+            [("resources", "requests", "cpu")],
+        ) is None
+
+
+class TestControllerRenderReuse:
+    """Tests for rendered analysis skipping helm for values-only edits."""
+
+    def test_values_edits_render_only_when_referenced(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+    ) -> None:
+        """Test unreferenced and resource edits avoid helm template runs."""
+        chart_dir, values_path = _write_chart(tmp_path, _VALUES)
+        renders: list[int] = []
+
+        def _render(**kwargs: Any) -> HelmRenderResult:
+            renders.append(1)
+            return HelmRenderResult(
+                ok=True,
+                chart_dir=chart_dir,
+                values_file=values_path,
+                docs=_rendered_docs("100m", "1"),
+            )
+
+        monkeypatch.setattr(
+            "kubeagle.models.optimization.optimizer_controller.render_chart",
+            _render,
+        )
+        controller = UnifiedOptimizerController(analysis_source="rendered")
+        controller._helm_available = True
+        chart = ChartInfo(
+            name="api",
+            team="platform",
+            values_file=str(values_path),
+            cpu_request=100.0,
+            cpu_limit=1000.0,
+            memory_request=128 * 1024**2,
+            memory_limit=256 * 1024**2,
+            qos_class=QoSClass.BURSTABLE,
+            has_liveness=False,
+            has_readiness=False,
+            has_startup=False,
+            has_anti_affinity=False,
+            has_topology_spread=False,
+            has_topology=False,
+            pdb_enabled=False,
+            pdb_template_exists=False,
+            pdb_min_available=None,
+            pdb_max_unavailable=None,
+            replicas=2,
+            priority_class=None,
+        )
+
+        assert "RES005" in {v.rule_id for v in controller.check_chart(chart)}
+        assert len(renders) == 1
+
+        _rewrite(values_path, _VALUES.replace("podAnnotations: {}", "podAnnotations:\n  a: b"))
+        controller.check_chart(chart)
+        assert len(renders) == 1
+
+        _rewrite(values_path, _VALUES.replace("cpu: 100m", "cpu: 800m"))
+        patched = controller.check_chart(chart)
+        assert len(renders) == 1
+        assert "RES005" not in {v.rule_id for v in patched}
+
+        _rewrite(values_path, _VALUES.replace("replicaCount: 2", "replicaCount: 3"))
+        controller.check_chart(chart)
+        assert len(renders) == 2
@@ -0,0 +1,286 @@
+"""Tests for threshold-aware optimizer outcome caching."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from kubeagle.constants.enums import QoSClass
+from kubeagle.constants.optimizer import (
+    LIMIT_REQUEST_RATIO_THRESHOLD as DEFAULT_LIMIT_REQUEST_RATIO_THRESHOLD,
+    LOW_CPU_THRESHOLD_MILLICORES as DEFAULT_LOW_CPU_THRESHOLD_MILLICORES,
+)
+from kubeagle.models.charts.chart_info import ChartInfo
+from kubeagle.models.optimization import UnifiedOptimizerController
+from kubeagle.models.optimization.optimization_rule import OptimizationRule
+from kubeagle.models.optimization.optimization_violation import (
+    OptimizationViolation,
+)
+from kubeagle.optimizer.helm_renderer import HelmRenderResult
+from kubeagle.optimizer.rule_features import ChartFeatures
+from kubeagle.optimizer.rules import (
+    RULES_BY_ID,
+    configure_rule_thresholds,
+    current_rule_thresholds,
+)
+from kubeagle.optimizer.violation_cache import (
+    RENDERED_INPUT_CACHE,
+    VIOLATION_CACHE,
+    ViolationCache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches() -> Generator[None, None, None]:
+    VIOLATION_CACHE.clear()
+    RENDERED_INPUT_CACHE.clear()
+    yield
+    configure_rule_thresholds(
+        limit_request_ratio_threshold=DEFAULT_LIMIT_REQUEST_RATIO_THRESHOLD,
+        low_cpu_threshold_millicores=DEFAULT_LOW_CPU_THRESHOLD_MILLICORES,
+        fixed_resource_fields={"cpu_limit", "memory_limit"},
+    )
+    VIOLATION_CACHE.clear()
+    RENDERED_INPUT_CACHE.clear()
+
+
+def _make_chart(values_file: str = "charts/api/values.yaml") -> ChartInfo:
+    return ChartInfo(
+        name="api",
+        team="platform",
+        values_file=values_file,
+        cpu_request=100.0,
+        cpu_limit=800.0,
+        memory_request=128 * 1024**2,
+        memory_limit=256 * 1024**2,
+        qos_class=QoSClass.BURSTABLE,
+        has_liveness=True,
+        has_readiness=False,
+        has_startup=False,
+        has_anti_affinity=False,
+        has_topology_spread=False,
+        has_topology=False,
+        pdb_enabled=False,
+        pdb_template_exists=False,
+        pdb_min_available=None,
+        pdb_max_unavailable=None,
+        replicas=2,
+        priority_class=None,
+    )
+
+
+def _counting_rule(
+    rule_id: str,
+    thresholds: tuple[str, ...] | None,
+    calls: list[str],
+) -> OptimizationRule:
+    def _evaluate(_features: ChartFeatures) -> list[OptimizationViolation]:
+        calls.append(rule_id)
+        return [
+            OptimizationViolation(
+                rule_id=rule_id,
+                name=rule_id,
+                description="counted",
+                severity="info",
+                category="resources",
+            )
+        ]
+
+    return OptimizationRule(
+        id=rule_id,
+        name=rule_id,
+        description="counted",
+        severity="info",
+        category="resources",
+        check=lambda _chart: [],
+        evaluate=_evaluate,
+        thresholds=thresholds,
+    )
+
+
+class TestViolationCache:
+    """Tests for ViolationCache keys and invalidation."""
+
+    def test_reuses_outcome_until_a_read_threshold_changes(self) -> None:
+        """Test only rules reading the changed threshold re-evaluate."""
+        calls: list[str] = []
+        ratio_rule = _counting_rule("R1", ("limit_request_ratio_threshold",), calls)
+        probe_rule = _counting_rule("R2", (), calls)
+        cache = ViolationCache()
+        features = ChartFeatures.from_chart_info(_make_chart())
+        fingerprint = features.fingerprint()
+
+        def _run() -> None:
+            thresholds = current_rule_thresholds()
+            for rule in (ratio_rule, probe_rule):
+                cache.evaluate(
+                    rule, features, fingerprint=fingerprint, thresholds=thresholds,
+                )
+
+        _run()
+        _run()
+        assert calls == ["R1", "R2"]
+
+        configure_rule_thresholds(limit_request_ratio_threshold=7.5)
+        _run()
+        assert calls == ["R1", "R2", "R1"]
+
+    def test_undeclared_thresholds_are_never_cached(self) -> None:
+        """Test rules without declared dependencies always evaluate."""
+        calls: list[str] = []
+        rule = _counting_rule("CUSTOM", None, calls)
+        cache = ViolationCache()
+        features = ChartFeatures()
+
+        for _ in range(2):
+            cache.evaluate(
+                rule,
+                features,
+                fingerprint=features.fingerprint(),
+                thresholds=current_rule_thresholds(),
+            )
+
+        assert calls == ["CUSTOM", "CUSTOM"]
+        assert len(cache) == 0
+
+    def test_configure_invalidates_only_dependent_rules(self) -> None:
+        """Test a setting change drops entries of dependent rules only."""
+        controller = UnifiedOptimizerController(analysis_source="values")
+        controller.check_chart(_make_chart())
+        cached_rule_ids = {key[1] for key in VIOLATION_CACHE._entries}
+
+        changed = configure_rule_thresholds(low_cpu_threshold_millicores=500)
+
+        assert changed == frozenset({"low_cpu_threshold_millicores"})
+        remaining = {key[1] for key in VIOLATION_CACHE._entries}
+        assert remaining == cached_rule_ids - {"RES007"}
+        assert configure_rule_thresholds(low_cpu_threshold_millicores=500) == frozenset()
+
+    def test_cached_results_follow_threshold_changes(self) -> None:
+        """Test cached evaluation matches uncached rules after a change."""
+        controller = UnifiedOptimizerController(analysis_source="values")
+        chart = _make_chart()
+        assert "RES005" in {v.rule_id for v in controller.check_chart(chart)}
+
+        configure_rule_thresholds(limit_request_ratio_threshold=100.0)
+        relaxed = {v.rule_id for v in controller.check_chart(chart)}
+
+        assert "RES005" not in relaxed
+        assert "PRB002" in relaxed
+        assert RULES_BY_ID["PRB002"].thresholds == ()
+
+
+class TestRenderedInputReuse:
+    """Tests for reusing rendered rule inputs across re-checks."""
+
+    def test_threshold_change_does_not_rerender(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+    ) -> None:
+        """Test renders are reused until the chart templates change."""
+        chart_dir = tmp_path / "api"
+        chart_dir.mkdir()
+        (chart_dir / "Chart.yaml").write_text("apiVersion: v2\nname: api\nversion: 0.1.0\n")
+        values_path = chart_dir / "values.yaml"
+        values_path.write_text("replicaCount: 2\n")
+        renders: list[Path] = []
+
+        def _render(**kwargs: object) -> HelmRenderResult:
+            renders.append(values_path)
+            return HelmRenderResult(
+                ok=True,
+                chart_dir=chart_dir,
+                values_file=values_path,
+                docs=[
+                    {
+                        "kind": "Deployment",
+                        "metadata": {"name": "api"},
+                        "spec": {
+                            "replicas": 2,
+                            "template": {
+                                "spec": {
+                                    "containers": [
+                                        {
+                                            "name": "api",
+                                            "resources": {
+                                                "requests": {"cpu": "100m"},
+                                                "limits": {"cpu": "1"},
+                                            },
+                                        }
+                                    ]
+                                }
+                            },
+                        },
+                    }
+                ],
+            )
+
+        monkeypatch.setattr(
+            "kubeagle.models.optimization.optimizer_controller.render_chart",
+            _render,
+        )
+        controller = UnifiedOptimizerController(analysis_source="rendered")
+        controller._helm_available = True
+        chart = _make_chart(str(values_path))
+
+        first = {v.rule_id for v in controller.check_chart(chart)}
+        configure_rule_thresholds(limit_request_ratio_threshold=100.0)
+        second = {v.rule_id for v in controller.check_chart(chart)}
+
+        assert len(renders) == 1
+        assert "RES005" in first
+        assert "RES005" not in second
+
+        templates_dir = chart_dir / "templates"
+        templates_dir.mkdir()
+        (templates_dir / "deployment.yaml").write_text("replicas: {{ .Values.replicaCount }}\n")
+        controller.check_chart(chart)
+
+        assert len(renders) == 2
+
+    def test_rule_reports_first_matching_workload(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+    ) -> None:
+        """Test each rule reports its first matching workload in doc order."""
+        chart_dir = tmp_path / "umbrella"
+        chart_dir.mkdir()
+        (chart_dir / "Chart.yaml").write_text("apiVersion: v2\nname: umbrella\nversion: 0.1.0\n")
+        values_path = chart_dir / "values.yaml"
+        values_path.write_text("{}\n")
+
+        def _deployment(name: str, *, probes: bool) -> dict:
+            container: dict = {"name": name, "resources": {"requests": {"cpu": "5m"}}}
+            if probes:
+                container["readinessProbe"] = {"tcpSocket": {"port": 80}}
+            return {
+                "kind": "Deployment",
+                "metadata": {"name": name},
+                "spec": {"template": {"spec": {"containers": [container]}}},
+            }
+
+        docs = [
+            _deployment("ready", probes=True),
+            *(_deployment(f"svc-{index}", probes=False) for index in range(20)),
+        ]
+        monkeypatch.setattr(
+            "kubeagle.models.optimization.optimizer_controller.render_chart",
+            lambda **kwargs: HelmRenderResult(
+                ok=True, chart_dir=chart_dir, values_file=values_path, docs=docs,
+            ),
+        )
+        controller = UnifiedOptimizerController(analysis_source="rendered")
+        controller._helm_available = True
+
+        violations = controller.check_chart(_make_chart(str(values_path)))
+
+        assert [v.rule_id for v in violations] == [
+            rule.id
+            for rule in controller.rules
+            if rule.id in {v.rule_id for v in violations}
+        ]
+        readiness = next(v for v in violations if v.rule_id == "PRB002")
+        assert readiness.analysis_source == "rendered"
+        rule_ids = [v.rule_id for v in violations]
+        assert rule_ids.count("RES007") == 1
+        assert len(rule_ids) == len(set(rule_ids))
@@ -723,3 +723,40 @@ __all__ = [
     "TestHelperMethods",
     "TestSorting",
 ]
+
+
+# =============================================================================
+# Row Cache Tests
+# =============================================================================
+
+
+class TestFormatChartRowCache:
+    """Test format_chart_row caching."""
+
+    def test_repeated_format_is_cached(self) -> None:
+        """Test the same chart object is formatted once."""
+        presenter = ChartsExplorerPresenter()
+        chart = _make_chart()
+        first = presenter.format_chart_row(chart)
+        second = presenter.format_chart_row(chart)
+        assert first is second
+        assert presenter.row_cache.misses == 1
+
+    def test_invalidate_and_theme_change_reformat(self) -> None:
+        """Test reloads and theme changes produce fresh rows."""
+        presenter = ChartsExplorerPresenter()
+        chart = _make_chart()
+        first = presenter.format_chart_row(chart)
+        presenter.invalidate_rows()
+        assert presenter.format_chart_row(chart) is not first
+        presenter.set_theme("textual-light")
+        presenter.format_chart_row(chart)
+        assert presenter.row_cache.misses == 3
+
+    def test_warm_row_cache(self) -> None:
+        """Test warm-up fills rows for later lookups."""
+        presenter = ChartsExplorerPresenter()
+        charts = [_make_chart(name="a"), _make_chart(name="b")]
+        assert presenter.warm_row_cache(charts) == 2
+        presenter.format_chart_row(charts[0])
+        assert presenter.row_cache.hits == 1
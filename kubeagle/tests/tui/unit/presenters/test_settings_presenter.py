@@ -41,6 +41,8 @@ class MockSettingsScreen:
         self._mock_settings.refresh_interval = 60
         self._mock_settings.auto_refresh = False
         self._mock_settings.export_path = "/test/export"
+        self._mock_settings.instance_price_table_path = "/test/prices.yaml"
+        self._mock_settings.use_git_index_discovery = False
         self._mock_settings.event_age_hours = 24.0
         self._mock_settings.high_cpu_threshold = 80
         self._mock_settings.high_memory_threshold = 80
@@ -205,6 +207,15 @@ class TestSettingsPresenterGetValue:
 
         assert value is True
 
+    def test_get_value_instance_price_table_path(self) -> None:
+        """Test getting instance price table path setting value."""
+        mock_screen = MockSettingsScreen()
+        presenter = SettingsPresenter(mock_screen)
+
+        value = presenter.get_value("instance-price-table-input")
+
+        assert value == "/test/prices.yaml"
+
     def test_get_value_helm_template_timeout(self) -> None:
         """Test getting helm template timeout setting value."""
         mock_screen = MockSettingsScreen()
@@ -285,6 +296,43 @@ class TestSettingsPresenterValidation:
         assert hasattr(presenter, 'validate_and_save')
         assert callable(presenter.validate_and_save)
 
+    def test_validate_and_save_stores_git_index_discovery(self, tmp_path, monkeypatch) -> None:
+        """Test the git index discovery switch is saved to settings."""
+        saved: list[object] = []
+        monkeypatch.setattr(
+            "kubeagle.screens.settings.presenter.ConfigManager.save", saved.append,
+        )
+        mock_screen = MockSettingsScreen()
+        presenter = SettingsPresenter(mock_screen)
+        assert presenter.get_value("git-index-discovery-switch") is False
+
+        ok, _ = presenter.validate_and_save(
+            {"charts-path-input": str(tmp_path)},
+            {"git-index-discovery-switch": True},
+        )
+
+        assert ok is True
+        assert len(saved) == 1
+        assert presenter.get_value("git-index-discovery-switch") is True
+
+    def test_validate_and_save_rejects_unreadable_price_table(self, tmp_path) -> None:
+        """Test a malformed instance price table blocks saving."""
+        mock_screen = MockSettingsScreen()
+        presenter = SettingsPresenter(mock_screen)
+        table = tmp_path / "prices.yaml"
+        table.write_text("- spot_hourly_usd: 0.1\n")
+
+        ok, message = presenter.validate_and_save(
+            {
+                "charts-path-input": str(tmp_path),
+                "instance-price-table-input": str(table),
+            },
+            {},
+        )
+
+        assert ok is False
+        assert "Invalid instance price table" in message
+
 
 # =============================================================================
 # SettingsPresenter Parse Tests
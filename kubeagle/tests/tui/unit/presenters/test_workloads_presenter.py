@@ -604,3 +604,41 @@ def test_assigned_node_detail_rows_include_real_usage_percentages() -> None:
             "1.0Gi (12%)",
         )
     ]
+
+
+def test_formatted_rows_are_cached_until_data_revision_changes() -> None:
+    presenter = WorkloadsPresenter(screen=SimpleNamespace())
+    workload = _make_workload(name="api", kind="Deployment", cpu_request=100, cpu_limit=200)
+    presenter._data["all_workloads"] = [workload]
+    columns = WORKLOADS_TABLE_COLUMNS_BY_TAB[TAB_WORKLOADS_ALL]
+
+    first = presenter.format_workload_rows([workload], columns=columns)
+    second = presenter.format_workload_rows([workload], columns=columns)
+
+    assert first == second
+    assert first[0] is second[0]
+    assert presenter.row_cache.hits == 1
+
+    presenter.row_cache.bump_revision()
+    third = presenter.format_workload_rows([workload], columns=columns)
+    assert third == first
+    assert third[0] is not first[0]
+
+
+def test_warm_row_cache_prefills_only_given_column_set() -> None:
+    presenter = WorkloadsPresenter(screen=SimpleNamespace())
+    presenter._data["all_workloads"] = [
+        _make_workload(name="api", kind="Deployment"),
+        _make_workload(name="db", kind="StatefulSet"),
+    ]
+    active = WORKLOADS_TABLE_COLUMNS_BY_TAB[TAB_WORKLOADS_ALL]
+    other = WORKLOADS_TABLE_COLUMNS_BY_TAB[TAB_WORKLOADS_NODE_ANALYSIS]
+
+    assert presenter.warm_row_cache(active, theme="") == 2
+    assert len(presenter.row_cache) == 2
+
+    presenter.get_resource_rows(columns=active)
+    assert presenter.row_cache.misses == 2
+
+    presenter.get_resource_rows(columns=other)
+    assert presenter.row_cache.misses == 4
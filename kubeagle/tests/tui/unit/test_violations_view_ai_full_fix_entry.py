@@ -527,3 +527,92 @@ def test_minimized_bulk_banner_counts_non_apply_terminal_status_as_complete() ->
     assert state.is_finished is True
     assert state.has_error is False
     assert state.status_text == "AI Fix complete for alchemy (Other)"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_apply_all_render_verification_drops_only_breaking_fixes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    """Fixes that break helm template are dropped; unresolved ones are reported apart."""
+    from kubeagle.optimizer.fix_verifier import (
+        BulkFixVerificationResult,
+        FixVerificationResult,
+    )
+
+    (tmp_path / "Chart.yaml").write_text("apiVersion: v2\nname: api\nversion: 0.1.0\n")
+    values_path = str(tmp_path / "values.yaml")
+    calls: list[list[str]] = []
+
+    def _verify(**kwargs: object) -> BulkFixVerificationResult:
+        candidates = cast("list", kwargs["candidates"])
+        calls.append([candidate.rule_id for candidate in candidates])
+        return BulkFixVerificationResult(
+            per_fix={
+                "0": FixVerificationResult(status="verified"),
+                "1": FixVerificationResult(status="unverified", note="Render failed"),
+                "2": FixVerificationResult(status="unresolved", note="Still present"),
+            },
+            render_count=2,
+            render_failed={"1"},
+        )
+
+    monkeypatch.setattr(
+        "kubeagle.screens.detail.components.violations_view.verify_values_fixes_bulk",
+        _verify,
+    )
+    view = ViolationsView()
+    pending = {
+        values_path: [("api", "RES002", {}), ("api", "PRB001", {}), ("api", "RES005", {})],
+        str(tmp_path / "missing" / "values.yaml"): [("other", "RES002", {})],
+    }
+    failed_details: list[str] = []
+    unresolved_details: list[str] = []
+
+    dropped = await view._drop_fixes_breaking_render(
+        pending, failed_details, unresolved_details,
+    )
+
+    assert calls == [["RES002", "PRB001", "RES005"]]
+    assert dropped == 1
+    assert [rule for _, rule, _ in pending[values_path]] == ["RES002", "RES005"]
+    assert len(pending) == 2
+    assert failed_details == ["api (PRB001): Render failed"]
+    assert unresolved_details == ["api (RES005) unresolved: Still present"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_interrupted_ai_fix_jobs_resume_only_on_user_choice(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Interrupted AI fix jobs are offered and only resumed when chosen."""
+    calls: list[tuple[str, list[str]]] = []
+    scheduler = SimpleNamespace(
+        interrupted_jobs=lambda: {
+            "job-1": SimpleNamespace(chart_dir=Path("/charts/api")),
+            "job-2": SimpleNamespace(chart_dir=Path("/charts/worker")),
+        },
+        set_max_workers=lambda _count: None,
+        resume=lambda job_ids: calls.append(("resume", list(job_ids))) or len(job_ids),
+        discard_interrupted=lambda job_ids: calls.append(("discard", list(job_ids))) or 0,
+    )
+    monkeypatch.setattr(
+        "kubeagle.screens.detail.components.violations_view.get_ai_fix_scheduler",
+        lambda: scheduler,
+    )
+    view = ViolationsView()
+    notices: list[str] = []
+    monkeypatch.setattr(view, "notify", lambda message, **_: notices.append(message))
+    monkeypatch.setattr(view, "_ai_fix_bulk_parallelism", lambda: 2)
+
+    await view._offer_interrupted_ai_fix_jobs()
+
+    assert calls == []
+    assert view._offered_ai_fix_job_ids == ["job-1", "job-2"]
+
+    await view._decide_interrupted_ai_fix_jobs(resume=True)
+
+    assert calls == [("resume", ["job-1", "job-2"])]
+    assert view._offered_ai_fix_job_ids == []
+    assert notices and notices[0].startswith("Resumed 2 AI fix job(s)")
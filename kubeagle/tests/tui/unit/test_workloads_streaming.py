@@ -10,8 +10,12 @@ import pytest
 from kubeagle.screens.workloads.config import (
     TAB_WORKLOADS_ALL,
     TAB_WORKLOADS_EXTREME_RATIOS,
+    TAB_WORKLOADS_NODE_ANALYSIS,
+)
+from kubeagle.screens.workloads.presenter import (
+    WorkloadsDataLoaded,
+    WorkloadsSourceLoaded,
 )
-from kubeagle.screens.workloads.presenter import WorkloadsSourceLoaded
 from kubeagle.screens.workloads.workloads_screen import WorkloadsScreen
 
 
@@ -731,3 +735,68 @@ def test_refresh_active_tab_reuses_filtered_workloads_for_summary_and_table(
     assert presenter_calls == ["filtered"]
     assert summary_payloads == [{"shown_total": "1/1"}]
     assert table_payloads == [(TAB_WORKLOADS_ALL, filtered_workloads)]
+
+
+@pytest.mark.unit
+def test_data_loaded_starts_row_cache_warmup(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Completed loads should warm the row cache for the active tab's columns."""
+    screen = WorkloadsScreen()
+    workers: list[tuple[Any, dict[str, Any]]] = []
+    warm_calls: list[tuple[list[tuple[str, int]], str]] = []
+
+    monkeypatch.setattr(
+        WorkloadsScreen,
+        "app",
+        property(lambda _self: SimpleNamespace(theme="textual-dark")),
+    )
+    monkeypatch.setattr(screen, "_set_load_progress", lambda progress, message: None)
+    monkeypatch.setattr(screen, "hide_loading_overlay", lambda: None)
+    monkeypatch.setattr(screen, "_refresh_filter_options", lambda: None)
+    monkeypatch.setattr(screen, "_refresh_active_tab", lambda: None)
+    monkeypatch.setattr(
+        screen,
+        "run_worker",
+        lambda work, **kwargs: workers.append((work, kwargs)),
+    )
+    monkeypatch.setattr(
+        screen._presenter,
+        "warm_row_cache",
+        lambda columns, *, theme, should_stop: warm_calls.append((columns, theme))
+        or 0,
+    )
+    monkeypatch.setattr(
+        "kubeagle.screens.workloads.workloads_screen.get_current_worker",
+        lambda: SimpleNamespace(is_cancelled=False),
+    )
+
+    screen.on_workloads_data_loaded(WorkloadsDataLoaded())
+
+    assert len(workers) == 1
+    work, kwargs = workers[0]
+    assert kwargs["group"] == "workloads-row-cache"
+    assert kwargs["thread"] is True
+    work()
+    assert len(warm_calls) == 1
+    columns, theme = warm_calls[0]
+    assert theme == "textual-dark"
+    assert columns == screen._columns_for_tab(screen._active_tab_id)
+
+
+@pytest.mark.unit
+def test_tab_switch_warms_row_cache_for_new_tab(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Switching tabs after loading should warm only the new tab's columns."""
+    screen = WorkloadsScreen()
+    screen._is_loading = False
+    screen._presenter._data["all_workloads"] = [SimpleNamespace(name="api")]
+    warmups: list[str] = []
+    monkeypatch.setattr(screen, "call_later", lambda callback: None)
+    monkeypatch.setattr(
+        screen,
+        "_start_row_cache_warmup",
+        lambda: warmups.append(screen._active_tab_id),
+    )
+
+    screen._set_active_tab(TAB_WORKLOADS_NODE_ANALYSIS)
+    screen._set_active_tab(TAB_WORKLOADS_NODE_ANALYSIS)
+
+    assert warmups == [TAB_WORKLOADS_NODE_ANALYSIS]
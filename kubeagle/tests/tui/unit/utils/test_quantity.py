@@ -0,0 +1,119 @@
+"""Tests for Kubernetes quantity parsing."""
+
+from __future__ import annotations
+
+import pytest
+
+from kubeagle.utils.quantity import (
+    _parse_quantity_text,
+    clear_quantity_cache,
+    parse_quantities,
+    parse_quantity,
+)
+
+
+class TestParseQuantity:
+    """Tests for parse_quantity function."""
+
+    def test_decimal_si_suffixes(self) -> None:
+        """Test parsing decimal SI suffixes to base units."""
+        assert parse_quantity("100m") == pytest.approx(0.1)
+        assert parse_quantity("500000u") == pytest.approx(0.5)
+        assert parse_quantity("500000000n") == pytest.approx(0.5)
+        assert parse_quantity("2k") == 2000.0
+        assert parse_quantity("1M") == 1_000_000.0
+        assert parse_quantity("1G") == 1_000_000_000.0
+        assert parse_quantity("1E") == 1e18
+
+    def test_binary_si_suffixes(self) -> None:
+        """Test parsing binary SI suffixes to bytes."""
+        assert parse_quantity("1Ki") == 1024.0
+        assert parse_quantity("512Mi") == 512 * 1024**2
+        assert parse_quantity("1Gi") == 1024**3
+        assert parse_quantity("1Pi") == 1024**5
+
+    def test_exponents(self) -> None:
+        """Test parsing decimal exponents."""
+        assert parse_quantity("1e3") == 1000.0
+        assert parse_quantity("1E3") == 1000.0
+        assert parse_quantity("2.5e-2") == pytest.approx(0.025)
+
+    def test_plain_numbers(self) -> None:
+        """Test parsing plain and numeric inputs."""
+        assert parse_quantity("2") == 2.0
+        assert parse_quantity("+1.5") == 1.5
+        assert parse_quantity(".5") == 0.5
+        assert parse_quantity(2) == 2.0
+        assert parse_quantity(0.25) == 0.25
+
+    def test_output_units_are_exact(self) -> None:
+        """Test conversion into millicores and mebibytes."""
+        assert parse_quantity("100m", unit="m") == 100.0
+        assert parse_quantity("0.5", unit="m") == 500.0
+        assert parse_quantity("1e-3", unit="m") == 1.0
+        assert parse_quantity("512Mi", unit="Mi") == 512.0
+        assert parse_quantity("1024Ki", unit="Mi") == 1.0
+        assert parse_quantity("1Gi", unit="Mi") == 1024.0
+
+    def test_invalid_and_empty(self) -> None:
+        """Test invalid inputs return None."""
+        assert parse_quantity(None) is None
+        assert parse_quantity("") is None
+        assert parse_quantity("   ") is None
+        assert parse_quantity("abc") is None
+        assert parse_quantity("1Xi") is None
+        assert parse_quantity("1mi") is None
+        assert parse_quantity(True) is None
+
+    def test_unknown_unit_raises(self) -> None:
+        """Test unknown output unit raises ValueError."""
+        with pytest.raises(ValueError):
+            parse_quantity("1", unit="cores")
+
+    def test_results_are_cached(self) -> None:
+        """Test repeated strings are served from the cache."""
+        clear_quantity_cache()
+        parse_quantity("250m")
+        parse_quantity(" 250m ")
+        info = _parse_quantity_text.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+
+class TestParseQuantities:
+    """Tests for parse_quantities batch function."""
+
+    def test_parses_in_order(self) -> None:
+        """Test batch parsing preserves order and invalid entries."""
+        result = parse_quantities(["100m", "1", None, "bad", "100m"], unit="m")
+        assert result == [100.0, 1000.0, None, None, 100.0]
+
+    def test_empty_input(self) -> None:
+        """Test batch parsing an empty iterable."""
+        assert parse_quantities([]) == []
+
+    def test_workload_totals_sum_batched_quantities(self) -> None:
+        """Test workload resource totals tolerate numbers and missing values."""
+        from kubeagle.controllers.cluster.controller import ClusterController
+
+        item = {
+            "kind": "Deployment",
+            "spec": {
+                "template": {
+                    "spec": {
+                        "containers": [
+                            {"resources": {"requests": {"cpu": "250m", "memory": "1Gi"}}},
+                            {"resources": {"requests": {"cpu": 1}, "limits": {"cpu": None}}},
+                            {"resources": "invalid"},
+                        ]
+                    }
+                }
+            },
+        }
+
+        assert ClusterController._extract_workload_resource_totals(item) == (
+            1250.0,
+            0.0,
+            1073741824.0,
+            0.0,
+        )
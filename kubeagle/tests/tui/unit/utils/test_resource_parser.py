@@ -39,6 +39,10 @@ class TestParseCpu:
         """Test parsing invalid CPU string."""
         assert parse_cpu("invalid") == 0.0
 
+    def test_parse_cpu_exponent(self) -> None:
+        """Test parsing CPU with a decimal exponent."""
+        assert parse_cpu("1e3") == 1000.0
+
     def test_parse_cpu_with_whitespace(self) -> None:
         """Test parsing CPU string with whitespace."""
         assert parse_cpu(" 100m ") == 0.1
@@ -62,6 +66,11 @@ class TestMemoryStrToBytes:
         result = memory_str_to_bytes("1024Ki")
         assert result == 1024 * 1024
 
+    def test_memory_str_to_bytes_decimal_suffix(self) -> None:
+        """Test converting decimal SI suffixes to bytes."""
+        assert memory_str_to_bytes("1G") == 1_000_000_000
+        assert memory_str_to_bytes("128M") == 128_000_000
+
     def test_memory_str_to_bytes_empty(self) -> None:
         """Test converting empty string."""
         assert memory_str_to_bytes("") == 0.0
@@ -0,0 +1,120 @@
+"""Tests for the formatted-row cache."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from kubeagle.utils.row_cache import FormattedRowCache
+
+
+def _counting_formatter(calls: list[str]):
+    def _format(record: SimpleNamespace) -> tuple[str, ...]:
+        calls.append(record.name)
+        return (record.name.upper(),)
+
+    return _format
+
+
+class TestFormattedRowCache:
+    """Tests for FormattedRowCache."""
+
+    def test_hit_reuses_formatted_row(self) -> None:
+        """Test a second lookup for the same object does not re-format."""
+        calls: list[str] = []
+        cache = FormattedRowCache()
+        record = SimpleNamespace(name="api")
+        fmt = _counting_formatter(calls)
+
+        first = cache.get_or_format(record, identity="api", columns=("Name",), formatter=fmt)
+        second = cache.get_or_format(record, identity="api", columns=("Name",), formatter=fmt)
+
+        assert first == second == ("API",)
+        assert calls == ["api"]
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_key_includes_columns_and_theme(self) -> None:
+        """Test column set and theme changes are cache misses."""
+        calls: list[str] = []
+        cache = FormattedRowCache()
+        record = SimpleNamespace(name="api")
+        fmt = _counting_formatter(calls)
+
+        cache.get_or_format(record, identity="api", columns=("A",), formatter=fmt)
+        cache.get_or_format(record, identity="api", columns=("B",), formatter=fmt)
+        cache.get_or_format(
+            record, identity="api", columns=("A",), formatter=fmt, theme="dark",
+        )
+
+        assert len(calls) == 3
+
+    def test_different_object_same_identity_is_miss(self) -> None:
+        """Test a replaced source object is never served a stale row."""
+        calls: list[str] = []
+        cache = FormattedRowCache()
+        fmt = _counting_formatter(calls)
+
+        cache.get_or_format(SimpleNamespace(name="a"), identity="x", columns=(), formatter=fmt)
+        row = cache.get_or_format(
+            SimpleNamespace(name="b"), identity="x", columns=(), formatter=fmt,
+        )
+
+        assert row == ("B",)
+        assert calls == ["a", "b"]
+
+    def test_bump_revision_invalidates(self) -> None:
+        """Test bumping the revision drops all rows."""
+        calls: list[str] = []
+        cache = FormattedRowCache()
+        record = SimpleNamespace(name="api")
+        fmt = _counting_formatter(calls)
+
+        cache.get_or_format(record, identity="api", columns=(), formatter=fmt)
+        assert cache.bump_revision() == 1
+        assert len(cache) == 0
+        cache.get_or_format(record, identity="api", columns=(), formatter=fmt)
+
+        assert calls == ["api", "api"]
+
+    def test_bounded_size(self) -> None:
+        """Test least recently used rows are evicted."""
+        cache = FormattedRowCache(max_rows=2)
+        records = [SimpleNamespace(name=str(i)) for i in range(3)]
+        for record in records:
+            cache.get_or_format(
+                record, identity=record.name, columns=(), formatter=lambda r: (r.name,),
+            )
+
+        assert len(cache) == 2
+        assert cache.get(records[0], identity="0", columns=()) is None
+        assert cache.get(records[2], identity="2", columns=()) == ("2",)
+
+    def test_warm_prefills_and_stops(self) -> None:
+        """Test warm formats missing rows and honours should_stop."""
+        calls: list[str] = []
+        cache = FormattedRowCache()
+        records = [SimpleNamespace(name=str(i)) for i in range(5)]
+        fmt = _counting_formatter(calls)
+
+        formatted = cache.warm(
+            records[:3], identity=lambda r: r.name, columns=(), formatter=fmt,
+        )
+        assert formatted == 3
+        assert cache.warm(records, identity=lambda r: r.name, columns=(), formatter=fmt,
+                          should_stop=lambda: len(calls) >= 4) == 1
+        assert calls == ["0", "1", "2", "3"]
+
+    def test_warm_never_evicts_its_own_rows(self) -> None:
+        """Test warm stops at max_rows so the warmed rows stay cached."""
+        calls: list[str] = []
+        cache = FormattedRowCache(max_rows=2)
+        records = [SimpleNamespace(name=str(i)) for i in range(4)]
+
+        formatted = cache.warm(
+            records, identity=lambda r: r.name, columns=(),
+            formatter=_counting_formatter(calls),
+        )
+
+        assert formatted == 2
+        assert calls == ["0", "1"]
+        assert cache.get(records[0], identity="0", columns=()) == ("0",)
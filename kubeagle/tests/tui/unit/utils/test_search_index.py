@@ -0,0 +1,97 @@
+"""Tests for the trigram search index."""
+
+from __future__ import annotations
+
+import random
+import string
+from types import SimpleNamespace
+
+from kubeagle.utils.search_index import SearchIndex
+
+
+def _record(name: str, team: str = "core", namespace: str = "default") -> SimpleNamespace:
+    return SimpleNamespace(name=name, team=team, namespace=namespace)
+
+
+def _index(separator: str = "\0") -> SearchIndex:
+    return SearchIndex(
+        lambda record: (record.name, record.namespace, record.team),
+        separator=separator,
+    )
+
+
+class TestSearchIndex:
+    """Tests for SearchIndex."""
+
+    def test_matches_equal_substring_scan(self) -> None:
+        """Test indexed results are exactly those of a linear substring scan."""
+        rng = random.Random(7)
+        alphabet = string.ascii_lowercase[:6] + "-"
+        records = [
+            _record(
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12))),
+                team=rng.choice(["Core", "Payments", "Data"]),
+            )
+            for _ in range(400)
+        ]
+        index = _index()
+        index.sync(records)
+
+        for query in ["a", "ab", "abc", "-ca", "PAY", "core", "zzz", "fault"]:
+            q = query.lower()
+            expected = [
+                r for r in records
+                if any(q in field.lower() for field in (r.name, r.namespace, r.team))
+            ]
+            assert index.filter(records, query) == expected
+
+    def test_separator_controls_cross_field_matches(self) -> None:
+        """Test queries only span fields when the separator allows it."""
+        record = _record("api", namespace="prod")
+        strict = _index()
+        spanning = _index(separator=" ")
+        strict.sync([record])
+        spanning.sync([record])
+
+        assert not strict.matches_record(record, "api prod")
+        assert spanning.matches_record(record, "api prod")
+
+    def test_sync_indexes_only_the_difference(self) -> None:
+        """Test sync adds new records and drops removed ones incrementally."""
+        first = [_record("api"), _record("billing")]
+        index = _index()
+        index.sync(first)
+        revision = index.revision
+
+        index.sync(first)
+        assert index.revision == revision
+
+        streamed = [*first, _record("apigw")]
+        index.sync(streamed)
+        assert len(index) == 3
+        assert [r.name for r in index.filter(streamed, "api")] == ["api", "apigw"]
+
+        remaining = streamed[1:]
+        index.sync(remaining)
+        assert first[0] not in index
+        assert [r.name for r in index.filter(remaining, "api")] == ["apigw"]
+
+    def test_removed_records_are_not_matched_after_compaction(self) -> None:
+        """Test tombstoned postings never leak removed records."""
+        records = [_record(f"svc-{i}") for i in range(50)]
+        index = _index()
+        index.sync(records)
+
+        index.remove(records[:40])
+
+        assert index.match_ids("svc") == {id(r) for r in records[40:]}
+
+    def test_large_index_query_verifies_only_candidates(self) -> None:
+        """Test a selective query on 50k rows returns the right records."""
+        records = [_record(f"workload-{i:05d}", team=f"team-{i % 17}") for i in range(50_000)]
+        index = _index()
+        index.sync(records)
+
+        matched = index.filter(records, "workload-4999")
+
+        assert [r.name for r in matched] == [f"workload-4999{i}" for i in range(10)]
@@ -0,0 +1,45 @@
+"""Tests for Helm-style values merging."""
+
+from __future__ import annotations
+
+from kubeagle.utils.values_merge import merge_helm_values
+
+
+class TestMergeHelmValues:
+    """Tests for merge_helm_values semantics and structural sharing."""
+
+    def test_maps_merge_lists_replace_and_null_deletes(self) -> None:
+        """Test Helm coalescing rules for maps, lists and nulls."""
+        base = {
+            "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}},
+            "tolerations": [{"key": "a"}],
+            "podAnnotations": {"team": "core"},
+        }
+        overlay = {
+            "resources": {"requests": {"cpu": "500m"}},
+            "tolerations": [],
+            "podAnnotations": None,
+            "replicaCount": 3,
+        }
+
+        merged = merge_helm_values(base, overlay)
+
+        assert merged == {
+            "resources": {"requests": {"cpu": "500m", "memory": "128Mi"}},
+            "tolerations": [],
+            "replicaCount": 3,
+        }
+        assert base["resources"]["requests"]["cpu"] == "100m"
+        assert "podAnnotations" in base
+
+    def test_untouched_subtrees_are_shared(self) -> None:
+        """Test only dicts on overridden paths are copied."""
+        base = {"probes": {"liveness": {"path": "/"}}, "resources": {"limits": {"cpu": "1"}}}
+
+        merged = merge_helm_values(base, {"resources": {"limits": {"cpu": "2"}}})
+
+        assert merged["probes"] is base["probes"]
+        assert merged["resources"] is not base["resources"]
+        assert merge_helm_values(base, {}) is base
+        assert merge_helm_values(base, {"probes": {"liveness": {"path": "/"}}}) is base
+        assert merge_helm_values(base, {"missing": None}) is base
@@ -0,0 +1,164 @@
+"""Tests for keyed row diffing and CustomDataTable keyed updates."""
+
+from __future__ import annotations
+
+import pytest
+from textual.app import App, ComposeResult
+
+from kubeagle.widgets.data.tables.custom_data_table import CustomDataTable
+from kubeagle.widgets.data.tables.keyed_rows import diff_keyed_rows, make_row_key
+
+
+@pytest.mark.unit
+@pytest.mark.fast
+class TestDiffKeyedRows:
+    """Tests for diff_keyed_rows."""
+
+    def test_make_row_key(self) -> None:
+        """Test key parts are joined with slashes."""
+        assert make_row_key("default", "Deployment", "api") == "default/Deployment/api"
+        assert make_row_key(None, "Node", "n1") == "/Node/n1"
+
+    def test_no_changes(self) -> None:
+        """Test identical rows produce an empty diff."""
+        current = {"a": ("1", "x"), "b": ("2", "y")}
+        diff = diff_keyed_rows(current, [("a", ("1", "x")), ("b", ("2", "y"))])
+        assert not diff.changed
+        assert diff.order == ["a", "b"]
+
+    def test_inserts_removes_and_cell_updates(self) -> None:
+        """Test only changed cells are reported as updates."""
+        current = {"a": ("1", "x"), "b": ("2", "y"), "c": ("3", "z")}
+        diff = diff_keyed_rows(
+            current,
+            [("a", ("1", "X")), ("c", ("3", "z")), ("d", ("4", "w"))],
+        )
+        assert diff.removed == ["b"]
+        assert diff.inserted == ["d"]
+        assert diff.updated == {"a": {1: "X"}}
+        assert diff.updated_cell_count == 1
+        assert diff.reordered is False
+
+    def test_reorder_detected(self) -> None:
+        """Test moved survivors and mid-table inserts are reorders."""
+        current = {"a": ("1",), "b": ("2",)}
+        assert diff_keyed_rows(current, [("b", ("2",)), ("a", ("1",))]).reordered
+        assert diff_keyed_rows(
+            current, [("a", ("1",)), ("n", ("0",)), ("b", ("2",))],
+        ).reordered
+
+    def test_duplicate_keys_raise(self) -> None:
+        """Test duplicate target keys are rejected."""
+        with pytest.raises(ValueError):
+            diff_keyed_rows({}, [("a", ()), ("a", ())])
+
+
+class _TableApp(App[None]):
+    def __init__(self, *, virtual: bool = False) -> None:
+        super().__init__()
+        self._virtual = virtual
+
+    def compose(self) -> ComposeResult:
+        yield CustomDataTable(
+            columns=[("Name", "name"), ("Status", "status")],
+            id="keyed-table",
+            virtual=self._virtual,
+        )
+
+
+def _rows(count: int, status: str = "Running") -> list[tuple[str, tuple[str, str]]]:
+    return [
+        (make_row_key("default", "Pod", f"pod-{index:03d}"), (f"pod-{index:03d}", status))
+        for index in range(count)
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_keyed_update_touches_only_changed_rows() -> None:
+    """Test refreshes apply in place and keep the cursor on its row."""
+    app = _TableApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        table = app.query_one("#keyed-table", CustomDataTable)
+        first = table.update_rows_keyed(_rows(100))
+        assert first.rebuilt is True
+        await pilot.pause()
+        table.cursor_row = 50
+
+        rows = _rows(100)
+        rows[10] = (rows[10][0], ("pod-010", "Pending"))
+        del rows[0]
+        rows.append((make_row_key("default", "Pod", "pod-new"), ("pod-new", "Running")))
+        diff = table.update_rows_keyed(rows)
+        await pilot.pause()
+
+        assert diff.rebuilt is False
+        assert diff.removed == ["default/Pod/pod-000"]
+        assert diff.inserted == ["default/Pod/pod-new"]
+        assert diff.updated == {"default/Pod/pod-010": {1: "Pending"}}
+        assert table.row_count == 100
+        assert table.get_row_data(9) == ("pod-010", "Pending")
+        assert table.get_row_data(99) == ("pod-new", "Running")
+        assert table.get_row_key_at(table.cursor_row).value == "default/Pod/pod-050"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_keyed_update_reorders_in_place() -> None:
+    """Test a reordered target is applied without repopulating."""
+    app = _TableApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        table = app.query_one("#keyed-table", CustomDataTable)
+        table.update_rows_keyed(_rows(5))
+        await pilot.pause()
+
+        reversed_rows = list(reversed(_rows(5)))
+        diff = table.update_rows_keyed(reversed_rows)
+        await pilot.pause()
+
+        assert diff.reordered is True
+        assert diff.rebuilt is False
+        assert [table.get_row_data(i)[0] for i in range(5)] == [
+            "pod-004", "pod-003", "pod-002", "pod-001", "pod-000",
+        ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_keyed_update_moves_row_with_new_cells() -> None:
+    """Test a moved row is re-added with its updated cells after the kept prefix."""
+    app = _TableApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        table = app.query_one("#keyed-table", CustomDataTable)
+        table.update_rows_keyed(_rows(5))
+        await pilot.pause()
+
+        rows = _rows(5)
+        moved = (rows[1][0], ("pod-001", "Pending"))
+        rows = [rows[0], rows[2], rows[3], rows[4], moved]
+        diff = table.update_rows_keyed(rows)
+        await pilot.pause()
+
+        assert diff.reordered is True
+        assert diff.rebuilt is False
+        assert [table.get_row_data(i) for i in range(5)] == [cells for _key, cells in rows]
+        assert [table.get_row_key_at(i).value for i in range(5)] == [key for key, _ in rows]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_keyed_update_virtual_keeps_cursor_key() -> None:
+    """Test virtual tables keep the cursor on the same key."""
+    app = _TableApp(virtual=True)
+    async with app.run_test(size=(80, 24)) as pilot:
+        table = app.query_one("#keyed-table", CustomDataTable)
+        table.update_rows_keyed(_rows(20))
+        await pilot.pause()
+        table.cursor_row = 5
+
+        table.update_rows_keyed(_rows(20)[3:])
+        await pilot.pause()
+
+        assert table.row_count == 17
+        assert table.cursor_row == 2
+        assert table.get_row_data(2) == ("pod-005", "Running")
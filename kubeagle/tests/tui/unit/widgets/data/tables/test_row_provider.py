@@ -0,0 +1,144 @@
+"""Tests for RowProvider lazy row source."""
+
+from __future__ import annotations
+
+import pytest
+
+from kubeagle.widgets.data.tables.row_provider import RowProvider
+
+
+@pytest.mark.unit
+@pytest.mark.fast
+class TestRowProvider:
+    """Tests for RowProvider."""
+
+    def test_rows_are_formatted_lazily(self) -> None:
+        """Test rows are only formatted when requested."""
+        calls: list[int] = []
+
+        def _format(record: int) -> tuple[str, str]:
+            calls.append(record)
+            return (f"row-{record}", str(record * 2))
+
+        provider = RowProvider(range(100_000), formatter=_format)
+        assert len(provider) == 100_000
+        assert calls == []
+
+        assert provider.get_row(42) == ("row-42", "84")
+        assert calls == [42]
+
+    def test_formatted_rows_are_cached_with_bound(self) -> None:
+        """Test formatted rows are reused and the cache stays bounded."""
+        calls: list[int] = []
+
+        def _format(record: int) -> tuple[int]:
+            calls.append(record)
+            return (record,)
+
+        provider = RowProvider(range(10), formatter=_format, cache_size=2)
+        provider.get_row(0)
+        provider.get_row(0)
+        assert calls == [0]
+
+        provider.get_row(1)
+        provider.get_row(2)
+        provider.get_row(0)
+        assert calls == [0, 1, 2, 0]
+
+    def test_default_formatter_and_key(self) -> None:
+        """Test tuple rows and index keys are used by default."""
+        provider = RowProvider([("a", 1), ("b", 2)])
+        assert provider.get_row(1) == ("b", 2)
+        assert provider.get_row_key(1) == 1
+
+    def test_custom_key(self) -> None:
+        """Test custom key callable is applied to the displayed record."""
+        provider = RowProvider(
+            [{"ns": "a", "name": "x"}, {"ns": "b", "name": "y"}],
+            formatter=lambda r: (r["ns"], r["name"]),
+            key=lambda r: (r["ns"], r["name"]),
+        )
+        assert provider.get_row_key(0) == ("a", "x")
+        assert provider.get_record(1) == {"ns": "b", "name": "y"}
+
+    def test_out_of_range_raises(self) -> None:
+        """Test out-of-range indices raise IndexError."""
+        provider = RowProvider([("a",)])
+        with pytest.raises(IndexError):
+            provider.get_row(1)
+        with pytest.raises(IndexError):
+            provider.get_row(-1)
+
+    def test_sort_by_formatted_cell(self) -> None:
+        """Test sorting reorders display order by formatted cell."""
+        provider = RowProvider([("b", 2), ("c", 3), ("a", 1)])
+        provider.sort(0)
+        assert [provider.get_row(i)[0] for i in range(3)] == ["a", "b", "c"]
+        assert provider.get_row_key(0) == 2
+
+        provider.sort(1, reverse=True)
+        assert [provider.get_row(i)[1] for i in range(3)] == [3, 2, 1]
+
+    def test_sort_with_sort_key(self) -> None:
+        """Test sort_key is used instead of formatted cells."""
+        calls: list[int] = []
+
+        def _format(record: int) -> tuple[str]:
+            calls.append(record)
+            return (str(record),)
+
+        provider = RowProvider(
+            [10, 9, 100],
+            formatter=_format,
+            sort_key=lambda record, _column: record,
+        )
+        provider.sort(0)
+        assert calls == []
+        assert [provider.get_record(i) for i in range(3)] == [9, 10, 100]
+
+    def test_extend_after_sort_appends(self) -> None:
+        """Test appended records follow the current sorted order."""
+        provider = RowProvider([("b",), ("a",)])
+        provider.sort(0)
+        provider.extend([("0",)])
+        assert [provider.get_row(i)[0] for i in range(3)] == ["a", "b", "0"]
+
+    def test_index_of_follows_sort_and_extend(self) -> None:
+        """Test index_of tracks display order through sort and extend."""
+        keys: list[object] = []
+
+        def _key(record: tuple[str, str]) -> str:
+            keys.append(record)
+            return record[1]
+
+        provider = RowProvider([("b", "kb"), ("a", "ka")], key=_key)
+        assert provider.index_of("ka") == 1
+        assert provider.index_of("ka") == 1
+        assert len(keys) == 2
+        assert provider.index_of("missing") is None
+
+        provider.sort(0)
+        assert provider.index_of("ka") == 0
+        assert provider.index_of("kb") == 1
+
+        provider.extend([("c", "kc"), ("d", "ka")])
+        assert provider.index_of("kc") == 2
+        assert provider.index_of("ka") == 0
+
+        provider.clear()
+        assert provider.index_of("ka") is None
+
+    def test_prefetch_and_clear(self) -> None:
+        """Test prefetch formats a window and clear resets state."""
+        calls: list[int] = []
+
+        def _format(record: int) -> tuple[int]:
+            calls.append(record)
+            return (record,)
+
+        provider = RowProvider(range(50), formatter=_format)
+        provider.prefetch(-5, 3)
+        assert calls == [0, 1, 2]
+
+        provider.clear()
+        assert len(provider) == 0
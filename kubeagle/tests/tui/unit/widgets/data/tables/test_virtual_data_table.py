@@ -0,0 +1,114 @@
+"""Tests for virtual mode of CustomDataTable."""
+
+from __future__ import annotations
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.message import Message
+
+from kubeagle.widgets.data.tables.custom_data_table import CustomDataTable
+from kubeagle.widgets.data.tables.row_provider import RowProvider
+from kubeagle.widgets.data.tables.virtual_data_table import VirtualDataTable
+
+
+class _VirtualTableApp(App[None]):
+    def compose(self) -> ComposeResult:
+        yield CustomDataTable(id="virtual-table", virtual=True)
+
+
+@pytest.mark.unit
+@pytest.mark.fast
+def test_virtual_flag_is_exposed() -> None:
+    """Test virtual mode is reported before mount."""
+    assert CustomDataTable(virtual=True).is_virtual is True
+    assert CustomDataTable().is_virtual is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_large_provider_formats_only_visible_rows() -> None:
+    """Test a large provider renders without formatting every row."""
+    formatted: list[int] = []
+
+    def _format(record: int) -> tuple[str, str]:
+        formatted.append(record)
+        return (f"name-{record:06d}", str(record))
+
+    app = _VirtualTableApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        table = app.query_one("#virtual-table", CustomDataTable)
+        assert isinstance(table.data_table, VirtualDataTable)
+        table.add_column("Name", key="name")
+        table.add_column("Value", key="value")
+
+        provider = RowProvider(range(100_000), formatter=_format)
+        table.set_row_provider(provider)
+        await pilot.pause()
+
+        assert table.row_count == 100_000
+        assert table.row_provider is provider
+        assert len(formatted) < 1_000
+        assert table.get_row_data(99_999) == ("name-099999", "99999")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_virtual_cursor_and_sort() -> None:
+    """Test cursor navigation and sorting use the provider order."""
+    app = _VirtualTableApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        table = app.query_one("#virtual-table", CustomDataTable)
+        table.add_column("Name", key="name")
+        provider = RowProvider(
+            ["b", "c", "a"],
+            formatter=lambda record: (record,),
+            key=lambda record: f"key-{record}",
+        )
+        table.set_row_provider(provider)
+        table.data_table.focus()
+        await pilot.pause()
+
+        await pilot.press("down")
+        assert table.cursor_row == 1
+        assert str(table.get_row_key_at(1).value) == "key-c"
+
+        table.data_table.sort("name")
+        await pilot.pause()
+        assert [table.get_row_data(i) for i in range(3)] == [("a",), ("b",), ("c",)]
+
+
+class _RowEventsApp(App[None]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.events: list[Message] = []
+
+    def compose(self) -> ComposeResult:
+        yield CustomDataTable(id="virtual-table", virtual=True)
+
+    def on_data_table_row_highlighted(self, event: VirtualDataTable.RowHighlighted) -> None:
+        self.events.append(event)
+
+    def on_data_table_row_selected(self, event: VirtualDataTable.RowSelected) -> None:
+        self.events.append(event)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_virtual_row_events_reach_data_table_handlers() -> None:
+    """Test the table's own row messages reach on_data_table_row_* handlers."""
+    app = _RowEventsApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        table = app.query_one("#virtual-table", CustomDataTable)
+        table.add_column("Name", key="name")
+        table.set_row_provider(RowProvider(["a", "b"], formatter=lambda record: (record,)))
+        table.data_table.focus()
+        await pilot.pause()
+
+        await pilot.press("down", "enter")
+        await pilot.pause()
+
+        highlighted, selected = app.events[-2:]
+        assert isinstance(highlighted, VirtualDataTable.RowHighlighted)
+        assert isinstance(selected, VirtualDataTable.RowSelected)
+        assert selected.cursor_row == 1
+        assert selected.control is table.data_table
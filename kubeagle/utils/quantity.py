@@ -0,0 +1,152 @@
+"""Kubernetes resource quantity parsing.
+
+Implements the Kubernetes quantity grammar used by ``resources.requests`` and
+``resources.limits`` values:
+
+- Binary SI suffixes: ``Ki``, ``Mi``, ``Gi``, ``Ti``, ``Pi``, ``Ei``
+- Decimal SI suffixes: ``n``, ``u``, ``m``, ``k``, ``M``, ``G``, ``T``, ``P``, ``E``
+- Decimal exponents: ``1e3``, ``2.5E-2``
+- Plain signed numbers: ``2``, ``0.5``, ``+1``
+
+Resource strings repeat heavily across containers ("100m", "512Mi"), so parsed
+results are memoized in a bounded LRU cache keyed by the raw text and the
+requested output unit.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from math import gcd
+
+# Maximum number of distinct (text, unit) pairs kept in the parse cache.
+_QUANTITY_CACHE_SIZE = 4096
+
+# Suffix -> (base, exponent) so that multiplier == base ** exponent.
+_SUFFIX_SCALES: dict[str, tuple[int, int]] = {
+    "": (10, 0),
+    "n": (10, -9),
+    "u": (10, -6),
+    "m": (10, -3),
+    "k": (10, 3),
+    "M": (10, 6),
+    "G": (10, 9),
+    "T": (10, 12),
+    "P": (10, 15),
+    "E": (10, 18),
+    "Ki": (2, 10),
+    "Mi": (2, 20),
+    "Gi": (2, 30),
+    "Ti": (2, 40),
+    "Pi": (2, 50),
+    "Ei": (2, 60),
+}
+
+# The exponent alternative is tried first so "1E3" is an exponent, not exa.
+_QUANTITY_PATTERN = re.compile(
+    r"^(?P<number>[+-]?(?:\d+(?:\.\d*)?|\.\d+))"
+    r"(?:(?P<exponent>[eE][+-]?\d+)|(?P<suffix>[KMGTPE]i|[numkMGTPE])?)$"
+)
+
+
+def _scale_factor(suffix: str, unit: str) -> tuple[int, int]:
+    """Return reduced ``(numerator, denominator)`` converting suffix to unit."""
+    base, exponent = _SUFFIX_SCALES[suffix]
+    unit_base, unit_exponent = _SUFFIX_SCALES[unit]
+
+    numerator = 1
+    denominator = 1
+    if exponent >= 0:
+        numerator *= base**exponent
+    else:
+        denominator *= base**-exponent
+    if unit_exponent >= 0:
+        denominator *= unit_base**unit_exponent
+    else:
+        numerator *= unit_base**-unit_exponent
+
+    divisor = gcd(numerator, denominator)
+    return numerator // divisor, denominator // divisor
+
+
+@lru_cache(maxsize=_QUANTITY_CACHE_SIZE)
+def _parse_quantity_text(text: str, unit: str) -> float | None:
+    """Parse a stripped quantity string into ``unit`` (cached)."""
+    match = _QUANTITY_PATTERN.match(text)
+    if match is None:
+        return None
+
+    exponent = match.group("exponent")
+    if exponent is not None:
+        number = float(match.group("number") + exponent)
+        suffix = ""
+    else:
+        number = float(match.group("number"))
+        suffix = match.group("suffix") or ""
+
+    numerator, denominator = _scale_factor(suffix, unit)
+    if numerator != 1:
+        number *= numerator
+    if denominator != 1:
+        number /= denominator
+    return number
+
+
+def parse_quantity(value: object, unit: str = "") -> float | None:
+    """Parse a Kubernetes quantity and express it in ``unit``.
+
+    Args:
+        value: Quantity as string or number (e.g., "100m", "512Mi", "1e3", 2)
+        unit: Output unit as a quantity suffix. ``""`` returns base units
+            (cores or bytes), ``"m"`` returns millicores, ``"Mi"`` returns
+            mebibytes.
+
+    Returns:
+        Parsed value as float, or None for empty or invalid input.
+
+    Raises:
+        ValueError: If ``unit`` is not a known quantity suffix.
+    """
+    if unit not in _SUFFIX_SCALES:
+        raise ValueError(f"Unknown quantity unit: {unit!r}")
+    if value is None or isinstance(value, bool):
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    return _parse_quantity_text(text, unit)
+
+
+def parse_quantities(values: Iterable[object], unit: str = "") -> list[float | None]:
+    """Parse many quantities at once, in input order.
+
+    Repeated inputs are resolved once per call before falling back to the
+    shared cache, which keeps large aggregation loops cheap.
+
+    Args:
+        values: Iterable of quantity strings or numbers
+        unit: Output unit as a quantity suffix (see ``parse_quantity``)
+
+    Returns:
+        List of parsed values, with None for empty or invalid entries.
+    """
+    if unit not in _SUFFIX_SCALES:
+        raise ValueError(f"Unknown quantity unit: {unit!r}")
+    resolved: dict[object, float | None] = {}
+    results: list[float | None] = []
+    for value in values:
+        try:
+            parsed = resolved[value]
+        except KeyError:
+            parsed = parse_quantity(value, unit)
+            resolved[value] = parsed
+        except TypeError:
+            parsed = parse_quantity(value, unit)
+        results.append(parsed)
+    return results
+
+
+def clear_quantity_cache() -> None:
+    """Drop all memoized quantity parse results."""
+    _parse_quantity_text.cache_clear()
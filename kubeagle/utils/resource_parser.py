@@ -7,25 +7,18 @@ Provides functions to parse Kubernetes resource strings into standardized format
 
 from typing import Any
 
-# Module-level constants to avoid re-creating on every function call.
-# Suffix multipliers for memory_str_to_bytes() to convert to bytes.
-_MEMORY_BYTES_MULTIPLIERS: tuple[tuple[str, int], ...] = (
-    ("Ki", 1024),
-    ("Mi", 1024**2),
-    ("Gi", 1024**3),
-    ("Ti", 1024**4),
-)
+from kubeagle.utils.quantity import parse_quantity
 
 
 def parse_cpu(cpu_str: str) -> float:
     """Parse CPU string to cores (float).
 
-    Handles various CPU resource formats:
+    Handles the full Kubernetes quantity grammar, for example:
     - Nanocores: "500000000n" -> 0.5 cores
     - Microcores: "500000u" -> 0.5 cores
     - Millicores: "100m" -> 0.1 cores
     - Decimal: "1.5" -> 1.5 cores
-    - Integer: "2" -> 2.0 cores
+    - Exponent: "1e3" -> 1000.0 cores
 
     Args:
         cpu_str: CPU value as string (e.g., "100m", "1.5", "500")
@@ -33,47 +26,30 @@ def parse_cpu(cpu_str: str) -> float:
     Returns:
         CPU value in cores as float. Returns 0.0 on parse error or empty string.
     """
-    if not cpu_str:
-        return 0.0
-
-    cpu_str = str(cpu_str).strip()
+    return parse_quantity(cpu_str) or 0.0
 
-    # Handle nanocores (e.g., "500000000n" -> 0.5)
-    if cpu_str.endswith("n"):
-        try:
-            return float(cpu_str[:-1]) / 1_000_000_000
-        except ValueError:
-            return 0.0
 
-    # Handle microcores (e.g., "500000u" -> 0.5)
-    if cpu_str.endswith("u"):
-        try:
-            return float(cpu_str[:-1]) / 1_000_000
-        except ValueError:
-            return 0.0
+def parse_cpu_millicores(cpu_str: object) -> float:
+    """Parse CPU string to millicores (float).
 
-    # Handle millicores (e.g., "100m" -> 0.1)
-    if cpu_str.endswith("m"):
-        try:
-            return float(cpu_str[:-1]) / 1000
-        except ValueError:
-            return 0.0
+    Args:
+        cpu_str: CPU value as string or number (e.g., "100m", "1.5", 2);
+            None and other types yield 0.0
 
-    # Handle plain numbers (cores)
-    try:
-        return float(cpu_str)
-    except ValueError:
-        return 0.0
+    Returns:
+        CPU value in millicores as float. Returns 0.0 on parse error or empty string.
+    """
+    return parse_quantity(cpu_str, unit="m") or 0.0
 
 
 def memory_str_to_bytes(memory_str: str) -> float:
     """Convert memory string to bytes.
 
-    Handles various memory resource formats:
+    Handles the full Kubernetes quantity grammar, for example:
     - Ki: "1024Ki" -> 1048576 bytes
     - Mi: "512Mi" -> 536870912 bytes
     - Gi: "1Gi" -> 1073741824 bytes
-    - Ti: "1Ti" -> 1099511627776 bytes
+    - G: "1G" -> 1000000000 bytes
 
     Args:
         memory_str: Memory value as string (e.g., "512Mi", "1Gi")
@@ -81,24 +57,7 @@ def memory_str_to_bytes(memory_str: str) -> float:
     Returns:
         Memory value in bytes as float. Returns 0.0 on parse error or empty string.
     """
-    if not memory_str:
-        return 0.0
-
-    memory_str = str(memory_str).strip()
-
-    for suffix, mult in _MEMORY_BYTES_MULTIPLIERS:
-        if memory_str.endswith(suffix):
-            try:
-                value = float(memory_str[:-2])
-                return value * mult
-            except ValueError:
-                return 0.0
-
-    # Handle plain bytes
-    try:
-        return float(memory_str)
-    except ValueError:
-        return 0.0
+    return parse_quantity(memory_str) or 0.0
 
 
 def _resolve_resources_dict(values: dict[str, Any]) -> dict[str, Any]:
@@ -147,7 +106,7 @@ def parse_cpu_from_dict(
             return 0.0
         if resource in container_resources:
             # Chart models/presenters use millicores for CPU display and aggregation.
-            return parse_cpu(container_resources[resource]) * 1000
+            return parse_cpu_millicores(container_resources[resource])
     except (ValueError, TypeError, AttributeError):
         return 0.0
     return 0.0
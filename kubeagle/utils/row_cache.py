@@ -0,0 +1,192 @@
+"""Bounded cache of pre-formatted table rows.
+
+Presenters format domain objects (workloads, charts) into tuples of Rich
+markup strings. Filtering and sorting only change *which* rows are shown, so
+the formatted tuples can be reused as long as the source object, the column
+set and the theme are unchanged. Entries are keyed by
+``(row identity, source revision, column set, theme)``; bumping the revision
+invalidates every row at once when the source data is reloaded.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from itertools import islice
+from typing import Any
+
+RowIdentityFunc = Callable[[Any], Hashable]
+RowFormatFunc = Callable[[Any], tuple[Any, ...]]
+
+
+class FormattedRowCache:
+    """Thread-safe LRU cache of formatted rows.
+
+    Rows are validated against the source object itself (``is``), so a stale
+    entry is never served for a different object that happens to share the
+    same identity key. The cache can be filled from a background thread while
+    the UI thread reads from it.
+
+    Example:
+        ```python
+        cache = FormattedRowCache()
+        row = cache.get_or_format(
+            workload,
+            identity=(workload.namespace, workload.kind, workload.name),
+            columns=("Namespace", "Name"),
+            formatter=format_row,
+        )
+        ```
+    """
+
+    DEFAULT_MAX_ROWS = 20_000
+
+    def __init__(self, max_rows: int = DEFAULT_MAX_ROWS) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_rows: Maximum number of formatted rows kept.
+        """
+        self._max_rows = max(1, int(max_rows))
+        self._rows: OrderedDict[Hashable, tuple[Any, tuple[Any, ...]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._revision = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def max_rows(self) -> int:
+        """Maximum number of formatted rows kept."""
+        return self._max_rows
+
+    @property
+    def revision(self) -> int:
+        """Current source revision."""
+        return self._revision
+
+    def bump_revision(self) -> int:
+        """Invalidate all rows after the source data changed.
+
+        Returns:
+            The new revision.
+        """
+        with self._lock:
+            self._revision += 1
+            self._rows.clear()
+            return self._revision
+
+    def clear(self) -> None:
+        """Drop all cached rows without changing the revision."""
+        with self._lock:
+            self._rows.clear()
+
+    def get(
+        self,
+        record: Any,
+        *,
+        identity: Hashable,
+        columns: Hashable,
+        theme: str = "",
+    ) -> tuple[Any, ...] | None:
+        """Return the cached row for ``record`` or None."""
+        key = (identity, self._revision, columns, theme)
+        with self._lock:
+            entry = self._rows.get(key)
+            if entry is None or entry[0] is not record:
+                return None
+            self._rows.move_to_end(key)
+            return entry[1]
+
+    def get_or_format(
+        self,
+        record: Any,
+        *,
+        identity: Hashable,
+        columns: Hashable,
+        formatter: RowFormatFunc,
+        theme: str = "",
+    ) -> tuple[Any, ...]:
+        """Return the cached row for ``record``, formatting it on a miss.
+
+        Args:
+            record: Source object being formatted.
+            identity: Stable identity key for the record.
+            columns: Hashable description of the column set.
+            formatter: Callable producing the row tuple for ``record``.
+            theme: Active theme name.
+
+        Returns:
+            Formatted row tuple.
+        """
+        revision = self._revision
+        key = (identity, revision, columns, theme)
+        with self._lock:
+            entry = self._rows.get(key)
+            if entry is not None and entry[0] is record:
+                self._rows.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # Format outside the lock so readers are never blocked on formatting.
+        row = formatter(record)
+        with self._lock:
+            if revision == self._revision:
+                self._rows[key] = (record, row)
+                self._rows.move_to_end(key)
+                while len(self._rows) > self._max_rows:
+                    self._rows.popitem(last=False)
+        return row
+
+    def warm(
+        self,
+        records: Iterable[Any],
+        *,
+        identity: RowIdentityFunc,
+        columns: Hashable,
+        formatter: RowFormatFunc,
+        theme: str = "",
+        should_stop: Callable[[], bool] | None = None,
+    ) -> int:
+        """Pre-format records so later lookups are cache hits.
+
+        At most ``max_rows`` records are warmed so warm-up never evicts the
+        rows it has just formatted.
+
+        Args:
+            records: Source objects to format.
+            identity: Callable returning the identity key for a record.
+            columns: Hashable description of the column set.
+            formatter: Callable producing the row tuple for a record.
+            theme: Active theme name.
+            should_stop: Optional callable polled between rows to abort early.
+
+        Returns:
+            Number of rows formatted (cache misses) during warm-up.
+        """
+        revision = self._revision
+        formatted = 0
+        for record in islice(records, self._max_rows):
+            if revision != self._revision:
+                break
+            if should_stop is not None and should_stop():
+                break
+            record_identity = identity(record)
+            cached = self.get(
+                record, identity=record_identity, columns=columns, theme=theme,
+            )
+            if cached is not None:
+                continue
+            self.get_or_format(
+                record,
+                identity=record_identity,
+                columns=columns,
+                formatter=formatter,
+                theme=theme,
+            )
+            formatted += 1
+        return formatted
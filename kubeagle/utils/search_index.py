@@ -0,0 +1,256 @@
+"""Trigram index for interactive table search.
+
+Search boxes on the charts, workloads and violations screens filter with a
+case-insensitive substring match over a handful of text fields (name,
+namespace, team, release, rule, ...). Scanning every record on each keystroke
+gets slow on large clusters, so records are indexed once per data revision:
+
+- Each record's fields are lower-cased and joined into one search text.
+- Every distinct 3-character gram of that text maps to the records that
+  contain it (the posting list).
+- A query of three or more characters only verifies the records in the
+  posting list of its rarest gram, so results are *exactly* those of the
+  substring scan. Shorter queries fall back to scanning the cached texts.
+
+Records can be added and removed incrementally; removed records are
+tombstoned and the postings are compacted once too many accumulate.
+Matches are returned as a set: the screens keep their own column sort order.
+"""
+
+from __future__ import annotations
+
+import threading
+from array import array
+from collections.abc import Callable, Iterable
+from typing import Any
+
+SearchFieldsFunc = Callable[[Any], Iterable[object]]
+
+GRAM_SIZE = 3
+
+# Default separator placed between fields so a query cannot match across them.
+FIELD_SEPARATOR = "\0"
+
+
+def _grams(text: str) -> set[str]:
+    """Return the distinct grams of ``text``."""
+    return {text[index : index + GRAM_SIZE] for index in range(len(text) - GRAM_SIZE + 1)}
+
+
+class SearchIndex:
+    """Incremental trigram index over arbitrary records.
+
+    Records are identified by object identity, and the index keeps a strong
+    reference to every indexed record so identities stay unique while indexed.
+    Mutations and lookups are serialized by a lock so the index can be synced
+    from a worker thread while another thread filters.
+
+    Example:
+        ```python
+        index = SearchIndex(lambda chart: (chart.name, chart.team))
+        index.sync(charts)
+        visible = [chart for chart in charts if index.matches_record(chart, "api")]
+        ```
+    """
+
+    # Rebuild postings once this share of posting entries points at removed records.
+    COMPACT_RATIO = 0.5
+
+    def __init__(
+        self,
+        fields: SearchFieldsFunc,
+        *,
+        separator: str = FIELD_SEPARATOR,
+    ) -> None:
+        """Initialize an empty index.
+
+        Args:
+            fields: Callable returning the searchable field values of a record.
+                ``None`` values are skipped.
+            separator: String placed between fields. Use ``" "`` to let a
+                query span adjacent fields.
+        """
+        self._fields = fields
+        self._separator = separator
+        self._records: dict[int, Any] = {}
+        self._texts: dict[int, str] = {}
+        self._postings: dict[str, array] = {}
+        self._posting_entries = 0
+        self._stale_entries = 0
+        self._revision = 0
+        self._source: list[Any] | None = None
+        self._source_len = -1
+        self._match_cache: tuple[int, str, frozenset[int]] | None = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, record: object) -> bool:
+        return id(record) in self._records
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped on every change to the indexed records."""
+        return self._revision
+
+    def text_for(self, record: Any) -> str:
+        """Return the normalized search text for ``record``."""
+        return self._separator.join(
+            str(value).lower() for value in self._fields(record) if value is not None
+        )
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def clear(self) -> None:
+        """Remove every record from the index."""
+        with self._lock:
+            self._records.clear()
+            self._texts.clear()
+            self._postings.clear()
+            self._posting_entries = 0
+            self._stale_entries = 0
+            self._source = None
+            self._source_len = -1
+            self._touch()
+
+    def rebuild(self, records: Iterable[Any]) -> None:
+        """Replace the indexed records with ``records``."""
+        with self._lock:
+            self.clear()
+            self.add(records)
+
+    def add(self, records: Iterable[Any]) -> int:
+        """Index records that are not indexed yet.
+
+        Returns:
+            Number of records added.
+        """
+        added = 0
+        with self._lock:
+            postings = self._postings
+            for record in records:
+                record_id = id(record)
+                if record_id in self._records:
+                    continue
+                text = self.text_for(record)
+                self._records[record_id] = record
+                self._texts[record_id] = text
+                for gram in _grams(text):
+                    posting = postings.get(gram)
+                    if posting is None:
+                        posting = postings[gram] = array("q")
+                    posting.append(record_id)
+                    self._posting_entries += 1
+                added += 1
+            if added:
+                self._touch()
+        return added
+
+    def remove(self, records: Iterable[Any]) -> int:
+        """Drop records from the index.
+
+        Posting lists keep the removed ids until the next compaction; they are
+        skipped while matching.
+
+        Returns:
+            Number of records removed.
+        """
+        removed = 0
+        with self._lock:
+            for record in records:
+                record_id = id(record)
+                if self._records.pop(record_id, None) is None:
+                    continue
+                text = self._texts.pop(record_id, "")
+                self._stale_entries += len(_grams(text))
+                removed += 1
+            if removed:
+                self._touch()
+                if self._stale_entries > self._posting_entries * self.COMPACT_RATIO:
+                    self._compact()
+        return removed
+
+    def sync(self, records: list[Any]) -> None:
+        """Make the index match ``records``, indexing only the difference.
+
+        Calling this again with the same, unchanged list is free, so callers
+        can sync on every filter pass.
+        """
+        with self._lock:
+            if records is self._source and len(records) == self._source_len:
+                return
+            current = {id(record) for record in records}
+            stale = [
+                record for record_id, record in self._records.items()
+                if record_id not in current
+            ]
+            if stale and len(stale) >= len(self._records) // 2:
+                self.rebuild(records)
+            else:
+                if stale:
+                    self.remove(stale)
+                self.add(records)
+            self._source = records
+            self._source_len = len(records)
+
+    def _touch(self) -> None:
+        self._revision += 1
+        self._match_cache = None
+
+    def _compact(self) -> None:
+        records = list(self._records.values())
+        source, source_len = self._source, self._source_len
+        self.rebuild(records)
+        self._source, self._source_len = source, source_len
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _candidates(self, query: str) -> Iterable[int]:
+        if len(query) < GRAM_SIZE:
+            return self._texts.keys()
+        smallest: array | None = None
+        for gram in _grams(query):
+            posting = self._postings.get(gram)
+            if posting is None:
+                return ()
+            if smallest is None or len(posting) < len(smallest):
+                smallest = posting
+        return smallest if smallest is not None else ()
+
+    def match_ids(self, query: str) -> frozenset[int]:
+        """Return ids (``id(record)``) of records whose text contains ``query``.
+
+        The result for the most recent query is cached until the index changes.
+        """
+        query = query.lower()
+        with self._lock:
+            cached = self._match_cache
+            if cached is not None and cached[0] == self._revision and cached[1] == query:
+                return cached[2]
+            texts = self._texts
+            if not query:
+                matched = frozenset(texts)
+            else:
+                matched = frozenset(
+                    record_id
+                    for record_id in self._candidates(query)
+                    if query in texts.get(record_id, "")
+                )
+            self._match_cache = (self._revision, query, matched)
+        return matched
+
+    def matches_record(self, record: object, query: str) -> bool:
+        """Return whether ``record`` matches ``query``."""
+        return id(record) in self.match_ids(query)
+
+    def filter(self, records: Iterable[Any], query: str) -> list[Any]:
+        """Return ``records`` matching ``query``, preserving their order."""
+        if not query:
+            return list(records)
+        matched = self.match_ids(query)
+        return [record for record in records if id(record) in matched]
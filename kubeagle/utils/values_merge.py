@@ -0,0 +1,56 @@
+"""Helm-style merging of overlay values onto a chart's base values.
+
+``helm install -f values-staging.yaml`` coalesces the overlay onto the
+chart's ``values.yaml``: maps merge key by key, any other overlay value
+(scalars, lists) replaces the base value, and an explicit ``null`` deletes
+the key.
+
+Merges share structure with their inputs: only the dicts on the path to an
+overridden key are copied, and every untouched subtree is the base's own
+object. One parsed base therefore serves every overlay of a chart, and merged
+views must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def merge_helm_values(
+    base: dict[str, Any],
+    overlay: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Return ``overlay`` coalesced onto ``base`` with Helm semantics.
+
+    Neither input is modified. An empty overlay returns ``base`` itself.
+
+    Args:
+        base: Chart defaults (``values.yaml``).
+        overlay: Values supplied on top of the defaults.
+
+    Returns:
+        The merged values, sharing unchanged subtrees with ``base``.
+    """
+    if not overlay:
+        return base
+
+    merged: dict[str, Any] | None = None
+    for key, value in overlay.items():
+        current = base.get(key)
+        if value is None:
+            if key not in base:
+                continue
+            if merged is None:
+                merged = dict(base)
+            merged.pop(key, None)
+            continue
+        if isinstance(value, dict) and isinstance(current, dict):
+            value = merge_helm_values(current, value)
+        if current is value and key in base:
+            continue
+        if merged is None:
+            # Copy on first write; unchanged children stay shared.
+            merged = dict(base)
+        merged[key] = value
+
+    return base if merged is None else merged
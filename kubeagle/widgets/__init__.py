@@ -32,6 +32,10 @@ from kubeagle.widgets.data import (
     CustomKPI,
     CustomTableBase,
     CustomTableMixin,
+    RowDiff,
+    RowProvider,
+    VirtualDataTable,
+    make_row_key,
 )
 
 # Display widgets
@@ -124,5 +128,9 @@ __all__ = [
     "CustomTextArea",
     "CustomTree",
     "CustomVertical",
+    "RowDiff",
+    "RowProvider",
     "StatefulWidget",
+    "VirtualDataTable",
+    "make_row_key",
 ]
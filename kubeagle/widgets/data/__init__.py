@@ -5,6 +5,10 @@ from kubeagle.widgets.data.tables import (
     CustomDataTable,
     CustomTableBase,
     CustomTableMixin,
+    RowDiff,
+    RowProvider,
+    VirtualDataTable,
+    make_row_key,
 )
 
 __all__ = [
@@ -12,4 +16,8 @@ __all__ = [
     "CustomKPI",
     "CustomTableBase",
     "CustomTableMixin",
+    "RowDiff",
+    "RowProvider",
+    "VirtualDataTable",
+    "make_row_key",
 ]
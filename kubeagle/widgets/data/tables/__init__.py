@@ -5,9 +5,21 @@ from kubeagle.widgets.data.tables.custom_table import (
     CustomTableBase,
     CustomTableMixin,
 )
+from kubeagle.widgets.data.tables.keyed_rows import (
+    RowDiff,
+    diff_keyed_rows,
+    make_row_key,
+)
+from kubeagle.widgets.data.tables.row_provider import RowProvider
+from kubeagle.widgets.data.tables.virtual_data_table import VirtualDataTable
 
 __all__ = [
     "CustomDataTable",
     "CustomTableBase",
     "CustomTableMixin",
+    "RowDiff",
+    "RowProvider",
+    "VirtualDataTable",
+    "diff_keyed_rows",
+    "make_row_key",
 ]
@@ -5,15 +5,24 @@ from __future__ import annotations
 import logging
 from collections.abc import Iterable, Mapping
 from contextlib import asynccontextmanager, contextmanager, suppress
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from textual.containers import Container
 from textual.coordinate import Coordinate
 from textual.events import Event, Leave, MouseMove
 from textual.widgets import DataTable as TextualDataTable
+from textual.widgets.data_table import RowKey
 
 from kubeagle.constants.limits import MAX_ROWS_DISPLAY
 from kubeagle.keyboard import DATA_TABLE_BINDINGS
+from kubeagle.widgets.data.tables.keyed_rows import (
+    KeyedRow,
+    RowDiff,
+    diff_keyed_rows,
+)
+from kubeagle.widgets.data.tables.row_provider import RowProvider
+from kubeagle.widgets.data.tables.virtual_data_table import VirtualDataTable
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +42,16 @@ class CustomDataTable(Container):
     - Provides is_loading, data, error reactives
     - Implements watch_* methods for UI updates
 
+    Virtual Mode:
+    - ``virtual=True`` composes a VirtualDataTable instead of DataTable
+    - Rows come from a RowProvider and only the viewport is formatted/rendered
+    - MAX_ROWS_DISPLAY truncation does not apply
+
+    Keyed Updates:
+    - ``update_rows_keyed()`` diffs ``(key, cells)`` rows against the table
+    - Only inserted/removed rows and changed cells are touched
+    - Cursor row and scroll offset survive refreshes
+
     Example:
         ```python
         from kubeagle.widgets.data.tables import CustomDataTable
@@ -41,6 +60,9 @@ class CustomDataTable(Container):
             columns=[("Name", "name"), ("Version", "version")],
             id="my-table",
         )
+
+        big_table = CustomDataTable(id="workloads-table", virtual=True)
+        big_table.set_row_provider(RowProvider(workloads, formatter=format_row))
         ```
     """
 
@@ -54,7 +76,7 @@ class CustomDataTable(Container):
         min-height: 3;
         background: $surface;
     }
-    CustomDataTable > DataTable {
+    CustomDataTable > DataTable, CustomDataTable > VirtualDataTable {
         height: 1fr;
         width: 1fr;
         min-width: 0;
@@ -70,6 +92,11 @@ class CustomDataTable(Container):
     _COLUMN_DEFS: ClassVar[list[tuple[str, str]]] = []
     _NUMERIC_COLUMNS: ClassVar[set[str]] = set()
 
+    # Below this many added/removed rows, keyed updates are always applied in
+    # place; above it they are applied in place only while churn stays under
+    # half the table.
+    KEYED_REBUILD_MIN_ROWS: ClassVar[int] = 64
+
     def __init__(
         self,
         columns: list[tuple[str, str]] | None = None,
@@ -78,6 +105,7 @@ class CustomDataTable(Container):
         classes: str = "",
         disabled: bool = False,
         zebra_stripes: bool = False,
+        virtual: bool = False,
     ) -> None:
         """Initialize the custom data table wrapper.
 
@@ -87,12 +115,14 @@ class CustomDataTable(Container):
             classes: CSS classes (widget-custom-data-table is automatically added).
             disabled: Whether the data table is disabled.
             zebra_stripes: Whether to display alternating row colors.
+            virtual: Whether to render rows from a RowProvider (viewport only).
         """
         super().__init__(id=id, classes=f"widget-custom-data-table {classes}".strip())
         self._columns = columns or []
         self._disabled = disabled
         self._zebra_stripes = zebra_stripes
-        self._inner_widget: TextualDataTable | None = None
+        self._virtual = virtual
+        self._inner_widget: TextualDataTable | VirtualDataTable | None = None
 
         # Standard reactive state
         self.is_loading: bool = False
@@ -107,10 +137,14 @@ class CustomDataTable(Container):
 
     def compose(self) -> ComposeResult:
         """Compose the data table with Textual's DataTable widget."""
-        table = TextualDataTable(
-            disabled=self._disabled,
-            cursor_type="row",
-        )
+        table: TextualDataTable | VirtualDataTable
+        if self._virtual:
+            table = VirtualDataTable(disabled=self._disabled, cursor_type="row")
+        else:
+            table = TextualDataTable(
+                disabled=self._disabled,
+                cursor_type="row",
+            )
         table.styles.scrollbar_size_horizontal = 1
         table.styles.scrollbar_size_vertical = 2
         self._inner_widget = table
@@ -125,14 +159,193 @@ class CustomDataTable(Container):
                 self.add_column(label, key=key)
 
     @property
-    def data_table(self) -> TextualDataTable | None:
+    def data_table(self) -> TextualDataTable | VirtualDataTable | None:
         """Get the underlying Textual DataTable widget.
 
         Returns:
-            The composed Textual DataTable widget, or None if not yet composed.
+            The composed Textual DataTable (or VirtualDataTable in virtual
+            mode), or None if not yet composed.
         """
         return self._inner_widget
 
+    @property
+    def is_virtual(self) -> bool:
+        """Whether the table renders rows from a RowProvider."""
+        return self._virtual
+
+    @property
+    def row_provider(self) -> RowProvider | None:
+        """Get the RowProvider backing a virtual table.
+
+        Returns:
+            The active RowProvider, or None when not in virtual mode.
+        """
+        if isinstance(self._inner_widget, VirtualDataTable):
+            return self._inner_widget.provider
+        return None
+
+    def set_row_provider(
+        self,
+        provider: RowProvider,
+        *,
+        keep_position: bool = False,
+    ) -> None:
+        """Render rows from a RowProvider.
+
+        In virtual mode the provider is rendered lazily. Otherwise rows are
+        materialized into the DataTable (subject to MAX_ROWS_DISPLAY).
+
+        Args:
+            provider: Row provider to display.
+            keep_position: Keep the cursor on the same row key and keep the
+                scroll offset (virtual mode only).
+        """
+        table = self._inner_widget
+        if isinstance(table, VirtualDataTable):
+            cursor_key: Any = None
+            if keep_position and table.row_count:
+                with suppress(IndexError):
+                    cursor_key = table.provider.get_row_key(table.cursor_row)
+            table.set_provider(provider)
+            if cursor_key is not None:
+                restored_row = provider.index_of(cursor_key)
+                if restored_row is not None:
+                    table.move_cursor(row=restored_row)
+            return
+        self.clear(columns=False)
+        row_limit = min(len(provider), MAX_ROWS_DISPLAY)
+        self.add_rows(provider.get_row(index) for index in range(row_limit))
+
+    def update_rows_keyed(self, rows: Iterable[KeyedRow]) -> RowDiff:
+        """Bring the table to ``rows`` with keyed inserts, deletes and cell updates.
+
+        Rows are matched by key (see ``make_row_key``), so refreshes only touch
+        the cells that changed and the cursor stays on the same row. The table
+        falls back to a full repopulate when most rows churn or the current
+        rows were added without keys. Cursor row and scroll offset are kept in
+        both cases.
+
+        Args:
+            rows: ``(key, cells)`` pairs in display order.
+
+        Returns:
+            The applied RowDiff (``rebuilt`` is set for full repopulates).
+
+        Raises:
+            ValueError: If ``rows`` contains duplicate keys.
+        """
+        target = [(str(key), tuple(cells)) for key, cells in rows]
+        table = self._inner_widget
+        if table is None:
+            return diff_keyed_rows({}, target)
+
+        if isinstance(table, VirtualDataTable):
+            # Only the viewport is rendered, so swapping the provider is
+            # cheaper than diffing every off-screen row.
+            diff = diff_keyed_rows({}, target)
+            diff.rebuilt = True
+            self.set_row_provider(
+                RowProvider(target, formatter=itemgetter(1), key=itemgetter(0)),
+                keep_position=True,
+            )
+            return diff
+
+        current: dict[str, tuple[Any, ...]] = {}
+        row_keys: dict[str, RowKey] = {}
+        keyed = True
+        for row in table.ordered_rows:
+            key_value = row.key.value
+            if key_value is None:
+                keyed = False
+                break
+            current[key_value] = tuple(table.get_row(row.key))
+            row_keys[key_value] = row.key
+
+        diff = diff_keyed_rows(current if keyed else {}, target)
+        if keyed and not diff.changed:
+            return diff
+
+        cursor_key: str | None = None
+        cursor_row = self.cursor_row
+        if keyed and cursor_row is not None and 0 <= cursor_row < len(current):
+            cursor_key = list(current)[cursor_row]
+        scroll_x, scroll_y = table.scroll_x, table.scroll_y
+
+        churn = len(diff.removed) + len(diff.inserted)
+        rebuild = (
+            not keyed
+            or not current
+            or churn > max(self.KEYED_REBUILD_MIN_ROWS, len(current) // 2)
+            or len(target) > MAX_ROWS_DISPLAY
+        )
+        with self.batch_update():
+            if rebuild:
+                diff.rebuilt = True
+                self.clear(columns=False)
+                for key, cells in target[:MAX_ROWS_DISPLAY]:
+                    table.add_row(*cells, key=key)
+            else:
+                self._apply_row_diff(table, diff, target, row_keys)
+
+        self._restore_scroll(table, scroll_x, scroll_y)
+        if cursor_key is not None:
+            with suppress(Exception):
+                table.cursor_coordinate = Coordinate(table.get_row_index(cursor_key), 0)
+        return diff
+
+    @staticmethod
+    def _restore_scroll(table: TextualDataTable, scroll_x: float, scroll_y: float) -> None:
+        """Restore a scroll offset now and again once new row sizes are known."""
+
+        def _scroll() -> None:
+            with suppress(Exception):
+                table.scroll_to(scroll_x, scroll_y, animate=False, force=True)
+
+        _scroll()
+        table.call_after_refresh(_scroll)
+
+    @staticmethod
+    def _apply_row_diff(
+        table: TextualDataTable,
+        diff: RowDiff,
+        target: list[tuple[str, tuple[Any, ...]]],
+        row_keys: dict[str, RowKey],
+    ) -> None:
+        """Apply a RowDiff to a DataTable in place.
+
+        DataTable can only append rows, so on a reorder the rows after the
+        longest prefix already in target order are removed and re-added.
+        """
+        for key in diff.removed:
+            table.remove_row(row_keys.pop(key))
+
+        appended = diff.inserted
+        if diff.reordered:
+            kept = 0
+            for current_key, target_key in zip(row_keys, diff.order, strict=False):
+                if current_key != target_key:
+                    break
+                kept += 1
+            for key in list(row_keys)[kept:]:
+                table.remove_row(row_keys.pop(key))
+            appended = diff.order[kept:]
+
+        column_keys = [column.key for column in table.ordered_columns]
+        for key, cells in diff.updated.items():
+            row_key = row_keys.get(key)
+            if row_key is None:
+                continue
+            for index, value in cells.items():
+                if index < len(column_keys):
+                    table.update_cell(
+                        row_key, column_keys[index], value, update_width=True,
+                    )
+
+        if appended:
+            cells_by_key = dict(target)
+            for key in appended:
+                row_keys[key] = table.add_row(*cells_by_key[key], key=key)
+
     @asynccontextmanager
     async def batch(self):
         """Async proxy for the inner DataTable's batch_update() context manager.
@@ -285,19 +498,40 @@ class CustomDataTable(Container):
             The row key, or None if MAX_ROWS_DISPLAY exceeded.
         """
         if self._inner_widget is not None:
+            if self._virtual:
+                return self._inner_widget.add_row(*args, **kwargs)
             if self._inner_widget.row_count >= MAX_ROWS_DISPLAY:
                 return None
             return self._inner_widget.add_row(*args, **kwargs)
         return None
 
-    def add_rows(self, rows: Iterable[Iterable[Any]]) -> list[Any]:
-        """Add multiple rows to the data table in one call."""
+    def add_rows(
+        self,
+        rows: Iterable[Iterable[Any]],
+        *,
+        keys: Iterable[str] | None = None,
+    ) -> list[Any]:
+        """Add multiple rows to the data table in one call.
+
+        Args:
+            rows: Rows to append.
+            keys: Optional row keys (one per row) so later
+                ``update_rows_keyed()`` calls can diff in place.
+        """
+        if isinstance(self._inner_widget, VirtualDataTable):
+            return self._inner_widget.add_rows(rows)
         if self._inner_widget is not None:
             # Materialize to list so we can check length and truncate.
             materialized: list[Iterable[Any]] = list(rows)
             if len(materialized) > MAX_ROWS_DISPLAY:
                 logger.warning("Truncating %d rows to %d", len(materialized), MAX_ROWS_DISPLAY)
                 materialized = materialized[:MAX_ROWS_DISPLAY]
+            if keys is not None:
+                table = self._inner_widget
+                return [
+                    table.add_row(*row, key=key)
+                    for row, key in zip(materialized, keys, strict=False)
+                ]
             return self._inner_widget.add_rows(materialized)
         return []
 
@@ -516,12 +750,13 @@ class CustomDataTable(Container):
         """
         if self._inner_widget is None or index < 0:
             return None
+        if isinstance(self._inner_widget, VirtualDataTable):
+            if index >= self._inner_widget.row_count:
+                return None
+            return self._inner_widget.provider.get_row(index)
         with suppress(Exception):
-            for i, row in enumerate(self._inner_widget.ordered_rows):
-                if i == index:
-                    return self._extract_row_data(row)
-                if i > index:
-                    break
+            if index < self._inner_widget.row_count:
+                return tuple(self._inner_widget.get_row_at(index))
         return None
 
     def _extract_row_data(self, row: Any) -> tuple[Any, ...]:
@@ -591,6 +826,10 @@ class CustomDataTable(Container):
         """
         if self._inner_widget is None or index < 0:
             return None
+        if isinstance(self._inner_widget, VirtualDataTable):
+            if index >= self._inner_widget.row_count:
+                return None
+            return self._inner_widget.get_row_key_at(index)
         try:
             for i, row in enumerate(self._inner_widget.ordered_rows):
                 if i == index:
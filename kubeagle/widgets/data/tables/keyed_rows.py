@@ -0,0 +1,101 @@
+"""Keyed row diffing for incremental table refreshes."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+ROW_KEY_SEPARATOR = "/"
+
+KeyedRow = tuple[str, Sequence[Any]]
+
+
+def make_row_key(*parts: object) -> str:
+    """Build a stable row key from identity parts.
+
+    Args:
+        *parts: Identity components, typically namespace, kind and name.
+
+    Returns:
+        Parts joined with ``/`` (``None`` parts become empty strings).
+    """
+    return ROW_KEY_SEPARATOR.join("" if part is None else str(part) for part in parts)
+
+
+@dataclass(slots=True)
+class RowDiff:
+    """Changes needed to turn the displayed rows into a target row set.
+
+    Attributes:
+        removed: Keys present on screen but missing from the target.
+        inserted: Keys in the target that are not on screen yet.
+        updated: Per-key mapping of column index to new cell value, only for
+            cells whose value changed.
+        order: Target key order.
+        reordered: Whether surviving rows change position relative to each
+            other or inserted rows do not simply append at the end.
+        rebuilt: Set by the table when it fell back to a full repopulate.
+    """
+
+    removed: list[str] = field(default_factory=list)
+    inserted: list[str] = field(default_factory=list)
+    updated: dict[str, dict[int, Any]] = field(default_factory=dict)
+    order: list[str] = field(default_factory=list)
+    reordered: bool = False
+    rebuilt: bool = False
+
+    @property
+    def changed(self) -> bool:
+        """Whether applying the diff changes anything on screen."""
+        return bool(self.removed or self.inserted or self.updated or self.reordered)
+
+    @property
+    def updated_cell_count(self) -> int:
+        """Number of individual cells that need re-rendering."""
+        return sum(len(cells) for cells in self.updated.values())
+
+
+def diff_keyed_rows(
+    current: Mapping[str, Sequence[Any]],
+    target: Iterable[KeyedRow],
+) -> RowDiff:
+    """Compute inserts, deletes and per-cell updates between two row sets.
+
+    Args:
+        current: Displayed rows keyed by row key, in display order.
+        target: ``(key, cells)`` pairs in the desired display order.
+
+    Returns:
+        RowDiff describing the changes.
+
+    Raises:
+        ValueError: If ``target`` contains duplicate keys.
+    """
+    diff = RowDiff()
+    order = diff.order
+    seen: set[str] = set()
+    for key, cells in target:
+        if key in seen:
+            raise ValueError(f"Duplicate row key: {key!r}")
+        seen.add(key)
+        order.append(key)
+        previous = current.get(key)
+        if previous is None:
+            diff.inserted.append(key)
+            continue
+        changed_cells: dict[int, Any] = {}
+        for index, value in enumerate(cells):
+            if index >= len(previous) or previous[index] != value:
+                changed_cells[index] = value
+        if changed_cells:
+            diff.updated[key] = changed_cells
+
+    diff.removed = [key for key in current if key not in seen]
+
+    # Survivors keep their relative order and inserts append at the end in the
+    # common refresh case, which the table can apply without re-sorting.
+    removed = set(diff.removed)
+    survivors = [key for key in current if key not in removed]
+    diff.reordered = order[: len(survivors)] != survivors
+    return diff
@@ -0,0 +1,182 @@
+"""Row provider backing virtualized table rendering."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+RowFormatter = Callable[[Any], Sequence[Any]]
+RowKeyFunc = Callable[[Any], Any]
+SortKeyFunc = Callable[[Any, int], Any]
+
+
+def _identity_row(record: Any) -> Sequence[Any]:
+    """Default formatter for records that are already row tuples."""
+    return tuple(record)
+
+
+class RowProvider:
+    """Indexable row source with lazy, bounded formatting cache.
+
+    Records are stored as-is and only formatted into cell tuples when a row is
+    requested (typically when it scrolls into the viewport). Sorting reorders a
+    permutation of record indices, so records are never copied or re-formatted
+    just to change the display order.
+
+    Example:
+        ```python
+        provider = RowProvider(
+            workloads,
+            formatter=lambda workload: (workload.namespace, workload.name),
+            key=lambda workload: (workload.namespace, workload.name),
+        )
+        table.set_row_provider(provider)
+        ```
+    """
+
+    DEFAULT_CACHE_SIZE = 2048
+
+    def __init__(
+        self,
+        records: Iterable[Any] = (),
+        *,
+        formatter: RowFormatter | None = None,
+        key: RowKeyFunc | None = None,
+        sort_key: SortKeyFunc | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """Initialize the row provider.
+
+        Args:
+            records: Source records (or pre-formatted row tuples).
+            formatter: Callable turning a record into a tuple of cells.
+                Defaults to ``tuple(record)``.
+            key: Optional callable returning a stable key for a record.
+                Defaults to the record's insertion index.
+            sort_key: Optional callable ``(record, column_index) -> value``
+                used for sorting. Defaults to the formatted cell value.
+            cache_size: Maximum number of formatted rows kept in memory.
+        """
+        self._records: list[Any] = list(records)
+        self._formatter = formatter or _identity_row
+        self._key = key
+        self._sort_key = sort_key
+        self._cache_size = max(1, int(cache_size))
+        self._cache: OrderedDict[int, tuple[Any, ...]] = OrderedDict()
+        self._order: list[int] | None = None
+        # Row key -> display index, built on first lookup.
+        self._index_by_key: dict[Any, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _source_index(self, index: int) -> int:
+        if index < 0 or index >= len(self._records):
+            raise IndexError(index)
+        if self._order is None:
+            return index
+        return self._order[index]
+
+    def _format_source(self, source_index: int) -> tuple[Any, ...]:
+        cache = self._cache
+        row = cache.get(source_index)
+        if row is not None:
+            cache.move_to_end(source_index)
+            return row
+        row = tuple(self._formatter(self._records[source_index]))
+        cache[source_index] = row
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return row
+
+    def get_record(self, index: int) -> Any:
+        """Return the source record displayed at ``index``."""
+        return self._records[self._source_index(index)]
+
+    def get_row(self, index: int) -> tuple[Any, ...]:
+        """Return formatted cells for the row displayed at ``index``."""
+        return self._format_source(self._source_index(index))
+
+    def get_row_key(self, index: int) -> Any:
+        """Return the stable key for the row displayed at ``index``."""
+        source_index = self._source_index(index)
+        if self._key is None:
+            return source_index
+        return self._key(self._records[source_index])
+
+    def index_of(self, key: Any) -> int | None:
+        """Return the display index of the row with ``key``, if present."""
+        index_by_key = self._index_by_key
+        if index_by_key is None:
+            index_by_key = {}
+            for index in range(len(self._records)):
+                index_by_key.setdefault(self.get_row_key(index), index)
+            self._index_by_key = index_by_key
+        try:
+            return index_by_key.get(key)
+        except TypeError:
+            return None
+
+    def prefetch(self, start: int, stop: int) -> None:
+        """Format rows in ``[start, stop)`` ahead of rendering."""
+        start = max(0, start)
+        stop = min(len(self._records), stop)
+        for index in range(start, stop):
+            self._format_source(self._source_index(index))
+
+    def append(self, record: Any) -> None:
+        """Append a single record after the current display order."""
+        self.extend((record,))
+
+    def extend(self, records: Iterable[Any]) -> None:
+        """Append records after the current display order."""
+        start = len(self._records)
+        self._records.extend(records)
+        if self._order is not None:
+            self._order.extend(range(start, len(self._records)))
+        index_by_key = self._index_by_key
+        if index_by_key is not None:
+            # Appended rows keep their display index after the existing ones.
+            for index in range(start, len(self._records)):
+                index_by_key.setdefault(self.get_row_key(index), index)
+
+    def clear(self) -> None:
+        """Remove all records and cached rows."""
+        self._records.clear()
+        self._cache.clear()
+        self._order = None
+        self._index_by_key = None
+
+    def invalidate(self) -> None:
+        """Drop formatted rows so they are rebuilt on next access."""
+        self._cache.clear()
+        self._index_by_key = None
+
+    def sort(self, column_index: int, *, reverse: bool = False) -> None:
+        """Reorder rows by a column without re-materializing records.
+
+        Args:
+            column_index: Index of the column to sort by.
+            reverse: If True, sort in descending order.
+        """
+        records = self._records
+        if self._sort_key is not None:
+            sort_key = self._sort_key
+
+            def _key(source_index: int) -> Any:
+                return sort_key(records[source_index], column_index)
+        else:
+
+            cache = self._cache
+            formatter = self._formatter
+
+            def _key(source_index: int) -> Any:
+                # Bypass the LRU so a full sort does not evict the viewport rows.
+                row = cache.get(source_index)
+                if row is None:
+                    row = tuple(formatter(records[source_index]))
+                return row[column_index] if column_index < len(row) else ""
+
+        self._order = sorted(range(len(records)), key=_key, reverse=reverse)
+        self._index_by_key = None
@@ -0,0 +1,601 @@
+"""VirtualDataTable widget - viewport-only table rendering over a RowProvider."""
+
+from __future__ import annotations
+
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+from rich.cells import cell_len
+from rich.errors import MarkupError
+from rich.segment import Segment
+from rich.style import Style
+from rich.text import Text
+from textual import events
+from textual.binding import Binding, BindingType
+from textual.cache import LRUCache
+from textual.coordinate import Coordinate
+from textual.geometry import Size
+from textual.message import Message
+from textual.reactive import Reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.widgets.data_table import CursorType, RowKey
+
+from kubeagle.widgets.data.tables.row_provider import RowProvider
+
+
+@dataclass
+class VirtualColumn:
+    """Column metadata for VirtualDataTable."""
+
+    key: str
+    label: Text
+    width: int
+    auto_width: bool = True
+
+
+def _to_text(cell: Any) -> Text:
+    """Convert a cell value to Rich Text the same way DataTable does."""
+    if isinstance(cell, Text):
+        return cell.copy()
+    if isinstance(cell, str):
+        plain = cell.replace("\n", " ")
+        try:
+            return Text.from_markup(plain)
+        except MarkupError:
+            return Text(plain)
+    if isinstance(cell, (int, float)) and not isinstance(cell, bool):
+        return Text(str(cell), justify="right")
+    return Text("" if cell is None else str(cell))
+
+
+class VirtualDataTable(ScrollView, can_focus=True):
+    """Row-cursor table that renders only the visible rows of a RowProvider.
+
+    Unlike Textual's DataTable, rows are never materialized into widget state.
+    Each frame formats and renders just the viewport (plus a small overscan
+    that is prefetched into the provider cache), so scrolling cost does not
+    depend on the total row count.
+
+    The public surface mirrors the subset of DataTable used by
+    CustomDataTable. Selection/highlight events are the table's own
+    ``RowSelected`` / ``RowHighlighted`` messages in the ``data_table``
+    namespace, so existing ``on_data_table_row_*`` handlers keep working.
+    """
+
+    class RowHighlighted(Message, namespace="data_table"):
+        """Posted when the row cursor moves; mirrors ``DataTable.RowHighlighted``."""
+
+        def __init__(
+            self, data_table: VirtualDataTable, cursor_row: int, row_key: RowKey,
+        ) -> None:
+            self.data_table = data_table
+            self.cursor_row = cursor_row
+            self.row_key = row_key
+            super().__init__()
+
+        @property
+        def control(self) -> VirtualDataTable:
+            """Alias for the data table."""
+            return self.data_table
+
+    class RowSelected(Message, namespace="data_table"):
+        """Posted when a row is selected; mirrors ``DataTable.RowSelected``."""
+
+        def __init__(
+            self, data_table: VirtualDataTable, cursor_row: int, row_key: RowKey,
+        ) -> None:
+            self.data_table = data_table
+            self.cursor_row = cursor_row
+            self.row_key = row_key
+            super().__init__()
+
+        @property
+        def control(self) -> VirtualDataTable:
+            """Alias for the data table."""
+            return self.data_table
+
+    OVERSCAN_ROWS: ClassVar[int] = 20
+    CELL_PADDING: ClassVar[int] = 1
+    WIDTH_SAMPLE_ROWS: ClassVar[int] = 200
+
+    BINDINGS: ClassVar[list[BindingType]] = [
+        Binding("enter", "select_cursor", "Select", show=False),
+        Binding("up", "cursor_up", "Cursor up", show=False),
+        Binding("down", "cursor_down", "Cursor down", show=False),
+        Binding("right", "scroll_right", "Scroll right", show=False),
+        Binding("left", "scroll_left", "Scroll left", show=False),
+        Binding("pageup", "page_up", "Page up", show=False),
+        Binding("pagedown", "page_down", "Page down", show=False),
+        Binding("ctrl+home", "scroll_top", "Top", show=False),
+        Binding("ctrl+end", "scroll_bottom", "Bottom", show=False),
+        Binding("home", "scroll_top", "Top", show=False),
+        Binding("end", "scroll_bottom", "Bottom", show=False),
+    ]
+
+    COMPONENT_CLASSES: ClassVar[set[str]] = {
+        "virtual-data-table--cursor",
+        "virtual-data-table--header",
+        "virtual-data-table--even-row",
+        "virtual-data-table--fixed",
+    }
+
+    DEFAULT_CSS = """
+    VirtualDataTable {
+        background: $surface;
+        color: $foreground;
+        height: 1fr;
+
+        &:focus {
+            background-tint: $foreground 5%;
+            & > .virtual-data-table--cursor {
+                background: $block-cursor-background;
+                color: $block-cursor-foreground;
+                text-style: $block-cursor-text-style;
+            }
+        }
+
+        & > .virtual-data-table--header {
+            text-style: bold;
+            background: $panel;
+            color: $foreground;
+        }
+
+        & > .virtual-data-table--fixed {
+            background: $secondary-muted;
+            color: $foreground;
+        }
+
+        & > .virtual-data-table--even-row {
+            background: $surface-lighten-1 50%;
+        }
+
+        & > .virtual-data-table--cursor {
+            background: $block-cursor-blurred-background;
+            color: $block-cursor-blurred-foreground;
+            text-style: $block-cursor-blurred-text-style;
+        }
+    }
+    """
+
+    zebra_stripes = Reactive(False)
+    fixed_columns = Reactive(0)
+    show_cursor = Reactive(True)
+    cursor_type: Reactive[CursorType] = Reactive("row")
+
+    def __init__(
+        self,
+        *,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+        cursor_type: CursorType = "row",
+    ) -> None:
+        """Initialize the virtual table.
+
+        Args:
+            name: Widget name.
+            id: Widget ID.
+            classes: CSS classes.
+            disabled: Whether the table is disabled.
+            cursor_type: "row" to show the row cursor, "none" to hide it.
+        """
+        super().__init__(name=name, id=id, classes=classes, disabled=disabled)
+        self._provider = RowProvider()
+        self._columns: list[VirtualColumn] = []
+        self._cursor_row = 0
+        self._batch_depth = 0
+        self._render_generation = 0
+        self._strip_cache: LRUCache[tuple[Any, ...], Strip] = LRUCache(1024)
+        self._pseudo_class_state: Any = None
+        self.set_reactive(VirtualDataTable.cursor_type, cursor_type)
+
+    # ------------------------------------------------------------------
+    # Data API (DataTable-compatible subset)
+    # ------------------------------------------------------------------
+
+    @property
+    def provider(self) -> RowProvider:
+        """The row provider currently rendered by this table."""
+        return self._provider
+
+    def set_provider(self, provider: RowProvider) -> None:
+        """Replace the rendered rows with a new provider.
+
+        Args:
+            provider: Row provider to render.
+        """
+        self._provider = provider
+        self._measure_columns(range(min(len(provider), self.WIDTH_SAMPLE_ROWS)))
+        self._cursor_row = max(0, min(self._cursor_row, len(provider) - 1))
+        self._data_changed()
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows in the provider."""
+        return len(self._provider)
+
+    @property
+    def ordered_columns(self) -> list[VirtualColumn]:
+        """Columns in display order."""
+        return list(self._columns)
+
+    @property
+    def columns(self) -> dict[str, VirtualColumn]:
+        """Columns keyed by column key."""
+        return {column.key: column for column in self._columns}
+
+    @property
+    def rows(self) -> dict[RowKey, int]:
+        """Row keys mapped to display index.
+
+        Built on demand; prefer ``row_count`` / ``get_row_at`` for large tables.
+        """
+        return {self.get_row_key_at(index): index for index in range(self.row_count)}
+
+    def add_column(
+        self,
+        label: Any,
+        *,
+        width: int | None = None,
+        key: str | None = None,
+        default: Any = None,
+    ) -> str:
+        """Add a column.
+
+        Args:
+            label: Column label.
+            width: Fixed content width; None measures content automatically.
+            key: Column key.
+            default: Unused; accepted for DataTable compatibility.
+
+        Returns:
+            The column key.
+        """
+        _ = default
+        label_text = _to_text(label)
+        column_key = str(key) if key is not None else label_text.plain
+        auto_width = width is None
+        column_width = cell_len(label_text.plain) if auto_width else int(width or 0)
+        self._columns.append(
+            VirtualColumn(
+                key=column_key,
+                label=label_text,
+                width=column_width,
+                auto_width=auto_width,
+            )
+        )
+        self._measure_columns(range(min(self.row_count, self.WIDTH_SAMPLE_ROWS)))
+        self._data_changed()
+        return column_key
+
+    def add_row(self, *cells: Any, key: str | None = None, **_kwargs: Any) -> RowKey:
+        """Append one pre-formatted row.
+
+        Returns:
+            Key of the new row.
+        """
+        _ = key
+        self._provider.append(tuple(cells))
+        index = self.row_count - 1
+        self._measure_columns((index,))
+        self._data_changed()
+        return self.get_row_key_at(index)
+
+    def add_rows(self, rows: Iterable[Iterable[Any]]) -> list[RowKey]:
+        """Append many pre-formatted rows.
+
+        Returns:
+            Keys of the new rows.
+        """
+        start = self.row_count
+        self._provider.extend(tuple(row) for row in rows)
+        stop = self.row_count
+        self._measure_columns(range(start, min(stop, start + self.WIDTH_SAMPLE_ROWS)))
+        self._data_changed()
+        return [self.get_row_key_at(index) for index in range(start, stop)]
+
+    def clear(self, columns: bool = False) -> VirtualDataTable:
+        """Remove all rows, and optionally all columns."""
+        self._provider.clear()
+        if columns:
+            self._columns.clear()
+        else:
+            for column in self._columns:
+                if column.auto_width:
+                    column.width = cell_len(column.label.plain)
+        self._cursor_row = 0
+        self._data_changed()
+        return self
+
+    def get_row_at(self, row_index: int) -> list[Any]:
+        """Return formatted cells for the row at ``row_index``."""
+        return list(self._provider.get_row(row_index))
+
+    def get_row_key_at(self, row_index: int) -> RowKey:
+        """Return a RowKey for the row at ``row_index``."""
+        return RowKey(str(self._provider.get_row_key(row_index)))
+
+    def sort(self, *columns: Any, reverse: bool = False, **_kwargs: Any) -> VirtualDataTable:
+        """Sort rows by the first given column key."""
+        if not columns:
+            return self
+        column_key = str(getattr(columns[0], "value", columns[0]))
+        for index, column in enumerate(self._columns):
+            if column.key == column_key:
+                self._provider.sort(index, reverse=reverse)
+                self._data_changed()
+                break
+        return self
+
+    @contextmanager
+    def batch_update(self) -> Generator[None, None, None]:
+        """Defer refreshes until the outermost batch exits."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._data_changed()
+
+    # ------------------------------------------------------------------
+    # Cursor
+    # ------------------------------------------------------------------
+
+    @property
+    def cursor_row(self) -> int:
+        """Index of the row under the cursor."""
+        return self._cursor_row
+
+    @property
+    def cursor_coordinate(self) -> Coordinate:
+        """Cursor position as a Coordinate (column is always 0)."""
+        return Coordinate(self._cursor_row, 0)
+
+    @cursor_coordinate.setter
+    def cursor_coordinate(self, coordinate: Coordinate) -> None:
+        self.move_cursor(row=coordinate.row)
+
+    def move_cursor(self, *, row: int | None = None, **_kwargs: Any) -> None:
+        """Move the row cursor and keep it in view."""
+        if row is None or self.row_count == 0:
+            self._cursor_row = 0
+            self._invalidate_lines()
+            return
+        new_row = max(0, min(int(row), self.row_count - 1))
+        if new_row == self._cursor_row:
+            self._scroll_cursor_into_view()
+            return
+        self._cursor_row = new_row
+        self._invalidate_lines()
+        self._scroll_cursor_into_view()
+        if self.cursor_type == "row" and self.show_cursor:
+            self.post_message(
+                self.RowHighlighted(self, new_row, self.get_row_key_at(new_row))
+            )
+
+    def _scroll_cursor_into_view(self) -> None:
+        body_height = max(1, self.scrollable_content_region.height - 1)
+        top = round(self.scroll_y)
+        if self._cursor_row < top:
+            self.scroll_to(y=self._cursor_row, animate=False, immediate=True)
+        elif self._cursor_row >= top + body_height:
+            self.scroll_to(
+                y=self._cursor_row - body_height + 1,
+                animate=False,
+                immediate=True,
+            )
+
+    def _post_selected(self) -> None:
+        if self.row_count == 0 or self.cursor_type != "row":
+            return
+        self.post_message(
+            self.RowSelected(
+                self, self._cursor_row, self.get_row_key_at(self._cursor_row),
+            )
+        )
+
+    def action_select_cursor(self) -> None:
+        """Post RowSelected for the cursor row."""
+        self._post_selected()
+
+    def action_cursor_up(self) -> None:
+        """Move the cursor up one row."""
+        self.move_cursor(row=self._cursor_row - 1)
+
+    def action_cursor_down(self) -> None:
+        """Move the cursor down one row."""
+        self.move_cursor(row=self._cursor_row + 1)
+
+    def action_page_up(self) -> None:
+        """Move the cursor up one page."""
+        page = max(1, self.scrollable_content_region.height - 1)
+        self.move_cursor(row=self._cursor_row - page)
+
+    def action_page_down(self) -> None:
+        """Move the cursor down one page."""
+        page = max(1, self.scrollable_content_region.height - 1)
+        self.move_cursor(row=self._cursor_row + page)
+
+    def action_scroll_top(self) -> None:
+        """Move the cursor to the first row."""
+        self.move_cursor(row=0)
+
+    def action_scroll_bottom(self) -> None:
+        """Move the cursor to the last row."""
+        self.move_cursor(row=self.row_count - 1)
+
+    def on_click(self, event: events.Click) -> None:
+        """Move the cursor to the clicked row and select it."""
+        if event.y < 1:
+            return
+        row_index = round(self.scroll_y) + event.y - 1
+        if 0 <= row_index < self.row_count:
+            self.move_cursor(row=row_index)
+            self._post_selected()
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+
+    def watch_zebra_stripes(self) -> None:
+        self._invalidate_lines()
+
+    def watch_fixed_columns(self) -> None:
+        self._invalidate_lines()
+
+    def watch_show_cursor(self) -> None:
+        self._invalidate_lines()
+
+    def watch_cursor_type(self) -> None:
+        self._invalidate_lines()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        top = round(new_value)
+        height = self.scrollable_content_region.height
+        self._provider.prefetch(top - self.OVERSCAN_ROWS, top + height + self.OVERSCAN_ROWS)
+
+    def notify_style_update(self) -> None:
+        super().notify_style_update()
+        self._invalidate_lines()
+
+    def _data_changed(self) -> None:
+        if self._batch_depth:
+            return
+        self._update_virtual_size()
+        self._invalidate_lines()
+
+    def _invalidate_lines(self) -> None:
+        self._render_generation += 1
+        self._strip_cache.clear()
+        self.refresh()
+
+    def _column_render_width(self, column: VirtualColumn) -> int:
+        return column.width + 2 * self.CELL_PADDING
+
+    def _update_virtual_size(self) -> None:
+        width = sum(self._column_render_width(column) for column in self._columns)
+        self.virtual_size = Size(width, self.row_count + 1)
+
+    def _measure_columns(self, row_indices: Iterable[int]) -> bool:
+        """Grow auto-width columns to fit the given rows."""
+        columns = self._columns
+        if not columns:
+            return False
+        grew = False
+        for row_index in row_indices:
+            try:
+                row = self._provider.get_row(row_index)
+            except IndexError:
+                continue
+            for column, cell in zip(columns, row, strict=False):
+                if not column.auto_width:
+                    continue
+                cell_width = _to_text(cell).cell_len
+                if cell_width > column.width:
+                    column.width = cell_width
+                    grew = True
+        return grew
+
+    def render_lines(self, crop: Any) -> list[Strip]:
+        self._pseudo_class_state = self.get_pseudo_class_state()
+        return super().render_lines(crop)
+
+    def render_line(self, y: int) -> Strip:
+        width = self.size.width
+        scroll_x, scroll_y = self.scroll_offset
+        base_style = self.rich_style
+        if y == 0:
+            full = self._render_header(base_style)
+        else:
+            row_index = scroll_y + y - 1
+            if row_index >= self.row_count:
+                return Strip.blank(width, base_style)
+            full = self._render_row(row_index, base_style)
+
+        fixed_width = sum(
+            self._column_render_width(column)
+            for column in self._columns[: self.fixed_columns]
+        )
+        if fixed_width:
+            strip = Strip.join(
+                [
+                    full.crop(0, fixed_width),
+                    full.crop(fixed_width + scroll_x, scroll_x + width),
+                ]
+            )
+        else:
+            strip = full.crop(scroll_x, scroll_x + width)
+        return strip.adjust_cell_length(width, base_style).simplify()
+
+    def _render_cells(
+        self,
+        cells: Iterable[Any],
+        row_style: Style,
+        *,
+        header: bool = False,
+    ) -> list[Segment]:
+        console = self.app.console
+        padding = Segment(" " * self.CELL_PADDING, row_style)
+        fixed_style = self.get_component_rich_style("virtual-data-table--fixed")
+        segments: list[Segment] = []
+        for column_index, (column, cell) in enumerate(zip(self._columns, cells, strict=False)):
+            text = cell if header else _to_text(cell)
+            text.truncate(column.width, overflow="ellipsis", pad=True)
+            style = row_style
+            if column_index < self.fixed_columns and not header:
+                style = row_style + fixed_style
+            if header:
+                style = style + Style(meta={"row": -1, "column": column_index})
+            cell_segments = list(Segment.apply_style(text.render(console), style=style))
+            segments.append(Segment(padding.text, style))
+            segments.extend(cell_segments)
+            segments.append(Segment(padding.text, style))
+        return segments
+
+    def _render_header(self, base_style: Style) -> Strip:
+        cache_key = ("header", self._render_generation, self._pseudo_class_state)
+        cached = self._strip_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        header_style = base_style + self.get_component_rich_style("virtual-data-table--header")
+        labels = [column.label.copy() for column in self._columns]
+        strip = Strip(self._render_cells(labels, header_style, header=True))
+        self._strip_cache[cache_key] = strip
+        return strip
+
+    def _render_row(self, row_index: int, base_style: Style) -> Strip:
+        is_cursor = (
+            self.show_cursor
+            and self.cursor_type == "row"
+            and row_index == self._cursor_row
+        )
+        cache_key = (row_index, is_cursor, self._render_generation, self._pseudo_class_state)
+        cached = self._strip_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        cells = self._provider.get_row(row_index)
+        if self._measure_columns((row_index,)):
+            # Column grew: recompute layout on the next frame.
+            self.call_after_refresh(self._data_changed)
+
+        row_style = base_style
+        if self.zebra_stripes and row_index % 2 == 0:
+            row_style = row_style + self.get_component_rich_style("virtual-data-table--even-row")
+        segments = self._render_cells(cells, row_style)
+        if is_cursor:
+            cursor_style = self.get_component_rich_style("virtual-data-table--cursor")
+            segments = list(Segment.apply_style(segments, post_style=cursor_style))
+        strip = Strip(segments)
+        self._strip_cache[cache_key] = strip
+        return strip
+
+    def on_resize(self, _: events.Resize) -> None:
+        with suppress(Exception):
+            self._scroll_cursor_into_view()